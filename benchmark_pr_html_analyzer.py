@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+PR HTML解析のベンチマーク（1パススキャナ vs 従来の正規表現カスケード）。
+
+Usage:
+    python benchmark_pr_html_analyzer.py [HTMLファイルまたはディレクトリ ...] [--repeat N]
+
+引数を省略すると logs/pr/*.html（監視中に保存された実際のPRページ）を使う。
+保存済みページが無い場合は、GitHubのPRページを模した合成ページで計測する。
+各ページについて、従来の解析結果と一致することも検証する。
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Set
+
+from src.gh_pr_phase_monitor.phase.html.llm_status_extractor import (
+    _add_status,
+    _extract_llm_statuses_via_text_patterns,
+    _html_to_simple_markdown,
+)
+from src.gh_pr_phase_monitor.phase.html.pr_html_analyzer import (
+    PHASE2A_REVIEW_COMPLETED,
+    PHASE3A_LLM_FEEDBACK_FINISHED_WORK,
+    _determine_html_status,
+    analyze_pr_html,
+)
+
+DEFAULT_PAGE_DIR = Path("logs/pr")
+
+# ---- 従来の実装（比較用。ページ全体のmarkdown変換と個別の正規表現による再走査） ----
+
+_LEGACY_DRAFT_PATTERNS = [
+    re.compile(r"<span[^>]*>\s*Draft\s*</span>", re.IGNORECASE),
+    re.compile(r'aria-label="[^"]*Draft[^"]*"', re.IGNORECASE),
+    re.compile(r'class="[^"]*State--draft[^"]*"', re.IGNORECASE),
+    re.compile(r'data-state="draft"', re.IGNORECASE),
+    re.compile(r'data-status="draft"', re.IGNORECASE),
+    re.compile(r'"state"\s*:\s*"DRAFT"'),
+    re.compile(r"octicon-git-pull-request-draft", re.IGNORECASE),
+]
+_LEGACY_NO_INLINE_COMMENTS = re.compile(r"generated\s+(?:no|0)\s+comments?", re.IGNORECASE)
+_LEGACY_BLOCK_SPLIT = re.compile(r"(?=<div[^>]*TimelineItem-body[^>]*>)", re.IGNORECASE)
+_LEGACY_TITLE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+def _legacy_statuses_via_html_elements(html: str, seen: Set[str]) -> List[str]:
+    statuses: List[str] = []
+    timeline_pattern = re.compile(
+        r'<div[^>]*class="[^"]*TimelineItem-body[^"]*"[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE
+    )
+    hovercard = re.compile(r'data-hovercard-type=["\']copilot["\']', re.IGNORECASE)
+    author_re = re.compile(r'data-hovercard-type=["\']copilot["\'][^>]*>([^<]+)</a>', re.IGNORECASE)
+    for body in re.findall(timeline_pattern, html):
+        if "session_id=" in body:
+            _add_status(statuses, seen, _html_to_simple_markdown(body))
+        elif hovercard.search(body):
+            author_match = author_re.search(body)
+            if not author_match:
+                continue
+            parts = re.split(r"</strong\b[^>]*>", body, maxsplit=1, flags=re.IGNORECASE)
+            if len(parts) < 2:
+                continue
+            action_text = _html_to_simple_markdown(parts[1]).strip()
+            if action_text:
+                _add_status(statuses, seen, f"{author_match.group(1).strip()} {action_text}")
+    for pattern in (
+        r'data-llm-status=["\']([^"\']+)["\']',
+        r'aria-label=["\'][^"\']*LLM status[^"\']*[:：]\s*([^"\']+)["\']',
+        r'title=["\'][^"\']*LLM status[^"\']*[:：]\s*([^"\']+)["\']',
+    ):
+        for match in re.finditer(pattern, html, flags=re.IGNORECASE):
+            _add_status(statuses, seen, match.group(1))
+    return statuses
+
+
+def legacy_analyze_pr_html(html: str, pr_url: str = "") -> Dict[str, Any]:
+    """1パススキャナ導入前の analyze_pr_html と同じ処理。"""
+    html_markdown = _html_to_simple_markdown(html)
+    seen: Set[str] = set()
+    llm_statuses = _legacy_statuses_via_html_elements(html, seen)
+    llm_statuses.extend(_extract_llm_statuses_via_text_patterns(html_markdown, seen))
+    is_draft = any(pattern.search(html) for pattern in _LEGACY_DRAFT_PATTERNS)
+    status = _determine_html_status(llm_statuses, is_draft)
+    if status == PHASE2A_REVIEW_COMPLETED and any(
+        "copilot-pull-request-reviewer" in block and _LEGACY_NO_INLINE_COMMENTS.search(block)
+        for block in _LEGACY_BLOCK_SPLIT.split(html)
+    ):
+        status = PHASE3A_LLM_FEEDBACK_FINISHED_WORK
+    result: Dict[str, Any] = {"pr_url": pr_url, "is_draft": is_draft, "llm_statuses": llm_statuses, "status": status}
+    title_match = _LEGACY_TITLE.search(html)
+    if title_match and " · Pull Request " in title_match.group(1):
+        import html as html_lib
+
+        title = html_lib.unescape(title_match.group(1).split(" · Pull Request ")[0].strip())
+        if title:
+            result["title"] = title
+    return result
+
+
+# ---- 計測 ----
+
+
+def synthetic_pr_page(timeline_items: int = 400) -> str:
+    """GitHubのPRページ（head・スクリプト・タイムライン・フッター）を模した合成HTML。"""
+    head = (
+        "<html><head><title>Fix parser · Pull Request #42 · owner/repo · GitHub</title>"
+        + "<script>"
+        + "var x = {'a': 1};" * 20000
+        + "</script>"
+        + "<style>"
+        + ".c{color:red}" * 20000
+        + "</style></head><body>"
+        + '<div class="prc-PageLayout-Content">'
+    )
+    items = []
+    for index in range(timeline_items):
+        if index % 40 == 0:
+            items.append(
+                '<div class="TimelineItem-body d-flex"><a href="https://github.com/owner/repo/tasks?session_id=1">'
+                f"Copilot started work on behalf of owner March 7, 2026 10:{index % 60:02d}</a></div>"
+            )
+        elif index % 40 == 20:
+            items.append(
+                '<div class="TimelineItem-body"><strong><a data-hovercard-type="copilot" '
+                'data-hovercard-url="/copilot/hovercard?bot=copilot-pull-request-reviewer">Copilot</a></strong>'
+                "reviewed<p>Copilot reviewed 3 out of 3 changed files and generated 2 comments.</p></div>"
+            )
+        else:
+            items.append(
+                '<div class="TimelineItem-body"><div class="comment-body"><p>Looks good. '
+                + "<code>value</code> <strong>bold</strong> <a href='/x'>link</a> " * 20
+                + "</p></div></div>"
+            )
+    return head + "".join(items) + "</div><footer>" + "<a href='/f'>f</a>" * 2000 + "</footer></body></html>"
+
+
+def _collect_pages(paths: List[str]) -> Dict[str, str]:
+    files: List[Path] = []
+    for raw in paths or [str(DEFAULT_PAGE_DIR)]:
+        path = Path(raw)
+        files.extend(sorted(path.glob("*.html")) if path.is_dir() else [path] if path.is_file() else [])
+    if not files:
+        return {"(synthetic page)": synthetic_pr_page()}
+    return {str(file): file.read_text(encoding="utf-8", errors="replace") for file in files}
+
+
+def _best_of(fn: Callable[[str], Any], html: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(html)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="HTMLファイルまたはディレクトリ（既定: logs/pr）")
+    parser.add_argument("--repeat", type=int, default=5, help="各ページの計測回数（最良値を採用）")
+    args = parser.parse_args()
+
+    pages = _collect_pages(args.paths)
+    total_legacy = total_scan = 0.0
+    mismatches = 0
+    print(f"{'page':<40} {'size':>9} {'legacy ms':>10} {'scan ms':>9} {'speedup':>8}")
+    for name, html in pages.items():
+        if legacy_analyze_pr_html(html) != analyze_pr_html(html):
+            mismatches += 1
+            print(f"  結果が一致しません: {name}", file=sys.stderr)
+        legacy = _best_of(legacy_analyze_pr_html, html, args.repeat)
+        scan = _best_of(analyze_pr_html, html, args.repeat)
+        total_legacy += legacy
+        total_scan += scan
+        print(
+            f"{Path(name).name[:40]:<40} {len(html) / 1024:>7.0f}KB {legacy * 1000:>10.1f} {scan * 1000:>9.1f}"
+            f" {legacy / scan:>7.1f}x"
+        )
+    print(
+        f"{'total':<40} {'':>9} {total_legacy * 1000:>10.1f} {total_scan * 1000:>9.1f} {total_legacy / total_scan:>7.1f}x"
+    )
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -82,6 +82,101 @@ DEFAULT_ENABLE_PR_PHASE_SNAPSHOTS = False
 # Default setting for local repo auto-pull (disabled by default; display only by default)
 DEFAULT_AUTO_GIT_PULL = False
 
+# Transport used for GraphQL queries
+# "gh": spawn `gh api graphql` per query (default, most compatible)
+# "http": in-process HTTPS with a keep-alive connection pool (falls back to gh on transport failure)
+GRAPHQL_TRANSPORT_GH = "gh"
+GRAPHQL_TRANSPORT_HTTP = "http"
+SUPPORTED_GRAPHQL_TRANSPORTS = (GRAPHQL_TRANSPORT_GH, GRAPHQL_TRANSPORT_HTTP)
+DEFAULT_GRAPHQL_TRANSPORT = GRAPHQL_TRANSPORT_GH
+
+# Maximum number of aliased GraphQL batches (PR details / issue lists) in flight at once
+DEFAULT_GRAPHQL_MAX_CONCURRENCY = 4
+
+# GraphQL point budget per monitoring iteration (0 = unlimited)
+# When set, low-priority queries (issue listing) are trimmed or deferred once the
+# estimated cost of the iteration's queries would exceed the budget.
+DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET = 0
+
+# TTL (seconds) of the GraphQL response cache per query kind, e.g.
+# {"issues": 300}. Kinds not listed are never cached.
+# Entries of repositories whose updatedAt changed are invalidated immediately.
+DEFAULT_GRAPHQL_CACHE_TTL_SECONDS: Dict[str, float] = {}
+
+# Attempts per idempotent GitHub read when it fails transiently (5xx, secondary rate
+# limit, network errors); 1 disables retries. Delays use jittered exponential backoff
+# or the server's Retry-After.
+DEFAULT_API_RETRY_MAX_ATTEMPTS = 3
+
+# Consecutive failed calls after which an optional dependency (Pages API, issue listing)
+# is skipped, and for how long before a trial call is allowed again
+DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS = 300
+
+# File where ETag / updatedAt baselines are persisted across restarts ("" = disabled)
+DEFAULT_API_BASELINE_FILE = ""
+
+# First-stage source of the per-iteration repository change detection
+# "updated_at": ETag pre-check of /user/repos, then the GraphQL updatedAt comparison (default)
+# "events": the user event feeds (falls back to "updated_at" whenever they cannot answer)
+CHANGE_DETECTION_SOURCE_UPDATED_AT = "updated_at"
+CHANGE_DETECTION_SOURCE_EVENTS = "events"
+SUPPORTED_CHANGE_DETECTION_SOURCES = (CHANGE_DETECTION_SOURCE_UPDATED_AT, CHANGE_DETECTION_SOURCE_EVENTS)
+DEFAULT_CHANGE_DETECTION_SOURCE = CHANGE_DETECTION_SOURCE_UPDATED_AT
+
+# Which cached open PRs get their HTML re-fetched when updatedAt is unchanged (skip path)
+# "all": every PR, every iteration (default)
+# "notifications": PRs with new /notifications activity, others every safety interval
+PR_HTML_REFETCH_SOURCE_ALL = "all"
+PR_HTML_REFETCH_SOURCE_NOTIFICATIONS = "notifications"
+SUPPORTED_PR_HTML_REFETCH_SOURCES = (PR_HTML_REFETCH_SOURCE_ALL, PR_HTML_REFETCH_SOURCE_NOTIFICATIONS)
+DEFAULT_PR_HTML_REFETCH_SOURCE = PR_HTML_REFETCH_SOURCE_ALL
+DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS = 600
+
+# How the skip path (updatedAt unchanged) checks whether the open PRs of cached repositories changed
+# "graphql": re-run the GraphQL open-PR inventory scan and compare per-repo counts (default)
+# "rest_etag": conditional GET /repos/{owner}/{repo}/pulls?state=open per repository (304s are free);
+#              only repositories that returned 200 get their PR details re-fetched
+SKIP_PATH_OPEN_PR_CHECK_GRAPHQL = "graphql"
+SKIP_PATH_OPEN_PR_CHECK_REST_ETAG = "rest_etag"
+SUPPORTED_SKIP_PATH_OPEN_PR_CHECKS = (SKIP_PATH_OPEN_PR_CHECK_GRAPHQL, SKIP_PATH_OPEN_PR_CHECK_REST_ETAG)
+DEFAULT_SKIP_PATH_OPEN_PR_CHECK = SKIP_PATH_OPEN_PR_CHECK_GRAPHQL
+
+# Fetch a cheap per-PR change fingerprint first and re-fetch the HTML only of PRs whose
+# fingerprint changed; other PRs reuse their stored analysis up to the staleness bound
+DEFAULT_ENABLE_PR_FINGERPRINT_CHECK = False
+DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS = 600
+
+# How PR pages are downloaded from github.com
+# "curl": one curl process per page (default)
+# "http": in-process keep-alive connections with gzip (and br when the brotli package is
+#         installed) compression; falls back to curl when a connection cannot be made
+PR_HTML_FETCH_BACKEND_CURL = "curl"
+PR_HTML_FETCH_BACKEND_HTTP = "http"
+SUPPORTED_PR_HTML_FETCH_BACKENDS = (PR_HTML_FETCH_BACKEND_CURL, PR_HTML_FETCH_BACKEND_HTTP)
+DEFAULT_PR_HTML_FETCH_BACKEND = PR_HTML_FETCH_BACKEND_CURL
+
+# Stream PR pages and close the connection once <footer> is reached (the analyzed content
+# ends there; "http" backend only), and the per-page download budget (0 = unlimited)
+DEFAULT_PR_HTML_STOP_AT_FOOTER = False
+DEFAULT_PR_HTML_MAX_BYTES = 0
+
+# Analyses of PR pages kept by the hash of their title and timeline region, so a page whose
+# timeline is unchanged skips analysis and the logs/pr write (0 = disabled)
+DEFAULT_PR_ANALYSIS_CACHE_SIZE = 256
+
+# Open PRs whose page (or timeline) is fetched and analyzed concurrently before the serial
+# phase-detection / action stage, and the cap on requests in flight to a single host
+DEFAULT_PR_FETCH_MAX_CONCURRENCY = 4
+DEFAULT_PR_FETCH_MAX_PER_HOST = 3
+
+# Embedded webhook listener (0 = disabled). Deliveries signed with webhook_secret wake the
+# monitoring loop for a targeted refresh; polling falls back to webhook_fallback_interval.
+DEFAULT_WEBHOOK_LISTEN_HOST = "127.0.0.1"
+DEFAULT_WEBHOOK_LISTEN_PORT = 0
+DEFAULT_WEBHOOK_SECRET = ""
+DEFAULT_WEBHOOK_FALLBACK_INTERVAL = "10m"
+
 
 def _validate_color_scheme(value: Any) -> str:
     """Validate that the color scheme is supported."""
@@ -98,6 +193,56 @@ def _validate_color_scheme(value: Any) -> str:
     return normalized
 
 
+def _validate_graphql_transport(value: Any) -> str:
+    """Validate that the GraphQL transport is supported."""
+    if not isinstance(value, str) or value.strip().lower() not in SUPPORTED_GRAPHQL_TRANSPORTS:
+        raise ValueError(
+            f"Configuration value 'graphql_transport' must be one of ({', '.join(SUPPORTED_GRAPHQL_TRANSPORTS)}), "
+            f"got {type(value).__name__}: {value!r}"
+        )
+    return value.strip().lower()
+
+
+def _validate_change_detection_source(value: Any) -> str:
+    """Validate that the change detection source is supported."""
+    if not isinstance(value, str) or value.strip().lower() not in SUPPORTED_CHANGE_DETECTION_SOURCES:
+        raise ValueError(
+            "Configuration value 'change_detection_source' must be one of "
+            f"({', '.join(SUPPORTED_CHANGE_DETECTION_SOURCES)}), got {type(value).__name__}: {value!r}"
+        )
+    return value.strip().lower()
+
+
+def _validate_pr_html_refetch_source(value: Any) -> str:
+    """Validate that the PR HTML refetch source is supported."""
+    if not isinstance(value, str) or value.strip().lower() not in SUPPORTED_PR_HTML_REFETCH_SOURCES:
+        raise ValueError(
+            "Configuration value 'pr_html_refetch_source' must be one of "
+            f"({', '.join(SUPPORTED_PR_HTML_REFETCH_SOURCES)}), got {type(value).__name__}: {value!r}"
+        )
+    return value.strip().lower()
+
+
+def _validate_skip_path_open_pr_check(value: Any) -> str:
+    """Validate that the skip-path open PR check is supported."""
+    if not isinstance(value, str) or value.strip().lower() not in SUPPORTED_SKIP_PATH_OPEN_PR_CHECKS:
+        raise ValueError(
+            "Configuration value 'skip_path_open_pr_check' must be one of "
+            f"({', '.join(SUPPORTED_SKIP_PATH_OPEN_PR_CHECKS)}), got {type(value).__name__}: {value!r}"
+        )
+    return value.strip().lower()
+
+
+def _validate_pr_html_fetch_backend(value: Any) -> str:
+    """Validate that the PR page fetch backend is supported."""
+    if not isinstance(value, str) or value.strip().lower() not in SUPPORTED_PR_HTML_FETCH_BACKENDS:
+        raise ValueError(
+            "Configuration value 'pr_html_fetch_backend' must be one of "
+            f"({', '.join(SUPPORTED_PR_HTML_FETCH_BACKENDS)}), got {type(value).__name__}: {value!r}"
+        )
+    return value.strip().lower()
+
+
 def _load_custom_colors(config: Dict[str, Any]) -> Dict[str, str]:
     """Validate and normalize custom color overrides from config."""
     custom_colors = config.get("colors")
@@ -254,6 +399,121 @@ def load_config(config_path: str = "config.toml") -> Dict[str, Any]:
                 f"Using default value: {DEFAULT_MAX_LLM_WORKING_PARALLEL}"
             )
             config["max_llm_working_parallel"] = DEFAULT_MAX_LLM_WORKING_PARALLEL
+    if "graphql_max_concurrency" in config:
+        value = config["graphql_max_concurrency"]
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            print(
+                f"Warning: graphql_max_concurrency must be a positive integer, "
+                f"got {type(value).__name__}: {value!r}. "
+                f"Using default value: {DEFAULT_GRAPHQL_MAX_CONCURRENCY}"
+            )
+            config["graphql_max_concurrency"] = DEFAULT_GRAPHQL_MAX_CONCURRENCY
+    if "graphql_iteration_point_budget" in config:
+        value = config["graphql_iteration_point_budget"]
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            print(
+                f"Warning: graphql_iteration_point_budget must be a non-negative integer, "
+                f"got {type(value).__name__}: {value!r}. "
+                f"Using default value: {DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET}"
+            )
+            config["graphql_iteration_point_budget"] = DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET
+    for key, default in (
+        ("pr_html_max_bytes", DEFAULT_PR_HTML_MAX_BYTES),
+        ("pr_analysis_cache_size", DEFAULT_PR_ANALYSIS_CACHE_SIZE),
+    ):
+        if key in config:
+            value = config[key]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                print(
+                    f"Warning: {key} must be a non-negative integer, "
+                    f"got {type(value).__name__}: {value!r}. "
+                    f"Using default value: {default}"
+                )
+                config[key] = default
+    for key, default in (
+        ("api_retry_max_attempts", DEFAULT_API_RETRY_MAX_ATTEMPTS),
+        ("circuit_breaker_failure_threshold", DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD),
+        ("pr_fetch_max_concurrency", DEFAULT_PR_FETCH_MAX_CONCURRENCY),
+        ("pr_fetch_max_per_host", DEFAULT_PR_FETCH_MAX_PER_HOST),
+    ):
+        if key in config:
+            value = config[key]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                print(
+                    f"Warning: {key} must be a positive integer, "
+                    f"got {type(value).__name__}: {value!r}. "
+                    f"Using default value: {default}"
+                )
+                config[key] = default
+    for key, default in (
+        ("circuit_breaker_cooldown_seconds", DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS),
+        ("pr_html_refetch_safety_interval_seconds", DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS),
+        ("pr_analysis_max_staleness_seconds", DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS),
+    ):
+        if key in config:
+            value = config[key]
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+                print(
+                    f"Warning: {key} must be a non-negative number, "
+                    f"got {type(value).__name__}: {value!r}. "
+                    f"Using default value: {default}"
+                )
+                config[key] = default
+    if "webhook_listen_port" in config:
+        value = config["webhook_listen_port"]
+        if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value <= 65535:
+            print(
+                f"Warning: webhook_listen_port must be an integer between 0 and 65535, "
+                f"got {type(value).__name__}: {value!r}. "
+                f"Using default value: {DEFAULT_WEBHOOK_LISTEN_PORT}"
+            )
+            config["webhook_listen_port"] = DEFAULT_WEBHOOK_LISTEN_PORT
+    for key, default in (
+        ("webhook_listen_host", DEFAULT_WEBHOOK_LISTEN_HOST),
+        ("webhook_secret", DEFAULT_WEBHOOK_SECRET),
+    ):
+        if key in config and not isinstance(config[key], str):
+            value = config[key]
+            print(
+                f"Warning: {key} must be a string, got {type(value).__name__}. "
+                f"Using default value: {default!r}"
+            )
+            config[key] = default
+    if "webhook_fallback_interval" in config:
+        try:
+            parse_interval(config["webhook_fallback_interval"])
+        except ValueError as e:
+            print(
+                f"Warning: Invalid webhook_fallback_interval: {e}. "
+                f"Using default value: {DEFAULT_WEBHOOK_FALLBACK_INTERVAL}"
+            )
+            config["webhook_fallback_interval"] = DEFAULT_WEBHOOK_FALLBACK_INTERVAL
+    if "api_baseline_file" in config and not isinstance(config["api_baseline_file"], str):
+        value = config["api_baseline_file"]
+        print(
+            f"Warning: api_baseline_file must be a string path, "
+            f"got {type(value).__name__}: {value!r}. Baseline persistence is disabled."
+        )
+        config["api_baseline_file"] = DEFAULT_API_BASELINE_FILE
+    if "graphql_cache_ttl_seconds" in config:
+        value = config["graphql_cache_ttl_seconds"]
+        if not isinstance(value, dict):
+            print(
+                f"Warning: graphql_cache_ttl_seconds must be a table of query kind = seconds, "
+                f"got {type(value).__name__}: {value!r}. Response caching is disabled."
+            )
+            config["graphql_cache_ttl_seconds"] = dict(DEFAULT_GRAPHQL_CACHE_TTL_SECONDS)
+        else:
+            ttls = {}
+            for kind, ttl in value.items():
+                if not isinstance(ttl, (int, float)) or isinstance(ttl, bool) or ttl < 0:
+                    print(
+                        f"Warning: graphql_cache_ttl_seconds.{kind} must be a non-negative number, "
+                        f"got {type(ttl).__name__}: {ttl!r}. Caching for '{kind}' is disabled."
+                    )
+                    continue
+                ttls[kind] = ttl
+            config["graphql_cache_ttl_seconds"] = ttls
     if "display_pr_author" in config:
         try:
             config["display_pr_author"] = _validate_boolean_flag(config["display_pr_author"], "display_pr_author")
@@ -282,6 +542,26 @@ def load_config(config_path: str = "config.toml") -> Dict[str, Any]:
             config["enable_pr_phase_snapshots"] = DEFAULT_ENABLE_PR_PHASE_SNAPSHOTS
     else:
         config["enable_pr_phase_snapshots"] = DEFAULT_ENABLE_PR_PHASE_SNAPSHOTS
+    if "pr_html_stop_at_footer" in config:
+        try:
+            config["pr_html_stop_at_footer"] = _validate_boolean_flag(
+                config["pr_html_stop_at_footer"], "pr_html_stop_at_footer"
+            )
+        except ValueError as e:
+            print(f"Warning: {e}. Using default value: {DEFAULT_PR_HTML_STOP_AT_FOOTER}")
+            config["pr_html_stop_at_footer"] = DEFAULT_PR_HTML_STOP_AT_FOOTER
+    else:
+        config["pr_html_stop_at_footer"] = DEFAULT_PR_HTML_STOP_AT_FOOTER
+    if "enable_pr_fingerprint_check" in config:
+        try:
+            config["enable_pr_fingerprint_check"] = _validate_boolean_flag(
+                config["enable_pr_fingerprint_check"], "enable_pr_fingerprint_check"
+            )
+        except ValueError as e:
+            print(f"Warning: {e}. Using default value: {DEFAULT_ENABLE_PR_FINGERPRINT_CHECK}")
+            config["enable_pr_fingerprint_check"] = DEFAULT_ENABLE_PR_FINGERPRINT_CHECK
+    else:
+        config["enable_pr_fingerprint_check"] = DEFAULT_ENABLE_PR_FINGERPRINT_CHECK
     if "enable_auto_update" in config:
         try:
             config["enable_auto_update"] = _validate_boolean_flag(config["enable_auto_update"], "enable_auto_update")
@@ -308,6 +588,46 @@ def load_config(config_path: str = "config.toml") -> Dict[str, Any]:
             config["auto_git_pull"] = DEFAULT_AUTO_GIT_PULL
     else:
         config["auto_git_pull"] = DEFAULT_AUTO_GIT_PULL
+    if "graphql_transport" in config:
+        try:
+            config["graphql_transport"] = _validate_graphql_transport(config["graphql_transport"])
+        except ValueError as e:
+            print(f"Warning: {e}. Using default value: {DEFAULT_GRAPHQL_TRANSPORT}")
+            config["graphql_transport"] = DEFAULT_GRAPHQL_TRANSPORT
+    else:
+        config["graphql_transport"] = DEFAULT_GRAPHQL_TRANSPORT
+    if "change_detection_source" in config:
+        try:
+            config["change_detection_source"] = _validate_change_detection_source(config["change_detection_source"])
+        except ValueError as e:
+            print(f"Warning: {e}. Using default value: {DEFAULT_CHANGE_DETECTION_SOURCE}")
+            config["change_detection_source"] = DEFAULT_CHANGE_DETECTION_SOURCE
+    else:
+        config["change_detection_source"] = DEFAULT_CHANGE_DETECTION_SOURCE
+    if "pr_html_refetch_source" in config:
+        try:
+            config["pr_html_refetch_source"] = _validate_pr_html_refetch_source(config["pr_html_refetch_source"])
+        except ValueError as e:
+            print(f"Warning: {e}. Using default value: {DEFAULT_PR_HTML_REFETCH_SOURCE}")
+            config["pr_html_refetch_source"] = DEFAULT_PR_HTML_REFETCH_SOURCE
+    else:
+        config["pr_html_refetch_source"] = DEFAULT_PR_HTML_REFETCH_SOURCE
+    if "skip_path_open_pr_check" in config:
+        try:
+            config["skip_path_open_pr_check"] = _validate_skip_path_open_pr_check(config["skip_path_open_pr_check"])
+        except ValueError as e:
+            print(f"Warning: {e}. Using default value: {DEFAULT_SKIP_PATH_OPEN_PR_CHECK}")
+            config["skip_path_open_pr_check"] = DEFAULT_SKIP_PATH_OPEN_PR_CHECK
+    else:
+        config["skip_path_open_pr_check"] = DEFAULT_SKIP_PATH_OPEN_PR_CHECK
+    if "pr_html_fetch_backend" in config:
+        try:
+            config["pr_html_fetch_backend"] = _validate_pr_html_fetch_backend(config["pr_html_fetch_backend"])
+        except ValueError as e:
+            print(f"Warning: {e}. Using default value: {DEFAULT_PR_HTML_FETCH_BACKEND}")
+            config["pr_html_fetch_backend"] = DEFAULT_PR_HTML_FETCH_BACKEND
+    else:
+        config["pr_html_fetch_backend"] = DEFAULT_PR_HTML_FETCH_BACKEND
     if "color_scheme" in config:
         try:
             config["color_scheme"] = _validate_color_scheme(config["color_scheme"])
@@ -12,14 +12,37 @@ def print_config(config: Dict[str, Any]) -> None:
         config: Configuration dictionary loaded from TOML
     """
     from .config import (
+        DEFAULT_API_BASELINE_FILE,
+        DEFAULT_API_RETRY_MAX_ATTEMPTS,
         DEFAULT_ASSIGN_TO_COPILOT_CONFIG,
+        DEFAULT_CHANGE_DETECTION_SOURCE,
         DEFAULT_CHECK_PROCESS_BEFORE_AUTORAISE,
+        DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
         DEFAULT_COLOR_SCHEME,
         DEFAULT_DISPLAY_LLM_STATUS_TIMELINE,
         DEFAULT_DISPLAY_PR_AUTHOR,
         DEFAULT_ENABLE_AUTO_UPDATE,
+        DEFAULT_ENABLE_PR_FINGERPRINT_CHECK,
         DEFAULT_ENABLE_PR_PHASE_SNAPSHOTS,
+        DEFAULT_GRAPHQL_CACHE_TTL_SECONDS,
+        DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET,
+        DEFAULT_GRAPHQL_MAX_CONCURRENCY,
+        DEFAULT_GRAPHQL_TRANSPORT,
         DEFAULT_MAX_LLM_WORKING_PARALLEL,
+        DEFAULT_PR_ANALYSIS_CACHE_SIZE,
+        DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS,
+        DEFAULT_PR_FETCH_MAX_CONCURRENCY,
+        DEFAULT_PR_FETCH_MAX_PER_HOST,
+        DEFAULT_PR_HTML_FETCH_BACKEND,
+        DEFAULT_PR_HTML_MAX_BYTES,
+        DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS,
+        DEFAULT_PR_HTML_REFETCH_SOURCE,
+        DEFAULT_PR_HTML_STOP_AT_FOOTER,
+        DEFAULT_SKIP_PATH_OPEN_PR_CHECK,
+        DEFAULT_WEBHOOK_FALLBACK_INTERVAL,
+        DEFAULT_WEBHOOK_LISTEN_HOST,
+        DEFAULT_WEBHOOK_LISTEN_PORT,
     )
 
     print("\n" + "=" * 50)
@@ -44,6 +67,54 @@ def print_config(config: Dict[str, Any]) -> None:
     )
     print(f"  enable_pr_phase_snapshots: {config.get('enable_pr_phase_snapshots', DEFAULT_ENABLE_PR_PHASE_SNAPSHOTS)}")
     print(f"  enable_auto_update: {config.get('enable_auto_update', DEFAULT_ENABLE_AUTO_UPDATE)}")
+    print(f"  graphql_transport: {config.get('graphql_transport', DEFAULT_GRAPHQL_TRANSPORT)}")
+    print(f"  graphql_max_concurrency: {config.get('graphql_max_concurrency', DEFAULT_GRAPHQL_MAX_CONCURRENCY)}")
+    print(
+        "  graphql_iteration_point_budget: "
+        f"{config.get('graphql_iteration_point_budget', DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET)}"
+    )
+    print(f"  graphql_cache_ttl_seconds: {config.get('graphql_cache_ttl_seconds', DEFAULT_GRAPHQL_CACHE_TTL_SECONDS)}")
+    print(f"  change_detection_source: {config.get('change_detection_source', DEFAULT_CHANGE_DETECTION_SOURCE)}")
+    print(f"  pr_html_refetch_source: {config.get('pr_html_refetch_source', DEFAULT_PR_HTML_REFETCH_SOURCE)}")
+    print(
+        "  pr_html_refetch_safety_interval_seconds: "
+        f"{config.get('pr_html_refetch_safety_interval_seconds', DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS)}"
+    )
+    print(f"  skip_path_open_pr_check: {config.get('skip_path_open_pr_check', DEFAULT_SKIP_PATH_OPEN_PR_CHECK)}")
+    print(
+        f"  enable_pr_fingerprint_check: {config.get('enable_pr_fingerprint_check', DEFAULT_ENABLE_PR_FINGERPRINT_CHECK)}"
+    )
+    print(
+        "  pr_analysis_max_staleness_seconds: "
+        f"{config.get('pr_analysis_max_staleness_seconds', DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS)}"
+    )
+    print(f"  pr_html_fetch_backend: {config.get('pr_html_fetch_backend', DEFAULT_PR_HTML_FETCH_BACKEND)}")
+    print(f"  pr_html_stop_at_footer: {config.get('pr_html_stop_at_footer', DEFAULT_PR_HTML_STOP_AT_FOOTER)}")
+    print(f"  pr_html_max_bytes: {config.get('pr_html_max_bytes', DEFAULT_PR_HTML_MAX_BYTES)}")
+    print(f"  pr_analysis_cache_size: {config.get('pr_analysis_cache_size', DEFAULT_PR_ANALYSIS_CACHE_SIZE)}")
+    print(f"  pr_fetch_max_concurrency: {config.get('pr_fetch_max_concurrency', DEFAULT_PR_FETCH_MAX_CONCURRENCY)}")
+    print(f"  pr_fetch_max_per_host: {config.get('pr_fetch_max_per_host', DEFAULT_PR_FETCH_MAX_PER_HOST)}")
+    webhook_port = config.get("webhook_listen_port", DEFAULT_WEBHOOK_LISTEN_PORT)
+    if webhook_port:
+        print(
+            f"  webhook_listen: {config.get('webhook_listen_host', DEFAULT_WEBHOOK_LISTEN_HOST)}:{webhook_port}"
+            f" (secret: {'set' if config.get('webhook_secret') else 'NOT SET'})"
+        )
+        print(
+            f"  webhook_fallback_interval: {config.get('webhook_fallback_interval', DEFAULT_WEBHOOK_FALLBACK_INTERVAL)}"
+        )
+    else:
+        print("  webhook_listen: (disabled)")
+    print(f"  api_baseline_file: {config.get('api_baseline_file', DEFAULT_API_BASELINE_FILE) or '(disabled)'}")
+    print(f"  api_retry_max_attempts: {config.get('api_retry_max_attempts', DEFAULT_API_RETRY_MAX_ATTEMPTS)}")
+    print(
+        "  circuit_breaker_failure_threshold: "
+        f"{config.get('circuit_breaker_failure_threshold', DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD)}"
+    )
+    print(
+        "  circuit_breaker_cooldown_seconds: "
+        f"{config.get('circuit_breaker_cooldown_seconds', DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS)}"
+    )
 
     coding_agent = config.get("coding_agent")
     if coding_agent and isinstance(coding_agent, dict):
@@ -134,3 +205,4 @@ def print_repo_execution_config(repo_owner: str, repo_name: str, exec_config: Di
     print(f"      assign_ci_failure_old: {exec_config.get('assign_ci_failure_old', False)}")
     print(f"      assign_deploy_pages_failure_old: {exec_config.get('assign_deploy_pages_failure_old', False)}")
     print(f"      assign_old: {exec_config.get('assign_old', False)}")
+    print(f"      llm_status_source: {exec_config.get('llm_status_source', 'html')}")
@@ -2,6 +2,14 @@
 
 from typing import Any, Dict
 
+# Where the LLM status timeline (llm_statuses) of a repository's PRs comes from
+# "html": scraped from the PR page (default)
+# "timeline": GET /repos/{owner}/{repo}/issues/{number}/timeline with per-PR ETags (304s are
+#             free); the PR page is still scraped whenever the timeline cannot be fetched
+LLM_STATUS_SOURCE_HTML = "html"
+LLM_STATUS_SOURCE_TIMELINE = "timeline"
+SUPPORTED_LLM_STATUS_SOURCES = (LLM_STATUS_SOURCE_HTML, LLM_STATUS_SOURCE_TIMELINE)
+
 
 def _validate_boolean_flag(value: Any, flag_name: str) -> bool:
     """Validate that a configuration flag is a boolean value
@@ -23,6 +31,20 @@ def _validate_boolean_flag(value: Any, flag_name: str) -> bool:
     return value
 
 
+def _validate_llm_status_source(value: Any) -> str:
+    """Validate that a ruleset's llm_status_source is supported
+
+    Raises:
+        ValueError: If the value is not one of SUPPORTED_LLM_STATUS_SOURCES
+    """
+    if not isinstance(value, str) or value.strip().lower() not in SUPPORTED_LLM_STATUS_SOURCES:
+        raise ValueError(
+            "Configuration value 'llm_status_source' must be one of "
+            f"({', '.join(SUPPORTED_LLM_STATUS_SOURCES)}), got {type(value).__name__}: {value!r}"
+        )
+    return value.strip().lower()
+
+
 def resolve_execution_config_for_repo(config: Dict[str, Any], repo_owner: str, repo_name: str) -> Dict[str, Any]:
     """Resolve execution configuration for a specific repository using rulesets
 
@@ -46,6 +68,7 @@ def resolve_execution_config_for_repo(config: Dict[str, Any], repo_owner: str, r
         - assign_ci_failure_old: Assign one old "ci-failure" issue
         - assign_deploy_pages_failure_old: Assign one old "deploy-pages-failure" issue
         - assign_old: Assign one old issue (any issue)
+        - llm_status_source: Where llm_statuses come from ("html" or "timeline")
     """
     # Start with all flags disabled (no global defaults)
     result = {
@@ -59,6 +82,7 @@ def resolve_execution_config_for_repo(config: Dict[str, Any], repo_owner: str, r
         "assign_ci_failure_old": False,  # Assign one old "ci-failure" issue
         "assign_deploy_pages_failure_old": False,  # Assign one old "deploy-pages-failure" issue
         "assign_old": False,  # Assign one old issue (any issue)
+        "llm_status_source": LLM_STATUS_SOURCE_HTML,  # Where llm_statuses come from
     }
 
     # Apply rulesets if they exist
@@ -132,4 +156,7 @@ def resolve_execution_config_for_repo(config: Dict[str, Any], repo_owner: str, r
             if "assign_old" in ruleset:
                 result["assign_old"] = _validate_boolean_flag(ruleset["assign_old"], "assign_old")
 
+            if "llm_status_source" in ruleset:
+                result["llm_status_source"] = _validate_llm_status_source(ruleset["llm_status_source"])
+
     return result
@@ -4,16 +4,26 @@ Process detection utilities
 
 import subprocess
 
+from .request_coalescer import coalesce
+
 
 def is_process_running(process_name: str) -> bool:
     """Check if a process with the given name is currently running
 
+    Within one monitoring iteration (request_coalescing_scope) the answer is looked up
+    once and reused, e.g. for every browser open.
+
     Args:
         process_name: Name of the process to check (e.g., "cat-window-watcher")
 
     Returns:
         True if the process is running, False otherwise
     """
+    return coalesce(("process_running", process_name), lambda: _check_process_running(process_name))
+
+
+def _check_process_running(process_name: str) -> bool:
+    """Run the actual process lookup for is_process_running()."""
     try:
         # Use pgrep for more reliable process detection
         # -f flag searches the full command line
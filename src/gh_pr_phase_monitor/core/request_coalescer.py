@@ -0,0 +1,110 @@
+"""
+Singleflight request coalescing
+
+Identical reads issued more than once per iteration (the current user's login, the
+repository inventory behind Phase 1 and the skip path, ``is_process_running`` on every
+browser open) share one result:
+
+- concurrent callers of the same key wait for the single in-flight call instead of
+  starting their own (always, also outside a scope)
+- inside request_coalescing_scope() (one monitoring iteration) a successful result is
+  also reused by later callers until the scope ends
+
+Failures are shared only with callers that were already waiting; the next caller tries
+again. Results are shared objects, so callers must not mutate them (copy instead).
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _InFlightCall:
+    """One running call that other callers of the same key can wait for."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+_in_flight: Dict[Hashable, _InFlightCall] = {}
+# Results reused until the outermost scope ends.
+# Using a dict to allow mutation without a `global` statement.
+_scope_state: Dict[str, Any] = {"depth": 0, "results": {}}
+_stats: Dict[str, int] = {"calls": 0, "shared": 0}
+_state_lock = threading.Lock()
+
+
+def coalesce(key: Hashable, fetch: Callable[[], T]) -> T:
+    """Return fetch()'s result, sharing it with every other caller of the same key.
+
+    Args:
+        key: Identity of the read (e.g. ("process_running", name))
+        fetch: Performs the read; called at most once per key while a call is in flight
+            (and at most once per scope when it succeeds inside request_coalescing_scope())
+    """
+    with _state_lock:
+        results = _scope_state["results"]
+        if _scope_state["depth"] > 0 and key in results:
+            _stats["shared"] += 1
+            return results[key]
+        call = _in_flight.get(key)
+        is_leader = call is None
+        if is_leader:
+            call = _InFlightCall()
+            _in_flight[key] = call
+            _stats["calls"] += 1
+        else:
+            _stats["shared"] += 1
+
+    if not is_leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = fetch()
+    except BaseException as error:
+        call.error = error
+        raise
+    finally:
+        with _state_lock:
+            _in_flight.pop(key, None)
+            if call.error is None and _scope_state["depth"] > 0:
+                _scope_state["results"][key] = call.result
+        call.done.set()
+    return call.result
+
+
+@contextmanager
+def request_coalescing_scope() -> Iterator[None]:
+    """Reuse successful coalesced reads until the block (one monitoring iteration) ends.
+
+    Scopes may be nested; results are dropped when the outermost scope exits.
+    """
+    with _state_lock:
+        _scope_state["depth"] += 1
+    try:
+        yield
+    finally:
+        with _state_lock:
+            _scope_state["depth"] -= 1
+            if _scope_state["depth"] == 0:
+                _scope_state["results"] = {}
+
+
+def get_coalescing_stats() -> Dict[str, int]:
+    """Return how many reads were performed ("calls") and answered from a shared result ("shared")."""
+    with _state_lock:
+        return dict(_stats)
+
+
+def reset_coalescing_stats() -> None:
+    """Reset the counters (useful for tests)."""
+    with _state_lock:
+        _stats["calls"] = 0
+        _stats["shared"] = 0
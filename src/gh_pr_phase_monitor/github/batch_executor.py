@@ -0,0 +1,101 @@
+"""
+Bounded concurrent execution of aliased GraphQL batches
+
+pr_fetcher and issue_fetcher split repositories into chunks that are each sent as one
+aliased GraphQL query. This module dispatches those chunks through a bounded worker
+pool, returns the results in the original chunk order, and stops dispatching further
+chunks as soon as one of them fails (e.g. with GitHubRateLimitError).
+"""
+
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Callable, List, Sequence, TypeVar
+
+from ..core.config import DEFAULT_GRAPHQL_MAX_CONCURRENCY
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Maximum number of GraphQL batches in flight at the same time
+_graphql_max_concurrency: int = DEFAULT_GRAPHQL_MAX_CONCURRENCY
+
+
+class BatchCancelledError(RuntimeError):
+    """Raised inside a worker that was skipped because another batch already failed."""
+
+
+def set_graphql_max_concurrency(value: int) -> None:
+    """Set the maximum number of batches executed concurrently (values < 1 are treated as 1)."""
+    global _graphql_max_concurrency
+    _graphql_max_concurrency = max(1, int(value))
+
+
+def get_graphql_max_concurrency() -> int:
+    """Return the maximum number of batches executed concurrently."""
+    return _graphql_max_concurrency
+
+
+def run_batches(
+    batches: Sequence[T],
+    worker: Callable[[int, T], R],
+    max_concurrency: int | None = None,
+) -> List[R]:
+    """Run worker(batch_index, batch) for every batch using a bounded thread pool.
+
+    Results are returned in the same order as ``batches`` regardless of completion order.
+    When any batch raises, batches that have not started yet are cancelled, the
+    in-flight ones are awaited (their results are discarded), and the first exception
+    is re-raised — so a GitHubRateLimitError stops the whole fetch just like the
+    previous sequential loop did.
+
+    Args:
+        batches: Chunks to process
+        worker: Function called with (batch_index, batch)
+        max_concurrency: Override for the configured graphql_max_concurrency
+
+    Returns:
+        List of worker results in batch order
+    """
+    limit = max_concurrency if max_concurrency is not None else _graphql_max_concurrency
+    limit = max(1, min(limit, len(batches)))
+
+    if limit <= 1:
+        return [worker(idx, batch) for idx, batch in enumerate(batches)]
+
+    cancelled = threading.Event()
+
+    def _run(idx: int, batch: T) -> R:
+        if cancelled.is_set():
+            raise BatchCancelledError(f"batch {idx + 1} cancelled after an earlier failure")
+        try:
+            return worker(idx, batch)
+        except BaseException:
+            # Flag the failure before this thread can pick up the next queued batch
+            cancelled.set()
+            raise
+
+    with ThreadPoolExecutor(max_workers=limit, thread_name_prefix="graphql-batch") as executor:
+        futures = [executor.submit(_run, idx, batch) for idx, batch in enumerate(batches)]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+            failed = [f for f in done if not f.cancelled() and f.exception() is not None]
+            if failed:
+                cancelled.set()
+                # Drop the queued batches now so leaving the block only waits for in-flight ones
+                executor.shutdown(wait=False, cancel_futures=True)
+                # Prefer the error of the earliest failing batch that was not a cancellation
+                first_error = next(
+                    (
+                        f.exception()
+                        for f in futures
+                        if f.done()
+                        and not f.cancelled()
+                        and f.exception() is not None
+                        and not isinstance(f.exception(), BatchCancelledError)
+                    ),
+                    failed[0].exception(),
+                )
+                raise first_error
+
+    return [future.result() for future in futures]
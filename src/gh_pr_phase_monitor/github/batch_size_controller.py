@@ -0,0 +1,165 @@
+"""
+Adaptive alias batch sizing for aliased GraphQL queries
+
+The best number of repositories per aliased query varies a lot: a batch of repos with
+one PR each is cheap, while repos with dozens of PRs carrying 100 review threads each
+can time out or hit GitHub's node limit. This module learns a batch size per query kind
+from the ``rateLimit.cost`` the queries already request and from the measured response
+time (additive increase, multiplicative decrease):
+
+- cheap and fast batches grow the size by BATCH_SIZE_GROWTH_STEP
+- slow batches shrink it by SLOW_RESPONSE_SHRINK_FACTOR
+- timeouts / node-limit errors halve it, and the failed batch is retried in halves
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+from .graphql_client import GitHubRateLimitError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+MIN_BATCH_SIZE = 1
+
+# Growth happens only when a full batch cost at most this many points and answered this fast
+CHEAP_BATCH_COST_POINTS = 10
+FAST_RESPONSE_SECONDS = 3.0
+BATCH_SIZE_GROWTH_STEP = 2
+
+# Batches slower than this shrink the size for the next iteration
+SLOW_RESPONSE_SECONDS = 10.0
+SLOW_RESPONSE_SHRINK_FACTOR = 0.75
+
+# Error message fragments that indicate the batch was too large rather than a generic failure
+_BATCH_TOO_LARGE_MARKERS = (
+    "max_node_limit_exceeded",
+    "exceeds the maximum",
+    "node limit",
+    "timeout",
+    "timed out",
+    "timedout",
+    "something went wrong while executing your query",
+    "http 502",
+    "http 504",
+)
+
+# Learned batch size per query kind (e.g. "pr_details", "issues")
+_batch_sizes: Dict[str, int] = {}
+_batch_size_limits: Dict[str, int] = {}
+_state_lock = threading.Lock()
+
+
+def get_batch_size(kind: str, initial_size: int, max_size: int) -> int:
+    """Return the current batch size for a query kind, initialising it on first use.
+
+    Args:
+        kind: Query kind key (e.g. "pr_details")
+        initial_size: Size used before anything has been learned
+        max_size: Upper bound for this kind (e.g. derived from GitHub's node limit)
+    """
+    with _state_lock:
+        _batch_size_limits[kind] = max_size
+        if kind not in _batch_sizes:
+            _batch_sizes[kind] = max(MIN_BATCH_SIZE, min(initial_size, max_size))
+        return _batch_sizes[kind]
+
+
+def _set_batch_size(kind: str, new_size: int, reason: str) -> None:
+    """Update the learned size (caller holds _state_lock) and log changes."""
+    max_size = _batch_size_limits.get(kind, new_size)
+    new_size = max(MIN_BATCH_SIZE, min(new_size, max_size))
+    old_size = _batch_sizes.get(kind, new_size)
+    if new_size != old_size:
+        print(f"  [GraphQL] バッチサイズ調整 ({kind}): {old_size} → {new_size} ({reason})")
+    _batch_sizes[kind] = new_size
+
+
+def record_batch_success(kind: str, batch_size: int, cost: Any, elapsed_seconds: float) -> None:
+    """Feed the result of a successful batch back into the controller.
+
+    Args:
+        kind: Query kind key
+        batch_size: Number of repositories in the batch that was sent
+        cost: rateLimit.cost reported by GitHub (None when unavailable)
+        elapsed_seconds: Measured response time
+    """
+    with _state_lock:
+        current = _batch_sizes.get(kind)
+        if current is None:
+            return
+        if elapsed_seconds > SLOW_RESPONSE_SECONDS:
+            _set_batch_size(kind, int(current * SLOW_RESPONSE_SHRINK_FACTOR), f"slow response {elapsed_seconds:.1f}s")
+            return
+        # Only a full-size batch tells us anything about whether a larger batch would be fine
+        if batch_size < current:
+            return
+        is_cheap = isinstance(cost, (int, float)) and cost <= CHEAP_BATCH_COST_POINTS
+        if is_cheap and elapsed_seconds < FAST_RESPONSE_SECONDS:
+            _set_batch_size(kind, current + BATCH_SIZE_GROWTH_STEP, f"cost={cost}, {elapsed_seconds:.1f}s")
+
+
+def is_batch_too_large_error(error: BaseException) -> bool:
+    """Return True when an error indicates the query was too large (timeout, node limit, 502/504)."""
+    if isinstance(error, GitHubRateLimitError):
+        return False
+    message = str(error).lower()
+    return any(marker in message for marker in _BATCH_TOO_LARGE_MARKERS)
+
+
+def record_batch_too_large(kind: str, batch_size: int) -> None:
+    """Halve the learned size after a timeout or node-limit error for a batch of batch_size."""
+    with _state_lock:
+        if kind not in _batch_sizes:
+            return
+        _set_batch_size(kind, min(_batch_sizes[kind], batch_size) // 2, "timeout/node limit")
+
+
+def split_into_batches(items: List[T], batch_size: int) -> List[List[T]]:
+    """Split items into consecutive batches of at most batch_size."""
+    size = max(MIN_BATCH_SIZE, batch_size)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def fetch_batch_adaptively(
+    kind: str,
+    batch: List[T],
+    fetch: Callable[[List[T]], Tuple[List[R], Dict[str, Any]]],
+) -> List[R]:
+    """Run one aliased batch, feed cost/latency back to the controller, and split on size errors.
+
+    Args:
+        kind: Query kind key
+        batch: Items (repositories) for this batch
+        fetch: Function executing the query for a batch; returns (results, raw GraphQL response)
+
+    Returns:
+        Results for every item in the batch, in order.
+
+    Raises:
+        Any error from fetch that is not a "batch too large" error, or a size error on a
+        single-item batch (which cannot be split further).
+    """
+    start = time.monotonic()
+    try:
+        results, response = fetch(batch)
+    except Exception as error:
+        if len(batch) <= MIN_BATCH_SIZE or not is_batch_too_large_error(error):
+            raise
+        record_batch_too_large(kind, len(batch))
+        half = (len(batch) + 1) // 2
+        print(f"  [GraphQL] バッチが大きすぎるため分割して再試行 ({kind}: {len(batch)} → {half}+{len(batch) - half})")
+        return fetch_batch_adaptively(kind, batch[:half], fetch) + fetch_batch_adaptively(kind, batch[half:], fetch)
+
+    elapsed = time.monotonic() - start
+    cost = (((response or {}).get("data") or {}).get("rateLimit") or {}).get("cost")
+    record_batch_success(kind, len(batch), cost, elapsed)
+    return results
+
+
+def reset_batch_size_state() -> None:
+    """Forget all learned batch sizes (useful for tests)."""
+    with _state_lock:
+        _batch_sizes.clear()
+        _batch_size_limits.clear()
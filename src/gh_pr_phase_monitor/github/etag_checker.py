@@ -1,11 +1,15 @@
 """ETag-based repository change detection using GitHub REST API conditional requests.
 
 Uses HTTP If-None-Match headers so that unchanged pages return 304 Not Modified
-without consuming GitHub API rate-limit points.
+without consuming GitHub API rate-limit points. Pages already known from the previous
+check are probed concurrently; new pages are discovered sequentially via Link: next.
 """
 
 import subprocess
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .gh_api_response import parse_gh_api_response
 
 # Per-page ETag storage: page_number -> ETag string
 _page_etags: Dict[int, str] = {}
@@ -16,6 +20,9 @@ _last_page_count: int = 0
 # Whether any ETag has been established (first-call tracker)
 _initialized: bool = False
 
+# Maximum number of known pages probed at the same time
+ETAG_PROBE_MAX_CONCURRENCY = 8
+
 
 def _run_repos_api(page: int, etag: Optional[str] = None) -> subprocess.CompletedProcess:
     """Run gh api --include for a page of /user/repos with an optional If-None-Match header."""
@@ -43,67 +50,47 @@ def _parse_response(output: str) -> Tuple[bool, Optional[str], bool]:
         etag:          The ETag value from response headers, or None if absent.
         has_next_page: True when the Link header contains rel="next".
     """
-    lines = output.split("\n")
-    if not lines:
-        return False, None, False
-
-    # The first line is the HTTP status line, e.g. "HTTP/2 200" or "HTTP/2 304"
-    first_line = lines[0].strip()
-    if "304" in first_line:
+    status_code, headers, _body = parse_gh_api_response(output)
+    if status_code == 304:
         return True, None, False
+    return False, headers.get("etag"), 'rel="next"' in headers.get("link", "")
 
-    etag: Optional[str] = None
-    has_next_page = False
-    in_headers = True
 
-    for line in lines[1:]:
-        if in_headers:
-            stripped = line.strip()
-            if not stripped:
-                # Empty line separates HTTP headers from the response body
-                in_headers = False
-                continue
-            lower = stripped.lower()
-            if lower.startswith("etag:"):
-                etag = stripped.split(":", 1)[1].strip()
-            elif lower.startswith("link:") and 'rel="next"' in stripped:
-                has_next_page = True
+def _probe_page(page: int) -> Tuple[bool, Optional[str], bool]:
+    """Send one conditional request for a page with its stored ETag and parse the response."""
+    result = _run_repos_api(page, _page_etags.get(page))
+    return _parse_response(result.stdout or "")
 
-    return False, etag, has_next_page
 
+def _probe_known_pages(page_count: int) -> List[Tuple[bool, Optional[str], bool]]:
+    """Probe pages 1..page_count concurrently; results are returned in page order."""
+    if page_count == 1:
+        return [_probe_page(1)]
+    with ThreadPoolExecutor(max_workers=min(ETAG_PROBE_MAX_CONCURRENCY, page_count)) as pool:
+        return list(pool.map(_probe_page, range(1, page_count + 1)))
 
-def check_repos_etag_changed() -> Optional[bool]:
-    """Check whether any repository has changed by using per-page ETags on GET /user/repos.
 
-    Sends ``If-None-Match`` headers (HTTP conditional GET) so that pages whose
-    content has not changed return **304 Not Modified**, which does **not** consume
-    GitHub API rate-limit points.
+def _store_last_page(page: int) -> None:
+    """Record page as the last page and purge stale ETags beyond it (e.g. repos were deleted)."""
+    global _last_page_count
+    _last_page_count = page
+    for p in list(_page_etags):
+        if p > page:
+            del _page_etags[p]
 
-    On the first call no ETags are stored yet, so every page returns 200 and the
-    ETags are saved as a baseline.
 
-    On subsequent calls:
-    - Pages that have not changed return 304 (free, no rate-limit cost).
-    - Pages that have changed return 200 with a new ETag.
+def _discover_pages(start_page: int) -> bool:
+    """Walk pages sequentially from start_page following Link: next.
 
     Returns:
-        None  — first call; baseline ETags stored; treat as possibly changed.
-        False — all pages returned 304; nothing changed; GraphQL check can be skipped.
-        True  — at least one page returned 200 (or an error occurred); proceed
-                with the full updatedAt GraphQL check.
+        True if any page returned 200 (changed), False otherwise
     """
-    global _page_etags, _last_page_count, _initialized
+    global _initialized
 
-    is_first_call = not _initialized
     any_changed = False
-    page = 1
-
+    page = start_page
     while True:
-        etag = _page_etags.get(page)
-        result = _run_repos_api(page, etag)
-        output = result.stdout or ""
-
-        is_304, new_etag, has_next = _parse_response(output)
+        is_304, new_etag, has_next = _probe_page(page)
 
         if is_304:
             # This page is unchanged; check the next page only if we know it existed.
@@ -120,20 +107,101 @@ def check_repos_etag_changed() -> Optional[bool]:
         _initialized = True
 
         if not has_next:
-            _last_page_count = page
-            # Purge stale ETags for pages that no longer exist (e.g. repos were deleted).
-            for p in list(_page_etags):
-                if p > page:
-                    del _page_etags[p]
+            _store_last_page(page)
             break
         page += 1
 
+    return any_changed
+
+
+def check_repos_etag_changed() -> Optional[bool]:
+    """Check whether any repository has changed by using per-page ETags on GET /user/repos.
+
+    Sends ``If-None-Match`` headers (HTTP conditional GET) so that pages whose
+    content has not changed return **304 Not Modified**, which does **not** consume
+    GitHub API rate-limit points.
+
+    On the first call no ETags are stored yet, so every page returns 200 and the
+    ETags are saved as a baseline.
+
+    On subsequent calls all pages known from the previous check are probed
+    concurrently (one round trip instead of one per page):
+    - Pages that have not changed return 304 (free, no rate-limit cost).
+    - Pages that have changed return 200 with a new ETag.
+    - If the last known page now links to a next page, the new pages are
+      discovered sequentially; if an earlier page has become the last one,
+      the stale ETags beyond it are purged.
+
+    Returns:
+        None  — first call; baseline ETags stored; treat as possibly changed.
+        False — all pages returned 304; nothing changed; GraphQL check can be skipped.
+        True  — at least one page returned 200 (or an error occurred); proceed
+                with the full updatedAt GraphQL check.
+    """
+    global _initialized
+
+    is_first_call = not _initialized
+    known_page_count = _last_page_count
+
+    if known_page_count == 0:
+        any_changed = _discover_pages(1)
+    else:
+        any_changed = False
+        grew = False
+        for page, (is_304, new_etag, has_next) in enumerate(_probe_known_pages(known_page_count), start=1):
+            if is_304:
+                continue
+
+            if new_etag:
+                _page_etags[page] = new_etag
+            any_changed = True
+            _initialized = True
+
+            if not has_next:
+                # Responses for pages beyond the new last page are meaningless
+                _store_last_page(page)
+                break
+            if page == known_page_count:
+                grew = True
+
+        if grew:
+            any_changed = _discover_pages(known_page_count + 1) or any_changed
+
     if is_first_call:
         return None
 
     return any_changed
 
 
+def export_etag_state() -> Dict[str, Any]:
+    """Return the per-page ETag baseline in a JSON-serializable form (see import_etag_state)."""
+    return {
+        "page_etags": {str(page): etag for page, etag in _page_etags.items()},
+        "last_page_count": _last_page_count,
+    }
+
+
+def import_etag_state(state: Dict[str, Any]) -> None:
+    """Restore a baseline produced by export_etag_state (e.g. after a restart).
+
+    Raises:
+        ValueError: If the state is malformed (nothing is restored then)
+    """
+    global _last_page_count, _initialized
+    page_etags = state.get("page_etags")
+    last_page_count = state.get("last_page_count")
+    if not isinstance(page_etags, dict) or not isinstance(last_page_count, int) or last_page_count < 0:
+        raise ValueError("invalid repository page ETag baseline")
+    try:
+        restored = {int(page): etag for page, etag in page_etags.items() if isinstance(etag, str) and etag}
+    except ValueError as e:
+        raise ValueError("invalid repository page ETag baseline") from e
+    _page_etags.clear()
+    _page_etags.update(restored)
+    _last_page_count = last_page_count
+    _initialized = bool(restored)
+
+
 def reset_etag_state() -> None:
     """Reset all ETag state (useful for tests or when monitoring state needs a full refresh)."""
     global _page_etags, _last_page_count, _initialized
@@ -0,0 +1,202 @@
+"""Event-feed-driven repository change detection using the GitHub user events API.
+
+``/users/{user}/events`` (the user's own activity) and ``/users/{user}/received_events``
+(activity on watched repositories, which includes the user's own repositories) list
+exactly which repositories saw a push, PR, issue or review. Both feeds support ETags
+(unchanged feeds return 304 Not Modified, free of rate-limit cost) and announce an
+``X-Poll-Interval`` that clients must respect.
+
+check_repos_changed_via_events() reads only the events newer than the last one seen and
+answers with the same contract as get_repos_changed_since_last_check(), or None when the
+feed cannot answer reliably (first call, API error, or more new events than the feed
+retains), in which case the caller falls back to the ETag / updatedAt check. Until a
+feed's poll interval has elapsed it is not requested and reports no change; the new
+events are picked up by the next allowed poll.
+
+Note: GitHub delivers events with a latency of 30 seconds up to several hours, so this
+source trades detection latency for fewer API calls. It is disabled by default.
+"""
+
+import json
+import subprocess
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .gh_api_response import parse_gh_api_response, poll_interval_seconds
+
+EVENT_FEEDS = ("events", "received_events")
+
+# Event types that change what the monitor displays (PRs, issues, reviews, branches)
+RELEVANT_EVENT_TYPES = frozenset(
+    {
+        "PushEvent",
+        "PullRequestEvent",
+        "PullRequestReviewEvent",
+        "PullRequestReviewCommentEvent",
+        "IssuesEvent",
+        "IssueCommentEvent",
+        "CreateEvent",
+        "DeleteEvent",
+    }
+)
+
+EVENT_FEED_PAGE_SIZE = 100
+# The events API serves at most 300 events per feed; older events are out of the window
+EVENT_FEED_MAX_PAGES = 3
+
+_enabled: bool = False
+
+# Per-feed state: feed -> {"etag": str | None, "last_event_id": int, "next_poll_at": float}
+_feed_state: Dict[str, Dict[str, Any]] = {}
+
+# Indirection so tests can control the poll interval clock
+_clock = time.monotonic
+
+
+def set_event_feed_enabled(enabled: bool) -> None:
+    """Enable or disable the event feed as the first-stage change source."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_event_feed_enabled() -> bool:
+    """Return whether the event feed is used as the first-stage change source."""
+    return _enabled
+
+
+def _run_events_api(user: str, feed: str, page: int, etag: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run gh api --include for a page of an event feed with an optional If-None-Match header."""
+    args = ["gh", "api", "--include", f"/users/{user}/{feed}?per_page={EVENT_FEED_PAGE_SIZE}&page={page}"]
+    if etag:
+        args.extend(["-H", f"If-None-Match: {etag}"])
+    return subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+
+
+def _event_id(event: Dict[str, Any]) -> Optional[int]:
+    """Return the numeric id of an event (ids grow monotonically), or None if missing."""
+    value = str(event.get("id", ""))
+    return int(value) if value.isdigit() else None
+
+
+def _changed_repo_name(event: Dict[str, Any], user: str) -> Optional[str]:
+    """Return the name of the user-owned repository a relevant event touched, if any."""
+    if event.get("type") not in RELEVANT_EVENT_TYPES:
+        return None
+    owner, _, name = str((event.get("repo") or {}).get("name", "")).partition("/")
+    if not name or owner.lower() != user.lower():
+        # Only user-owned repositories are monitored (same scope as the repository inventory)
+        return None
+    return name
+
+
+def _fetch_events_page(
+    user: str, feed: str, page: int, etag: Optional[str]
+) -> Tuple[Optional[int], Dict[str, str], List]:
+    """Fetch one page of a feed; returns (status_code, headers, events)."""
+    result = _run_events_api(user, feed, page, etag)
+    status_code, headers, body = parse_gh_api_response(result.stdout or "")
+    if status_code != 200:
+        return status_code, headers, []
+    events = json.loads(body)
+    if not isinstance(events, list):
+        raise ValueError(f"unexpected {feed} response")
+    return status_code, headers, events
+
+
+def _poll_feed(user: str, feed: str) -> Optional[Set[str]]:
+    """Read the events of one feed that are newer than the last seen event.
+
+    Returns:
+        Names of user-owned repositories touched by new relevant events (empty while the
+        poll interval has not elapsed; the next allowed poll reports them), or None when
+        the feed cannot answer (first call, error, window exceeded)
+    """
+    state = _feed_state.get(feed)
+    if state is not None and _clock() < state["next_poll_at"]:
+        return set()
+
+    last_event_id = state["last_event_id"] if state is not None else None
+    status_code, headers, events = _fetch_events_page(user, feed, 1, state["etag"] if state is not None else None)
+    if status_code is None or status_code not in (200, 304):
+        return None
+
+    next_poll_at = _clock() + poll_interval_seconds(headers)
+    if status_code == 304 and state is not None:
+        state["next_poll_at"] = next_poll_at
+        return set()
+
+    etag = headers.get("etag")
+    newest_event_id = next((event_id for event_id in map(_event_id, events) if event_id is not None), None)
+    changed: Set[str] = set()
+    reached_known = False
+    page = 1
+    while last_event_id is not None:
+        for event in events:
+            event_id = _event_id(event)
+            if event_id is not None and event_id <= last_event_id:
+                reached_known = True
+                break
+            name = _changed_repo_name(event, user)
+            if name:
+                changed.add(name)
+        if reached_known or len(events) < EVENT_FEED_PAGE_SIZE:
+            # A short page is the end of the feed: everything newer than an empty baseline was read
+            reached_known = reached_known or last_event_id == 0
+            break
+        page += 1
+        if page > EVENT_FEED_MAX_PAGES:
+            break
+        status_code, _, events = _fetch_events_page(user, feed, page, None)
+        if status_code != 200:
+            break
+
+    _feed_state[feed] = {
+        "etag": etag,
+        "last_event_id": newest_event_id if newest_event_id is not None else (last_event_id or 0),
+        "next_poll_at": next_poll_at,
+    }
+    if last_event_id is None:
+        # First call: baseline established
+        return None
+    if not reached_known:
+        print(f"  イベントフィード({feed}): 前回以降のイベントが取得可能な範囲を超えました → 通常の変化検知へ")
+        return None
+    return changed
+
+
+def check_repos_changed_via_events(user: str) -> Optional[Set[str]]:
+    """Find the user-owned repositories that changed since the last call from the event feeds.
+
+    Every feed is polled (so each one's baseline stays current) unless its X-Poll-Interval
+    has not elapsed yet; such a feed counts as unchanged.
+
+    Returns:
+        None if any feed could not answer (the caller must fall back to the ETag / updatedAt check).
+        Empty set if no relevant event happened since the last call.
+        Non-empty set of repository names touched by new relevant events.
+    """
+    changed: Set[str] = set()
+    complete = True
+    for feed in EVENT_FEEDS:
+        try:
+            feed_changed = _poll_feed(user, feed)
+        except (ValueError, OSError) as e:
+            print(f"  イベントフィード({feed})の取得に失敗しました: {e}")
+            feed_changed = None
+        if feed_changed is None:
+            complete = False
+        else:
+            changed |= feed_changed
+    return changed if complete else None
+
+
+def reset_event_feed_state() -> None:
+    """Forget all feed baselines (useful for tests or when monitoring state needs a full refresh)."""
+    _feed_state.clear()
@@ -0,0 +1,47 @@
+"""Parsing of ``gh api --include`` output shared by the REST pollers and ETag probes.
+
+``gh api --include`` prints the HTTP status line and the response headers before the
+body. Every REST response (including 304 Not Modified) carries the ``x-ratelimit-*``
+headers, so parsing a response also keeps the rate-limit tracker current for free.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from .rate_limit_tracker import record_rate_limit_headers
+
+# Used when a response carries no X-Poll-Interval header
+DEFAULT_POLL_INTERVAL_SECONDS = 60
+
+
+def parse_gh_api_response(output: str) -> Tuple[Optional[int], Dict[str, str], str]:
+    """Parse gh api --include output into (status_code, lower-cased headers, body).
+
+    status_code is None when the status line cannot be read.
+    """
+    lines = output.split("\n")
+
+    status_code: Optional[int] = None
+    status_parts = lines[0].split()
+    if len(status_parts) >= 2 and status_parts[0].upper().startswith("HTTP/") and status_parts[1].isdigit():
+        status_code = int(status_parts[1])
+
+    headers: Dict[str, str] = {}
+    body_start = len(lines)
+    for index, line in enumerate(lines[1:], start=1):
+        stripped = line.strip()
+        if not stripped:
+            # Empty line separates HTTP headers from the response body
+            body_start = index + 1
+            break
+        name, separator, value = stripped.partition(":")
+        if separator:
+            headers[name.strip().lower()] = value.strip()
+
+    record_rate_limit_headers(headers)
+    return status_code, headers, "\n".join(lines[body_start:])
+
+
+def poll_interval_seconds(headers: Dict[str, str]) -> float:
+    """Return the X-Poll-Interval announced by the server, in seconds."""
+    value = headers.get("x-poll-interval", "")
+    return float(value) if value.isdigit() else float(DEFAULT_POLL_INTERVAL_SECONDS)
@@ -4,6 +4,8 @@ GitHub authentication module
 
 import subprocess
 
+from ..core.request_coalescer import coalesce
+
 # Cache for current user to avoid repeated subprocess calls
 _current_user_cache = None
 
@@ -17,12 +19,18 @@ def get_current_user() -> str:
     Raises:
         RuntimeError: If unable to retrieve the current user (authentication failure)
     """
-    global _current_user_cache
-
     # Return cached value if available (only cache successful authentication)
     if _current_user_cache is not None and _current_user_cache != "":
         return _current_user_cache
 
+    # Concurrent first callers share one `gh api user` call
+    return coalesce("current_user", _fetch_current_user)
+
+
+def _fetch_current_user() -> str:
+    """Look up the current user's login via `gh api user` and cache it (see get_current_user)."""
+    global _current_user_cache
+
     cmd = ["gh", "api", "user", "--jq", ".login"]
 
     try:
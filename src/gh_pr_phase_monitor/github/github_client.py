@@ -34,6 +34,8 @@ from .repository_fetcher import (
     get_repos_changed_since_last_check,
     get_repositories_with_no_prs_and_open_issues,
     get_repositories_with_open_prs,
+    get_repository_inventory,
+    repository_inventory_scope,
     reset_repos_updated_at_baseline,
 )
 
@@ -45,6 +47,8 @@ __all__ = [
     "get_repos_changed_since_last_check",
     "reset_repos_updated_at_baseline",
     "get_repositories_with_no_prs_and_open_issues",
+    "get_repository_inventory",
+    "repository_inventory_scope",
     "get_pr_details_batch",
     "get_issues_from_repositories",
     "assign_issue_to_copilot",
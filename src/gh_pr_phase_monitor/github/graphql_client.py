@@ -1,10 +1,28 @@
 """
-GraphQL client module for executing queries via GitHub CLI
+GraphQL client module for executing queries via GitHub CLI or the in-process HTTPS transport
 """
 
 import json
 import subprocess
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
+
+from ..core.config import DEFAULT_GRAPHQL_TRANSPORT, GRAPHQL_TRANSPORT_GH, GRAPHQL_TRANSPORT_HTTP
+from . import graphql_response_cache, http_transport
+from .http_transport import GitHubTransportError
+from .query_budget_planner import record_query_cost
+from .query_cost_estimator import estimate_query_cost
+from .rate_limit_tracker import GRAPHQL_BUCKET, record_graphql_rate_limit, record_rate_limit_headers
+from .resilience import call_with_resilience, parse_retry_after, raise_if_transient
+
+# Name under which GraphQL retries are counted when no dependency-specific endpoint is given
+GRAPHQL_ENDPOINT = "graphql"
+
+# HTTP statuses that indicate a transient server-side failure worth retrying
+_TRANSIENT_HTTP_STATUSES = (500, 502, 503)
+
+# Transport used by execute_graphql_query ("gh" subprocess or in-process "http").
+# The gh CLI always remains the fallback when the HTTP transport is unavailable.
+_graphql_transport: str = DEFAULT_GRAPHQL_TRANSPORT
 
 
 class GitHubRateLimitError(RuntimeError):
@@ -49,31 +67,223 @@ def get_rate_limit_info() -> Dict[str, Any] | None:
 _get_graphql_rate_limit_info = get_rate_limit_info
 
 
+def set_graphql_transport(transport: str) -> None:
+    """Select the transport used by execute_graphql_query ("gh" or "http")."""
+    global _graphql_transport
+    if transport not in (GRAPHQL_TRANSPORT_GH, GRAPHQL_TRANSPORT_HTTP):
+        transport = DEFAULT_GRAPHQL_TRANSPORT
+    _graphql_transport = transport
+
+
+def get_graphql_transport() -> str:
+    """Return the currently selected GraphQL transport."""
+    return _graphql_transport
+
+
+def _build_rate_limit_error(graphql_limit_info: Dict[str, Any] | None) -> GitHubRateLimitError:
+    """Build the GitHubRateLimitError raised when the GraphQL quota is exhausted."""
+    if graphql_limit_info:
+        limit = graphql_limit_info.get("limit", "unknown")
+        used = graphql_limit_info.get("used", "unknown")
+        remaining = graphql_limit_info.get("remaining", "unknown")
+        reset = graphql_limit_info.get("reset", "unknown")
+        rate_limit_message = (
+            "GitHub API rate limit exceeded. "
+            f"GraphQL limit: used={used}, remaining={remaining}, limit={limit}, reset={reset}. "
+            "Wait for reset and retry."
+        )
+    else:
+        rate_limit_message = (
+            "GitHub API rate limit exceeded. "
+            "Wait for reset and retry. "
+            "You can check remaining quota with `gh api rate_limit`."
+        )
+    return GitHubRateLimitError(rate_limit_message, rate_limit_info=graphql_limit_info)
+
+
+def _rate_limit_info_from_headers(headers: Dict[str, str]) -> Dict[str, Any] | None:
+    """Build a rate-limit info dict (same keys as `gh api rate_limit`) from x-ratelimit-* headers."""
+    info: Dict[str, Any] = {}
+    for key in ("limit", "used", "remaining", "reset"):
+        value = headers.get(f"x-ratelimit-{key}")
+        if value is None:
+            continue
+        try:
+            info[key] = int(value)
+        except ValueError:
+            continue
+    return info or None
+
+
+def _display_query_cost(parsed: Dict[str, Any]) -> None:
+    """Display cost info if the query includes rateLimit in its response."""
+    rate_limit = (parsed.get("data") or {}).get("rateLimit", {})
+    if rate_limit and rate_limit.get("cost") is not None:
+        print(f"  [GraphQL] 消費コスト: {rate_limit.get('cost')}点, 残={rate_limit.get('remaining')}")
+
+
+def _charge_query_cost(parsed: Dict[str, Any], estimated_points: int) -> None:
+    """Charge a completed query against the iteration budget (actual cost when reported, else the estimate)."""
+    actual_cost = None
+    if isinstance(parsed, dict):
+        actual_cost = ((parsed.get("data") or {}).get("rateLimit") or {}).get("cost")
+    record_query_cost(actual_cost if isinstance(actual_cost, int) else estimated_points)
+
+
+def _execute_graphql_via_http(query: str, variables: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Execute a GraphQL query over the pooled in-process HTTPS transport.
+
+    Errors are mapped onto the same exceptions as the gh CLI path: rate-limit
+    exhaustion raises GitHubRateLimitError, transient failures (5xx, secondary rate
+    limits) raise TransientGitHubError, any other API error raises RuntimeError.
+
+    Raises:
+        GitHubTransportError: If the transport itself is unusable (no token, connection
+            failure, rejected credentials); the caller then falls back to the gh CLI.
+    """
+    payload: Dict[str, Any] = {"query": query}
+    if variables:
+        payload["variables"] = variables
+    body = json.dumps(payload).encode("utf-8")
+
+    status, headers, raw_body = http_transport.request(
+        "POST", "/graphql", body=body, headers={"Content-Type": "application/json"}
+    )
+    text = raw_body.decode("utf-8", errors="replace")
+    record_rate_limit_headers(headers, default_bucket=GRAPHQL_BUCKET)
+
+    if status == 401:
+        # The cached token may be stale; let the gh CLI (with its own credential store) handle it
+        http_transport.invalidate_auth_token()
+        raise GitHubTransportError("GitHub API rejected the token (HTTP 401)")
+
+    if status in (403, 429) or status in _TRANSIENT_HTTP_STATUSES:
+        # Secondary rate limits must be checked before the primary-limit wording they share
+        raise_if_transient(
+            f"HTTP {status}\n{text}" if status in _TRANSIENT_HTTP_STATUSES else text,
+            message=f"Error executing GraphQL query: HTTP {status}\n{text.strip()}",
+            retry_after=parse_retry_after(headers.get("retry-after")),
+        )
+
+    if status in (403, 429) and _is_rate_limit_exceeded_error(text):
+        print(f"Error executing GraphQL query: HTTP {status}")
+        graphql_limit_info = _rate_limit_info_from_headers(headers) or _get_graphql_rate_limit_info()
+        raise _build_rate_limit_error(graphql_limit_info)
+
+    if status < 200 or status >= 300:
+        error_message = f"Error executing GraphQL query: HTTP {status}\n{text.strip()}"
+        print(error_message)
+        raise RuntimeError(error_message)
+
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError as e:
+        error_message = f"Error parsing JSON response from GitHub API: {e}\nRaw output:\n{text}"
+        print(error_message)
+        raise RuntimeError(error_message) from e
+
+    errors = parsed.get("errors") if isinstance(parsed, dict) else None
+    if errors:
+        # gh api graphql exits non-zero whenever the response carries errors; mirror that here
+        messages = "; ".join(str(err.get("message", err)) if isinstance(err, dict) else str(err) for err in errors)
+        is_rate_limited = any(isinstance(err, dict) and err.get("type") == "RATE_LIMITED" for err in errors)
+        if is_rate_limited or _is_rate_limit_exceeded_error(messages):
+            print(f"Error executing GraphQL query: {messages}")
+            graphql_limit_info = _rate_limit_info_from_headers(headers) or _get_graphql_rate_limit_info()
+            raise _build_rate_limit_error(graphql_limit_info)
+        error_message = f"Error executing GraphQL query: {messages}"
+        print(error_message)
+        raise RuntimeError(error_message)
+
+    return parsed
+
+
 def execute_graphql_query(
-    query: str, variables: Dict[str, Any] | None = None, intent: str | None = None
+    query: str,
+    variables: Dict[str, Any] | None = None,
+    intent: str | None = None,
+    cache_kind: str | None = None,
+    cache_repositories: Iterable[str] | None = None,
+    endpoint: str | None = None,
 ) -> Dict[str, Any]:
-    """Execute a GraphQL query using gh CLI
+    """Execute a GraphQL query using the configured transport
+
+    With the "http" transport the query is sent over a pooled in-process HTTPS
+    connection; if that transport is unavailable the gh CLI is used instead.
 
     Args:
         query: GraphQL query string
         variables: Optional dictionary of GraphQL variables
         intent: Optional human-readable description of the query's purpose (displayed before execution)
+        cache_kind: Optional query kind; when graphql_cache_ttl_seconds sets a TTL for it,
+            identical queries are answered from the response cache until the TTL expires
+        cache_repositories: Repository names the response depends on, used to invalidate the
+            cached entry when their updatedAt changes (None = depends on all repositories)
+        endpoint: Optional dependency name (e.g. "issues"); when given, a circuit breaker skips
+            the query after repeated failures. Transient failures are retried either way.
 
     Returns:
         Parsed JSON response from GitHub API
 
     Raises:
+        CircuitOpenError: If endpoint's circuit breaker is open
         RuntimeError: If the query execution fails or the response cannot be parsed as JSON.
     """
+    cache_key = None
+    if cache_kind and graphql_response_cache.is_cache_enabled(cache_kind):
+        cache_key = graphql_response_cache.make_cache_key(query, variables)
+        cached = graphql_response_cache.get_cached_response(cache_kind, cache_key)
+        if cached is not None:
+            if intent:
+                print(f"  [GraphQL] クエリ意図: {intent} (キャッシュヒット: 0点)")
+            return cached
+
+    # Estimate locally before sending so the cost is known even when the response omits rateLimit
+    estimated_points = estimate_query_cost(query, variables)["points"]
     if intent:
-        print(f"  [GraphQL] クエリ意図: {intent}")
+        print(f"  [GraphQL] クエリ意図: {intent} (推定コスト: {estimated_points}点)")
+
+    def _attempt() -> Dict[str, Any]:
+        if _graphql_transport == GRAPHQL_TRANSPORT_HTTP:
+            try:
+                parsed = _execute_graphql_via_http(query, variables)
+            except GitHubTransportError as transport_error:
+                print(f"  [GraphQL] HTTP transport unavailable, falling back to gh CLI: {transport_error}")
+            else:
+                _display_query_cost(parsed)
+                return parsed
+        return _execute_graphql_via_gh(query, variables)
+
+    parsed = call_with_resilience(
+        endpoint or GRAPHQL_ENDPOINT,
+        _attempt,
+        # Queries are reads; mutations must not be replayed
+        idempotent=not query.lstrip().startswith("mutation"),
+        use_circuit_breaker=endpoint is not None,
+    )
+    _charge_query_cost(parsed, estimated_points)
+    record_graphql_rate_limit(parsed)
+
+    if cache_key is not None:
+        graphql_response_cache.store_response(cache_kind, cache_key, parsed, cache_repositories)
+    return parsed
+
 
+def _execute_graphql_via_gh(query: str, variables: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Execute a GraphQL query by spawning `gh api graphql`."""
     cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
 
-    # Add variables to command if provided
+    # Add variables to command if provided.
+    # Strings use -f (raw) so names like "123" or "true" are not coerced by gh;
+    # None is omitted, which GraphQL treats as null for nullable variables (e.g. the first-page $after).
     if variables:
         for key, value in variables.items():
-            cmd.extend(["-F", f"{key}={value}"])
+            if value is None:
+                continue
+            if isinstance(value, str):
+                cmd.extend(["-f", f"{key}={value}"])
+            else:
+                cmd.extend(["-F", f"{key}={json.dumps(value) if isinstance(value, bool) else value}"])
 
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", check=True)
@@ -84,11 +294,7 @@ def execute_graphql_query(
             print(error_message)
             raise RuntimeError(error_message) from e
 
-        # Display cost info if the query includes rateLimit in its response
-        rate_limit = parsed.get("data", {}).get("rateLimit", {})
-        if rate_limit and rate_limit.get("cost") is not None:
-            print(f"  [GraphQL] 消費コスト: {rate_limit.get('cost')}点, 残={rate_limit.get('remaining')}")
-
+        _display_query_cost(parsed)
         return parsed
 
     except subprocess.CalledProcessError as e:
@@ -98,24 +304,13 @@ def execute_graphql_query(
         if stderr_text:
             print(f"stderr: {stderr_text}")
 
+        # Keep stderr in the exception so callers can classify the failure (e.g. timeouts)
+        full_message = f"{error_message}\n{stderr_text}" if stderr_text else error_message
+
+        # Secondary rate limits must be checked before the primary-limit wording they share
+        raise_if_transient(stderr_text, message=full_message)
+
         if _is_rate_limit_exceeded_error(stderr_text):
-            graphql_limit_info = _get_graphql_rate_limit_info()
-            if graphql_limit_info:
-                limit = graphql_limit_info.get("limit", "unknown")
-                used = graphql_limit_info.get("used", "unknown")
-                remaining = graphql_limit_info.get("remaining", "unknown")
-                reset = graphql_limit_info.get("reset", "unknown")
-                rate_limit_message = (
-                    "GitHub API rate limit exceeded. "
-                    f"GraphQL limit: used={used}, remaining={remaining}, limit={limit}, reset={reset}. "
-                    "Wait for reset and retry."
-                )
-            else:
-                rate_limit_message = (
-                    "GitHub API rate limit exceeded. "
-                    "Wait for reset and retry. "
-                    "You can check remaining quota with `gh api rate_limit`."
-                )
-            raise GitHubRateLimitError(rate_limit_message, rate_limit_info=graphql_limit_info) from e
+            raise _build_rate_limit_error(_get_graphql_rate_limit_info()) from e
 
-        raise RuntimeError(error_message) from e
+        raise RuntimeError(full_message) from e
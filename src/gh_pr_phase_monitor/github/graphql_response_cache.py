@@ -0,0 +1,133 @@
+"""
+TTL response cache for GraphQL queries
+
+execute_graphql_query consults this cache for queries that pass a ``cache_kind``.
+Entries are keyed by the whitespace-normalized query text plus the sorted variables,
+expire after the TTL configured for their kind, and are tagged with the repository
+names they depend on so that get_repos_changed_since_last_check can drop exactly the
+entries of repositories whose updatedAt moved (entries tagged with no repositories,
+such as the repository inventory, depend on every repository).
+
+Caching is opt-in: kinds without a positive TTL in graphql_cache_ttl_seconds are
+never cached.
+"""
+
+import copy
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# TTL in seconds per query kind; kinds not listed (or <= 0) are not cached
+_cache_ttl_seconds: Dict[str, float] = {}
+
+# key -> (kind, expires_at, repository names the entry depends on (empty = all), response)
+_entries: Dict[str, Tuple[str, float, FrozenSet[str], Dict[str, Any]]] = {}
+_stats: Dict[str, Dict[str, int]] = {}
+_state_lock = threading.Lock()
+
+
+def set_graphql_cache_ttls(ttls: Optional[Dict[str, float]]) -> None:
+    """Configure the TTL per query kind and drop entries of kinds that are no longer cached."""
+    with _state_lock:
+        _cache_ttl_seconds.clear()
+        for kind, ttl in (ttls or {}).items():
+            if ttl > 0:
+                _cache_ttl_seconds[kind] = float(ttl)
+        for key in [key for key, entry in _entries.items() if entry[0] not in _cache_ttl_seconds]:
+            del _entries[key]
+
+
+def is_cache_enabled(kind: Optional[str] = None) -> bool:
+    """Return True if any kind (or the given kind) has a positive TTL."""
+    if kind is None:
+        return bool(_cache_ttl_seconds)
+    return kind in _cache_ttl_seconds
+
+
+def make_cache_key(query: str, variables: Optional[Dict[str, Any]]) -> str:
+    """Build a cache key from the normalized query text and sorted variables."""
+    normalized = _WHITESPACE_PATTERN.sub(" ", query).strip()
+    return normalized + "\n" + json.dumps(variables or {}, sort_keys=True, default=str)
+
+
+def _count(kind: str, field: str) -> None:
+    """Increment a hit/miss counter (caller holds _state_lock)."""
+    kind_stats = _stats.setdefault(kind, {"hits": 0, "misses": 0})
+    kind_stats[field] += 1
+
+
+def get_cached_response(kind: str, key: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of a fresh cached response, or None on a miss."""
+    if kind not in _cache_ttl_seconds:
+        return None
+    with _state_lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[1] <= time.monotonic():
+            del _entries[key]
+            entry = None
+        if entry is None:
+            _count(kind, "misses")
+            return None
+        _count(kind, "hits")
+        response = entry[3]
+    # Callers own the returned dict; keep the cached copy pristine
+    return copy.deepcopy(response)
+
+
+def store_response(kind: str, key: str, response: Dict[str, Any], repositories: Optional[Iterable[str]]) -> None:
+    """Cache a successful response for its kind's TTL.
+
+    Args:
+        kind: Query kind
+        key: Key from make_cache_key
+        response: Parsed GraphQL response
+        repositories: Repository names the response depends on (None = all repositories)
+    """
+    ttl = _cache_ttl_seconds.get(kind)
+    if not ttl:
+        return
+    depends_on = frozenset(repositories or ())
+    with _state_lock:
+        _entries[key] = (kind, time.monotonic() + ttl, depends_on, copy.deepcopy(response))
+
+
+def invalidate_repositories(changed_repos: Optional[Iterable[str]]) -> int:
+    """Drop entries that depend on changed repositories.
+
+    Args:
+        changed_repos: Names of repositories whose updatedAt changed; None clears everything
+            (no baseline to compare against). Entries that depend on all repositories are
+            dropped whenever at least one repository changed.
+
+    Returns:
+        Number of entries removed
+    """
+    with _state_lock:
+        if changed_repos is None:
+            removed = len(_entries)
+            _entries.clear()
+            return removed
+        changed = set(changed_repos)
+        if not changed:
+            return 0
+        stale = [key for key, entry in _entries.items() if not entry[2] or entry[2] & changed]
+        for key in stale:
+            del _entries[key]
+        return len(stale)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return hit/miss counters per query kind (cumulative since start or last reset)."""
+    with _state_lock:
+        return {kind: dict(kind_stats) for kind, kind_stats in _stats.items()}
+
+
+def clear_graphql_response_cache() -> None:
+    """Drop all entries and reset the counters (useful for tests)."""
+    with _state_lock:
+        _entries.clear()
+        _stats.clear()
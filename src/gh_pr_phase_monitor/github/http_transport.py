@@ -0,0 +1,224 @@
+"""
+In-process HTTPS transport for the GitHub API
+
+Keeps a small pool of keep-alive connections to api.github.com and reads the auth
+token only once, so each API call no longer pays for a ``gh`` subprocess spawn,
+a token lookup and a fresh TLS handshake.
+"""
+
+import http.client
+import os
+import subprocess
+import threading
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_API_BASE_URL = "https://api.github.com"
+
+# Timeout for a single HTTP request (connect + read)
+HTTP_TIMEOUT_SECONDS = 30
+
+# Maximum number of idle keep-alive connections kept in the pool
+MAX_IDLE_CONNECTIONS = 8
+
+# Environment variables checked (in order) before falling back to `gh auth token`
+TOKEN_ENV_VARS = ("GH_TOKEN", "GITHUB_TOKEN")
+
+USER_AGENT = "cat-github-watcher"
+
+# Connection errors that indicate a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class GitHubTransportError(RuntimeError):
+    """Raised when the in-process transport cannot complete a request (no token, connection failure)."""
+
+
+_api_base_url: str = DEFAULT_API_BASE_URL
+_cached_token: Optional[str] = None
+_token_lock = threading.Lock()
+
+_idle_connections: List[http.client.HTTPConnection] = []
+_pool_lock = threading.Lock()
+
+
+def set_api_base_url(base_url: str) -> None:
+    """Point the transport at a different API root (e.g. a local stub server in tests).
+
+    Any pooled connections to the previous host are closed.
+    """
+    global _api_base_url
+    _api_base_url = base_url.rstrip("/")
+    _close_idle_connections()
+
+
+def get_api_base_url() -> str:
+    """Return the API root currently used by the transport."""
+    return _api_base_url
+
+
+def get_auth_token() -> str:
+    """Return the GitHub token, reading it only once per process.
+
+    The token is taken from ``GH_TOKEN`` / ``GITHUB_TOKEN`` if set, otherwise from
+    ``gh auth token``.
+
+    Raises:
+        GitHubTransportError: If no token can be obtained.
+    """
+    global _cached_token
+
+    with _token_lock:
+        if _cached_token:
+            return _cached_token
+
+        for env_var in TOKEN_ENV_VARS:
+            value = os.environ.get(env_var, "").strip()
+            if value:
+                _cached_token = value
+                return _cached_token
+
+        try:
+            result = subprocess.run(
+                ["gh", "auth", "token"],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                check=True,
+            )
+        except (subprocess.CalledProcessError, OSError) as e:
+            raise GitHubTransportError(f"Could not read GitHub token via `gh auth token`: {e}") from e
+
+        token = (result.stdout or "").strip()
+        if not token:
+            raise GitHubTransportError("`gh auth token` returned an empty token")
+        _cached_token = token
+        return _cached_token
+
+
+def invalidate_auth_token() -> None:
+    """Forget the cached token so the next request re-reads it (e.g. after a 401)."""
+    global _cached_token
+    with _token_lock:
+        _cached_token = None
+
+
+def _new_connection() -> http.client.HTTPConnection:
+    """Open a new connection to the configured API root."""
+    parsed = urllib.parse.urlsplit(_api_base_url)
+    if parsed.scheme == "http":
+        return http.client.HTTPConnection(parsed.hostname, parsed.port, timeout=HTTP_TIMEOUT_SECONDS)
+    return http.client.HTTPSConnection(parsed.hostname, parsed.port, timeout=HTTP_TIMEOUT_SECONDS)
+
+
+def _acquire_connection() -> Tuple[http.client.HTTPConnection, bool]:
+    """Take an idle connection from the pool, or open a new one.
+
+    Returns:
+        (connection, reused) where reused is True when the connection came from the pool.
+    """
+    with _pool_lock:
+        if _idle_connections:
+            return _idle_connections.pop(), True
+    return _new_connection(), False
+
+
+def _release_connection(conn: http.client.HTTPConnection) -> None:
+    """Return a healthy connection to the pool (or close it if the pool is full)."""
+    with _pool_lock:
+        if len(_idle_connections) < MAX_IDLE_CONNECTIONS:
+            _idle_connections.append(conn)
+            return
+    conn.close()
+
+
+def _close_idle_connections() -> None:
+    """Close and drop every pooled connection."""
+    with _pool_lock:
+        connections = list(_idle_connections)
+        _idle_connections.clear()
+    for conn in connections:
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+
+def _api_path(path: str) -> str:
+    """Join a request path onto the path prefix of the configured API root."""
+    prefix = urllib.parse.urlsplit(_api_base_url).path.rstrip("/")
+    if not path.startswith("/"):
+        path = "/" + path
+    return prefix + path
+
+
+def request(
+    method: str,
+    path: str,
+    body: Optional[bytes] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[int, Dict[str, str], bytes]:
+    """Send an authenticated request to the GitHub API over a pooled keep-alive connection.
+
+    A request that fails on a reused connection because the server already closed it
+    is retried once on a fresh connection.
+
+    Args:
+        method: HTTP method (e.g. "GET", "POST")
+        path: Request path relative to the API root (e.g. "/graphql", "/user/repos?page=1")
+        body: Optional request body
+        headers: Optional extra request headers
+
+    Returns:
+        (status, headers, body) where header names are lower-cased.
+
+    Raises:
+        GitHubTransportError: If no token is available or the connection fails.
+    """
+    request_headers = {
+        "Authorization": f"bearer {get_auth_token()}",
+        "User-Agent": USER_AGENT,
+        "Accept": "application/vnd.github+json",
+    }
+    if headers:
+        request_headers.update(headers)
+
+    full_path = _api_path(path)
+
+    for attempt in range(2):
+        conn, reused = _acquire_connection()
+        try:
+            conn.request(method, full_path, body=body, headers=request_headers)
+            response = conn.getresponse()
+            response_body = response.read()
+        except _STALE_CONNECTION_ERRORS as e:
+            conn.close()
+            if reused and attempt == 0:
+                continue
+            raise GitHubTransportError(f"HTTP {method} {path} failed: {e}") from e
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise GitHubTransportError(f"HTTP {method} {path} failed: {e}") from e
+
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+        if response.will_close:
+            conn.close()
+        else:
+            _release_connection(conn)
+        return response.status, response_headers, response_body
+
+    # Unreachable: the loop either returns or raises
+    raise GitHubTransportError(f"HTTP {method} {path} failed")
+
+
+def reset_transport() -> None:
+    """Close pooled connections and forget the cached token (useful for tests)."""
+    _close_idle_connections()
+    invalidate_auth_token()
@@ -2,13 +2,23 @@
 
 Uses HTTP If-None-Match headers so that repositories whose open issue list has not
 changed return 304 Not Modified without consuming GitHub API rate-limit points.
+Repositories are probed through a bounded worker pool, and the check can return as
+soon as the first changed repository is seen.
 """
 
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional, Tuple
 
+from .gh_api_response import parse_gh_api_response
+
 # Per-repo ETag storage: "{owner}/{repo}" -> ETag string
 _repo_issue_etags: Dict[str, str] = {}
+_etags_lock = threading.Lock()
+
+# Maximum number of repositories probed at the same time
+ISSUE_ETAG_PROBE_MAX_CONCURRENCY = 8
 
 
 def _run_issues_api(owner: str, repo: str, etag: Optional[str] = None) -> subprocess.CompletedProcess:
@@ -42,39 +52,39 @@ def _parse_issue_response(output: str) -> Tuple[bool, Optional[str]]:
         is_304: True when the server returned 304 Not Modified.
         etag:   The ETag value from response headers, or None if absent.
     """
-    lines = output.split("\n")
-    if not lines:
-        return False, None
-
-    # The first line is the HTTP status line, e.g. "HTTP/2 200" or "HTTP/2 304"
-    first_line = lines[0].strip()
-    if "304" in first_line:
+    status_code, headers, _body = parse_gh_api_response(output)
+    if status_code == 304:
         return True, None
+    return False, headers.get("etag")
 
-    found_etag: Optional[str] = None
-    in_headers = True
 
-    for line in lines[1:]:
-        if in_headers:
-            stripped = line.strip()
-            if not stripped:
-                # Empty line separates HTTP headers from the response body
-                in_headers = False
-                continue
-            lower = stripped.lower()
-            if lower.startswith("etag:"):
-                found_etag = stripped.split(":", 1)[1].strip()
+def _probe_repo(key: str, owner: str, name: str, stored_etag: Optional[str]) -> bool:
+    """Send one conditional request for a repository and record its new ETag.
 
-    return False, found_etag
+    Returns:
+        True if the repository's issues changed (200 or an unrecognized response)
+    """
+    result = _run_issues_api(owner, name, stored_etag)
+    is_304, new_etag = _parse_issue_response(result.stdout or "")
+    if is_304:
+        return False
+    # 200 OK (or an unrecognized error response) — treat as changed.
+    if new_etag:
+        with _etags_lock:
+            _repo_issue_etags[key] = new_etag
+    return True
 
 
-def check_issues_etag_changed(repos: List[Dict[str, Any]]) -> Optional[bool]:
+def check_issues_etag_changed(repos: List[Dict[str, Any]], early_exit: bool = True) -> Optional[bool]:
     """Check whether any repository's issues have changed using per-repo ETags.
 
     Sends ``If-None-Match`` headers (HTTP conditional GET) so that repositories whose
     open issue list has not changed return **304 Not Modified**, which does **not**
     consume GitHub API rate-limit points.
 
+    Repositories are probed concurrently (at most ISSUE_ETAG_PROBE_MAX_CONCURRENCY
+    requests at a time).
+
     On the first call for a repository no ETag is stored yet, so the response returns
     200 and the ETag is saved as a baseline.
 
@@ -84,6 +94,10 @@ def check_issues_etag_changed(repos: List[Dict[str, Any]]) -> Optional[bool]:
 
     Args:
         repos: List of repository dicts with 'name' and 'owner' keys.
+        early_exit: Return True as soon as the first changed repository is seen; probes
+            not yet started are cancelled, probes already in flight still record their
+            ETags. Ignored while any repository has no stored ETag (every repository must
+            be probed to establish the baseline).
 
     Returns:
         None  — at least one repo has no stored ETag (first call); baseline established.
@@ -93,47 +107,62 @@ def check_issues_etag_changed(repos: List[Dict[str, Any]]) -> Optional[bool]:
     if not repos:
         return False
 
-    any_first_call = False
-    any_changed = False
-    any_checked = False
-
+    probes: List[Tuple[str, str, str, Optional[str]]] = []
     for repo in repos:
         owner = repo.get("owner", "")
         name = repo.get("name", "")
         if not owner or not name:
             continue
-
-        any_checked = True
         key = f"{owner}/{name}"
-        stored_etag = _repo_issue_etags.get(key)
-
-        if stored_etag is None:
-            any_first_call = True
-
-        result = _run_issues_api(owner, name, stored_etag)
-        output = result.stdout or ""
-
-        is_304, new_etag = _parse_issue_response(output)
+        with _etags_lock:
+            probes.append((key, owner, name, _repo_issue_etags.get(key)))
 
-        if is_304:
-            # This repo's issues are unchanged
-            continue
-
-        # 200 OK (or an unrecognized error response) — treat as changed.
-        if new_etag:
-            _repo_issue_etags[key] = new_etag
-        any_changed = True
-
-    if not any_checked:
+    if not probes:
         # No valid repo entries were found; treat as changed to avoid silently skipping GraphQL.
         return True
 
+    any_first_call = any(stored_etag is None for _, _, _, stored_etag in probes)
+    stop_early = early_exit and not any_first_call
+    any_changed = False
+
+    pool = ThreadPoolExecutor(max_workers=min(ISSUE_ETAG_PROBE_MAX_CONCURRENCY, len(probes)))
+    try:
+        futures = [pool.submit(_probe_repo, *probe) for probe in probes]
+        for future in as_completed(futures):
+            if future.result():
+                any_changed = True
+                if stop_early:
+                    break
+    finally:
+        # On early exit, return without waiting; in-flight probes finish in the background
+        pool.shutdown(wait=not stop_early or not any_changed, cancel_futures=True)
+
     if any_first_call:
         return None
 
     return any_changed
 
 
+def export_issue_etag_state() -> Dict[str, str]:
+    """Return a copy of the per-repo issue ETag baseline ("{owner}/{repo}" -> ETag)."""
+    with _etags_lock:
+        return dict(_repo_issue_etags)
+
+
+def import_issue_etag_state(etags: Dict[str, str]) -> None:
+    """Restore a baseline produced by export_issue_etag_state (e.g. after a restart).
+
+    Raises:
+        ValueError: If the baseline is malformed (nothing is restored then)
+    """
+    if not isinstance(etags, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in etags.items()):
+        raise ValueError("invalid issue ETag baseline")
+    with _etags_lock:
+        _repo_issue_etags.clear()
+        _repo_issue_etags.update(etags)
+
+
 def reset_issue_etag_state() -> None:
     """Reset all issue ETag state (useful for tests or when monitoring state needs a full refresh)."""
-    _repo_issue_etags.clear()
+    with _etags_lock:
+        _repo_issue_etags.clear()
@@ -2,153 +2,143 @@
 Issue fetching module for GitHub issues
 """
 
-import json
 from typing import Any, Dict, List, Optional
 
 from ..browser.browser_automation import assign_issue_to_copilot_automated, is_pyautogui_available
+from .batch_executor import run_batches
+from .batch_size_controller import fetch_batch_adaptively, get_batch_size, split_into_batches
 from .graphql_client import execute_graphql_query
+from .query_budget_planner import PRIORITY_LOW, plan_batches
+from .query_cost_estimator import estimate_query_cost
+from .query_templates import (
+    aliased_repository_query,
+    aliased_repository_variables,
+    issues_selection,
+    repository_alias,
+)
 
 # GraphQL pagination constants
+# Initial repositories per aliased query; the actual size is learned by batch_size_controller
 REPOSITORIES_BATCH_SIZE = 10
-ISSUES_PER_REPO = 50
+MAX_REPOSITORIES_BATCH_SIZE = 50
+ISSUES_QUERY_KIND = "issues"
+
+
+def _build_issues_query(batch: List[Dict[str, Any]], labels: Optional[List[str]], sort_by_number: bool) -> str:
+    """Return the prebuilt aliased issues query for a batch of this size (see aliased_repository_variables)."""
+    return aliased_repository_query(issues_selection(sort_by_number, tuple(labels or ())), len(batch))
+
+
+def _parse_issues_response(data: Dict[str, Any], batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Transform one aliased issues response into issue dicts with repository info."""
+    batch_issues = []
+
+    # Extract issue data from response
+    for idx, repo in enumerate(batch):
+        alias = repository_alias(idx)
+        repo_data = data.get("data", {}).get(alias, {})
+
+        if repo_data:
+            issues = repo_data.get("issues", {}).get("nodes", [])
+            repo_name = repo_data.get("name", repo["name"])
+            owner = repo_data.get("owner", {}).get("login", repo["owner"])
+
+            # Add repository info to each issue
+            for issue in issues:
+                # Handle null author
+                author_data = issue.get("author")
+                if author_data is None:
+                    author = {"login": "[deleted]"}
+                else:
+                    author = {"login": author_data.get("login", "")}
+
+                # Extract label names
+                label_nodes = issue.get("labels", {}).get("nodes", [])
+                label_names = [label.get("name", "") for label in label_nodes]
+                assignee_nodes = issue.get("assignees", {}).get("nodes", [])
+                assignee_logins = [assignee.get("login", "") for assignee in assignee_nodes if assignee.get("login")]
+
+                issue_with_repo = {
+                    "title": issue.get("title", ""),
+                    "url": issue.get("url", ""),
+                    "number": issue.get("number", 0),
+                    "createdAt": issue.get("createdAt", ""),
+                    "updatedAt": issue.get("updatedAt", ""),
+                    "author": author,
+                    "labels": label_names,
+                    "assignees": assignee_logins,
+                    "repository": {"name": repo_name, "owner": owner},
+                }
+                batch_issues.append(issue_with_repo)
+
+    return batch_issues
 
 
 def get_issues_from_repositories(
-    repos: List[Dict[str, Any]], limit: int = 10, labels: Optional[List[str]] = None, sort_by_number: bool = False
+    repos: List[Dict[str, Any]],
+    limit: int = 10,
+    labels: Optional[List[str]] = None,
+    sort_by_number: bool = False,
+    fetch_status: Optional[Dict[str, Any]] = None,
 ) -> List[Dict[str, Any]]:
     """Get issues from multiple repositories, sorted by timestamp descending or by issue number ascending
 
+    Repositories are split into batches whose size is learned per query kind (starting
+    at REPOSITORIES_BATCH_SIZE); the batches are executed concurrently (bounded by graphql_max_concurrency) and merged in order.
+
     Args:
         repos: List of repository dicts with 'name' and 'owner' keys
         limit: Maximum number of issues to return (default: 10)
         labels: Optional list of label names to filter by (e.g., ["good first issue"])
         sort_by_number: If True, sort by issue number ascending; otherwise sort by updatedAt descending (default: False)
+        fetch_status: Optional dict that receives ``"dropped_repositories"``: the repositories whose
+            batches were trimmed by the point budget (empty when every repository was queried).
+            A non-empty list means the result is partial.
 
     Returns:
         List of issue data sorted by updatedAt timestamp in descending order or by issue number in ascending order
+
+    Raises:
+        QueryBudgetExceededError: If graphql_iteration_point_budget leaves no room for any batch
+        CircuitOpenError: If the issue listing is being skipped after repeated failures
     """
+    if fetch_status is not None:
+        fetch_status["dropped_repositories"] = []
     if not repos:
         return []
 
-    # Build GraphQL query to fetch issues from all repositories
-    # We'll batch repositories to avoid overly complex queries
-    all_issues = []
+    # We'll batch repositories to avoid overly complex queries; the size adapts to observed cost/latency
+    batch_size = get_batch_size(ISSUES_QUERY_KIND, REPOSITORIES_BATCH_SIZE, MAX_REPOSITORIES_BATCH_SIZE)
+    batches = split_into_batches(repos, batch_size)
+    # Issue listing is low priority: trim trailing batches that do not fit the iteration's point budget
+    planned_batches = plan_batches(
+        ISSUES_QUERY_KIND,
+        batches,
+        lambda batch: estimate_query_cost(_build_issues_query(batch, labels, sort_by_number))["points"],
+        PRIORITY_LOW,
+    )
+    if fetch_status is not None:
+        # plan_batches returns a prefix of the batches; the rest were not queried this iteration
+        fetch_status["dropped_repositories"] = [repo for batch in batches[len(planned_batches) :] for repo in batch]
+    batches = planned_batches
+
+    def _fetch_batch(batch_index: int, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        def _fetch(sub_batch: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+            data = execute_graphql_query(
+                _build_issues_query(sub_batch, labels, sort_by_number),
+                aliased_repository_variables(sub_batch),
+                intent=f"Issue一覧取得 (バッチ{batch_index + 1}: {len(sub_batch)}リポジトリ)",
+                cache_kind=ISSUES_QUERY_KIND,
+                cache_repositories=[repo["name"] for repo in sub_batch],
+                endpoint=ISSUES_QUERY_KIND,
+            )
+            return _parse_issues_response(data, sub_batch), data
+
+        return fetch_batch_adaptively(ISSUES_QUERY_KIND, batch, _fetch)
 
-    for i in range(0, len(repos), REPOSITORIES_BATCH_SIZE):
-        batch = repos[i : i + REPOSITORIES_BATCH_SIZE]
-
-        # Build query fragments for each repository
-        repo_queries = []
-        for idx, repo in enumerate(batch):
-            alias = f"repo{idx}"
-            repo_name = repo["name"]
-            owner = repo["owner"]
-
-            # Escape values to prevent GraphQL injection
-            owner_literal = json.dumps(owner)
-            repo_name_literal = json.dumps(repo_name)
-
-            # Build labels filter if provided
-            labels_filter = ""
-            if labels:
-                labels_json = json.dumps(labels)
-                labels_filter = f", labels: {labels_json}"
-
-            # Determine ordering based on sort_by_number parameter
-            # When sorting by number, we need to fetch issues ordered by CREATED_AT ascending
-            # (since issue numbers are assigned sequentially at creation time)
-            if sort_by_number:
-                order_clause = "orderBy: {field: CREATED_AT, direction: ASC}"
-            else:
-                order_clause = "orderBy: {field: UPDATED_AT, direction: DESC}"
-
-            # Fetch up to ISSUES_PER_REPO issues per repository
-            repo_query = f"""
-            {alias}: repository(owner: {owner_literal}, name: {repo_name_literal}) {{
-              name
-              owner {{
-                login
-              }}
-              issues(first: {ISSUES_PER_REPO}, states: OPEN, {order_clause}{labels_filter}) {{
-                nodes {{
-                  title
-                  url
-                  number
-                  createdAt
-                  updatedAt
-                  author {{
-                    login
-                  }}
-                  labels(first: 10) {{
-                    nodes {{
-                      name
-                    }}
-                  }}
-                  assignees(first: 10) {{
-                    nodes {{
-                      login
-                    }}
-                  }}
-                }}
-              }}
-            }}
-            """
-            repo_queries.append(repo_query)
-
-        # Combine all repository queries
-        full_query = f"""
-        query {{
-          {" ".join(repo_queries)}
-          rateLimit {{
-            cost
-            remaining
-          }}
-        }}
-        """
-
-        # Execute GraphQL query
-        batch_num = i // REPOSITORIES_BATCH_SIZE + 1
-        data = execute_graphql_query(full_query, intent=f"Issue一覧取得 (バッチ{batch_num}: {len(batch)}リポジトリ)")
-
-        # Extract issue data from response
-        for idx, repo in enumerate(batch):
-            alias = f"repo{idx}"
-            repo_data = data.get("data", {}).get(alias, {})
-
-            if repo_data:
-                issues = repo_data.get("issues", {}).get("nodes", [])
-                repo_name = repo_data.get("name", repo["name"])
-                owner = repo_data.get("owner", {}).get("login", repo["owner"])
-
-                # Add repository info to each issue
-                for issue in issues:
-                    # Handle null author
-                    author_data = issue.get("author")
-                    if author_data is None:
-                        author = {"login": "[deleted]"}
-                    else:
-                        author = {"login": author_data.get("login", "")}
-
-                    # Extract label names
-                    label_nodes = issue.get("labels", {}).get("nodes", [])
-                    label_names = [label.get("name", "") for label in label_nodes]
-                    assignee_nodes = issue.get("assignees", {}).get("nodes", [])
-                    assignee_logins = [
-                        assignee.get("login", "") for assignee in assignee_nodes if assignee.get("login")
-                    ]
-
-                    issue_with_repo = {
-                        "title": issue.get("title", ""),
-                        "url": issue.get("url", ""),
-                        "number": issue.get("number", 0),
-                        "createdAt": issue.get("createdAt", ""),
-                        "updatedAt": issue.get("updatedAt", ""),
-                        "author": author,
-                        "labels": label_names,
-                        "assignees": assignee_logins,
-                        "repository": {"name": repo_name, "owner": owner},
-                    }
-                    all_issues.append(issue_with_repo)
+    all_issues = []
+    for batch_issues in run_batches(batches, _fetch_batch):
+        all_issues.extend(batch_issues)
 
     # Sort all issues after combining results from multiple repositories
     # Note: Issues from each repository are already pre-sorted by the GraphQL API,
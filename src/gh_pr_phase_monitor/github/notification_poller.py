@@ -0,0 +1,207 @@
+"""Notification-driven selection of the PRs whose HTML is re-fetched on the skip path.
+
+When updatedAt is unchanged the monitor still re-fetches the HTML of every cached open
+PR each iteration, because Copilot phase changes do not move updatedAt. GET /notifications
+reports review requests, review submissions and comment activity per thread and supports
+``If-Modified-Since`` (an unchanged inbox returns 304 Not Modified, free of rate-limit
+cost). With ``pr_html_refetch_source = "notifications"``:
+
+- PRs with a notification thread updated since the previous poll are re-fetched
+- every other PR is re-fetched only on a slower safety cadence
+  (``pr_html_refetch_safety_interval_seconds`` since its last HTML fetch)
+- whenever the notifications cannot answer (first poll, error, more threads than one
+  page) every PR is re-fetched, as before
+"""
+
+import json
+import re
+import subprocess
+import threading
+import time
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.config import (
+    DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS,
+    PR_HTML_REFETCH_SOURCE_NOTIFICATIONS,
+)
+from .gh_api_response import parse_gh_api_response, poll_interval_seconds
+
+NOTIFICATIONS_PAGE_SIZE = 50
+
+_PR_HTML_URL_PATTERN = re.compile(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)", re.IGNORECASE)
+_PR_API_URL_PATTERN = re.compile(r"/repos/([^/]+)/([^/]+)/pulls/(\d+)", re.IGNORECASE)
+
+_enabled: bool = False
+_safety_interval_seconds: float = DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS
+
+# Poll state: {"last_modified": str | None, "since": str | None, "next_poll_at": float}
+_poll_state: Dict[str, Any] = {}
+# PR key (owner, repo, number) -> monotonic time of the last successful HTML fetch
+_last_html_fetch: Dict[Tuple[str, str, int], float] = {}
+_state_lock = threading.Lock()
+
+# Indirection so tests can control the clock
+_clock = time.monotonic
+
+
+def set_pr_html_refetch_settings(
+    source: str, safety_interval_seconds: float = DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS
+) -> None:
+    """Configure whether notifications select the PRs re-fetched on the skip path."""
+    global _enabled, _safety_interval_seconds
+    _enabled = source == PR_HTML_REFETCH_SOURCE_NOTIFICATIONS
+    _safety_interval_seconds = max(0.0, float(safety_interval_seconds))
+
+
+def _pr_key_from_html_url(url: str) -> Optional[Tuple[str, str, int]]:
+    """Return (owner, repo, number) for https://github.com/{owner}/{repo}/pull/{number}."""
+    match = _PR_HTML_URL_PATTERN.search(url or "")
+    if not match:
+        return None
+    return match.group(1).lower(), match.group(2).lower(), int(match.group(3))
+
+
+def _pr_key_from_api_url(url: str) -> Optional[Tuple[str, str, int]]:
+    """Return (owner, repo, number) for https://api.github.com/repos/{owner}/{repo}/pulls/{number}."""
+    match = _PR_API_URL_PATTERN.search(url or "")
+    if not match:
+        return None
+    return match.group(1).lower(), match.group(2).lower(), int(match.group(3))
+
+
+def record_pr_html_fetched(pr_url: str) -> None:
+    """Remember that a PR's HTML was just fetched (starts its safety cadence)."""
+    key = _pr_key_from_html_url(pr_url)
+    if key is not None:
+        with _state_lock:
+            _last_html_fetch[key] = _clock()
+
+
+def _run_notifications_api(since: Optional[str], last_modified: Optional[str]) -> subprocess.CompletedProcess:
+    """Run gh api --include for GET /notifications with an optional If-Modified-Since header."""
+    path = f"/notifications?all=true&per_page={NOTIFICATIONS_PAGE_SIZE}"
+    if since:
+        path += f"&since={since}"
+    args = ["gh", "api", "--include", path]
+    if last_modified:
+        args.extend(["-H", f"If-Modified-Since: {last_modified}"])
+    return subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+
+
+def _server_time_iso(headers: Dict[str, str]) -> Optional[str]:
+    """Convert the response's Date header into the ISO 8601 form the since parameter expects."""
+    try:
+        server_time = parsedate_to_datetime(headers.get("date", ""))
+    except (TypeError, ValueError):
+        return None
+    return server_time.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _poll_notifications() -> Optional[Set[Tuple[str, str, int]]]:
+    """Return the PRs with notification activity since the previous poll.
+
+    Before the server's X-Poll-Interval has elapsed no request is sent and an empty set is
+    returned; the activity is reported by the next poll (its since cursor did not move).
+
+    Returns:
+        Set of PR keys, or None when the notifications cannot answer (first poll, error,
+        more threads than one page)
+    """
+    if _poll_state and _clock() < _poll_state["next_poll_at"]:
+        return set()
+
+    result = _run_notifications_api(_poll_state.get("since"), _poll_state.get("last_modified"))
+    status_code, headers, body = parse_gh_api_response(result.stdout or "")
+    if status_code == 304 and _poll_state:
+        _poll_state["next_poll_at"] = _clock() + poll_interval_seconds(headers)
+        return set()
+    if status_code != 200:
+        return None
+
+    threads: List[Dict[str, Any]] = json.loads(body)
+    if not isinstance(threads, list):
+        raise ValueError("unexpected /notifications response")
+
+    is_first_poll = not _poll_state
+    _poll_state.update(
+        {
+            "last_modified": headers.get("last-modified"),
+            "since": _server_time_iso(headers) or _poll_state.get("since"),
+            "next_poll_at": _clock() + poll_interval_seconds(headers),
+        }
+    )
+    if is_first_poll or len(threads) >= NOTIFICATIONS_PAGE_SIZE:
+        return None
+
+    active: Set[Tuple[str, str, int]] = set()
+    for thread in threads:
+        subject = thread.get("subject") or {}
+        if subject.get("type") != "PullRequest":
+            continue
+        key = _pr_key_from_api_url(subject.get("url", ""))
+        if key is not None:
+            active.add(key)
+    return active
+
+
+def select_prs_for_html_refetch(prs: Iterable[Dict[str, Any]]) -> Optional[Tuple[Set[str], Set[str]]]:
+    """Choose which cached PRs need their HTML re-fetched on the skip path.
+
+    Returns:
+        None when every PR must be re-fetched (notifications disabled or unable to answer),
+        otherwise (notified, due): the URLs of PRs with new notification activity, and of the
+        other PRs that were never fetched before or whose safety interval has elapsed
+    """
+    if not _enabled:
+        return None
+    try:
+        active = _poll_notifications()
+    except (ValueError, OSError) as e:
+        print(f"  通知の取得に失敗しました: {e}")
+        active = None
+    if active is None:
+        return None
+
+    now = _clock()
+    notified: Set[str] = set()
+    due: Set[str] = set()
+    with _state_lock:
+        for pr in prs:
+            url = pr.get("url", "")
+            key = _pr_key_from_html_url(url)
+            last_fetch = _last_html_fetch.get(key) if key is not None else None
+            if key in active:
+                notified.add(url)
+            elif key is None or last_fetch is None or now - last_fetch >= _safety_interval_seconds:
+                due.add(url)
+    return notified, due
+
+
+def select_prs_fetched_before(prs: Iterable[Dict[str, Any]], max_age_seconds: float) -> Set[str]:
+    """Return the URLs of PRs whose HTML was never fetched or is at least max_age_seconds old."""
+    now = _clock()
+    selected: Set[str] = set()
+    with _state_lock:
+        for pr in prs:
+            url = pr.get("url", "")
+            key = _pr_key_from_html_url(url)
+            last_fetch = _last_html_fetch.get(key) if key is not None else None
+            if last_fetch is None or now - last_fetch >= max_age_seconds:
+                selected.add(url)
+    return selected
+
+
+def reset_notification_poller_state() -> None:
+    """Forget the poll cursor and HTML fetch times (useful for tests)."""
+    with _state_lock:
+        _poll_state.clear()
+        _last_html_fetch.clear()
@@ -2,18 +2,97 @@
 PR fetching module for GitHub pull requests
 """
 
-import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
+from .batch_executor import run_batches
+from .batch_size_controller import fetch_batch_adaptively, get_batch_size, split_into_batches
 from .graphql_client import execute_graphql_query
+from .query_templates import (
+    PR_DETAILS_SELECTION,
+    PR_FINGERPRINT_SELECTION,
+    aliased_repository_query,
+    aliased_repository_variables,
+    repository_alias,
+)
 
 # GraphQL pagination constants
+# Initial repositories per aliased query; the actual size is learned by batch_size_controller
 REPOSITORIES_BATCH_SIZE = 10
+# Upper bound: each repository can contribute ~12k nodes (100 PRs x 100 review threads, ...),
+# so 30 repositories stay well under GitHub's 500k node limit
+MAX_REPOSITORIES_BATCH_SIZE = 30
+PR_DETAILS_QUERY_KIND = "pr_details"
+PR_FINGERPRINT_QUERY_KIND = "pr_fingerprints"
+# Fingerprint selections are tiny, so far more repositories fit into one query
+MAX_FINGERPRINT_REPOSITORIES_BATCH_SIZE = 50
+
+
+def _build_pr_details_query(batch: List[Dict[str, Any]]) -> str:
+    """Return the prebuilt aliased PR details query for a batch of this size (see aliased_repository_variables)."""
+    return aliased_repository_query(PR_DETAILS_SELECTION, len(batch))
+
+
+def _parse_pr_details_response(data: Dict[str, Any], batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Transform one aliased PR details response into the PR dicts expected by determine_phase()."""
+    batch_prs = []
+
+    # Extract PR data from response
+    for idx, repo in enumerate(batch):
+        alias = repository_alias(idx)
+        repo_data = data.get("data", {}).get(alias, {})
+
+        if repo_data:
+            prs = repo_data.get("pullRequests", {}).get("nodes", [])
+            repo_name = repo_data.get("name", repo["name"])
+            owner = repo_data.get("owner", {}).get("login", repo["owner"])
+
+            # Transform GraphQL data to match expected format
+            for pr in prs:
+                # Transform reviewRequests
+                review_requests = []
+                for req in pr.get("reviewRequests", {}).get("nodes", []):
+                    reviewer = req.get("requestedReviewer", {})
+                    login = reviewer.get("login") or reviewer.get("name", "")
+                    if login:
+                        review_requests.append({"login": login})
+
+                # Handle null PR author
+                author_data = pr.get("author")
+                if author_data is None:
+                    # Deleted account - use placeholder
+                    author = {"login": "[deleted]"}
+                else:
+                    author = {"login": author_data.get("login", "")}
+
+                # Extract comment nodes with reactionGroups
+                comment_nodes = pr.get("comments", {}).get("nodes", [])
+
+                # Extract review threads
+                review_threads = pr.get("reviewThreads", {}).get("nodes", [])
+
+                # Add repository info to PR
+                pr_with_repo = {
+                    "title": pr.get("title", ""),
+                    "url": pr.get("url", ""),
+                    "isDraft": pr.get("isDraft", False),
+                    "createdAt": pr.get("createdAt", ""),
+                    "author": author,
+                    "reviewRequests": review_requests,
+                    "commentNodes": comment_nodes,
+                    "reviewThreads": review_threads,
+                    "repository": {"name": repo_name, "owner": owner},
+                }
+                batch_prs.append(pr_with_repo)
+
+    return batch_prs
 
 
 def get_pr_details_batch(repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Get PR details for multiple repositories in a single GraphQL query (Phase 2)
 
+    Repositories are split into batches whose size is learned per query kind (starting
+    at REPOSITORIES_BATCH_SIZE); the batches are executed concurrently (bounded by graphql_max_concurrency) and merged in order.
+
     Args:
         repos: List of repository dicts with 'name' and 'owner' keys
 
@@ -23,140 +102,83 @@ def get_pr_details_batch(repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     if not repos:
         return []
 
-    # Build GraphQL query with aliases for multiple repositories
-    # Limit to REPOSITORIES_BATCH_SIZE repos per query to avoid overly complex queries
-    all_prs = []
+    # Limit repos per query to avoid overly complex queries; the size adapts to observed cost/latency
+    batch_size = get_batch_size(PR_DETAILS_QUERY_KIND, REPOSITORIES_BATCH_SIZE, MAX_REPOSITORIES_BATCH_SIZE)
+    batches = split_into_batches(repos, batch_size)
 
-    for i in range(0, len(repos), REPOSITORIES_BATCH_SIZE):
-        batch = repos[i : i + REPOSITORIES_BATCH_SIZE]
-
-        # Build query fragments for each repository
-        repo_queries = []
-        for idx, repo in enumerate(batch):
-            alias = f"repo{idx}"
-            repo_name = repo["name"]
-            owner = repo["owner"]
-
-            # Escape values to prevent GraphQL injection
-            owner_literal = json.dumps(owner)
-            repo_name_literal = json.dumps(repo_name)
-
-            # Note: We intentionally fetch a single page of open PRs and rely on GitHub's
-            # maximum page size (first: 100). Repositories with >100 open PRs will be
-            # truncated; add pagination here if full coverage is required.
-            repo_query = f"""
-            {alias}: repository(owner: {owner_literal}, name: {repo_name_literal}) {{
-              name
-              owner {{
-                login
-              }}
-              pullRequests(first: 100, states: OPEN, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{
-                nodes {{
-                  title
-                  url
-                  isDraft
-                  createdAt
-                  author {{
-                    login
-                  }}
-                  reviewRequests(first: 10) {{
-                    nodes {{
-                      requestedReviewer {{
-                        ... on User {{
-                          login
-                        }}
-                        ... on Team {{
-                          name
-                        }}
-                      }}
-                    }}
-                  }}
-                  comments(last: 10) {{
-                    nodes {{
-                      reactionGroups {{
-                        content
-                        users {{
-                          totalCount
-                        }}
-                      }}
-                    }}
-                  }}
-                  # Note: We fetch only the first 100 review threads; PRs with more than 100
-                  # threads will be truncated unless pagination is added.
-                  reviewThreads(first: 100) {{
-                    nodes {{
-                      isResolved
-                      isOutdated
-                    }}
-                  }}
-                }}
-              }}
-            }}
-            """
-            repo_queries.append(repo_query)
-
-        # Combine all repository queries
-        full_query = f"""
-        query {{
-          {" ".join(repo_queries)}
-          rateLimit {{
-            cost
-            remaining
-            resetAt
-          }}
-        }}
-        """
-
-        # Execute GraphQL query
-        batch_num = i // REPOSITORIES_BATCH_SIZE + 1
-        data = execute_graphql_query(full_query, intent=f"PR詳細取得 (バッチ{batch_num}: {len(batch)}リポジトリ)")
-
-        # Extract PR data from response
-        for idx, repo in enumerate(batch):
-            alias = f"repo{idx}"
-            repo_data = data.get("data", {}).get(alias, {})
-
-            if repo_data:
-                prs = repo_data.get("pullRequests", {}).get("nodes", [])
-                repo_name = repo_data.get("name", repo["name"])
-                owner = repo_data.get("owner", {}).get("login", repo["owner"])
-
-                # Transform GraphQL data to match expected format
-                for pr in prs:
-                    # Transform reviewRequests
-                    review_requests = []
-                    for req in pr.get("reviewRequests", {}).get("nodes", []):
-                        reviewer = req.get("requestedReviewer", {})
-                        login = reviewer.get("login") or reviewer.get("name", "")
-                        if login:
-                            review_requests.append({"login": login})
-
-                    # Handle null PR author
-                    author_data = pr.get("author")
-                    if author_data is None:
-                        # Deleted account - use placeholder
-                        author = {"login": "[deleted]"}
-                    else:
-                        author = {"login": author_data.get("login", "")}
-
-                    # Extract comment nodes with reactionGroups
-                    comment_nodes = pr.get("comments", {}).get("nodes", [])
-
-                    # Extract review threads
-                    review_threads = pr.get("reviewThreads", {}).get("nodes", [])
-
-                    # Add repository info to PR
-                    pr_with_repo = {
-                        "title": pr.get("title", ""),
-                        "url": pr.get("url", ""),
-                        "isDraft": pr.get("isDraft", False),
-                        "createdAt": pr.get("createdAt", ""),
-                        "author": author,
-                        "reviewRequests": review_requests,
-                        "commentNodes": comment_nodes,
-                        "reviewThreads": review_threads,
-                        "repository": {"name": repo_name, "owner": owner},
-                    }
-                    all_prs.append(pr_with_repo)
+    def _fetch_batch(batch_index: int, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        def _fetch(sub_batch: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
+            data = execute_graphql_query(
+                _build_pr_details_query(sub_batch),
+                aliased_repository_variables(sub_batch),
+                intent=f"PR詳細取得 (バッチ{batch_index + 1}: {len(sub_batch)}リポジトリ)",
+            )
+            return _parse_pr_details_response(data, sub_batch), data
 
+        return fetch_batch_adaptively(PR_DETAILS_QUERY_KIND, batch, _fetch)
+
+    all_prs = []
+    for batch_prs in run_batches(batches, _fetch_batch):
+        all_prs.extend(batch_prs)
     return all_prs
+
+
+def _parse_pr_fingerprint_response(data: Dict[str, Any], batch: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """Extract (PR URL, fingerprint) pairs from one aliased fingerprint response."""
+    fingerprints = []
+    for idx in range(len(batch)):
+        repo_data = data.get("data", {}).get(repository_alias(idx)) or {}
+        for pr in (repo_data.get("pullRequests") or {}).get("nodes", []):
+            url = pr.get("url", "")
+            if not url:
+                continue
+            timeline_nodes = (pr.get("timelineItems") or {}).get("nodes") or [{}]
+            fingerprint = "|".join(
+                str(value)
+                for value in (
+                    pr.get("updatedAt", ""),
+                    pr.get("headRefOid", ""),
+                    (pr.get("reviews") or {}).get("totalCount", 0),
+                    (timeline_nodes[-1] or {}).get("id", ""),
+                )
+            )
+            fingerprints.append((url, fingerprint))
+    return fingerprints
+
+
+def get_pr_fingerprints(repos: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Get a cheap change fingerprint for every open PR of the given repositories.
+
+    The fingerprint combines updatedAt, the head commit SHA, the review count and the id
+    of the last timeline item; it changes whenever the PR page would show something new.
+    All repositories are fetched with aliased queries (usually a single one).
+
+    Args:
+        repos: List of repository dicts with 'name' and 'owner' keys
+
+    Returns:
+        Dict mapping PR URL to its fingerprint string
+    """
+    if not repos:
+        return {}
+
+    batch_size = get_batch_size(
+        PR_FINGERPRINT_QUERY_KIND, MAX_FINGERPRINT_REPOSITORIES_BATCH_SIZE, MAX_FINGERPRINT_REPOSITORIES_BATCH_SIZE
+    )
+    batches = split_into_batches(repos, batch_size)
+
+    def _fetch_batch(batch_index: int, batch: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        def _fetch(sub_batch: List[Dict[str, Any]]) -> tuple[List[Tuple[str, str]], Dict[str, Any]]:
+            data = execute_graphql_query(
+                aliased_repository_query(PR_FINGERPRINT_SELECTION, len(sub_batch)),
+                aliased_repository_variables(sub_batch),
+                intent=f"PR変更フィンガープリント取得 (バッチ{batch_index + 1}: {len(sub_batch)}リポジトリ)",
+            )
+            return _parse_pr_fingerprint_response(data, sub_batch), data
+
+        return fetch_batch_adaptively(PR_FINGERPRINT_QUERY_KIND, batch, _fetch)
+
+    fingerprints: Dict[str, str] = {}
+    for batch_fingerprints in run_batches(batches, _fetch_batch):
+        fingerprints.update(batch_fingerprints)
+    return fingerprints
@@ -0,0 +1,136 @@
+"""ETag-based open-PR change detection for the skip path using REST conditional requests.
+
+When updatedAt is unchanged, the skip path used to re-run the GraphQL open-PR inventory
+scan on every iteration just to compare per-repository open-PR counts. With
+``skip_path_open_pr_check = "rest_etag"`` each repository with cached open PRs is probed
+with ``GET /repos/{owner}/{repo}/pulls?state=open`` and its stored ETag instead:
+unchanged lists return 304 Not Modified, which costs no rate-limit points, and only the
+repositories that returned 200 get their PR details fetched again.
+
+Repositories without cached open PRs are not probed; a first PR opened there is picked
+up by the regular updatedAt change detection.
+"""
+
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..core.config import SKIP_PATH_OPEN_PR_CHECK_REST_ETAG
+from .gh_api_response import parse_gh_api_response
+
+# Per-repo ETag storage: "{owner}/{repo}" -> ETag of its open pull request list
+_repo_pull_etags: Dict[str, str] = {}
+_etags_lock = threading.Lock()
+
+_enabled: bool = False
+
+# Maximum number of repositories probed at the same time
+PULL_ETAG_PROBE_MAX_CONCURRENCY = 8
+# One page covers the open PRs of every repository this monitor is meant for
+PULLS_PAGE_SIZE = 100
+
+
+def set_skip_path_open_pr_check(source: str) -> None:
+    """Configure whether the skip path probes open pull request lists by ETag."""
+    global _enabled
+    _enabled = source == SKIP_PATH_OPEN_PR_CHECK_REST_ETAG
+
+
+def is_open_pull_probe_enabled() -> bool:
+    """Return True when the skip path uses the REST ETag probes."""
+    return _enabled
+
+
+def _run_pulls_api(owner: str, repo: str, etag: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run gh api --include for the open pull requests of a repository."""
+    args = ["gh", "api", "--include", f"/repos/{owner}/{repo}/pulls?state=open&per_page={PULLS_PAGE_SIZE}"]
+    if etag:
+        args.extend(["-H", f"If-None-Match: {etag}"])
+    return subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+
+
+def _probe_repo(key: str, owner: str, name: str, stored_etag: Optional[str]) -> bool:
+    """Send one conditional request for a repository and record its new ETag.
+
+    Returns:
+        True if the repository's open pull requests changed (200 or an unrecognized response)
+    """
+    result = _run_pulls_api(owner, name, stored_etag)
+    status_code, headers, _body = parse_gh_api_response(result.stdout or "")
+    new_etag = headers.get("etag")
+    if status_code == 304 and stored_etag:
+        return False
+    with _etags_lock:
+        if status_code == 200 and new_etag:
+            _repo_pull_etags[key] = new_etag
+        else:
+            # Error response: drop the ETag so the next probe cannot report a stale 304
+            _repo_pull_etags.pop(key, None)
+    return True
+
+
+def check_open_pulls_changed(repos: List[Dict[str, Any]]) -> Optional[Set[str]]:
+    """Find the repositories whose open pull request list changed since the last probe.
+
+    Repositories are probed concurrently (at most PULL_ETAG_PROBE_MAX_CONCURRENCY
+    requests at a time) with ``If-None-Match``; 304 responses are free.
+
+    Args:
+        repos: List of repository dicts with 'name' and 'owner' keys.
+
+    Returns:
+        None when at least one repository had no stored ETag yet (its baseline was just
+        established, so the caller must check the counts another way), otherwise the
+        "{owner}/{name}" keys of the repositories that returned 200 (or an error)
+    """
+    probes: List[Tuple[str, str, str, Optional[str]]] = []
+    for repo in repos:
+        owner = repo.get("owner", "")
+        name = repo.get("name", "")
+        if not owner or not name:
+            continue
+        key = f"{owner}/{name}"
+        with _etags_lock:
+            probes.append((key, owner, name, _repo_pull_etags.get(key)))
+    if not probes:
+        return set()
+
+    with ThreadPoolExecutor(max_workers=min(PULL_ETAG_PROBE_MAX_CONCURRENCY, len(probes))) as pool:
+        results = list(pool.map(lambda probe: _probe_repo(*probe), probes))
+
+    if any(stored_etag is None for _, _, _, stored_etag in probes):
+        return None
+    return {probe[0] for probe, changed in zip(probes, results) if changed}
+
+
+def export_pull_etag_state() -> Dict[str, str]:
+    """Return a copy of the per-repo open pull request ETags ("{owner}/{repo}" -> ETag)."""
+    with _etags_lock:
+        return dict(_repo_pull_etags)
+
+
+def import_pull_etag_state(etags: Dict[str, str]) -> None:
+    """Restore ETags produced by export_pull_etag_state (e.g. after a restart).
+
+    Raises:
+        ValueError: If the data is malformed (nothing is restored then)
+    """
+    if not isinstance(etags, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in etags.items()):
+        raise ValueError("invalid pull request ETag baseline")
+    with _etags_lock:
+        _repo_pull_etags.clear()
+        _repo_pull_etags.update(etags)
+
+
+def reset_pull_etag_state() -> None:
+    """Reset all pull request ETag state (useful for tests)."""
+    with _etags_lock:
+        _repo_pull_etags.clear()
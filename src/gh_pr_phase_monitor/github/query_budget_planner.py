@@ -0,0 +1,122 @@
+"""
+Per-iteration GraphQL point budget planner
+
+Every query sent through execute_graphql_query is charged against the current
+iteration's budget (the actual ``rateLimit.cost`` when the response carries it,
+otherwise the local estimate from query_cost_estimator). Before dispatching
+low-priority work such as the issue listing, callers ask plan_batches() which of
+their batches still fit; the rest is trimmed, and when nothing fits the whole
+request is deferred with QueryBudgetExceededError so the caller can fall back to
+cached data.
+
+The budget is disabled (unlimited) when graphql_iteration_point_budget is 0.
+"""
+
+import threading
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from ..core.config import DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET
+
+T = TypeVar("T")
+
+# Query priorities: high-priority queries are always sent (but still charged),
+# low-priority queries are trimmed or deferred when they do not fit the budget
+PRIORITY_HIGH = "high"
+PRIORITY_LOW = "low"
+
+_iteration_point_budget: int = DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET
+_spent_points: int = 0
+_state_lock = threading.Lock()
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Raised when low-priority queries are deferred because the iteration budget is exhausted."""
+
+
+def set_iteration_point_budget(points: int) -> None:
+    """Set the per-iteration point budget (0 or negative disables budgeting)."""
+    global _iteration_point_budget
+    _iteration_point_budget = max(0, int(points))
+
+
+def get_iteration_point_budget() -> int:
+    """Return the per-iteration point budget (0 = unlimited)."""
+    return _iteration_point_budget
+
+
+def begin_iteration() -> None:
+    """Reset the points charged so far; call at the start of each monitoring iteration."""
+    global _spent_points
+    with _state_lock:
+        _spent_points = 0
+
+
+def record_query_cost(points: int) -> None:
+    """Charge a sent query's cost against the current iteration."""
+    global _spent_points
+    with _state_lock:
+        _spent_points += max(0, int(points))
+
+
+def get_spent_points() -> int:
+    """Return the points charged in the current iteration."""
+    with _state_lock:
+        return _spent_points
+
+
+def get_remaining_points() -> Optional[int]:
+    """Return the points left in the current iteration, or None when budgeting is disabled."""
+    if _iteration_point_budget <= 0:
+        return None
+    with _state_lock:
+        return max(0, _iteration_point_budget - _spent_points)
+
+
+def plan_batches(
+    kind: str,
+    batches: Sequence[T],
+    estimate_points: Callable[[T], int],
+    priority: str = PRIORITY_LOW,
+) -> List[T]:
+    """Select the batches that fit into the remaining budget.
+
+    High-priority batches are always returned. Low-priority batches are accepted in
+    order while their cumulative estimated cost fits the remaining points; the rest
+    is trimmed.
+
+    Args:
+        kind: Query kind key used in log messages (e.g. "issues")
+        batches: Batches in dispatch order
+        estimate_points: Function returning the estimated point cost of one batch
+        priority: PRIORITY_HIGH or PRIORITY_LOW
+
+    Returns:
+        The batches to send (a prefix of ``batches``)
+
+    Raises:
+        QueryBudgetExceededError: If no low-priority batch fits at all
+    """
+    remaining = get_remaining_points()
+    if remaining is None or priority == PRIORITY_HIGH or not batches:
+        return list(batches)
+
+    accepted: List[T] = []
+    planned = 0
+    for batch in batches:
+        cost = estimate_points(batch)
+        if planned + cost > remaining:
+            break
+        accepted.append(batch)
+        planned += cost
+
+    if not accepted:
+        raise QueryBudgetExceededError(
+            f"GraphQL point budget exhausted for {kind}: "
+            f"remaining={remaining}点, spent={get_spent_points()}/{_iteration_point_budget}点"
+        )
+    if len(accepted) < len(batches):
+        print(
+            f"  [GraphQL] 予算制限によりバッチを削減 ({kind}): {len(batches)} → {len(accepted)} "
+            f"(推定{planned}点 / 残り{remaining}点)"
+        )
+    return accepted
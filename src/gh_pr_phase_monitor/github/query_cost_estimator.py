@@ -0,0 +1,122 @@
+"""
+Local GraphQL cost estimator
+
+Estimates the node count and rate-limit point cost of a GraphQL query before it is
+sent, following GitHub's documented rules:
+
+- Every connection (a field with a ``first``/``last`` argument) needs one request per
+  parent object, so its request count is the product of the page sizes of all
+  enclosing connections.
+- The node count of a connection is that same product multiplied by its own page size.
+- The point cost is the total request count divided by 100, rounded to the nearest
+  whole number, with a minimum of 1.
+
+Fields without ``first``/``last`` (e.g. ``pullRequests(states: OPEN) { totalCount }``)
+are not counted as connections, which matches what GitHub reports for such queries.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+# GitHub rejects queries that could return more than this many nodes
+GITHUB_MAX_NODE_LIMIT = 500_000
+
+_TOKEN_PATTERN = re.compile(
+    r'"""(?:.|\n)*?"""'  # block string
+    r'|"(?:\\.|[^"\\])*"'  # string
+    r"|#[^\n]*"  # comment
+    r"|\.\.\."  # spread
+    r"|\$?[A-Za-z_][A-Za-z0-9_]*"  # name or variable
+    r"|-?\d+(?:\.\d+)?"  # number
+    r"|[{}()\[\]:!=@,|&]"  # punctuation
+)
+
+
+def _tokenize(query: str) -> List[str]:
+    """Split a GraphQL document into tokens, dropping comments and commas."""
+    return [tok for tok in _TOKEN_PATTERN.findall(query) if not tok.startswith("#") and tok != ","]
+
+
+def _page_size_from_args(tokens: List[str], start: int, variables: Dict[str, Any]) -> tuple[Optional[int], int]:
+    """Parse an argument list starting at tokens[start] == "(".
+
+    Returns:
+        (page_size, index_after_closing_paren) where page_size is the value of a
+        top-level ``first``/``last`` argument, or None if there is none.
+    """
+    depth = 0
+    page_size: Optional[int] = None
+    idx = start
+    while idx < len(tokens):
+        tok = tokens[idx]
+        if tok in ("(", "{", "["):
+            depth += 1
+        elif tok in (")", "}", "]"):
+            depth -= 1
+            if depth == 0:
+                return page_size, idx + 1
+        elif depth == 1 and tok in ("first", "last") and idx + 2 < len(tokens) and tokens[idx + 1] == ":":
+            value = tokens[idx + 2]
+            if value.startswith("$"):
+                value = variables.get(value[1:])
+            try:
+                size = int(value)
+            except (TypeError, ValueError):
+                size = None
+            if size is not None:
+                page_size = max(page_size or 0, size)
+            idx += 2
+        idx += 1
+    return page_size, idx
+
+
+def estimate_query_cost(query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """Estimate the cost of a GraphQL query before sending it.
+
+    Args:
+        query: GraphQL query text
+        variables: Optional variables used to resolve ``first: $n`` style arguments
+
+    Returns:
+        {"requests": int, "nodes": int, "points": int}
+    """
+    variables = variables or {}
+    tokens = _tokenize(query)
+
+    # Stack of parent multipliers: number of objects the current selection set is evaluated for
+    multipliers: List[int] = [1]
+    total_requests = 0
+    total_nodes = 0
+    # Multiplier to push when the next "{" opens (set by the field that precedes it)
+    pending_multiplier: Optional[int] = None
+
+    idx = 0
+    while idx < len(tokens):
+        tok = tokens[idx]
+        if tok == "(":
+            page_size, idx = _page_size_from_args(tokens, idx, variables)
+            if page_size is not None:
+                parent = multipliers[-1]
+                total_requests += parent
+                total_nodes += parent * page_size
+                pending_multiplier = parent * page_size
+            continue
+        if tok == "{":
+            multipliers.append(pending_multiplier if pending_multiplier is not None else multipliers[-1])
+            pending_multiplier = None
+        elif tok == "}":
+            if len(multipliers) > 1:
+                multipliers.pop()
+            pending_multiplier = None
+        elif tok != ":" and not tok.startswith("$"):
+            # A new field name resets any multiplier left by a previous field without a selection set.
+            # Aliases ("alias: field") are handled because the alias is followed by ":" and then the field.
+            if idx + 1 < len(tokens) and tokens[idx + 1] == ":":
+                idx += 1
+                continue
+            if pending_multiplier is not None and tok not in ("on", "..."):
+                pending_multiplier = None
+        idx += 1
+
+    points = max(1, round(total_requests / 100))
+    return {"requests": total_requests, "nodes": total_nodes, "points": points}
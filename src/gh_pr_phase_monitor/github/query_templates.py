@@ -0,0 +1,227 @@
+"""
+Prebuilt GraphQL query templates
+
+Query texts are built once and reused; everything that changes between calls is passed
+as GraphQL variables instead of being spliced into the text:
+
+- repository scans page with ``$after`` (null on the first page) instead of
+  rewriting the query with ``str.replace`` for every cursor
+- aliased batch queries take ``$owner0``/``$name0``... variables; one text is built
+  per (selection, batch size) and then reused for every batch of that size
+
+Stable query texts keep the response cache keys and cost estimates stable, and avoid
+escaping user-controlled names into the query.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# rateLimit fields requested by every query: cost for budgeting, the rest feeds rate_limit_tracker
+RATE_LIMIT_FIELDS = """        cost
+        limit
+        remaining
+        used
+        resetAt"""
+
+# GraphQL pagination constants
+REPOSITORIES_PER_PAGE = 100
+ISSUES_PER_REPO = 50
+
+
+def _repository_scan_query(node_fields: str) -> str:
+    """Build a paginated scan over the current user's own repositories."""
+    return f"""
+    query($login: String!, $after: String) {{
+      user(login: $login) {{
+        repositories(first: {REPOSITORIES_PER_PAGE}, ownerAffiliations: [OWNER], after: $after) {{
+          nodes {{
+{node_fields}
+          }}
+          pageInfo {{
+            hasNextPage
+            endCursor
+          }}
+        }}
+      }}
+      rateLimit {{
+{RATE_LIMIT_FIELDS}
+      }}
+    }}
+    """
+
+
+# Repository inventory: everything the updatedAt check, Phase 1 and the issue listing need
+REPOSITORY_INVENTORY_QUERY = _repository_scan_query(
+    """            name
+            owner {
+              login
+            }
+            updatedAt
+            pullRequests(states: OPEN) {
+              totalCount
+            }
+            issues(states: OPEN) {
+              totalCount
+            }"""
+)
+
+# Phase 2: open PR details selected for each aliased repository.
+# Note: We intentionally fetch a single page of open PRs and rely on GitHub's
+# maximum page size (first: 100). Repositories with >100 open PRs will be
+# truncated; add pagination here if full coverage is required.
+PR_DETAILS_SELECTION = """
+          name
+          owner {
+            login
+          }
+          pullRequests(first: 100, states: OPEN, orderBy: {field: UPDATED_AT, direction: DESC}) {
+            nodes {
+              title
+              url
+              isDraft
+              createdAt
+              author {
+                login
+              }
+              reviewRequests(first: 10) {
+                nodes {
+                  requestedReviewer {
+                    ... on User {
+                      login
+                    }
+                    ... on Team {
+                      name
+                    }
+                  }
+                }
+              }
+              comments(last: 10) {
+                nodes {
+                  reactionGroups {
+                    content
+                    users {
+                      totalCount
+                    }
+                  }
+                }
+              }
+              # Note: We fetch only the first 100 review threads; PRs with more than 100
+              # threads will be truncated unless pagination is added.
+              reviewThreads(first: 100) {
+                nodes {
+                  isResolved
+                  isOutdated
+                }
+              }
+            }
+          }
+"""
+
+# Cheap per-PR change fingerprint: any push, review, comment or timeline event (e.g. the
+# Copilot agent starting or finishing work) changes at least one of these fields
+PR_FINGERPRINT_SELECTION = """
+          pullRequests(first: 100, states: OPEN) {
+            nodes {
+              url
+              updatedAt
+              headRefOid
+              reviews {
+                totalCount
+              }
+              timelineItems(last: 1) {
+                nodes {
+                  ... on Node {
+                    id
+                  }
+                }
+              }
+            }
+          }
+"""
+
+
+@lru_cache(maxsize=None)
+def issues_selection(sort_by_number: bool, labels: Tuple[str, ...] = ()) -> str:
+    """Return the open-issues selection for one aliased repository.
+
+    Ordering and label filters are fixed per call site, so they stay literal and each
+    combination is built only once.
+    """
+    # When sorting by number, we need to fetch issues ordered by CREATED_AT ascending
+    # (since issue numbers are assigned sequentially at creation time)
+    if sort_by_number:
+        order_clause = "orderBy: {field: CREATED_AT, direction: ASC}"
+    else:
+        order_clause = "orderBy: {field: UPDATED_AT, direction: DESC}"
+    labels_filter = f", labels: {json.dumps(list(labels))}" if labels else ""
+
+    return f"""
+          name
+          owner {{
+            login
+          }}
+          issues(first: {ISSUES_PER_REPO}, states: OPEN, {order_clause}{labels_filter}) {{
+            nodes {{
+              title
+              url
+              number
+              createdAt
+              updatedAt
+              author {{
+                login
+              }}
+              labels(first: 10) {{
+                nodes {{
+                  name
+                }}
+              }}
+              assignees(first: 10) {{
+                nodes {{
+                  login
+                }}
+              }}
+            }}
+          }}
+"""
+
+
+def repository_alias(index: int) -> str:
+    """Return the alias used for the index-th repository of an aliased batch query."""
+    return f"repo{index}"
+
+
+@lru_cache(maxsize=None)
+def aliased_repository_query(selection: str, batch_size: int) -> str:
+    """Build (once per selection and batch size) an aliased query over batch_size repositories.
+
+    Repository i is selected as ``repo{i}: repository(owner: $owner{i}, name: $name{i})``;
+    use aliased_repository_variables() to build the matching variables.
+    """
+    variable_definitions = ", ".join(f"$owner{idx}: String!, $name{idx}: String!" for idx in range(batch_size))
+    repo_queries = "".join(
+        f"""
+        {repository_alias(idx)}: repository(owner: $owner{idx}, name: $name{idx}) {{{selection}        }}"""
+        for idx in range(batch_size)
+    )
+    return f"""
+    query({variable_definitions}) {{{repo_queries}
+      rateLimit {{
+{RATE_LIMIT_FIELDS}
+      }}
+    }}
+    """
+
+
+def aliased_repository_variables(batch: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Build the $ownerN / $nameN variables for an aliased batch query."""
+    variables: Dict[str, str] = {}
+    for idx, repo in enumerate(batch):
+        variables[f"owner{idx}"] = repo["owner"]
+        variables[f"name{idx}"] = repo["name"]
+    return variables
+
+
+def repository_scan_variables(login: str, after: Optional[str]) -> Dict[str, Any]:
+    """Build the variables for one page of a repository scan."""
+    return {"login": login, "after": after}
@@ -3,6 +3,7 @@ Rate limit handling utilities for GitHub PR Phase Monitor.
 
 Provides functions for monitoring GraphQL API rate limits, displaying usage
 statistics, and throttling requests when approaching rate limit exhaustion.
+The rate-limit readings come from rate_limit_tracker (fed by API responses).
 """
 
 import math
@@ -54,6 +55,19 @@ def _display_rate_limit_usage(
         print(f"\nGraphQL API使用状況: {status}")
 
 
+def _display_rest_rate_limit_status(snapshots: dict[str, dict[str, Any]]) -> None:
+    """Display the latest known REST API buckets (core / search) observed from response headers."""
+    for bucket in ("core", "search"):
+        info = snapshots.get(bucket)
+        if not info:
+            continue
+        reset_display, reset_in_display = _format_rate_limit_reset(info.get("reset"))
+        print(
+            f"REST API使用状況 ({bucket}): 残={info.get('remaining', '?')}/{info.get('limit', '?')}, "
+            f"リセット={reset_display} (あと{reset_in_display})"
+        )
+
+
 def _check_rate_limit_throttle(
     before: dict[str, Any] | None,
     after: dict[str, Any] | None,
@@ -0,0 +1,127 @@
+"""
+Rate-limit telemetry derived from API responses
+
+Instead of spawning ``gh api rate_limit`` before and after every iteration, the
+monitor keeps the latest rate-limit state per bucket up to date from data it already
+receives:
+
+- GraphQL responses: the ``rateLimit { cost limit remaining used resetAt }`` field that
+  every query requests
+- REST / HTTP responses: the ``x-ratelimit-*`` headers (``x-ratelimit-resource`` names
+  the bucket, e.g. "core", "search" or "graphql")
+
+Snapshots use the same shape as ``gh api rate_limit``'s ``resources.<bucket>`` entries
+({"limit", "remaining", "used", "reset"}), so rate_limit_handler works unchanged.
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+GRAPHQL_BUCKET = "graphql"
+CORE_BUCKET = "core"
+SEARCH_BUCKET = "search"
+
+_buckets: Dict[str, Dict[str, Any]] = {}
+_state_lock = threading.Lock()
+
+
+def _parse_reset_at(value: Any) -> Optional[int]:
+    """Convert a GraphQL resetAt ISO timestamp into epoch seconds."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return None
+
+
+def _update_bucket(bucket: str, values: Dict[str, Any]) -> None:
+    """Merge known fields into a bucket (fields missing from this observation keep their last value)."""
+    with _state_lock:
+        state = _buckets.setdefault(bucket, {})
+        state.update({key: value for key, value in values.items() if value is not None})
+        if (
+            values.get("used") is None
+            and isinstance(state.get("limit"), int)
+            and isinstance(state.get("remaining"), int)
+        ):
+            state["used"] = state["limit"] - state["remaining"]
+
+
+def record_graphql_rate_limit(response: Any) -> None:
+    """Update the GraphQL bucket from a parsed GraphQL response carrying a rateLimit field."""
+    if not isinstance(response, dict):
+        return
+    rate_limit = (response.get("data") or {}).get("rateLimit")
+    if not isinstance(rate_limit, dict) or not isinstance(rate_limit.get("remaining"), int):
+        return
+    _update_bucket(
+        GRAPHQL_BUCKET,
+        {
+            "limit": rate_limit.get("limit") if isinstance(rate_limit.get("limit"), int) else None,
+            "remaining": rate_limit["remaining"],
+            "used": rate_limit.get("used") if isinstance(rate_limit.get("used"), int) else None,
+            "reset": _parse_reset_at(rate_limit.get("resetAt")),
+        },
+    )
+
+
+def record_rate_limit_headers(headers: Dict[str, str], default_bucket: str = CORE_BUCKET) -> None:
+    """Update a bucket from x-ratelimit-* response headers (keys compared case-insensitively).
+
+    Args:
+        headers: Response headers
+        default_bucket: Bucket used when the response has no x-ratelimit-resource header
+    """
+    lowered = {key.lower(): value for key, value in headers.items()}
+    if "x-ratelimit-remaining" not in lowered:
+        return
+    values: Dict[str, Any] = {}
+    for field in ("limit", "remaining", "used", "reset"):
+        raw = lowered.get(f"x-ratelimit-{field}")
+        if raw is None:
+            continue
+        try:
+            values[field] = int(str(raw).strip())
+        except ValueError:
+            continue
+    if "remaining" not in values:
+        return
+    bucket = str(lowered.get("x-ratelimit-resource") or default_bucket).strip() or default_bucket
+    _update_bucket(bucket, values)
+
+
+def record_rate_limit_header_lines(lines: Iterable[str], default_bucket: str = CORE_BUCKET) -> None:
+    """Update a bucket from raw ``Name: value`` header lines (e.g. from ``gh api --include``).
+
+    Reading stops at the first empty line, which separates the headers from the body.
+    """
+    headers: Dict[str, str] = {}
+    for line in lines:
+        if not line.strip():
+            break
+        name, separator, value = line.partition(":")
+        if separator and name.lower().startswith("x-ratelimit-"):
+            headers[name.strip()] = value.strip()
+    if headers:
+        record_rate_limit_headers(headers, default_bucket)
+
+
+def get_rate_limit_snapshot(bucket: str = GRAPHQL_BUCKET) -> Optional[Dict[str, Any]]:
+    """Return a copy of the latest known state of a bucket, or None if nothing was observed yet."""
+    with _state_lock:
+        state = _buckets.get(bucket)
+        return dict(state) if state else None
+
+
+def get_all_rate_limit_snapshots() -> Dict[str, Dict[str, Any]]:
+    """Return copies of every bucket observed so far."""
+    with _state_lock:
+        return {bucket: dict(state) for bucket, state in _buckets.items()}
+
+
+def reset_rate_limit_tracker() -> None:
+    """Forget all observed rate-limit state (useful for tests)."""
+    with _state_lock:
+        _buckets.clear()
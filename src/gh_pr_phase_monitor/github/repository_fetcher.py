@@ -1,15 +1,24 @@
 """
 Repository fetching module for GitHub repositories
+
+All repository-level lookups (updatedAt change detection, Phase 1 open PR counts and the
+repositories-without-PRs issue listing) read from one repository inventory: a single
+paginated scan returning name, owner, updatedAt, open PR count and open issue count.
+Inside repository_inventory_scope() (one monitoring iteration) the inventory is fetched
+once and shared by every consumer; outside a scope each call fetches a fresh one
+(concurrent callers still share one in-flight scan).
 """
 
-from typing import Any, Dict, List, Optional, Set
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
 
+from ..core.request_coalescer import coalesce, request_coalescing_scope
 from .etag_checker import check_repos_etag_changed
+from .event_feed import check_repos_changed_via_events, is_event_feed_enabled
 from .github_auth import get_current_user
 from .graphql_client import execute_graphql_query
-
-# GraphQL pagination constants
-REPOSITORIES_PER_PAGE = 100
+from .graphql_response_cache import invalidate_repositories
+from .query_templates import REPOSITORY_INVENTORY_QUERY, repository_scan_variables
 
 # Module-level cache: stores the last known updatedAt for each repository.
 # Used to detect which repos have changed since the previous check, allowing
@@ -17,76 +26,98 @@ REPOSITORIES_PER_PAGE = 100
 _last_repo_updated_at: Dict[str, str] = {}
 
 
-def get_all_repos_updated_at() -> Dict[str, str]:
-    """Lightweight query: get updatedAt timestamps for all user-owned repositories.
-
-    This is used to cheaply detect which repositories have changed since the last
-    monitoring iteration, before deciding whether to run the expensive Phase 1/2 queries.
+def _scan_repositories(query: str, intent: str) -> Iterator[Dict[str, Any]]:
+    """Yield repository nodes from every page of a prebuilt repository scan query.
 
-    Returns:
-        Dict mapping repository name to its updatedAt ISO timestamp string.
-        Example: {"repo1": "2024-01-01T00:00:00Z", "repo2": "2024-01-02T00:00:00Z"}
+    The query text stays the same for every page; only the $after cursor variable changes.
     """
     current_user = get_current_user()
-
-    query = """
-    query($login: String!) {{
-      user(login: $login) {{
-        repositories(first: {repositories_per_page}, ownerAffiliations: [OWNER]) {{
-          nodes {{
-            name
-            updatedAt
-          }}
-          pageInfo {{
-            hasNextPage
-            endCursor
-          }}
-        }}
-      }}
-      rateLimit {{
-        cost
-        remaining
-      }}
-    }}
-    """.format(repositories_per_page=REPOSITORIES_PER_PAGE)
-
-    result: Dict[str, str] = {}
     has_next_page = True
     end_cursor = None
 
     while has_next_page:
-        if end_cursor:
-            query_with_pagination = query.replace(
-                f"repositories(first: {REPOSITORIES_PER_PAGE}, ownerAffiliations: [OWNER])",
-                f'repositories(first: {REPOSITORIES_PER_PAGE}, ownerAffiliations: [OWNER], after: "{end_cursor}")',
-            )
-        else:
-            query_with_pagination = query
-
         data = execute_graphql_query(
-            query_with_pagination, {"login": current_user}, intent="リポジトリ更新日時一括チェック"
+            query,
+            repository_scan_variables(current_user, end_cursor),
+            intent=intent,
         )
 
         repositories = data.get("data", {}).get("user", {}).get("repositories", {})
-        nodes = repositories.get("nodes", [])
-        page_info = repositories.get("pageInfo", {})
-
-        for repo in nodes:
-            name = repo.get("name", "")
-            updated_at = repo.get("updatedAt", "")
-            if name and updated_at:
-                result[name] = updated_at
+        yield from repositories.get("nodes", [])
 
+        page_info = repositories.get("pageInfo", {})
         has_next_page = page_info.get("hasNextPage", False)
         end_cursor = page_info.get("endCursor")
 
+
+def _fetch_repository_inventory() -> List[Dict[str, Any]]:
+    """Scan all user-owned repositories once (name, owner, updatedAt, open PR/issue counts)."""
+    # Only includes user-owned repos (not organization repos)
+    repositories = []
+    for repo in _scan_repositories(REPOSITORY_INVENTORY_QUERY, "リポジトリインベントリ取得"):
+        repositories.append(
+            {
+                "name": repo.get("name"),
+                "owner": (repo.get("owner") or {}).get("login"),
+                "updatedAt": repo.get("updatedAt", ""),
+                "openPRCount": (repo.get("pullRequests") or {}).get("totalCount", 0),
+                "openIssueCount": (repo.get("issues") or {}).get("totalCount", 0),
+            }
+        )
+    return repositories
+
+
+def get_repository_inventory() -> List[Dict[str, Any]]:
+    """Return the repository inventory, fetching it at most once per inventory scope.
+
+    Returns:
+        List of repositories (fresh dicts owned by the caller)
+        Example: [{"name": "repo1", "owner": "user", "updatedAt": "2024-01-01T00:00:00Z",
+                   "openPRCount": 2, "openIssueCount": 5}, ...]
+    """
+    repositories = coalesce("repository_inventory", _fetch_repository_inventory)
+    return [dict(repo) for repo in repositories]
+
+
+@contextmanager
+def repository_inventory_scope() -> Iterator[None]:
+    """Share one repository inventory between all consumers inside the block.
+
+    Wrap one monitoring iteration with this so the updatedAt check, Phase 1 and the
+    issue listing reuse a single paginated scan instead of scanning three times.
+    This is a request_coalescing_scope(), so other coalesced reads are shared as well.
+    """
+    with request_coalescing_scope():
+        yield
+
+
+def get_all_repos_updated_at() -> Dict[str, str]:
+    """Get updatedAt timestamps for all user-owned repositories from the repository inventory.
+
+    This is used to cheaply detect which repositories have changed since the last
+    monitoring iteration, before deciding whether to run the expensive Phase 1/2 queries.
+
+    Returns:
+        Dict mapping repository name to its updatedAt ISO timestamp string.
+        Example: {"repo1": "2024-01-01T00:00:00Z", "repo2": "2024-01-02T00:00:00Z"}
+    """
+    result: Dict[str, str] = {}
+    for repo in get_repository_inventory():
+        name = repo.get("name", "")
+        updated_at = repo.get("updatedAt", "")
+        if name and updated_at:
+            result[name] = updated_at
+
     return result
 
 
 def get_repos_changed_since_last_check() -> Optional[Set[str]]:
     """Perform a lightweight check to find repositories that changed since the last call.
 
-    Uses a two-stage strategy:
+    When the event feed is enabled (``change_detection_source = "events"``), the user
+    event feeds are consulted first; if they can answer (see check_repos_changed_via_events)
+    their result is returned and the stages below are skipped (when the feed reports changes,
+    the ``updatedAt`` baseline is advanced from the shared inventory scan). Otherwise:
 
     1. **ETag pre-check** (REST API, ``If-None-Match``):  Pages that have not
        changed return HTTP 304 Not Modified, which does **not** consume GitHub
@@ -107,6 +138,26 @@ def get_repos_changed_since_last_check() -> Optional[Set[str]]:
         Empty set if no repositories changed since the last check.
         Non-empty set of repository names whose updatedAt changed.
     """
+    # Stage 0 (optional): event feed — lists exactly which repositories saw activity.
+    if is_event_feed_enabled():
+        try:
+            feed_result = check_repos_changed_via_events(get_current_user())
+        except Exception:
+            # Event feed failure is non-fatal; fall through to the ETag / updatedAt check.
+            feed_result = None
+        # Without an updatedAt baseline the fallback below must still establish one
+        if feed_result is not None and _last_repo_updated_at:
+            print(f"  イベントフィード: {len(feed_result)} リポジトリで変化 (ETag/GraphQL スキップ)")
+            if feed_result:
+                # Phase 1/2 run anyway and read the same inventory scan, so advancing the updatedAt
+                # baseline is free here; otherwise the next fallback would report every repository
+                # updated since the feed took over. The ETag baselines are left stale: a changed
+                # page only sends the fallback on to this (now current) updatedAt comparison.
+                _last_repo_updated_at.clear()
+                _last_repo_updated_at.update(get_all_repos_updated_at())
+            invalidate_repositories(feed_result)
+            return feed_result
+
     # Stage 1: ETag pre-check — free 304 responses skip the GraphQL query.
     try:
         etag_result = check_repos_etag_changed()
@@ -123,6 +174,8 @@ def get_repos_changed_since_last_check() -> Optional[Set[str]]:
 
     if not _last_repo_updated_at:
         _last_repo_updated_at.update(current_map)
+        # No baseline to compare against: cached GraphQL responses cannot be trusted
+        invalidate_repositories(None)
         return None
 
     changed: Set[str] = {name for name, ts in current_map.items() if _last_repo_updated_at.get(name) != ts}
@@ -131,6 +184,8 @@ def get_repos_changed_since_last_check() -> Optional[Set[str]]:
 
     _last_repo_updated_at.clear()
     _last_repo_updated_at.update(current_map)
+    # Drop cached responses of changed repos; unchanged repos keep answering from the cache
+    invalidate_repositories(changed)
     return changed
 
 
@@ -144,158 +199,56 @@ def reset_repos_updated_at_baseline() -> None:
     _last_repo_updated_at.clear()
 
 
-def get_repositories_with_open_prs() -> List[Dict[str, Any]]:
-    """Get all repositories with open PR counts using GraphQL (Phase 1)
-
-    Returns:
-        List of repositories with name and open PR count
-        Example: [{"name": "repo1", "owner": "user", "openPRCount": 2}, ...]
-    """
-    current_user = get_current_user()
+def export_repos_updated_at_baseline() -> Dict[str, str]:
+    """Return a copy of the stored updatedAt baseline (repository name -> updatedAt)."""
+    return dict(_last_repo_updated_at)
 
-    # GraphQL query to get all repositories with open PR counts
-    # Only includes user-owned repos (not organization repos)
-    query = """
-    query($login: String!) {{
-      user(login: $login) {{
-        repositories(first: {repositories_per_page}, ownerAffiliations: [OWNER]) {{
-          nodes {{
-            name
-            owner {{
-              login
-            }}
-            pullRequests(states: OPEN) {{
-              totalCount
-            }}
-          }}
-          pageInfo {{
-            hasNextPage
-            endCursor
-          }}
-        }}
-      }}
-      rateLimit {{
-        cost
-        remaining
-      }}
-    }}
-    """.format(repositories_per_page=REPOSITORIES_PER_PAGE)
-
-    repos_with_prs = []
-    has_next_page = True
-    end_cursor = None
 
-    while has_next_page:
-        # Build query with pagination
-        if end_cursor:
-            query_with_pagination = query.replace(
-                f"repositories(first: {REPOSITORIES_PER_PAGE}, ownerAffiliations: [OWNER])",
-                f'repositories(first: {REPOSITORIES_PER_PAGE}, ownerAffiliations: [OWNER], after: "{end_cursor}")',
-            )
-        else:
-            query_with_pagination = query
-
-        # Execute GraphQL query
-        data = execute_graphql_query(
-            query_with_pagination, {"login": current_user}, intent="リポジトリ一覧取得 (open PRあり)"
-        )
+def import_repos_updated_at_baseline(baseline: Dict[str, str]) -> None:
+    """Restore a baseline produced by export_repos_updated_at_baseline (e.g. after a restart).
 
-        repositories = data.get("data", {}).get("user", {}).get("repositories", {})
-        nodes = repositories.get("nodes", [])
-        page_info = repositories.get("pageInfo", {})
+    Raises:
+        ValueError: If the baseline is malformed (nothing is restored then)
+    """
+    if not isinstance(baseline, dict) or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in baseline.items()
+    ):
+        raise ValueError("invalid updatedAt baseline")
+    _last_repo_updated_at.clear()
+    _last_repo_updated_at.update(baseline)
 
-        # Filter repositories with open PRs
-        for repo in nodes:
-            pr_count = repo.get("pullRequests", {}).get("totalCount", 0)
-            if pr_count > 0:
-                repos_with_prs.append(
-                    {"name": repo.get("name"), "owner": repo.get("owner", {}).get("login"), "openPRCount": pr_count}
-                )
 
-        has_next_page = page_info.get("hasNextPage", False)
-        end_cursor = page_info.get("endCursor")
+def get_repositories_with_open_prs() -> List[Dict[str, Any]]:
+    """Get all repositories with open PR counts from the repository inventory (Phase 1)
 
-    return repos_with_prs
+    Returns:
+        List of repositories with name and open PR count
+        Example: [{"name": "repo1", "owner": "user", "openPRCount": 2}, ...]
+    """
+    # Filter repositories with open PRs
+    return [
+        {"name": repo["name"], "owner": repo["owner"], "openPRCount": repo["openPRCount"]}
+        for repo in get_repository_inventory()
+        if repo["openPRCount"] > 0
+    ]
 
 
 def get_all_repositories() -> List[Dict[str, Any]]:
-    """Get all repositories for the authenticated user using GraphQL
+    """Get all repositories for the authenticated user from the repository inventory
 
     Returns:
         List of repositories with name, owner, open PR count, and open issue count
         Example: [{"name": "repo1", "owner": "user", "openPRCount": 2, "openIssueCount": 5}, ...]
     """
-    current_user = get_current_user()
-
-    # GraphQL query to get all repositories with open PR and issue counts
-    # Only includes user-owned repos (not organization repos)
-    query = """
-    query($login: String!) {{
-      user(login: $login) {{
-        repositories(first: {repositories_per_page}, ownerAffiliations: [OWNER]) {{
-          nodes {{
-            name
-            owner {{
-              login
-            }}
-            pullRequests(states: OPEN) {{
-              totalCount
-            }}
-            issues(states: OPEN) {{
-              totalCount
-            }}
-          }}
-          pageInfo {{
-            hasNextPage
-            endCursor
-          }}
-        }}
-      }}
-      rateLimit {{
-        cost
-        remaining
-      }}
-    }}
-    """.format(repositories_per_page=REPOSITORIES_PER_PAGE)
-
-    all_repos = []
-    has_next_page = True
-    end_cursor = None
-
-    while has_next_page:
-        # Build query with pagination
-        if end_cursor:
-            query_with_pagination = query.replace(
-                f"repositories(first: {REPOSITORIES_PER_PAGE}, ownerAffiliations: [OWNER])",
-                f'repositories(first: {REPOSITORIES_PER_PAGE}, ownerAffiliations: [OWNER], after: "{end_cursor}")',
-            )
-        else:
-            query_with_pagination = query
-
-        # Execute GraphQL query
-        data = execute_graphql_query(query_with_pagination, {"login": current_user}, intent="リポジトリ一覧取得 (全件)")
-
-        repositories = data.get("data", {}).get("user", {}).get("repositories", {})
-        nodes = repositories.get("nodes", [])
-        page_info = repositories.get("pageInfo", {})
-
-        # Collect all repositories with their counts
-        for repo in nodes:
-            pr_count = repo.get("pullRequests", {}).get("totalCount", 0)
-            issue_count = repo.get("issues", {}).get("totalCount", 0)
-            all_repos.append(
-                {
-                    "name": repo.get("name"),
-                    "owner": repo.get("owner", {}).get("login"),
-                    "openPRCount": pr_count,
-                    "openIssueCount": issue_count,
-                }
-            )
-
-        has_next_page = page_info.get("hasNextPage", False)
-        end_cursor = page_info.get("endCursor")
-
-    return all_repos
+    return [
+        {
+            "name": repo["name"],
+            "owner": repo["owner"],
+            "openPRCount": repo["openPRCount"],
+            "openIssueCount": repo["openIssueCount"],
+        }
+        for repo in get_repository_inventory()
+    ]
 
 
 def get_repositories_with_no_prs_and_open_issues() -> List[Dict[str, Any]]:
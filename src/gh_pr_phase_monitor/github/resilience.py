@@ -0,0 +1,267 @@
+"""
+Retry, backoff and circuit breaking for GitHub API calls
+
+Transient failures (HTTP 500/502/503, secondary rate limits, dropped connections) no
+longer abandon the whole iteration:
+
+- call_with_resilience() retries idempotent reads that raise TransientGitHubError, waiting
+  for the server's Retry-After when given and otherwise with full-jitter exponential backoff
+- a per-endpoint circuit breaker skips an optional dependency (e.g. the Pages API or the
+  issue listing) for a cooldown after repeated failed calls instead of paying for the
+  failures every loop; after the cooldown one trial call decides whether it closes again
+
+Retry counts and breaker states are exposed through get_resilience_stats().
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from ..core.config import (
+    DEFAULT_API_RETRY_MAX_ATTEMPTS,
+    DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+)
+
+T = TypeVar("T")
+
+RETRY_BASE_DELAY_SECONDS = 1.0
+# Waits longer than this are not worth blocking the iteration for; the call fails instead
+RETRY_MAX_DELAY_SECONDS = 60.0
+# GitHub asks clients to wait at least a minute after a secondary rate limit without Retry-After
+SECONDARY_RATE_LIMIT_DEFAULT_WAIT_SECONDS = 60.0
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+_SECONDARY_RATE_LIMIT_MARKERS = ("secondary rate limit", "abuse detection")
+_TRANSIENT_FAILURE_MARKERS = (
+    "http 500",
+    "http 502",
+    "http 503",
+    "internal server error",
+    "bad gateway",
+    "service unavailable",
+    "connection reset",
+    "connection refused",
+    "could not resolve host",
+    "no such host",
+    "network is unreachable",
+    "unexpected eof",
+    "tls handshake",
+)
+
+
+class TransientGitHubError(RuntimeError):
+    """Raised for failures that are expected to succeed when retried (5xx, secondary limits, network)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+    def __init__(self, endpoint: str, retry_in_seconds: float):
+        super().__init__(f"{endpoint}: 連続失敗のためスキップ中 (あと{int(retry_in_seconds)}秒)")
+        self.endpoint = endpoint
+        self.retry_in_seconds = retry_in_seconds
+
+
+_retry_max_attempts: int = DEFAULT_API_RETRY_MAX_ATTEMPTS
+_failure_threshold: int = DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+_cooldown_seconds: float = DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS
+
+# endpoint -> {"state", "consecutive_failures", "opened_at", "retries", "failures", "skipped"}
+_endpoints: Dict[str, Dict[str, Any]] = {}
+_state_lock = threading.Lock()
+
+# Indirection so tests can skip the actual waiting
+_sleep = time.sleep
+
+
+def set_resilience_settings(
+    max_attempts: int = DEFAULT_API_RETRY_MAX_ATTEMPTS,
+    failure_threshold: int = DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    cooldown_seconds: float = DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+) -> None:
+    """Configure retry attempts and circuit breaker thresholds."""
+    global _retry_max_attempts, _failure_threshold, _cooldown_seconds
+    _retry_max_attempts = max(1, int(max_attempts))
+    _failure_threshold = max(1, int(failure_threshold))
+    _cooldown_seconds = max(0.0, float(cooldown_seconds))
+
+
+def is_secondary_rate_limit(text: str) -> bool:
+    """Return True when an error message describes a secondary (abuse) rate limit."""
+    lower_text = (text or "").lower()
+    return any(marker in lower_text for marker in _SECONDARY_RATE_LIMIT_MARKERS)
+
+
+def is_transient_failure(text: str) -> bool:
+    """Return True when an error message describes a failure worth retrying."""
+    lower_text = (text or "").lower()
+    return is_secondary_rate_limit(lower_text) or any(marker in lower_text for marker in _TRANSIENT_FAILURE_MARKERS)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def raise_if_transient(error_text: str, message: Optional[str] = None, retry_after: Optional[float] = None) -> None:
+    """Raise TransientGitHubError when error_text describes a retryable failure.
+
+    Args:
+        error_text: Text to classify (e.g. gh stderr or an HTTP response body)
+        message: Exception message (defaults to error_text)
+        retry_after: Server-provided wait in seconds, if any
+    """
+    if not is_transient_failure(error_text):
+        return
+    if retry_after is None and is_secondary_rate_limit(error_text):
+        retry_after = SECONDARY_RATE_LIMIT_DEFAULT_WAIT_SECONDS
+    raise TransientGitHubError((message or error_text).strip(), retry_after=retry_after)
+
+
+def _endpoint_state(endpoint: str) -> Dict[str, Any]:
+    """Return (creating on first use) the state of an endpoint (caller holds _state_lock)."""
+    return _endpoints.setdefault(
+        endpoint,
+        {
+            "state": CIRCUIT_CLOSED,
+            "consecutive_failures": 0,
+            "opened_at": 0.0,
+            "retries": 0,
+            "failures": 0,
+            "skipped": 0,
+        },
+    )
+
+
+def _before_call(endpoint: str) -> None:
+    """Raise CircuitOpenError while the endpoint's breaker is open; move to half-open after the cooldown."""
+    with _state_lock:
+        state = _endpoint_state(endpoint)
+        if state["state"] != CIRCUIT_OPEN:
+            return
+        retry_in = state["opened_at"] + _cooldown_seconds - time.monotonic()
+        if retry_in > 0:
+            state["skipped"] += 1
+            raise CircuitOpenError(endpoint, retry_in)
+        state["state"] = CIRCUIT_HALF_OPEN
+
+
+def _record_outcome(endpoint: str, failed: bool, use_circuit_breaker: bool) -> None:
+    """Update counters and the breaker state after a call finished."""
+    with _state_lock:
+        state = _endpoint_state(endpoint)
+        if not failed:
+            state["consecutive_failures"] = 0
+            state["state"] = CIRCUIT_CLOSED
+            return
+        state["failures"] += 1
+        state["consecutive_failures"] += 1
+        if not use_circuit_breaker:
+            return
+        if state["state"] == CIRCUIT_HALF_OPEN or state["consecutive_failures"] >= _failure_threshold:
+            if state["state"] != CIRCUIT_OPEN:
+                print(
+                    f"  [API] {endpoint}: {state['consecutive_failures']}回連続で失敗したため"
+                    f"{int(_cooldown_seconds)}秒間スキップします"
+                )
+            state["state"] = CIRCUIT_OPEN
+            state["opened_at"] = time.monotonic()
+
+
+def _backoff_delay(retry_number: int) -> float:
+    """Full-jitter exponential backoff for the retry_number-th retry (0-based)."""
+    return random.uniform(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * (2**retry_number)))
+
+
+def call_with_resilience(
+    endpoint: str,
+    operation: Callable[[], T],
+    idempotent: bool = True,
+    use_circuit_breaker: bool = True,
+) -> T:
+    """Run operation with retries for transient failures and an optional circuit breaker.
+
+    Args:
+        endpoint: Name of the dependency (counters and breaker state are kept per name)
+        operation: Callable performing one attempt; raises TransientGitHubError for retryable failures
+        idempotent: Retry only when True (reads); non-idempotent calls are attempted once
+        use_circuit_breaker: Skip the call while the endpoint's breaker is open
+
+    Returns:
+        The operation's result
+
+    Raises:
+        CircuitOpenError: If the breaker is open (the operation is not called)
+        TransientGitHubError: If every attempt failed transiently
+        Exception: Any non-transient error raised by the operation, unchanged
+    """
+    if use_circuit_breaker:
+        _before_call(endpoint)
+
+    max_attempts = _retry_max_attempts if idempotent else 1
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            result = operation()
+        except TransientGitHubError as e:
+            delay = e.retry_after if e.retry_after is not None else _backoff_delay(attempt - 1)
+            if attempt >= max_attempts or delay > RETRY_MAX_DELAY_SECONDS:
+                _record_outcome(endpoint, True, use_circuit_breaker)
+                raise
+            with _state_lock:
+                _endpoint_state(endpoint)["retries"] += 1
+            summary = str(e).splitlines()[0] if str(e) else type(e).__name__
+            print(
+                f"  [API] {endpoint}: 一時的なエラーのため{delay:.1f}秒後に再試行します ({attempt}/{max_attempts}): {summary}"
+            )
+            _sleep(delay)
+            continue
+        except Exception:
+            # The endpoint answered (e.g. 404 or a query error): it is reachable
+            _record_outcome(endpoint, False, use_circuit_breaker)
+            raise
+        _record_outcome(endpoint, False, use_circuit_breaker)
+        return result
+
+
+def get_resilience_stats() -> Dict[str, Dict[str, Any]]:
+    """Return retry / failure / skip counters and the breaker state per endpoint."""
+    with _state_lock:
+        return {
+            endpoint: {
+                "state": state["state"],
+                "retries": state["retries"],
+                "failures": state["failures"],
+                "skipped": state["skipped"],
+            }
+            for endpoint, state in _endpoints.items()
+        }
+
+
+def reset_resilience_state() -> None:
+    """Close every breaker and reset the counters (useful for tests)."""
+    with _state_lock:
+        _endpoints.clear()
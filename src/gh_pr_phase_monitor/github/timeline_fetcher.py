@@ -0,0 +1,156 @@
+"""Conditional REST fetch of PR timelines (GET /repos/{owner}/{repo}/issues/{number}/timeline).
+
+The timeline lists events oldest first, so new events are always appended to the last
+page. Each PR remembers its pages and the ETag of its last page; the next fetch sends
+``If-None-Match`` for that page only. An unchanged PR therefore costs a single 304
+response, which does not consume rate-limit points. When the last page changed, it is
+replaced and any pages that appeared after it are fetched. A full last page
+(TIMELINE_PAGE_SIZE events) does not change when new events start the next page, so
+the page after it is probed as well (conditionally, once its empty response was seen).
+"""
+
+import json
+import re
+import subprocess
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .gh_api_response import parse_gh_api_response
+
+TIMELINE_PAGE_SIZE = 100
+# Safety bound on pages followed in one fetch (10,000 events)
+TIMELINE_MAX_PAGES = 100
+
+_PR_URL_PATTERN = re.compile(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+_NEXT_LINK_PATTERN = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="next"')
+
+# "{owner}/{repo}#{number}" -> {"pages": [[event, ...], ...], "etag": str | None, "next_etag": str | None}
+# ("next_etag" is the ETag of the empty page after a full last page)
+_timelines: Dict[str, Dict[str, Any]] = {}
+_state_lock = threading.Lock()
+# Conditional requests sent and how many of them returned 304
+_stats: Dict[str, int] = {"conditional": 0, "not_modified": 0}
+
+
+def _run_timeline_api(
+    owner: str, repo: str, number: int, page: int, etag: Optional[str] = None
+) -> subprocess.CompletedProcess:
+    """Run gh api --include for one page of a PR's timeline."""
+    args = [
+        "gh",
+        "api",
+        "--include",
+        f"/repos/{owner}/{repo}/issues/{number}/timeline?per_page={TIMELINE_PAGE_SIZE}&page={page}",
+    ]
+    if etag:
+        args.extend(["-H", f"If-None-Match: {etag}"])
+    return subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+
+
+def _fetch_page(
+    owner: str, repo: str, number: int, page: int, etag: Optional[str] = None
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], bool]:
+    """Fetch one timeline page.
+
+    Returns:
+        (events, etag, has_next); events is None when the page is unchanged (304)
+
+    Raises:
+        ValueError: If the response is neither 200 nor 304, or its body is not a JSON list
+    """
+    result = _run_timeline_api(owner, repo, number, page, etag)
+    status_code, headers, body = parse_gh_api_response(result.stdout or "")
+    if status_code == 304 and etag:
+        return None, etag, False
+    if status_code != 200:
+        raise ValueError(f"timeline request for {owner}/{repo}#{number} page {page} returned {status_code}")
+    events = json.loads(body)
+    if not isinstance(events, list):
+        raise ValueError(f"unexpected timeline response for {owner}/{repo}#{number}")
+    has_next = bool(_NEXT_LINK_PATTERN.search(headers.get("link", "")))
+    return events, headers.get("etag"), has_next
+
+
+def fetch_pr_timeline(owner: str, repo: str, number: int) -> List[Dict[str, Any]]:
+    """Return every timeline event of a PR, oldest first, using the stored ETags.
+
+    Raises:
+        ValueError: If the timeline cannot be fetched (the stored timeline is kept)
+    """
+    key = f"{owner}/{repo}#{number}"
+    with _state_lock:
+        stored = _timelines.get(key)
+        pages = [list(page) for page in stored["pages"]] if stored else []
+        etag = stored.get("etag") if stored else None
+        next_etag = stored.get("next_etag") if stored else None
+
+    page_number = max(len(pages), 1)
+    events, new_etag, has_next = _fetch_page(owner, repo, number, page_number, etag if pages else None)
+    _count_conditional(bool(etag and pages), events is None)
+    if events is not None:
+        pages[page_number - 1 :] = [events]
+    elif len(pages[-1]) < TIMELINE_PAGE_SIZE:
+        return [event for page in pages for event in page]
+    else:
+        # A full last page stays unchanged when new events start the next page, so probe that one too
+        events, probed_etag, has_next = _fetch_page(owner, repo, number, len(pages) + 1, next_etag)
+        _count_conditional(bool(next_etag), events is None)
+        if not events:
+            # Still no next page; its ETag (of the empty page) makes the next probe a free 304
+            if probed_etag != next_etag:
+                with _state_lock:
+                    _timelines[key] = {"pages": pages, "etag": etag, "next_etag": probed_etag}
+            return [event for page in pages for event in page]
+        pages.append(events)
+        new_etag = probed_etag
+
+    while has_next and len(pages) < TIMELINE_MAX_PAGES:
+        events, new_etag, has_next = _fetch_page(owner, repo, number, len(pages) + 1)
+        pages.append(events or [])
+
+    with _state_lock:
+        _timelines[key] = {"pages": pages, "etag": new_etag, "next_etag": None}
+    return [event for page in pages for event in page]
+
+
+def _count_conditional(sent_validator: bool, not_modified: bool) -> None:
+    """Add a request to the conditional request statistics if it carried a validator."""
+    if not sent_validator:
+        return
+    with _state_lock:
+        _stats["conditional"] += 1
+        if not_modified:
+            _stats["not_modified"] += 1
+
+
+def get_timeline_stats() -> Dict[str, int]:
+    """Return the conditional timeline request counts (conditional / not_modified)."""
+    with _state_lock:
+        return dict(_stats)
+
+
+def retain_pr_timelines(open_pr_urls: Iterable[str]) -> None:
+    """Drop the stored timelines of PRs that are no longer open."""
+    keep = set()
+    for url in open_pr_urls:
+        match = _PR_URL_PATTERN.search(url or "")
+        if match:
+            keep.add(f"{match.group(1)}/{match.group(2)}#{match.group(3)}")
+    with _state_lock:
+        for key in [key for key in _timelines if key not in keep]:
+            del _timelines[key]
+
+
+def reset_timeline_state() -> None:
+    """Forget stored timelines and statistics (useful for tests)."""
+    with _state_lock:
+        _timelines.clear()
+        _stats["conditional"] = 0
+        _stats["not_modified"] = 0
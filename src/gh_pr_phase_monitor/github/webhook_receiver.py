@@ -0,0 +1,221 @@
+"""Embedded HTTP listener for GitHub webhook deliveries (push-based refresh).
+
+Polling costs API calls every iteration even when nothing happened. With
+``webhook_listen_port`` set, a small HTTP server in a background thread accepts webhook
+deliveries from GitHub (typically forwarded to localhost, e.g. by ``gh webhook forward``
+or a reverse proxy), validates ``X-Hub-Signature-256`` against ``webhook_secret`` and
+queues targeted refreshes:
+
+- PR-level events (reviews, comments on PRs, new commits) queue the PR's URL, so the next
+  iteration re-fetches that PR's HTML in addition to the regular selection
+- repository-level events (push, issues, page builds, PRs opened/closed) queue the
+  repository's "owner/name", which is treated as changed by the next iteration
+
+Every queued delivery wakes wait_with_countdown() so the refresh runs immediately.
+Polling keeps running as a slow fallback (``webhook_fallback_interval``) in case a
+delivery is lost.
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Set, Tuple
+
+# Events that affect what the monitor displays; others are acknowledged and ignored
+WEBHOOK_EVENTS = frozenset({"pull_request", "pull_request_review", "issue_comment", "issues", "push", "page_build"})
+# pull_request actions that change which PRs are open (a repository-level refresh)
+PR_SET_CHANGING_ACTIONS = frozenset({"opened", "closed", "reopened"})
+# GitHub caps webhook payloads at 25 MB
+MAX_PAYLOAD_BYTES = 25 * 1024 * 1024
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_thread: Optional[threading.Thread] = None
+_secret: bytes = b""
+# (host, port) from the config the running listener was started with
+_listen_address: Optional[Tuple[str, int]] = None
+
+_pending_repos: Set[str] = set()
+_pending_pr_urls: Set[str] = set()
+_state_lock = threading.Lock()
+# Set whenever a delivery queued a refresh; wait_with_countdown() wakes up on it
+_wake_event = threading.Event()
+
+
+def verify_signature(secret: bytes, body: bytes, signature_header: str) -> bool:
+    """Check an ``X-Hub-Signature-256: sha256=<hex>`` header against the payload."""
+    algorithm, _, signature = (signature_header or "").partition("=")
+    if algorithm != "sha256" or not signature or not secret:
+        return False
+    expected = hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.strip())
+
+
+def _refresh_targets(event: str, payload: Dict[str, Any]) -> Tuple[Set[str], Set[str]]:
+    """Return (repository full names "owner/name", PR URLs) that a delivery asks to refresh."""
+    repo_name = (payload.get("repository") or {}).get("full_name", "")
+    repos: Set[str] = set()
+    pr_urls: Set[str] = set()
+    pr_url = ""
+    if event in ("pull_request", "pull_request_review"):
+        pr_url = (payload.get("pull_request") or {}).get("html_url", "")
+        if event == "pull_request" and payload.get("action") in PR_SET_CHANGING_ACTIONS:
+            pr_url = ""
+    elif event == "issue_comment":
+        issue = payload.get("issue") or {}
+        if issue.get("pull_request"):
+            pr_url = (issue.get("pull_request") or {}).get("html_url") or issue.get("html_url", "")
+    if pr_url:
+        pr_urls.add(pr_url)
+    elif repo_name:
+        repos.add(repo_name)
+    return repos, pr_urls
+
+
+def _enqueue(repos: Set[str], pr_urls: Set[str]) -> None:
+    """Queue refresh targets and wake the monitoring loop."""
+    if not repos and not pr_urls:
+        return
+    with _state_lock:
+        _pending_repos.update(repos)
+        _pending_pr_urls.update(pr_urls)
+        _wake_event.set()
+
+
+class _WebhookRequestHandler(BaseHTTPRequestHandler):
+    """Accepts POSTed webhook deliveries; everything else is rejected."""
+
+    def _respond(self, status: int, message: str) -> None:
+        body = message.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler naming
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._respond(411, "length required")
+            return
+        if length < 0 or length > MAX_PAYLOAD_BYTES:
+            self._respond(413, "payload too large")
+            return
+        body = self.rfile.read(length)
+        if not verify_signature(_secret, body, self.headers.get("X-Hub-Signature-256", "")):
+            self._respond(401, "invalid signature")
+            return
+
+        event = self.headers.get("X-GitHub-Event", "")
+        if event not in WEBHOOK_EVENTS:
+            # ping and unrelated events are acknowledged so GitHub does not report failures
+            self._respond(200, "ignored")
+            return
+        try:
+            payload = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            self._respond(400, "invalid JSON")
+            return
+        if not isinstance(payload, dict):
+            self._respond(400, "invalid payload")
+            return
+        _enqueue(*_refresh_targets(event, payload))
+        self._respond(202, "queued")
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler naming
+        self._respond(405, "method not allowed")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - signature of the base class
+        # Keep the countdown display clean; deliveries are summarized by the iteration
+        pass
+
+
+def start_webhook_receiver(host: str, port: int, secret: str) -> int:
+    """Start listening for deliveries in a daemon thread (stops a running listener first).
+
+    Args:
+        host: Interface to bind (e.g. "127.0.0.1")
+        port: TCP port (0 picks a free port, used by tests)
+        secret: The webhook secret configured on GitHub
+
+    Returns:
+        The bound port
+
+    Raises:
+        OSError: If the port cannot be bound
+    """
+    global _server, _server_thread, _secret
+    stop_webhook_receiver()
+    _secret = secret.encode("utf-8")
+    _server = ThreadingHTTPServer((host, port), _WebhookRequestHandler)
+    _server.daemon_threads = True
+    _server_thread = threading.Thread(target=_server.serve_forever, name="webhook-receiver", daemon=True)
+    _server_thread.start()
+    return _server.server_address[1]
+
+
+def stop_webhook_receiver() -> None:
+    """Stop the listener if it is running."""
+    global _server, _server_thread, _listen_address
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+    if _server_thread is not None:
+        _server_thread.join(timeout=5)
+    _server = None
+    _server_thread = None
+    _listen_address = None
+
+
+def is_webhook_receiver_running() -> bool:
+    """Return True while the listener accepts deliveries."""
+    return _server is not None
+
+
+def apply_webhook_receiver_settings(host: str, port: int, secret: str) -> None:
+    """Start, restart, reconfigure or stop the listener according to the config.
+
+    A port of 0 disables the listener. Without a secret no delivery could be verified,
+    so the listener is not started either.
+    """
+    global _secret, _listen_address
+    if not port:
+        stop_webhook_receiver()
+        return
+    if not secret:
+        print("  [Webhook] webhook_secret が未設定のため、Webhook受信を無効にします")
+        stop_webhook_receiver()
+        return
+    if _server is not None and _listen_address == (host, port):
+        _secret = secret.encode("utf-8")
+        return
+    try:
+        bound_port = start_webhook_receiver(host, port, secret)
+    except OSError as e:
+        print(f"  [Webhook] {host}:{port} で待ち受けできません: {e}")
+        return
+    _listen_address = (host, port)
+    print(f"  [Webhook] {host}:{bound_port} でWebhookを待ち受けます")
+
+
+def get_webhook_wake_event() -> threading.Event:
+    """Return the event set whenever a delivery queued a refresh."""
+    return _wake_event
+
+
+def take_webhook_refreshes() -> Tuple[Set[str], Set[str]]:
+    """Take the queued refreshes (repository full names "owner/name", PR URLs) and clear the queue."""
+    with _state_lock:
+        repos, pr_urls = set(_pending_repos), set(_pending_pr_urls)
+        _pending_repos.clear()
+        _pending_pr_urls.clear()
+        _wake_event.clear()
+    return repos, pr_urls
+
+
+def reset_webhook_receiver_state() -> None:
+    """Stop the listener and drop queued refreshes (useful for tests)."""
+    stop_webhook_receiver()
+    take_webhook_refreshes()
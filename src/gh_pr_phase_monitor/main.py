@@ -8,33 +8,172 @@ import time
 import traceback
 
 from .core.config import (
+    CHANGE_DETECTION_SOURCE_EVENTS,
+    DEFAULT_API_BASELINE_FILE,
+    DEFAULT_API_RETRY_MAX_ATTEMPTS,
+    DEFAULT_CHANGE_DETECTION_SOURCE,
+    DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
     DEFAULT_ENABLE_AUTO_UPDATE,
     DEFAULT_ENABLE_AUTO_UPDATE_DEBUG_LOG,
+    DEFAULT_ENABLE_PR_FINGERPRINT_CHECK,
+    DEFAULT_GRAPHQL_CACHE_TTL_SECONDS,
+    DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET,
+    DEFAULT_GRAPHQL_MAX_CONCURRENCY,
+    DEFAULT_GRAPHQL_TRANSPORT,
+    DEFAULT_PR_ANALYSIS_CACHE_SIZE,
+    DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS,
+    DEFAULT_PR_FETCH_MAX_CONCURRENCY,
+    DEFAULT_PR_FETCH_MAX_PER_HOST,
+    DEFAULT_PR_HTML_FETCH_BACKEND,
+    DEFAULT_PR_HTML_MAX_BYTES,
+    DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS,
+    DEFAULT_PR_HTML_REFETCH_SOURCE,
+    DEFAULT_PR_HTML_STOP_AT_FOOTER,
+    DEFAULT_SKIP_PATH_OPEN_PR_CHECK,
+    DEFAULT_WEBHOOK_FALLBACK_INTERVAL,
+    DEFAULT_WEBHOOK_LISTEN_HOST,
+    DEFAULT_WEBHOOK_LISTEN_PORT,
+    DEFAULT_WEBHOOK_SECRET,
     get_config_mtime,
     load_config,
     parse_interval,
     print_config,
 )
-from .github.graphql_client import GitHubRateLimitError, get_rate_limit_info
+from .github.batch_executor import set_graphql_max_concurrency
+from .github.event_feed import set_event_feed_enabled
+from .github.github_auth import get_current_user
+from .github.graphql_client import GitHubRateLimitError, set_graphql_transport
+from .github.graphql_response_cache import get_cache_stats, is_cache_enabled, set_graphql_cache_ttls
+from .github.notification_poller import set_pr_html_refetch_settings
+from .github.pull_etag_checker import set_skip_path_open_pr_check
+from .github.query_budget_planner import (
+    begin_iteration,
+    get_iteration_point_budget,
+    get_spent_points,
+    set_iteration_point_budget,
+)
 from .github.rate_limit_handler import (
     _check_rate_limit_throttle,
     _display_rate_limit_usage,
+    _display_rest_rate_limit_status,
     _format_rate_limit_reset,
 )
+from .github.rate_limit_tracker import GRAPHQL_BUCKET, get_all_rate_limit_snapshots, get_rate_limit_snapshot
+from .github.resilience import get_resilience_stats, set_resilience_settings
+from .github.timeline_fetcher import get_timeline_stats
+from .github.webhook_receiver import (
+    apply_webhook_receiver_settings,
+    get_webhook_wake_event,
+    is_webhook_receiver_running,
+)
 from .monitor.auto_updater import (
     UPDATE_CHECK_INTERVAL_SECONDS,
     maybe_self_update,
     run_startup_self_update_foreground,
     set_auto_update_debug_log_enabled,
 )
+from .monitor.baseline_store import load_baselines, save_baselines
 from .monitor.error_logger import log_error_to_file
 from .monitor.iteration_runner import run_one_iteration
 from .monitor.monitor import check_no_state_change_timeout, determine_current_interval
+from .monitor.pr_fingerprint_tracker import set_pr_fingerprint_settings
+from .monitor.pr_processor import set_pr_fetch_concurrency
 from .monitor.state_tracker import get_last_pr_snapshot
+from .phase.html.pr_html_analysis_cache import set_analysis_cache_size, take_analysis_cache_stats
+from .phase.html.pr_html_fetcher import set_pr_html_fetch_backend, set_pr_html_fetch_limits
+from .phase.html.pr_html_http_client import get_page_fetch_stats
+from .phase.html.pr_html_validators import get_pr_html_validator_stats
 from .ui.display import display_cached_top_issues, display_status_summary
 from .ui.wait_handler import wait_with_countdown
 
 
+def _apply_network_settings(config: dict) -> None:
+    """Apply API transport / fetching settings from config to the modules that use them.
+
+    Called at startup and again whenever the config file is hot-reloaded.
+    """
+    set_graphql_transport(config.get("graphql_transport", DEFAULT_GRAPHQL_TRANSPORT))
+    set_graphql_max_concurrency(config.get("graphql_max_concurrency", DEFAULT_GRAPHQL_MAX_CONCURRENCY))
+    set_iteration_point_budget(
+        config.get("graphql_iteration_point_budget", DEFAULT_GRAPHQL_ITERATION_POINT_BUDGET)
+    )
+    set_graphql_cache_ttls(config.get("graphql_cache_ttl_seconds", DEFAULT_GRAPHQL_CACHE_TTL_SECONDS))
+    set_resilience_settings(
+        config.get("api_retry_max_attempts", DEFAULT_API_RETRY_MAX_ATTEMPTS),
+        config.get("circuit_breaker_failure_threshold", DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD),
+        config.get("circuit_breaker_cooldown_seconds", DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS),
+    )
+    set_event_feed_enabled(
+        config.get("change_detection_source", DEFAULT_CHANGE_DETECTION_SOURCE) == CHANGE_DETECTION_SOURCE_EVENTS
+    )
+    set_pr_html_refetch_settings(
+        config.get("pr_html_refetch_source", DEFAULT_PR_HTML_REFETCH_SOURCE),
+        config.get("pr_html_refetch_safety_interval_seconds", DEFAULT_PR_HTML_REFETCH_SAFETY_INTERVAL_SECONDS),
+    )
+    set_skip_path_open_pr_check(config.get("skip_path_open_pr_check", DEFAULT_SKIP_PATH_OPEN_PR_CHECK))
+    set_pr_fingerprint_settings(
+        config.get("enable_pr_fingerprint_check", DEFAULT_ENABLE_PR_FINGERPRINT_CHECK),
+        config.get("pr_analysis_max_staleness_seconds", DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS),
+    )
+    set_pr_html_fetch_backend(config.get("pr_html_fetch_backend", DEFAULT_PR_HTML_FETCH_BACKEND))
+    set_pr_html_fetch_limits(
+        config.get("pr_html_stop_at_footer", DEFAULT_PR_HTML_STOP_AT_FOOTER),
+        config.get("pr_html_max_bytes", DEFAULT_PR_HTML_MAX_BYTES),
+    )
+    set_analysis_cache_size(config.get("pr_analysis_cache_size", DEFAULT_PR_ANALYSIS_CACHE_SIZE))
+    set_pr_fetch_concurrency(
+        config.get("pr_fetch_max_concurrency", DEFAULT_PR_FETCH_MAX_CONCURRENCY),
+        config.get("pr_fetch_max_per_host", DEFAULT_PR_FETCH_MAX_PER_HOST),
+    )
+    apply_webhook_receiver_settings(
+        config.get("webhook_listen_host", DEFAULT_WEBHOOK_LISTEN_HOST),
+        config.get("webhook_listen_port", DEFAULT_WEBHOOK_LISTEN_PORT),
+        config.get("webhook_secret", DEFAULT_WEBHOOK_SECRET),
+    )
+
+
+def _apply_webhook_fallback_interval(
+    config: dict, interval_seconds: float, interval_str: str
+) -> tuple[float, str]:
+    """Stretch the wait to webhook_fallback_interval while webhook deliveries drive refreshes.
+
+    Polling then only guards against lost deliveries; each delivery ends the wait early.
+    """
+    if not is_webhook_receiver_running():
+        return interval_seconds, interval_str
+    fallback_str = config.get("webhook_fallback_interval", DEFAULT_WEBHOOK_FALLBACK_INTERVAL)
+    try:
+        fallback_seconds = parse_interval(fallback_str)
+    except ValueError:
+        return interval_seconds, interval_str
+    if fallback_seconds > interval_seconds:
+        return fallback_seconds, fallback_str
+    return interval_seconds, interval_str
+
+
+def _restore_api_baselines(config: dict) -> None:
+    """Restore persisted ETag / updatedAt baselines at startup when api_baseline_file is set."""
+    baseline_file = config.get("api_baseline_file", DEFAULT_API_BASELINE_FILE)
+    if not baseline_file:
+        return
+    try:
+        load_baselines(baseline_file, get_current_user())
+    except Exception as baseline_error:
+        log_error_to_file("Failed to restore API baselines", baseline_error)
+
+
+def _persist_api_baselines(config: dict) -> None:
+    """Save the current ETag / updatedAt baselines after an iteration when api_baseline_file is set."""
+    baseline_file = config.get("api_baseline_file", DEFAULT_API_BASELINE_FILE)
+    if not baseline_file:
+        return
+    try:
+        save_baselines(baseline_file, get_current_user())
+    except Exception as baseline_error:
+        log_error_to_file("Failed to persist API baselines", baseline_error)
+
+
 def main():
     """Main execution function"""
     # --fetch-pr-html <URL> オプション: PR HTMLを取得してlogs/pr/に保存して終了
@@ -65,6 +204,7 @@ def main():
     set_auto_update_debug_log_enabled(
         config.get("enable_auto_update_debug_log", DEFAULT_ENABLE_AUTO_UPDATE_DEBUG_LOG)
     )
+    _apply_network_settings(config)
 
     # Get interval
     normal_interval_str = config.get("interval", "1m")
@@ -98,6 +238,9 @@ def main():
         apply_update=config.get("enable_auto_update", DEFAULT_ENABLE_AUTO_UPDATE)
     )
 
+    # Continue from the baselines saved before the last restart (free 304s instead of a cold scan)
+    _restore_api_baselines(config)
+
     # Infinite monitoring loop
     iteration = 0
     consecutive_failures = 0
@@ -114,9 +257,11 @@ def main():
         print(f"Check #{iteration} - {time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'=' * 50}")
 
-        # Capture rate limit before API calls for per-iteration consumption tracking
+        # Capture rate limit before API calls for per-iteration consumption tracking.
+        # The tracker is fed by the rateLimit field / x-ratelimit-* headers of earlier responses,
+        # so this costs no extra API call.
         try:
-            before_rate_limit = get_rate_limit_info()
+            before_rate_limit = get_rate_limit_snapshot(GRAPHQL_BUCKET)
         except Exception as rate_limit_error:
             log_error_to_file("Failed to fetch pre-iteration rate limit info", rate_limit_error)
             before_rate_limit = None
@@ -125,6 +270,9 @@ def main():
         repos_with_prs: list = []
         skip_pr_check = False
 
+        # Start a fresh GraphQL point budget for this iteration
+        begin_iteration()
+
         try:
             all_prs, repos_with_prs, skip_pr_check = run_one_iteration(config, iteration)
             consecutive_failures = 0
@@ -159,6 +307,8 @@ def main():
                 print("\nEncountered 3 consecutive unexpected errors; continuing monitoring with error counter capped.")
                 consecutive_failures = 3
 
+        _persist_api_baselines(config)
+
         # Display status summary before waiting
         # This helps users understand the current state at a glance,
         # especially on terminals with limited display lines.
@@ -166,12 +316,56 @@ def main():
         # incomplete or empty data, which is acceptable as it reflects the actual
         # state that was successfully retrieved before the error.
         try:
-            after_rate_limit = get_rate_limit_info()
+            after_rate_limit = get_rate_limit_snapshot(GRAPHQL_BUCKET)
             _display_rate_limit_usage(before_rate_limit, after_rate_limit)
+            _display_rest_rate_limit_status(get_all_rate_limit_snapshots())
         except Exception as rate_limit_display_error:
             log_error_to_file("Failed to display rate limit usage", rate_limit_display_error)
             after_rate_limit = None
 
+        if get_iteration_point_budget() > 0:
+            print(f"  [GraphQL] イテレーション予算: {get_spent_points()}/{get_iteration_point_budget()}点使用")
+        if is_cache_enabled():
+            cache_summary = ", ".join(
+                f"{kind}: hit={stats['hits']} miss={stats['misses']}" for kind, stats in sorted(get_cache_stats().items())
+            )
+            print(f"  [GraphQL] レスポンスキャッシュ累計: {cache_summary or 'なし'}")
+        resilience_summary = ", ".join(
+            f"{endpoint}: retry={stats['retries']} fail={stats['failures']} circuit={stats['state']}"
+            for endpoint, stats in sorted(get_resilience_stats().items())
+            if stats["retries"] or stats["failures"] or stats["state"] != "closed"
+        )
+        if resilience_summary:
+            print(f"  [API] 再試行/サーキット累計: {resilience_summary}")
+        html_stats = get_pr_html_validator_stats()
+        if html_stats["conditional"]:
+            hit_rate = 100 * html_stats["not_modified"] / html_stats["conditional"]
+            print(
+                f"  [HTML] 条件付きGET累計: 304={html_stats['not_modified']}/{html_stats['conditional']}"
+                f" (ヒット率 {hit_rate:.0f}%)"
+            )
+        page_stats = get_page_fetch_stats()
+        if page_stats["requests"]:
+            print(
+                f"  [HTML] 転送量累計: {page_stats['wire_bytes'] / 1024:.0f} KB"
+                f" (展開後 {page_stats['decoded_bytes'] / 1024:.0f} KB, {page_stats['requests']}件,"
+                f" footerで打ち切り {page_stats['stopped_at_footer']}件, 上限超過 {page_stats['over_budget']}件)"
+            )
+        analysis_cache_stats = take_analysis_cache_stats()
+        analysis_lookups = analysis_cache_stats["hits"] + analysis_cache_stats["misses"]
+        if analysis_lookups:
+            print(
+                f"  [HTML] 解析キャッシュ（今回）: hit={analysis_cache_stats['hits']}/{analysis_lookups}"
+                f" (ヒット率 {100 * analysis_cache_stats['hits'] / analysis_lookups:.0f}%)"
+            )
+        timeline_stats = get_timeline_stats()
+        if timeline_stats["conditional"]:
+            hit_rate = 100 * timeline_stats["not_modified"] / timeline_stats["conditional"]
+            print(
+                f"  [Timeline] 条件付きGET累計: 304={timeline_stats['not_modified']}/{timeline_stats['conditional']}"
+                f" (ヒット率 {hit_rate:.0f}%)"
+            )
+
         # Check if current consumption rate would exhaust the rate limit before reset
         try:
             should_throttle, throttled_interval = _check_rate_limit_throttle(
@@ -215,6 +409,9 @@ def main():
             normal_interval_str,
             config,
         )
+        current_interval_seconds, current_interval_str = _apply_webhook_fallback_interval(
+            config, current_interval_seconds, current_interval_str
+        )
 
         # Wait with countdown display and check for config changes
         try:
@@ -229,6 +426,7 @@ def main():
                 self_update_interval_seconds=UPDATE_CHECK_INTERVAL_SECONDS,
                 status_display_callback=redisplay_cached_issues,
                 status_display_interval_seconds=60,
+                wake_event=get_webhook_wake_event() if is_webhook_receiver_running() else None,
             )
         except Exception as wait_error:
             log_error_to_file("wait_with_countdown failed; falling back to sleep", wait_error)
@@ -243,6 +441,7 @@ def main():
             set_auto_update_debug_log_enabled(
                 config.get("enable_auto_update_debug_log", DEFAULT_ENABLE_AUTO_UPDATE_DEBUG_LOG)
             )
+            _apply_network_settings(config)
             # Update normal interval only on hot reload (config change).
             # This prevents the normal interval from being contaminated by reduced frequency
             # interval values that may be returned from wait_with_countdown().
@@ -0,0 +1,148 @@
+"""
+On-disk persistence of change-detection baselines
+
+The watcher restarts itself (restart_application) after every auto-update or self-pull.
+Without persisted state the first iteration after a restart is a cold full scan; with
+``api_baseline_file`` set, the following are saved after every iteration and restored
+at startup so the restarted process continues with free 304 responses:
+
+- per-page ETags of GET /user/repos (etag_checker)
+- per-repository issue ETags (issue_etag_checker)
+- per-repository open pull request list ETags (pull_etag_checker)
+- the updatedAt baseline (repository_fetcher)
+- the last PR snapshot and the cached top issues, which the ETag / updatedAt fast paths
+  display instead of re-fetching
+- the PR HTML validators (ETag / Last-Modified plus the analysis of that page), so PR
+  pages are fetched with conditional GETs right after a restart
+
+The file carries a schema version and the authenticated user's login; a file written
+by another schema or for another user is ignored (the next iteration is a full scan).
+"""
+
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..github.etag_checker import export_etag_state, import_etag_state
+from ..github.issue_etag_checker import export_issue_etag_state, import_issue_etag_state
+from ..github.pull_etag_checker import export_pull_etag_state, import_pull_etag_state
+from ..github.repository_fetcher import export_repos_updated_at_baseline, import_repos_updated_at_baseline
+from ..phase.html.pr_html_validators import export_pr_html_validators, import_pr_html_validators
+from ..ui.display import get_cached_top_issues, restore_cached_top_issues
+from .state_tracker import get_last_pr_snapshot, set_last_pr_snapshot
+
+BASELINE_SCHEMA_VERSION = 1
+
+
+def _build_baselines(user: str) -> Dict[str, Any]:
+    """Collect the current baselines into one JSON-serializable document."""
+    document: Dict[str, Any] = {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "user": user,
+        "saved_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "repo_page_etags": export_etag_state(),
+        "issue_etags": export_issue_etag_state(),
+        "repo_updated_at": export_repos_updated_at_baseline(),
+        "top_issues": get_cached_top_issues(),
+        "pull_etags": export_pull_etag_state(),
+        "pr_html_validators": export_pr_html_validators(),
+    }
+    snapshot = get_last_pr_snapshot()
+    if snapshot is not None:
+        document["pr_snapshot"] = {"prs": snapshot[0], "repos": snapshot[1]}
+    return document
+
+
+def save_baselines(path: str | Path, user: str) -> bool:
+    """Write the current baselines to path (atomically, via a temporary file).
+
+    Returns:
+        True if the file was written, False if the baselines could not be serialized or written
+    """
+    path = Path(path)
+    try:
+        text = json.dumps(_build_baselines(user), ensure_ascii=False)
+    except (TypeError, ValueError) as e:
+        print(f"  [Baseline] ベースラインをJSONに変換できないため保存をスキップしました: {e}")
+        return False
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"  [Baseline] ベースラインの保存に失敗しました ({path}): {e}")
+        return False
+    return True
+
+
+def _read_document(path: Path, user: str) -> Optional[Dict[str, Any]]:
+    """Read and validate the stored document header; return None when it must be ignored."""
+    if not path.exists():
+        return None
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"  [Baseline] ベースラインファイルを読み込めません ({path}): {e}")
+        return None
+    if not isinstance(document, dict) or document.get("schema_version") != BASELINE_SCHEMA_VERSION:
+        print(f"  [Baseline] スキーマが異なるためベースラインを破棄します ({path})")
+        return None
+    if document.get("user") != user:
+        print(f"  [Baseline] 別ユーザーのベースラインのため破棄します ({path})")
+        return None
+    return document
+
+
+def load_baselines(path: str | Path, user: str) -> bool:
+    """Restore baselines saved by save_baselines for the same user and schema version.
+
+    Either every section is restored or nothing is (a malformed file leaves the cold-start state).
+
+    Returns:
+        True if the baselines were restored
+    """
+    path = Path(path)
+    document = _read_document(path, user)
+    if document is None:
+        return False
+
+    snapshot = document.get("pr_snapshot")
+    top_issues = document.get("top_issues")
+    snapshot_is_valid = snapshot is None or (
+        isinstance(snapshot, dict) and isinstance(snapshot.get("prs"), list) and isinstance(snapshot.get("repos"), list)
+    )
+    if not snapshot_is_valid or not isinstance(top_issues, list):
+        print(f"  [Baseline] ベースラインファイルの形式が不正なため破棄します ({path})")
+        return False
+
+    previous = (
+        export_etag_state(),
+        export_issue_etag_state(),
+        export_repos_updated_at_baseline(),
+        export_pr_html_validators(),
+        export_pull_etag_state(),
+    )
+    try:
+        import_etag_state(document.get("repo_page_etags"))
+        import_issue_etag_state(document.get("issue_etags"))
+        import_repos_updated_at_baseline(document.get("repo_updated_at"))
+        # Optional sections (files written before these were persisted lack them)
+        import_pr_html_validators(document.get("pr_html_validators", {}))
+        import_pull_etag_state(document.get("pull_etags", {}))
+    except (ValueError, TypeError, AttributeError) as e:
+        import_etag_state(previous[0])
+        import_issue_etag_state(previous[1])
+        import_repos_updated_at_baseline(previous[2])
+        import_pr_html_validators(previous[3])
+        import_pull_etag_state(previous[4])
+        print(f"  [Baseline] ベースラインファイルの形式が不正なため破棄します ({path}): {e}")
+        return False
+
+    if snapshot is not None:
+        set_last_pr_snapshot(snapshot["prs"], snapshot["repos"])
+    restore_cached_top_issues(top_issues)
+    print(f"  [Baseline] 前回のベースラインを復元しました ({document.get('saved_at', '?')} 保存)")
+    return True
@@ -1,13 +1,22 @@
 """One monitoring loop iteration for GitHub PR Phase Monitor."""
 
-from ..core.config import DEFAULT_MAX_LLM_WORKING_PARALLEL, validate_phase3_merge_config_required
+from ..core.config import (
+    DEFAULT_MAX_LLM_WORKING_PARALLEL,
+    DEFAULT_WEBHOOK_FALLBACK_INTERVAL,
+    validate_phase3_merge_config_required,
+)
+from ..core.interval_parser import parse_interval
 from ..github.github_auth import get_current_user
 from ..github.github_client import (
     get_pr_details_batch,
     get_repos_changed_since_last_check,
     get_repositories_with_open_prs,
+    repository_inventory_scope,
     reset_repos_updated_at_baseline,
 )
+from ..github.notification_poller import select_prs_fetched_before, select_prs_for_html_refetch
+from ..github.pull_etag_checker import check_open_pulls_changed, is_open_pull_probe_enabled
+from ..github.webhook_receiver import take_webhook_refreshes
 from ..monitor.error_logger import log_error_to_file
 from ..monitor.local_repo_watcher import (
     display_pending_local_repo_results,
@@ -25,6 +34,11 @@ from ..ui.display import display_cached_top_issues, display_issues_from_repos_wi
 def run_one_iteration(config: dict, iteration: int) -> tuple[list, list, bool]:
     """Execute one monitoring loop iteration.
 
+    The whole iteration runs inside one repository inventory scope (a request coalescing
+    scope), so the updatedAt check, Phase 1, the skip path and the issue listing share a
+    single repository scan, and repeated identical lookups such as the current user or
+    the cat-window-watcher process check share one result.
+
     Runs:
     1. updatedAt pre-check (Phase 1/2 skip optimisation)
     2. Phase 1: fetch repos with open PRs (if not skipped)
@@ -39,6 +53,12 @@ def run_one_iteration(config: dict, iteration: int) -> tuple[list, list, bool]:
     Raises:
         Any exception raised by the underlying calls (to be caught by the caller).
     """
+    with repository_inventory_scope():
+        return _run_iteration_steps(config, iteration)
+
+
+def _run_iteration_steps(config: dict, iteration: int) -> tuple[list, list, bool]:
+    """Run the steps of run_one_iteration() (see there)."""
     all_prs: list = []
     repos_with_prs: list = []
     phase3_repo_names: list[str] = []
@@ -59,6 +79,16 @@ def run_one_iteration(config: dict, iteration: int) -> tuple[list, list, bool]:
     except Exception as updated_at_error:
         log_error_to_file("updatedAt check failed, running full check", updated_at_error)
 
+    # Webhook deliveries received since the previous iteration: repository-level events force
+    # Phase 1/2 even when updatedAt has not caught up yet; PR-level events select the PRs whose
+    # HTML the skip path re-fetches
+    webhook_repos, webhook_pr_urls = take_webhook_refreshes()
+    if webhook_repos:
+        print(f"  Webhook: {len(webhook_repos)} リポジトリの更新を受信 → Phase 1/2 実行")
+        if changed_repos is not None:
+            changed_repos = changed_repos | _owned_repo_names(webhook_repos)
+        skip_pr_check = False
+
     if not skip_pr_check:
         # Phase 1: Get all repositories with open PRs (lightweight query)
         print("\nPhase 1: Fetching repositories with open PRs...")
@@ -110,7 +140,7 @@ def run_one_iteration(config: dict, iteration: int) -> tuple[list, list, bool]:
         if snapshot is not None and snapshot[0]:
             cached_prs, cached_repos = snapshot
             all_prs, repos_with_prs, skip_pr_check = _run_skip_check_path(
-                cached_prs, cached_repos, phase3_repo_names, config
+                cached_prs, cached_repos, phase3_repo_names, config, webhook_pr_urls
             )
         else:
             # スナップショット未作成またはPRなし: 次イテレーションでフルチェックを強制する
@@ -162,6 +192,16 @@ def run_one_iteration(config: dict, iteration: int) -> tuple[list, list, bool]:
     return all_prs, repos_with_prs, skip_pr_check
 
 
+def _owned_repo_names(full_names: set) -> set:
+    """Return the names of the current user's repositories among "owner/name" webhook targets.
+
+    changed_repos holds bare names of the user's own repositories, so a delivery for a
+    same-named repository of another owner must not mark the user's repository as changed.
+    """
+    prefix = f"{get_current_user().lower()}/"
+    return {full_name[len(prefix) :] for full_name in full_names if full_name.lower().startswith(prefix)}
+
+
 def _maybe_display_available_work(all_prs: list, config: dict) -> None:
     """Display available work (issues) when conditions allow more parallel PRs.
 
@@ -205,56 +245,150 @@ def _run_skip_check_path(
     cached_repos: list,
     phase3_repo_names: list,
     config: dict,
+    webhook_pr_urls: set | None = None,
 ) -> tuple[list, list, bool]:
     """Handle the skip_pr_check path: re-check PR counts and re-fetch HTML if needed.
 
+    With skip_path_open_pr_check = "rest_etag" the PR counts are checked with per-repository
+    ETag probes, and only repositories whose open PR list changed get their details re-fetched.
+    PRs named by webhook deliveries are added to the notification-based selection; without one,
+    the other PRs are re-fetched once their HTML is older than webhook_fallback_interval.
+
     Returns:
         (all_prs, repos_with_prs, skip_pr_check)
         skip_pr_check is always False (reset so display uses live HTML-fetched data).
     """
-    # open PR 件数を毎回 GraphQL で再取得し、変化があれば Phase 1/2 を強制実行する
-    # (updatedAt は PR の新規作成を反映しないことがあるため、件数の乖離が生じうる)
-    # リポジトリごとの件数を辞書で比較することで、「1件クローズ+1件新規」のように
-    # 合計が変わらない場合でも変化を検知できる。
-    print("\n  open PR 件数を再確認中 (GraphQL)...")
-    fresh_repos_with_prs = get_repositories_with_open_prs()
-    cached_count_map = {
-        (r.get("owner", ""), r.get("name", "")): r.get("openPRCount", 0) for r in cached_repos
-    }
-    fresh_count_map = {
-        (r.get("owner", ""), r.get("name", "")): r.get("openPRCount", 0)
-        for r in fresh_repos_with_prs
-    }
-
-    if fresh_count_map != cached_count_map:
-        # リポジトリごとの PR 件数が変化 → Phase 1/2 を強制実行して最新の PR 一覧を取得する
-        print("  open PR 件数/構成が変化。Phase 1/2 を強制実行します。")
-        repos_with_prs = fresh_repos_with_prs
-
-        # validate phase3_merge configuration (same as normal Phase 1 flow)
-        print("\nValidating phase3_merge configuration...")
-        for repo in repos_with_prs:
-            repo_owner = repo.get("owner", "")
-            repo_name = repo.get("name", "")
-            if repo_owner and repo_name:
-                validate_phase3_merge_config_required(config, repo_owner, repo_name)
+    changed_repo_keys: set | None = None
+    if is_open_pull_probe_enabled():
+        # リポジトリごとの open PR 一覧を ETag 付き REST で確認する (304 はレート制限を消費しない)
+        print("\n  open PR 一覧を再確認中 (REST ETag)...")
+        try:
+            changed_repo_keys = check_open_pulls_changed(cached_repos)
+        except Exception as probe_error:
+            log_error_to_file("Open pull request ETag probe failed, recounting via GraphQL", probe_error)
+        if changed_repo_keys is None:
+            print("  ETag ベースライン未記録のリポジトリあり → GraphQL で件数を確認します。")
 
-        all_prs = get_pr_details_batch(repos_with_prs)
-        if all_prs:
-            print(f"\n  Found {len(all_prs)} open PR(s) total")
-            _process_open_prs(all_prs, phase3_repo_names, config)
-        set_last_pr_snapshot(all_prs, repos_with_prs)
-    else:
-        # PR 件数は変化なし → HTML のみ再取得 (phase 変化を検知するため)
-        print(
-            "\n  open PR のHTML再取得 (updatedAt 不変でもphase変化を検知するため"
-            " / Refetching HTML for open PRs to detect phase changes)..."
+    if changed_repo_keys is None:
+        # open PR 件数を GraphQL で再取得し、変化があれば Phase 1/2 を強制実行する
+        # (updatedAt は PR の新規作成を反映しないことがあるため、件数の乖離が生じうる)
+        # リポジトリごとの件数を辞書で比較することで、「1件クローズ+1件新規」のように
+        # 合計が変わらない場合でも変化を検知できる。
+        print("\n  open PR 件数を再確認中 (GraphQL)...")
+        fresh_repos_with_prs = get_repositories_with_open_prs()
+        cached_count_map = {
+            (r.get("owner", ""), r.get("name", "")): r.get("openPRCount", 0) for r in cached_repos
+        }
+        fresh_count_map = {
+            (r.get("owner", ""), r.get("name", "")): r.get("openPRCount", 0)
+            for r in fresh_repos_with_prs
+        }
+
+        if fresh_count_map != cached_count_map:
+            # リポジトリごとの PR 件数が変化 → Phase 1/2 を強制実行して最新の PR 一覧を取得する
+            print("  open PR 件数/構成が変化。Phase 1/2 を強制実行します。")
+            repos_with_prs = fresh_repos_with_prs
+
+            # validate phase3_merge configuration (same as normal Phase 1 flow)
+            print("\nValidating phase3_merge configuration...")
+            for repo in repos_with_prs:
+                repo_owner = repo.get("owner", "")
+                repo_name = repo.get("name", "")
+                if repo_owner and repo_name:
+                    validate_phase3_merge_config_required(config, repo_owner, repo_name)
+
+            all_prs = get_pr_details_batch(repos_with_prs)
+            if all_prs:
+                print(f"\n  Found {len(all_prs)} open PR(s) total")
+                _process_open_prs(all_prs, phase3_repo_names, config)
+            set_last_pr_snapshot(all_prs, repos_with_prs)
+            return all_prs, repos_with_prs, False
+
+    all_prs = cached_prs
+    repos_with_prs = cached_repos
+    fresh_pr_urls: set = set()
+    if changed_repo_keys:
+        # 200 を返したリポジトリのみ Phase 2 を実行し、その他のリポジトリはキャッシュを使う
+        print(f"  open PR 一覧が変化: {len(changed_repo_keys)} リポジトリの PR 詳細を再取得します。")
+        all_prs, repos_with_prs, fresh_pr_urls = _refresh_changed_repos(
+            cached_prs, cached_repos, changed_repo_keys, config
         )
-        all_prs = cached_prs
-        repos_with_prs = cached_repos
-        _process_open_prs(all_prs, phase3_repo_names, config)
-        set_last_pr_snapshot(all_prs, repos_with_prs)
+
+    # PR 件数は変化なし → HTML のみ再取得 (phase 変化を検知するため)
+    print(
+        "\n  open PR のHTML再取得 (updatedAt 不変でもphase変化を検知するため"
+        " / Refetching HTML for open PRs to detect phase changes)..."
+    )
+    # 明示的に更新が通知されたPR（通知・Webhook）とPR詳細を再取得したPRは必ずHTMLも取得する
+    signalled_urls = set(fresh_pr_urls)
+    refetch_urls: set | None = None
+    # 通知ベースの選択が有効なら、新しいアクティビティのあるPR（と安全間隔を過ぎたPR）のみ再取得する
+    selection = select_prs_for_html_refetch(all_prs)
+    if selection is not None:
+        notified_urls, refetch_urls = selection
+        signalled_urls |= notified_urls
+        print(f"  通知に基づきHTML再取得: {len(notified_urls | refetch_urls)}/{len(all_prs)} PR")
+    if webhook_pr_urls:
+        # Webhookで更新が通知されたPRを再取得対象に加える。通知による選択が無い場合でも、
+        # webhook_fallback_interval 以上HTMLを取得していないPRはフォールバックとして再取得する
+        if refetch_urls is None:
+            refetch_urls = select_prs_fetched_before(all_prs, _webhook_fallback_seconds(config))
+        signalled_urls |= webhook_pr_urls
+        print(f"  Webhookに基づきHTML再取得: {len(refetch_urls | signalled_urls)}/{len(all_prs)} PR")
+    _process_open_prs(all_prs, phase3_repo_names, config, refetch_urls, signalled_urls)
+    set_last_pr_snapshot(all_prs, repos_with_prs)
 
     # skip_pr_check を False にリセット: 今イテレーションの表示セクション (display_status_summary)
     # でスナップショットではなく最新のHTML取得結果を使うため
     return all_prs, repos_with_prs, False
+
+
+def _webhook_fallback_seconds(config: dict) -> int:
+    """Return webhook_fallback_interval in seconds (the default when it cannot be parsed)."""
+    try:
+        return parse_interval(config.get("webhook_fallback_interval", DEFAULT_WEBHOOK_FALLBACK_INTERVAL))
+    except ValueError:
+        return parse_interval(DEFAULT_WEBHOOK_FALLBACK_INTERVAL)
+
+
+def _refresh_changed_repos(
+    cached_prs: list,
+    cached_repos: list,
+    changed_repo_keys: set,
+    config: dict,
+) -> tuple[list, list, set]:
+    """Re-fetch PR details only for the repositories whose open PR list changed.
+
+    Returns:
+        (all_prs, repos_with_prs, fresh_pr_urls): the cached PRs of unchanged repositories
+        plus the fresh PRs of changed ones, the repository list with updated openPRCount
+        (repositories left without open PRs are dropped), and the URLs of the fresh PRs
+    """
+
+    def repo_key(owner: str, name: str) -> str:
+        return f"{owner}/{name}"
+
+    changed_repos = [r for r in cached_repos if repo_key(r.get("owner", ""), r.get("name", "")) in changed_repo_keys]
+    for repo in changed_repos:
+        validate_phase3_merge_config_required(config, repo.get("owner", ""), repo.get("name", ""))
+    fresh_prs = get_pr_details_batch(changed_repos)
+
+    def pr_repo_key(pr: dict) -> str:
+        repository = pr.get("repository") or {}
+        return repo_key(repository.get("owner", ""), repository.get("name", ""))
+
+    fresh_counts: dict[str, int] = {}
+    for pr in fresh_prs:
+        fresh_counts[pr_repo_key(pr)] = fresh_counts.get(pr_repo_key(pr), 0) + 1
+
+    repos_with_prs = []
+    for repo in cached_repos:
+        key = repo_key(repo.get("owner", ""), repo.get("name", ""))
+        if key in changed_repo_keys:
+            if not fresh_counts.get(key):
+                continue
+            repo = dict(repo, openPRCount=fresh_counts[key])
+        repos_with_prs.append(repo)
+
+    all_prs = [pr for pr in cached_prs if pr_repo_key(pr) not in changed_repo_keys] + fresh_prs
+    return all_prs, repos_with_prs, {pr.get("url", "") for pr in fresh_prs}
@@ -17,12 +17,41 @@ from ..browser.browser_automation import (
     _should_autoraise_window,
 )
 from ..core.config import resolve_execution_config_for_repo
+from ..github.resilience import call_with_resilience, raise_if_transient
+
+# Circuit breaker / retry counter name for the Pages-related REST calls
+PAGES_ENDPOINT = "pages"
 
 # Track which repo+SHA combinations have been handled (browser opened or dry-run shown)
 # Key format: "{owner}/{repo}@{sha}" for deployed, "{owner}/{repo}@errored:{sha}" for errored
 _pages_browser_opened: Set[str] = set()
 
 
+def _run_gh_api(args: List[str]) -> subprocess.CompletedProcess:
+    """Run a read-only `gh api` call with retries and the Pages circuit breaker.
+
+    Raises:
+        subprocess.CalledProcessError: For non-transient API errors (e.g. 404 when Pages is disabled)
+        RuntimeError: If the call kept failing transiently or the breaker is open
+    """
+
+    def _attempt() -> subprocess.CompletedProcess:
+        try:
+            return subprocess.run(
+                ["gh", "api", *args],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            raise_if_transient(e.stderr or "", message=f"gh api {args[0]} failed: {(e.stderr or '').strip()}")
+            raise
+
+    return call_with_resilience(PAGES_ENDPOINT, _attempt)
+
+
 def get_main_branch_sha(owner: str, repo: str) -> Optional[str]:
     """Get the latest commit SHA on the main branch via gh api
 
@@ -38,17 +67,10 @@ def get_main_branch_sha(owner: str, repo: str) -> Optional[str]:
         or repository does not have a 'main' branch)
     """
     try:
-        result = subprocess.run(
-            ["gh", "api", f"repos/{owner}/{repo}/branches/main", "--jq", ".commit.sha"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=True,
-        )
+        result = _run_gh_api([f"repos/{owner}/{repo}/branches/main", "--jq", ".commit.sha"])
         sha = result.stdout.strip()
         return sha if sha and sha != "null" else None
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, RuntimeError):
         return None
 
 
@@ -63,19 +85,12 @@ def get_pages_latest_build(owner: str, repo: str) -> Optional[Dict[str, Any]]:
         Latest build dict with keys like 'status', 'commit', or None if unavailable
     """
     try:
-        result = subprocess.run(
-            ["gh", "api", f"repos/{owner}/{repo}/pages/builds/latest"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=True,
-        )
+        result = _run_gh_api([f"repos/{owner}/{repo}/pages/builds/latest"])
         text = result.stdout.strip()
         if not text or text == "null":
             return None
         return json.loads(text)
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
+    except (subprocess.CalledProcessError, RuntimeError, json.JSONDecodeError):
         return None
 
 
@@ -90,17 +105,10 @@ def get_pages_url(owner: str, repo: str) -> Optional[str]:
         Pages HTML URL string, or None if unavailable
     """
     try:
-        result = subprocess.run(
-            ["gh", "api", f"repos/{owner}/{repo}/pages", "--jq", ".html_url"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=True,
-        )
+        result = _run_gh_api([f"repos/{owner}/{repo}/pages", "--jq", ".html_url"])
         url = result.stdout.strip()
         return url if url and url != "null" else None
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, RuntimeError):
         return None
 
 
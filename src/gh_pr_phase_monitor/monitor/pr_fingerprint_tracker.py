@@ -0,0 +1,122 @@
+"""
+Per-PR change fingerprints deciding which PR pages need their HTML re-fetched
+
+Every iteration used to fetch and analyze the HTML of every open PR whatever happened.
+With ``enable_pr_fingerprint_check`` a cheap fingerprint (updatedAt, head SHA, review
+count, last timeline item id) is fetched for all PRs in one aliased GraphQL query first;
+only PRs whose fingerprint changed since their last analysis are fetched again. The
+others reuse their stored analysis (llm_statuses, html_status, title) until it is older
+than ``pr_analysis_max_staleness_seconds``.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+from ..core.config import DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS
+from ..github.pr_fetcher import get_pr_fingerprints
+from .error_logger import log_error_to_file
+
+# Analysis fields written onto a PR dict by fetch_and_analyze_pr_html
+_ANALYSIS_FIELDS = ("llm_statuses", "html_status", "title")
+
+_enabled: bool = False
+_max_staleness_seconds: float = DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS
+
+# PR URL -> {"fingerprint", "analyzed_at", and the _ANALYSIS_FIELDS of the last analysis}
+_analyses: Dict[str, Dict[str, Any]] = {}
+# PR URL -> fingerprint observed by the latest selection (stored once the analysis succeeds)
+_current_fingerprints: Dict[str, str] = {}
+_state_lock = threading.Lock()
+
+# Indirection so tests can control the staleness clock
+_clock = time.monotonic
+
+
+def set_pr_fingerprint_settings(
+    enabled: bool, max_staleness_seconds: float = DEFAULT_PR_ANALYSIS_MAX_STALENESS_SECONDS
+) -> None:
+    """Enable or disable fingerprint-based HTML refetch selection."""
+    global _enabled, _max_staleness_seconds
+    _enabled = bool(enabled)
+    _max_staleness_seconds = max(0.0, float(max_staleness_seconds))
+
+
+def _repos_of(prs: Iterable[Dict[str, Any]]) -> list:
+    """Return the distinct repositories ({"owner", "name"}) of the given PRs, in first-seen order."""
+    repos: Dict[tuple, Dict[str, str]] = {}
+    for pr in prs:
+        repository = pr.get("repository") or {}
+        owner, name = repository.get("owner", ""), repository.get("name", "")
+        if owner and name:
+            repos.setdefault((owner, name), {"owner": owner, "name": name})
+    return list(repos.values())
+
+
+def select_prs_needing_analysis(prs: list) -> Optional[Set[str]]:
+    """Choose which PRs need their HTML fetched and analyzed this iteration.
+
+    PRs that are not selected get their stored analysis copied onto the PR dict, so
+    determine_phase() sees the same llm_statuses as after a fresh fetch.
+
+    Returns:
+        None when every PR must be fetched (disabled, or the fingerprints could not be
+        fetched), otherwise the URLs of PRs that are new, changed or whose stored analysis
+        is stale
+    """
+    if not _enabled or not prs:
+        return None
+    try:
+        fingerprints = get_pr_fingerprints(_repos_of(prs))
+    except Exception as fingerprint_error:
+        log_error_to_file("Failed to fetch PR fingerprints, fetching HTML for every PR", fingerprint_error)
+        return None
+
+    now = _clock()
+    selected: Set[str] = set()
+    with _state_lock:
+        _current_fingerprints.clear()
+        # PRs that are no longer open will never be looked up again
+        open_urls = {pr.get("url", "") for pr in prs}
+        for url in [url for url in _analyses if url not in open_urls]:
+            del _analyses[url]
+        for pr in prs:
+            url = pr.get("url", "")
+            fingerprint = fingerprints.get(url)
+            if fingerprint is not None:
+                _current_fingerprints[url] = fingerprint
+            stored = _analyses.get(url)
+            if (
+                fingerprint is None
+                or stored is None
+                or stored["fingerprint"] != fingerprint
+                or now - stored["analyzed_at"] >= _max_staleness_seconds
+            ):
+                selected.add(url)
+                continue
+            for field in _ANALYSIS_FIELDS:
+                if field in stored:
+                    pr[field] = stored[field]
+    print(f"  PR変更フィンガープリント: HTML再取得 {len(selected)}/{len(prs)} PR")
+    return selected
+
+
+def record_pr_analysis(pr: Dict[str, Any]) -> None:
+    """Store a PR's fresh analysis together with the fingerprint seen by the latest selection."""
+    url = pr.get("url", "")
+    with _state_lock:
+        fingerprint = _current_fingerprints.get(url)
+        if fingerprint is None:
+            # No fingerprint known for this PR (feature disabled or fingerprint query failed)
+            _analyses.pop(url, None)
+            return
+        entry: Dict[str, Any] = {"fingerprint": fingerprint, "analyzed_at": _clock()}
+        entry.update({field: pr[field] for field in _ANALYSIS_FIELDS if field in pr})
+        _analyses[url] = entry
+
+
+def reset_pr_fingerprint_state() -> None:
+    """Forget all stored analyses and fingerprints (useful for tests)."""
+    with _state_lock:
+        _analyses.clear()
+        _current_fingerprints.clear()
@@ -2,28 +2,139 @@
 PR processing utilities for GitHub PR Phase Monitor
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set
+from urllib.parse import urlparse
+
 from ..actions.pr_actions import process_pr
+from ..core.config import (
+    DEFAULT_PR_FETCH_MAX_CONCURRENCY,
+    DEFAULT_PR_FETCH_MAX_PER_HOST,
+    resolve_execution_config_for_repo,
+)
+from ..core.config_ruleset import LLM_STATUS_SOURCE_TIMELINE
+from ..github.notification_poller import record_pr_html_fetched
+from ..github.timeline_fetcher import retain_pr_timelines
 from ..phase.html.html_status_processor import fetch_and_analyze_pr_html
+from ..phase.html.pr_html_validators import retain_pr_html_validators
 from ..phase.phase_detector import PHASE_3, PHASE_LLM_WORKING, determine_phase
+from ..phase.timeline_analyzer import fetch_and_analyze_pr_timeline
 from .error_logger import log_error_to_file
+from .pr_fingerprint_tracker import record_pr_analysis, select_prs_needing_analysis
+
+# 取得・解析ステージの同時実行数と、1ホストあたりの同時リクエスト数の上限
+_max_concurrency: int = DEFAULT_PR_FETCH_MAX_CONCURRENCY
+_max_per_host: int = DEFAULT_PR_FETCH_MAX_PER_HOST
+# ホスト名 -> 同時リクエスト数を制限するセマフォ（設定変更時に作り直す）
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+_TIMELINE_API_HOST = "api.github.com"
+
+
+def set_pr_fetch_concurrency(max_concurrency: int, max_per_host: int) -> None:
+    """取得・解析ステージの並列数と1ホストあたりの上限を設定する（1未満は1として扱う）。"""
+    global _max_concurrency, _max_per_host
+    with _host_slots_lock:
+        _max_concurrency = max(1, int(max_concurrency))
+        _max_per_host = max(1, int(max_per_host))
+        _host_slots.clear()
+
+
+@contextmanager
+def _host_slot(host: str) -> Iterator[None]:
+    """host への同時リクエストが pr_fetch_max_per_host 件を超えないよう待機する。"""
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(_max_per_host)
+    with slot:
+        yield
+
+
+def _fetch_and_analyze_pr(pr: dict, config: dict) -> Optional[dict]:
+    """ルールセットの llm_status_source に従って llm_statuses を取得・解析する。
+
+    "timeline" のリポジトリはREST タイムライン（ETag付き条件付きGET）を使い、
+    取得できなかった場合はHTML解析にフォールバックする。
+    """
+    repository = pr.get("repository") or {}
+    try:
+        exec_config = resolve_execution_config_for_repo(config, repository.get("owner", ""), repository.get("name", ""))
+    except ValueError:
+        exec_config = {}
+    if exec_config.get("llm_status_source") == LLM_STATUS_SOURCE_TIMELINE:
+        with _host_slot(_TIMELINE_API_HOST):
+            analysis = fetch_and_analyze_pr_timeline(pr)
+        if analysis is not None:
+            return analysis
+    with _host_slot(urlparse(pr.get("url", "")).netloc.lower()):
+        return fetch_and_analyze_pr_html(pr)
+
+
+def _fetch_stage(pr: dict, config: dict) -> Optional[Exception]:
+    """1件のPRを取得・解析する（ワーカースレッドで実行）。失敗時は例外を返す。"""
+    try:
+        if _fetch_and_analyze_pr(pr, config) is not None:
+            record_pr_html_fetched(pr.get("url", ""))
+            record_pr_analysis(pr)
+    except Exception as html_error:
+        return html_error
+    return None
+
+
+def _fetch_and_analyze_prs(prs: List[dict], config: dict) -> List[Optional[Exception]]:
+    """PRの取得・解析を最大 pr_fetch_max_concurrency 件並列に実行する。
+
+    各PRの pr["llm_statuses"] 等を更新し、prs と同じ順序で各PRの例外（成功時は None）を返す。
+    """
+    workers = min(_max_concurrency, len(prs))
+    if workers <= 1:
+        return [_fetch_stage(pr, config) for pr in prs]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pr-fetch") as executor:
+        return list(executor.map(lambda pr: _fetch_stage(pr, config), prs))
 
 
 def _process_open_prs(
     all_prs: list,
     phase3_repo_names: list,
     config: dict,
+    refetch_urls: Optional[Set[str]] = None,
+    signalled_urls: Optional[Set[str]] = None,
 ) -> None:
     """HTML取得・phase判定・PR処理を全openなPRに対して実行する。
 
-    all_prs の各PRに対して fetch_and_analyze_pr_html → determine_phase → process_pr を実行し、
+    all_prs の各PRに対して HTML（またはタイムライン）の取得・解析 → determine_phase → process_pr を実行し、
     結果を pr["phase"] に書き込み、phase3_repo_names に追記する。
+    取得・解析は最大 pr_fetch_max_concurrency 件並列（1ホストあたり pr_fetch_max_per_host 件まで）で
+    先に済ませ、phase判定とPR処理は all_prs の順に逐次実行する。
+
+    refetch_urls を指定した場合、HTMLを再取得するのはそのURLのPRのみ。
+    それ以外のPRは前回取得した llm_statuses のまま phase判定・PR処理を行う。
+    enable_pr_fingerprint_check が有効な場合は、さらに変更フィンガープリントが
+    変化していない（かつ解析結果が古すぎない）PRのHTML取得を省略し、保存済みの解析結果を使う。
+    signalled_urls（通知・Webhookなどで更新が明示的に伝えられたPR）はフィンガープリントに
+    関係なく必ず再取得する（レビューコメントやCopilotの動きはフィンガープリントを変えないことがある）。
     """
+    retain_pr_timelines(pr.get("url", "") for pr in all_prs)
+    retain_pr_html_validators(pr.get("url", "") for pr in all_prs)
+    fingerprint_urls = select_prs_needing_analysis(all_prs)
+    if fingerprint_urls is not None:
+        refetch_urls = fingerprint_urls if refetch_urls is None else refetch_urls & fingerprint_urls
+    if refetch_urls is not None and signalled_urls:
+        refetch_urls = refetch_urls | signalled_urls
+
+    # ステージ1: HTML（またはタイムライン）の取得・解析を並列に実行する
+    targets = [pr for pr in all_prs if refetch_urls is None or pr.get("url", "") in refetch_urls]
+    fetch_errors = {id(pr): error for pr, error in zip(targets, _fetch_and_analyze_prs(targets, config)) if error}
+
+    # ステージ2: phase判定とPR処理は元のPR順に1件ずつ実行する
     for pr in all_prs:
         try:
-            # HTMLを取得・解析・保存（メインフロー: phaseに関わらず全PRに対して実行）
-            try:
-                fetch_and_analyze_pr_html(pr)
-            except Exception as html_error:
+            html_error = fetch_errors.get(id(pr))
+            if html_error is not None:
                 print(f"    Failed to fetch/analyze HTML for PR: {html_error}")
                 log_error_to_file(
                     f"Failed to fetch/analyze HTML for {pr.get('url', 'unknown')}",
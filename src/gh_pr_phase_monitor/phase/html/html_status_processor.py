@@ -7,9 +7,11 @@ HTML+JSONをlogs/prに保存する。
 
 from typing import Any, Dict, Optional
 
+from .pr_html_analysis_cache import cache_analysis, get_cached_analysis, timeline_digest
 from .pr_html_analyzer import analyze_pr_html
-from .pr_html_fetcher import _fetch_pr_html
+from .pr_html_fetcher import PrHtmlNotModified, _fetch_pr_html
 from .pr_html_saver import save_html_to_logs
+from .pr_html_validators import get_stored_analysis, store_analysis
 
 
 def fetch_and_analyze_pr_html(pr: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -21,6 +23,11 @@ def fetch_and_analyze_pr_html(pr: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     pr["llm_statuses"] と pr["html_status"] を更新するため、
     呼び出し後に determine_phase(pr) を実行すると最新のstatusが反映される。
 
+    前回の解析結果があるPRは条件付きGETで取得し、304 Not Modified なら
+    HTMLの解析も保存も行わず前回の解析結果を再利用する。
+    200でも解析に使う部分（タイトルとタイムライン領域）のハッシュが既知なら、
+    解析を省略してその結果を再利用し、保存も省略する。
+
     Args:
         pr: PR データ辞書。llm_statuses と html_status を更新する。
 
@@ -32,14 +39,26 @@ def fetch_and_analyze_pr_html(pr: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if not pr_url:
         return None
 
-    html = _fetch_pr_html(pr_url)
-    if not html:
-        return None
+    try:
+        html = _fetch_pr_html(pr_url)
+    except PrHtmlNotModified:
+        # 304: ページは前回から変化なし → 前回の解析結果をそのまま使う（ログも前回保存分のまま）
+        analysis = get_stored_analysis(pr_url)
+        if analysis is None:
+            return None
+    else:
+        if not html:
+            return None
 
-    analysis = analyze_pr_html(html, pr_url)
+        digest = timeline_digest(html)
+        analysis = get_cached_analysis(digest, pr_url)
+        if analysis is None:
+            analysis = analyze_pr_html(html, pr_url)
+            cache_analysis(digest, analysis)
+        store_analysis(pr_url, analysis)
 
-    # HTML+JSONをlogs/pr/に保存（phaseに関わらず常に保存）
-    save_html_to_logs(html, pr_url, analysis=analysis)
+        # HTML+JSONをlogs/pr/に保存（phaseに関わらず常に保存。ハッシュが前回の保存時と同じなら省略）
+        save_html_to_logs(html, pr_url, analysis=analysis, digest=digest)
 
     # phase判定・表示用にpr辞書を更新
     pr["llm_statuses"] = analysis.get("llm_statuses", [])
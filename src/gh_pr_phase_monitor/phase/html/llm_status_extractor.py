@@ -5,9 +5,10 @@ Utilities for extracting LLM working status information from PR HTML pages.
 import html as html_lib
 import re
 from datetime import datetime, timezone
-from typing import List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 from .pr_html_fetcher import _html_to_simple_markdown
+from .pr_html_scanner import scan_pr_html
 
 _MONTH_NAMES = {
     "january": 1, "february": 2, "march": 3, "april": 4,
@@ -22,6 +23,25 @@ _DATE_IN_STATUS_RE = re.compile(
     re.IGNORECASE,
 )
 
+# markdown変換後に "llm status" となりうる箇所（間に空白・&nbsp;・タグのみを挟む）
+_LLM_STATUS_LABEL_HINT_PATTERN = re.compile(r"llm(?:\s|&nbsp;|<[^>]*>)+status", re.IGNORECASE)
+_LLM_STATUS_ATTRIBUTE_PATTERNS = [
+    re.compile(r'data-llm-status=["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(r'aria-label=["\'][^"\']*LLM status[^"\']*[:：]\s*([^"\']+)["\']', re.IGNORECASE),
+    re.compile(r'title=["\'][^"\']*LLM status[^"\']*[:：]\s*([^"\']+)["\']', re.IGNORECASE),
+]
+_COPILOT_HOVERCARD_PATTERN = re.compile(r'data-hovercard-type=["\']copilot["\']', re.IGNORECASE)
+_AUTHOR_FROM_COPILOT_PATTERN = re.compile(r'data-hovercard-type=["\']copilot["\'][^>]*>([^<]+)</a>', re.IGNORECASE)
+
+
+def may_contain_llm_status_label(html: Optional[str]) -> bool:
+    """HTMLに "LLM status:" ラベル（テキストパターン抽出の対象）が含まれうるかを返す。
+
+    False の場合、ページ全体をmarkdownに変換しても _extract_llm_statuses_via_text_patterns は
+    何も抽出しないため、変換そのものを省略できる。
+    """
+    return bool(html) and _LLM_STATUS_LABEL_HINT_PATTERN.search(html) is not None
+
 
 def _parse_timestamp_from_status_text(text: str) -> Optional[float]:
     """Parse a timestamp from status text like 'Copilot started work ... March 7, 2026 10:01'.
@@ -186,31 +206,31 @@ def _extract_llm_statuses_via_text_patterns(html_markdown: str, seen: Set[str])
     return statuses
 
 
-def _extract_llm_statuses_via_html_elements(html: str, seen: Set[str]) -> List[str]:
+def _extract_llm_statuses_via_html_elements(
+    html: str, seen: Set[str], scan: Optional[Dict[str, Any]] = None
+) -> List[str]:
     """Extract LLM statuses by parsing HTML structural elements (timeline items and attributes).
 
     Scans ``TimelineItem-body`` divs for ``session_id=`` links and Copilot hovercard
     events, and also checks ``data-llm-status`` / ``aria-label`` / ``title`` attributes.
     Because this walks the HTML structure in document order it preserves chronological
     ordering of events (e.g. review before subsequent work events).
+
+    ``scan`` may carry the result of scan_pr_html() for the same page so the page is not
+    scanned again.
     """
     statuses: List[str] = []
     if not html:
         return statuses
 
-    timeline_pattern = re.compile(
-        r'<div[^>]*class="[^"]*TimelineItem-body[^"]*"[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE
-    )
-    copilot_hovercard_re = re.compile(r'data-hovercard-type=["\']copilot["\']', re.IGNORECASE)
-    author_from_copilot_re = re.compile(
-        r'data-hovercard-type=["\']copilot["\'][^>]*>([^<]+)</a>', re.IGNORECASE
-    )
-    for body in re.findall(timeline_pattern, html):
+    if scan is None:
+        scan = scan_pr_html(html)
+    for body in scan["timeline_bodies"]:
         if "session_id=" in body:
             timeline_text = _html_to_simple_markdown(body)
             _add_status(statuses, seen, timeline_text)
-        elif copilot_hovercard_re.search(body):
-            author_match = author_from_copilot_re.search(body)
+        elif _COPILOT_HOVERCARD_PATTERN.search(body):
+            author_match = _AUTHOR_FROM_COPILOT_PATTERN.search(body)
             if not author_match:
                 continue
             author = author_match.group(1).strip()
@@ -221,19 +241,17 @@ def _extract_llm_statuses_via_html_elements(html: str, seen: Set[str]) -> List[s
             if action_text:
                 _add_status(statuses, seen, f"{author} {action_text}")
 
-    attribute_patterns = [
-        r'data-llm-status=["\']([^"\']+)["\']',
-        r'aria-label=["\'][^"\']*LLM status[^"\']*[:：]\s*([^"\']+)["\']',
-        r'title=["\'][^"\']*LLM status[^"\']*[:：]\s*([^"\']+)["\']',
-    ]
-    for pattern in attribute_patterns:
-        for match in re.finditer(pattern, html, flags=re.IGNORECASE):
-            _add_status(statuses, seen, match.group(1))
+    if scan["mentions_llm"]:
+        for pattern in _LLM_STATUS_ATTRIBUTE_PATTERNS:
+            for match in pattern.finditer(html):
+                _add_status(statuses, seen, match.group(1))
 
     return statuses
 
 
-def _extract_llm_statuses(html: Optional[str], html_markdown: str) -> List[str]:
+def _extract_llm_statuses(
+    html: Optional[str], html_markdown: str, scan: Optional[Dict[str, Any]] = None
+) -> List[str]:
     """Extract unique LLM statuses from HTML and its plain-text representation.
 
     HTML-element extraction runs first so that timeline items are processed in their
@@ -245,6 +263,6 @@ def _extract_llm_statuses(html: Optional[str], html_markdown: str) -> List[str]:
     seen: Set[str] = set()
     statuses: List[str] = []
     if html:
-        statuses.extend(_extract_llm_statuses_via_html_elements(html, seen))
+        statuses.extend(_extract_llm_statuses_via_html_elements(html, seen, scan))
     statuses.extend(_extract_llm_statuses_via_text_patterns(html_markdown, seen))
     return statuses
@@ -0,0 +1,102 @@
+"""
+PR HTMLの解析結果のメモ化（内容ハッシュ → analyze_pr_html() 結果のLRU）。
+
+PRページはCSRFトークン等がリクエストごとに変わるため、ページ全体では毎回別物になる。
+解析に使う部分（<title> と、prc-PageLayout-Content から <footer> までのタイムライン領域）だけを
+ハッシュし、同じハッシュのページは正規表現による解析を省略して前回の結果を再利用する。
+draft化・タイトル変更などはタイムラインに項目が追加されるため、ハッシュも変わる。
+
+同じハッシュは logs/pr への保存で「変更なし」を判定するのにも使う（pr_html_saver）。
+"""
+
+import copy
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ...core.config import DEFAULT_PR_ANALYSIS_CACHE_SIZE
+
+_TITLE_PATTERN = re.compile(r"<title>.*?</title>", re.IGNORECASE | re.DOTALL)
+_CONTENT_START_PATTERN = re.compile(r'<div[^>]*class="[^"]*prc-PageLayout-Content[^"]*"[^>]*>', re.IGNORECASE)
+_FOOTER_PATTERN = re.compile(r"<footer[^>]*>", re.IGNORECASE)
+
+# ハッシュ -> 解析結果（pr_url を除く）。末尾が直近に使われたもの
+_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_max_entries: int = DEFAULT_PR_ANALYSIS_CACHE_SIZE
+# 直近のイテレーションでのヒット数・ミス数（take_analysis_cache_stats で取り出すとリセットされる）
+_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+_cache_lock = threading.Lock()
+
+
+def set_analysis_cache_size(max_entries: int) -> None:
+    """保持する解析結果の上限件数を設定する（0 でメモ化を無効にする）。"""
+    global _max_entries
+    with _cache_lock:
+        _max_entries = max_entries if isinstance(max_entries, int) and max_entries > 0 else 0
+        while len(_cache) > _max_entries:
+            _cache.popitem(last=False)
+
+
+def timeline_digest(html: str) -> str:
+    """解析に使う部分（<title> とタイムライン領域）のSHA-256ハッシュを返す。
+
+    prc-PageLayout-Content が見つからなければ先頭から、<footer> が見つからなければ末尾までを対象にする。
+    """
+    html = html or ""
+    title_match = _TITLE_PATTERN.search(html)
+    content_match = _CONTENT_START_PATTERN.search(html)
+    start = content_match.start() if content_match else 0
+    footer_match = _FOOTER_PATTERN.search(html, start)
+    end = footer_match.start() if footer_match else len(html)
+
+    digest = hashlib.sha256()
+    digest.update((title_match.group(0) if title_match else "").encode("utf-8", "surrogatepass"))
+    digest.update(b"\0")
+    digest.update(html[start:end].encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def get_cached_analysis(digest: str, pr_url: str) -> Optional[Dict[str, Any]]:
+    """同じハッシュの解析結果があれば、pr_url を差し替えたコピーを返す（無ければ None）。"""
+    with _cache_lock:
+        if not _max_entries:
+            return None
+        analysis = _cache.get(digest)
+        if analysis is None:
+            _stats["misses"] += 1
+            return None
+        _cache.move_to_end(digest)
+        _stats["hits"] += 1
+        analysis = copy.deepcopy(analysis)
+    analysis["pr_url"] = pr_url
+    return analysis
+
+
+def cache_analysis(digest: str, analysis: Dict[str, Any]) -> None:
+    """解析結果をハッシュに紐づけて保存する（上限を超えたら最も古いものを捨てる）。"""
+    with _cache_lock:
+        if not _max_entries:
+            return
+        _cache[digest] = copy.deepcopy(analysis)
+        _cache.move_to_end(digest)
+        while len(_cache) > _max_entries:
+            _cache.popitem(last=False)
+
+
+def take_analysis_cache_stats() -> Dict[str, int]:
+    """前回の呼び出し以降のヒット数・ミス数を返し、カウンタをリセットする（イテレーションごとの表示用）。"""
+    with _cache_lock:
+        stats = dict(_stats)
+        _stats["hits"] = 0
+        _stats["misses"] = 0
+        return stats
+
+
+def reset_analysis_cache() -> None:
+    """キャッシュと統計をリセットする（テスト用）。"""
+    with _cache_lock:
+        _cache.clear()
+        _stats["hits"] = 0
+        _stats["misses"] = 0
@@ -8,7 +8,6 @@ statusを算出するための元データをJSONに出力する。
 ステータスの判定（PHASE1A〜PHASE3A への分類）は呼び出し側の責務。
 """
 
-import html as html_lib
 import json
 import re
 from pathlib import Path
@@ -28,8 +27,9 @@ from ..phase_detector import (
     _phase_from_llm_statuses,
     llm_working_from_statuses,
 )
-from .llm_status_extractor import _extract_llm_statuses
+from .llm_status_extractor import _extract_llm_statuses, may_contain_llm_status_label
 from .pr_html_fetcher import _html_to_simple_markdown
+from .pr_html_scanner import scan_pr_html
 
 # 7種のステータス定数 (phase_detector.py からインポート; 後方互換性のためここで再エクスポート)
 __all__ = [
@@ -42,34 +42,13 @@ __all__ = [
     "PHASE3A_LLM_FEEDBACK_FINISHED_WORK",
 ]
 
-_DRAFT_PATTERNS = [
-    re.compile(r"<span[^>]*>\s*Draft\s*</span>", re.IGNORECASE),
-    re.compile(r'aria-label="[^"]*Draft[^"]*"', re.IGNORECASE),
-    re.compile(r'class="[^"]*State--draft[^"]*"', re.IGNORECASE),
-    re.compile(r'data-state="draft"', re.IGNORECASE),
-    re.compile(r'data-status="draft"', re.IGNORECASE),
-    re.compile(r'"state"\s*:\s*"DRAFT"'),
-    re.compile(r"octicon-git-pull-request-draft", re.IGNORECASE),
-]
-
 # Matches GitHub Copilot's review summary when it left no inline code comments.
-_NO_INLINE_COMMENTS_PATTERN = re.compile(r"generated\s+(?:no|0)\s+comments?", re.IGNORECASE)
-# Lookahead that splits HTML at the start of each TimelineItem-body div boundary.
-_TIMELINE_ITEM_BODY_SPLIT_PATTERN = re.compile(r"(?=<div[^>]*TimelineItem-body[^>]*>)", re.IGNORECASE)
-
-# Pattern to extract PR title from the HTML <title> tag.
-# GitHub PR page title format: "PR Title · Pull Request #N · owner/repo · GitHub"
-_HTML_TITLE_TAG_PATTERN = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
-# Separator between PR title and " · Pull Request #N ..." in GitHub's <title> tag.
-_PR_TITLE_SEPARATOR = " \u00b7 Pull Request "  # " · Pull Request "
+NO_INLINE_COMMENTS_PATTERN = re.compile(r"generated\s+(?:no|0)\s+comments?", re.IGNORECASE)
 
 
 def _is_draft_from_html(html: str) -> bool:
     """HTMLからdraft状態を検出する。"""
-    for pattern in _DRAFT_PATTERNS:
-        if pattern.search(html):
-            return True
-    return False
+    return scan_pr_html(html)["is_draft"]
 
 
 def _extract_title_from_html(html: str) -> Optional[str]:
@@ -84,26 +63,15 @@ def _extract_title_from_html(html: str) -> Optional[str]:
     Returns:
         PRタイトル文字列。抽出失敗時はNone
     """
-    title_match = _HTML_TITLE_TAG_PATTERN.search(html)
-    if not title_match:
-        return None
-
-    title_text = title_match.group(1)
-    if _PR_TITLE_SEPARATOR not in title_text:
-        return None
-
-    title = title_text.split(_PR_TITLE_SEPARATOR)[0].strip()
-    title = html_lib.unescape(title)
-
-    return title if title else None
+    return scan_pr_html(html)["title"]
 
 
 def _copilot_review_has_no_inline_comments(html: str) -> bool:
     """Return True when the Copilot PR reviewer's review body explicitly states no inline comments.
 
-    Scopes the search to HTML blocks that contain the copilot-pull-request-reviewer marker
-    (i.e. the TimelineItem-body div for the Copilot reviewer's event) to prevent false
-    positives from arbitrary PR comment text that happens to quote the phrase.
+    Scopes the search to the TimelineItem-body section that contains the
+    copilot-pull-request-reviewer marker (i.e. the Copilot reviewer's event) to prevent
+    false positives from arbitrary PR comment text that happens to quote the phrase.
 
     GitHub Copilot's review body contains text like
     "generated no comments" or "generated 0 comments" when the review found no issues
@@ -114,15 +82,7 @@ def _copilot_review_has_no_inline_comments(html: str) -> bool:
     """
     if not html:
         return False
-    # Split at TimelineItem-body boundaries so the "generated no/0 comments" phrase is only
-    # matched within the same reviewer block as the copilot-pull-request-reviewer marker.
-    # This prevents a user comment that quotes the phrase from triggering a false-positive
-    # PHASE2A → PHASE3A upgrade.
-    blocks = _TIMELINE_ITEM_BODY_SPLIT_PATTERN.split(html)
-    return any(
-        "copilot-pull-request-reviewer" in block and _NO_INLINE_COMMENTS_PATTERN.search(block)
-        for block in blocks
-    )
+    return scan_pr_html(html)["copilot_review_without_inline_comments"]
 
 
 def _is_review_still_in_progress(llm_statuses: list[str]) -> bool:
@@ -145,7 +105,7 @@ def _is_review_still_in_progress(llm_statuses: list[str]) -> bool:
     return last_started_review_idx is not None and last_completed_review_idx is None
 
 
-def _determine_html_status(llm_statuses: list[str], is_draft: bool) -> str:
+def determine_html_status(llm_statuses: list[str], is_draft: bool) -> str:
     """llm_statusesとdraft状態から7種のステータスを決定する。
 
     コアのphase2/3検出はphase_detectorの_phase_from_llm_statusesに委譲する。
@@ -209,14 +169,20 @@ def analyze_pr_html(html: str, pr_url: str = "") -> dict[str, Any]:
             "title": str,               # PRタイトル（HTMLから抽出できた場合のみ）
         }
     """
-    html_markdown = _html_to_simple_markdown(html)
-    llm_statuses = _extract_llm_statuses(html, html_markdown)
-    is_draft = _is_draft_from_html(html)
-    status = _determine_html_status(llm_statuses, is_draft)
+    # タイトル・draft・タイムライン項目・Copilotレビュー要約は1回の走査でまとめて抽出する。
+    # ページ全体のmarkdown変換は "LLM status:" ラベルがありうるページでのみ行う。
+    scan = scan_pr_html(html)
+    if scan["mentions_llm"] and may_contain_llm_status_label(html):
+        html_markdown = _html_to_simple_markdown(html)
+    else:
+        html_markdown = ""
+    llm_statuses = _extract_llm_statuses(html, html_markdown, scan=scan)
+    is_draft = scan["is_draft"]
+    status = determine_html_status(llm_statuses, is_draft)
 
     # When review is completed with no inline comments (e.g. "generated no comments" in the
     # review body), there is nothing for Copilot to address → upgrade directly to PHASE3A.
-    if status == PHASE2A_REVIEW_COMPLETED and _copilot_review_has_no_inline_comments(html):
+    if status == PHASE2A_REVIEW_COMPLETED and scan["copilot_review_without_inline_comments"]:
         status = PHASE3A_LLM_FEEDBACK_FINISHED_WORK
 
     result = {
@@ -226,7 +192,7 @@ def analyze_pr_html(html: str, pr_url: str = "") -> dict[str, Any]:
         "status": status,
     }
 
-    title = _extract_title_from_html(html)
+    title = scan["title"]
     if title is not None:
         result["title"] = title
 
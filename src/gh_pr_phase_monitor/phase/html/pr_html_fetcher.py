@@ -4,38 +4,152 @@ Utilities for fetching and converting PR HTML pages.
 
 import re
 import subprocess
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+from ...core.config import (
+    DEFAULT_PR_HTML_FETCH_BACKEND,
+    DEFAULT_PR_HTML_MAX_BYTES,
+    DEFAULT_PR_HTML_STOP_AT_FOOTER,
+    PR_HTML_FETCH_BACKEND_HTTP,
+    SUPPORTED_PR_HTML_FETCH_BACKENDS,
+)
+from .pr_html_http_client import PageFetchError, PageTooLargeError, fetch_page
+from .pr_html_validators import get_request_validators, record_conditional_result, remember_response_validators
 
-def _fetch_pr_html(pr_url: str) -> Optional[str]:
-    """Fetch PR HTML page using curl.
+# PRページの取得方法（"curl": PRごとに curl を起動 / "http": プロセス内の keep-alive 接続）
+_backend: str = DEFAULT_PR_HTML_FETCH_BACKEND
+# <footer> 以降を受信しない（"http" のみ）/ 1ページの上限バイト数（0 は無制限）
+_stop_at_footer: bool = DEFAULT_PR_HTML_STOP_AT_FOOTER
+_max_bytes: int = DEFAULT_PR_HTML_MAX_BYTES
+
+
+class PrHtmlNotModified(Exception):
+    """条件付きGETに 304 Not Modified が返った（前回の解析結果を再利用できる）。"""
+
+
+def _split_response_headers(output: str) -> Tuple[Dict[str, str], str]:
+    """curl -D - の出力から最終レスポンスのヘッダ（小文字キー）と本文を取り出す。
+
+    -L でリダイレクトを辿った場合はヘッダブロックが複数並ぶため、最後のブロックを使う。
+    ヘッダが含まれない出力はそのまま本文として扱う。
+    """
+    headers: Dict[str, str] = {}
+    body = output
+    while body.startswith("HTTP/"):
+        crlf_end, lf_end = body.find("\r\n\r\n"), body.find("\n\n")
+        if crlf_end != -1 and (lf_end == -1 or crlf_end < lf_end):
+            block, body = body[:crlf_end], body[crlf_end + 4 :]
+        elif lf_end != -1:
+            block, body = body[:lf_end], body[lf_end + 2 :]
+        else:
+            block, body = body, ""
+        headers = {}
+        for line in block.splitlines()[1:]:
+            name, separator, value = line.partition(":")
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+    return headers, body
+
+
+def set_pr_html_fetch_backend(backend: str) -> None:
+    """PRページの取得方法を設定する（"curl" または "http"。未知の値は "curl"）。"""
+    global _backend
+    _backend = backend if backend in SUPPORTED_PR_HTML_FETCH_BACKENDS else DEFAULT_PR_HTML_FETCH_BACKEND
+
+
+def set_pr_html_fetch_limits(stop_at_footer: bool, max_bytes: int) -> None:
+    """PRページの受信範囲を設定する。
+
+    Args:
+        stop_at_footer: <footer> に達したら受信をやめる（pr_html_fetch_backend = "http" のときのみ有効）
+        max_bytes: 1ページの上限バイト数。超えたページは取得失敗として扱う（0 は無制限）
+    """
+    global _stop_at_footer, _max_bytes
+    _stop_at_footer = bool(stop_at_footer)
+    _max_bytes = max_bytes if isinstance(max_bytes, int) and max_bytes > 0 else 0
+
+
+def _fetch_with_curl(pr_url: str, request_headers: Dict[str, str]) -> Tuple[str, Dict[str, str], str]:
+    """curl でページを取得し、(HTTPステータス文字列, 小文字キーのヘッダ, 本文) を返す。
+
+    Raises:
+        OSError / subprocess.SubprocessError: curl を実行できなかった場合
+    """
+    args = ["curl", "-L", "-s", "-D", "-", "-w", "\n%{http_code}"]
+    if _max_bytes:
+        # 上限を超えると curl は転送を中断して終了コード 63 を返す
+        args.extend(["--max-filesize", str(_max_bytes)])
+    for name, value in request_headers.items():
+        args.extend(["-H", f"{name}: {value}"])
+    args.append(pr_url)
+    result = subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        timeout=30,
+        check=False,
+    )
+    if result.returncode != 0 or not result.stdout:
+        return "", {}, ""
+    # The last line is the HTTP status code appended by -w
+    parts = result.stdout.rsplit("\n", 1)
+    headers, body = _split_response_headers(parts[0])
+    return (parts[1].strip() if len(parts) > 1 else ""), headers, body
+
+
+def _fetch_with_http_client(pr_url: str, request_headers: Dict[str, str]) -> Tuple[str, Dict[str, str], str]:
+    """プロセス内HTTPクライアントで取得する。接続できない場合は curl にフォールバックする。"""
+    try:
+        status, headers, body = fetch_page(
+            pr_url, request_headers, stop_at_footer=_stop_at_footer, max_bytes=_max_bytes
+        )
+    except PageTooLargeError:
+        # curl で取り直しても同じ上限で中断されるため、取得失敗として扱う
+        return "", {}, ""
+    except PageFetchError:
+        return _fetch_with_curl(pr_url, request_headers)
+    return str(status), headers, body
+
+
+def _fetch_pr_html(pr_url: str, conditional: bool = True) -> Optional[str]:
+    """Fetch PR HTML page using curl or the in-process HTTP client (pr_html_fetch_backend).
+
+    When a previous analysis of the page is stored (pr_html_validators), the request carries
+    If-None-Match / If-Modified-Since; validators of 200 responses are remembered.
 
     Args:
         pr_url: The PR URL to fetch
+        conditional: Send the stored validators (False always downloads the page)
 
     Returns:
         HTML content as string, or None if fetch fails or HTTP status is non-2xx
+
+    Raises:
+        PrHtmlNotModified: If the conditional request returned 304 Not Modified
     """
+    etag, last_modified = get_request_validators(pr_url) if conditional else (None, None)
+    request_headers: Dict[str, str] = {}
+    if etag:
+        request_headers["If-None-Match"] = etag
+    if last_modified:
+        request_headers["If-Modified-Since"] = last_modified
+    fetch = _fetch_with_http_client if _backend == PR_HTML_FETCH_BACKEND_HTTP else _fetch_with_curl
     try:
-        result = subprocess.run(
-            ["curl", "-L", "-s", "-w", "\n%{http_code}", pr_url],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=30,
-            check=False,
-        )
-        if result.returncode == 0 and result.stdout:
-            # The last line is the HTTP status code appended by -w
-            parts = result.stdout.rsplit("\n", 1)
-            body = parts[0]
-            http_code = parts[1].strip() if len(parts) > 1 else ""
-            if body and http_code.startswith("2"):
-                return body
+        http_code, headers, body = fetch(pr_url, request_headers)
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
         # Silently fail on network/timeout errors - HTML fetch is optional
-        pass
+        return None
+    if not http_code:
+        return None
+    if etag or last_modified:
+        record_conditional_result(http_code == "304")
+    if http_code == "304" and (etag or last_modified):
+        raise PrHtmlNotModified(pr_url)
+    if body and http_code.startswith("2"):
+        remember_response_validators(pr_url, headers.get("etag"), headers.get("last-modified"))
+        return body
     return None
 
 
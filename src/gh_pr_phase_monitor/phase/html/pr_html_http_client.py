@@ -0,0 +1,332 @@
+"""
+github.com のPRページを取得するプロセス内HTTPクライアント（pr_html_fetch_backend = "http"）。
+
+PRごとに curl を起動する代わりに、ホストごとの keep-alive 接続プールを使い回し、
+gzip（brotli パッケージがインストールされていれば br も）で圧縮された応答を受け取って展開する。
+リダイレクトは curl -L と同様に辿る。
+
+stop_at_footer を指定すると本文を少しずつ受信・展開し、解析に不要な <footer> 以降を
+受信する前に接続を閉じる。max_bytes を超えるページは受信を打ち切って PageTooLargeError とする。
+"""
+
+import codecs
+import gzip
+import http.client
+import re
+import threading
+import urllib.parse
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# 1リクエスト（接続＋読み込み）のタイムアウト（curl 経由と同じ）
+HTTP_TIMEOUT_SECONDS = 30
+
+# ホストごとに保持する待機中の keep-alive 接続数の上限
+MAX_IDLE_CONNECTIONS_PER_HOST = 4
+
+# 辿るリダイレクトの上限
+MAX_REDIRECTS = 5
+
+USER_AGENT = "cat-github-watcher"
+ACCEPT_ENCODING = "br, gzip" if BROTLI_AVAILABLE else "gzip"
+
+# ストリーミング受信時に1回で読む量
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+_CHARSET_PATTERN = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+# 解析対象（prc-PageLayout-Content 以降）の終わりを示す <footer> 開始タグ
+_FOOTER_PATTERN = re.compile(r"<footer[\s>]", re.IGNORECASE)
+_FOOTER_LOOKBEHIND = len("<footer ") - 1
+
+# サーバー側で既に閉じられていた keep-alive 接続を示すエラー
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+_Origin = Tuple[str, str, Optional[int]]
+_Body = TypeVar("_Body")
+
+_idle_connections: Dict[_Origin, List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+# 応答の転送量（圧縮後）と展開後のサイズの累計、<footer> で打ち切った件数、上限超過で中断した件数
+_stats: Dict[str, int] = {"requests": 0, "wire_bytes": 0, "decoded_bytes": 0, "stopped_at_footer": 0, "over_budget": 0}
+_stats_lock = threading.Lock()
+
+
+class PageFetchError(OSError):
+    """接続失敗・展開失敗など、HTTPクライアントで応答を得られなかった。"""
+
+
+class PageTooLargeError(PageFetchError):
+    """展開後の本文が max_bytes を超えたため受信を打ち切った。"""
+
+
+def _new_connection(origin: _Origin) -> http.client.HTTPConnection:
+    scheme, host, port = origin
+    if scheme == "http":
+        return http.client.HTTPConnection(host, port, timeout=HTTP_TIMEOUT_SECONDS)
+    return http.client.HTTPSConnection(host, port, timeout=HTTP_TIMEOUT_SECONDS)
+
+
+def _acquire_connection(origin: _Origin) -> Tuple[http.client.HTTPConnection, bool]:
+    """プールから待機中の接続を取り出す（なければ新規に開く）。(接続, 再利用か) を返す。"""
+    with _pool_lock:
+        idle = _idle_connections.get(origin)
+        if idle:
+            return idle.pop(), True
+    return _new_connection(origin), False
+
+
+def _release_connection(origin: _Origin, conn: http.client.HTTPConnection) -> None:
+    """使い終わった接続をプールに戻す（上限を超える場合は閉じる）。"""
+    with _pool_lock:
+        idle = _idle_connections.setdefault(origin, [])
+        if len(idle) < MAX_IDLE_CONNECTIONS_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _read_all(response: http.client.HTTPResponse) -> Tuple[bytes, bool]:
+    return response.read(), True
+
+
+def _request(
+    origin: _Origin,
+    path: str,
+    headers: Dict[str, str],
+    read_body: Callable[[http.client.HTTPResponse], Tuple[_Body, bool]] = _read_all,
+) -> Tuple[int, Dict[str, str], _Body]:
+    """GETを1回送る。再利用した接続が閉じられていた場合のみ新しい接続で1回やり直す。
+
+    read_body は (本文, 最後まで読んだか) を返す。途中で読むのをやめた接続はプールに戻さず閉じる。
+    """
+    for attempt in range(2):
+        conn, reused = _acquire_connection(origin)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            body, complete = read_body(response)
+        except _STALE_CONNECTION_ERRORS as e:
+            conn.close()
+            if reused and attempt == 0:
+                continue
+            raise PageFetchError(f"GET {origin[1]}{path} failed: {e}") from e
+        except PageFetchError:
+            conn.close()
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise PageFetchError(f"GET {origin[1]}{path} failed: {e}") from e
+
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+        if response.will_close or not complete:
+            conn.close()
+        else:
+            _release_connection(origin, conn)
+        return response.status, response_headers, body
+
+    # 到達しない: ループは必ず return か raise する
+    raise PageFetchError(f"GET {origin[1]}{path} failed")
+
+
+def _decode_content(data: bytes, content_encoding: str) -> bytes:
+    """Content-Encoding に従って応答本文を展開する。"""
+    encoding = content_encoding.strip().lower()
+    try:
+        if encoding in ("", "identity"):
+            return data
+        if encoding in ("gzip", "x-gzip"):
+            return gzip.decompress(data)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(data)
+            except zlib.error:
+                # zlib ヘッダなしの raw deflate を返すサーバーもある
+                return zlib.decompress(data, -zlib.MAX_WBITS)
+        if encoding == "br" and BROTLI_AVAILABLE:
+            return brotli.decompress(data)
+    except Exception as e:
+        # gzip / zlib / brotli はそれぞれ別系統の例外を送出する（brotli.error は Exception 直下）
+        raise PageFetchError(f"failed to decode {encoding} response: {e}") from e
+    raise PageFetchError(f"unsupported Content-Encoding: {content_encoding}")
+
+
+def _decode_text(data: bytes, content_type: str) -> str:
+    """Content-Type の charset（既定 UTF-8）で本文を文字列にする。"""
+    match = _CHARSET_PATTERN.search(content_type or "")
+    charset = match.group(1) if match else "utf-8"
+    try:
+        return data.decode(charset, errors="replace")
+    except LookupError:
+        return data.decode("utf-8", errors="replace")
+
+
+def _new_decompressor(content_encoding: str) -> Callable[[bytes], bytes]:
+    """Content-Encoding に従って受信した断片を順に展開する関数を返す。"""
+    encoding = content_encoding.strip().lower()
+    if encoding in ("", "identity"):
+        return lambda data: data
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+    if encoding == "deflate":
+        state: Dict[str, Callable[[bytes], bytes]] = {}
+
+        def decompress_deflate(data: bytes) -> bytes:
+            # zlib ヘッダなしの raw deflate を返すサーバーもあるため、最初の断片で形式を判定する
+            if "decompress" not in state:
+                zlib_header = len(data) >= 2 and data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0
+                wbits = zlib.MAX_WBITS if zlib_header else -zlib.MAX_WBITS
+                state["decompress"] = zlib.decompressobj(wbits).decompress
+            return state["decompress"](data)
+
+        return decompress_deflate
+    if encoding == "br" and BROTLI_AVAILABLE:
+        return brotli.Decompressor().process
+    raise PageFetchError(f"unsupported Content-Encoding: {content_encoding}")
+
+
+def _read_streamed(
+    response: http.client.HTTPResponse, stop_at_footer: bool, max_bytes: int
+) -> Tuple[Tuple[str, int, int], bool]:
+    """本文を STREAM_CHUNK_SIZE ずつ受信・展開・デコードする。
+
+    stop_at_footer なら <footer> 開始タグの直前までで受信をやめる。
+    max_bytes（0 は無制限）は展開後のバイト数の上限。
+
+    Returns:
+        ((<footer> より前の本文, 転送量, 展開後のバイト数), 最後まで受信したか)
+
+    Raises:
+        PageTooLargeError: <footer> に達する前に展開後のバイト数が max_bytes を超えた場合
+    """
+    decompress = _new_decompressor(response.getheader("Content-Encoding", ""))
+    match = _CHARSET_PATTERN.search(response.getheader("Content-Type", "") or "")
+    try:
+        decoder = codecs.getincrementaldecoder(match.group(1) if match else "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    parts: List[str] = []
+    tail = ""
+    received_chars = wire_bytes = decoded_bytes = 0
+    while True:
+        data = response.read(STREAM_CHUNK_SIZE)
+        try:
+            content = decompress(data) if data else b""
+        except Exception as e:
+            # zlib.error / brotli.error は OSError 系ではない
+            raise PageFetchError(f"failed to decode streamed response: {e}") from e
+        wire_bytes += len(data)
+        decoded_bytes += len(content)
+        text = decoder.decode(content, final=not data)
+        parts.append(text)
+
+        if stop_at_footer and text:
+            # 断片の境目をまたぐタグも見つけられるよう、直前の断片の末尾と合わせて探す
+            window = tail + text
+            footer = _FOOTER_PATTERN.search(window)
+            if footer:
+                with _stats_lock:
+                    _stats["stopped_at_footer"] += 1
+                end = received_chars - len(tail) + footer.start()
+                return ("".join(parts)[:end], wire_bytes, decoded_bytes), False
+            tail = window[-_FOOTER_LOOKBEHIND:]
+        received_chars += len(text)
+
+        if not data:
+            return ("".join(parts), wire_bytes, decoded_bytes), True
+        if max_bytes and decoded_bytes > max_bytes:
+            with _stats_lock:
+                _stats["over_budget"] += 1
+            raise PageTooLargeError(f"page exceeds pr_html_max_bytes ({max_bytes} bytes)")
+
+
+def fetch_page(
+    url: str, headers: Optional[Dict[str, str]] = None, stop_at_footer: bool = False, max_bytes: int = 0
+) -> Tuple[int, Dict[str, str], str]:
+    """ページを keep-alive 接続・圧縮転送で取得する（リダイレクトは辿る）。
+
+    Args:
+        url: 取得するURL（http / https）
+        headers: 追加のリクエストヘッダ（If-None-Match 等。リダイレクト先にも送る）
+        stop_at_footer: 本文をストリーミングで受信し、<footer> 開始タグに達したら接続を閉じる
+        max_bytes: 展開後の本文の上限バイト数（0 は無制限）
+
+    Returns:
+        (status, 小文字キーのヘッダ, 展開・デコード済みの本文（stop_at_footer なら <footer> の直前まで）)
+
+    Raises:
+        PageTooLargeError: 本文が max_bytes を超えた場合
+        PageFetchError: 接続・展開に失敗した、またはリダイレクトが多すぎる場合
+    """
+    request_headers = {"User-Agent": USER_AGENT, "Accept": "text/html", "Accept-Encoding": ACCEPT_ENCODING}
+    if headers:
+        request_headers.update(headers)
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise PageFetchError(f"unsupported URL: {url}")
+        origin = (parts.scheme, parts.hostname, parts.port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        if stop_at_footer or max_bytes:
+            status, response_headers, (text, wire_bytes, decoded_bytes) = _request(
+                origin, path, request_headers, lambda response: _read_streamed(response, stop_at_footer, max_bytes)
+            )
+            if status in _REDIRECT_STATUSES and response_headers.get("location"):
+                url = urllib.parse.urljoin(url, response_headers["location"])
+                continue
+            with _stats_lock:
+                _stats["requests"] += 1
+                _stats["wire_bytes"] += wire_bytes
+                _stats["decoded_bytes"] += decoded_bytes
+            return status, response_headers, text
+
+        status, response_headers, raw = _request(origin, path, request_headers)
+        if status in _REDIRECT_STATUSES and response_headers.get("location"):
+            url = urllib.parse.urljoin(url, response_headers["location"])
+            continue
+
+        content = _decode_content(raw, response_headers.get("content-encoding", ""))
+        with _stats_lock:
+            _stats["requests"] += 1
+            _stats["wire_bytes"] += len(raw)
+            _stats["decoded_bytes"] += len(content)
+        return status, response_headers, _decode_text(content, response_headers.get("content-type", ""))
+
+    raise PageFetchError(f"too many redirects: {url}")
+
+
+def get_page_fetch_stats() -> Dict[str, int]:
+    """応答数・転送量（圧縮後）・展開後サイズ・<footer> での打ち切り・上限超過の累計を返す。"""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_page_client() -> None:
+    """待機中の接続を閉じ、統計をリセットする（テスト用）。"""
+    with _pool_lock:
+        connections = [conn for idle in _idle_connections.values() for conn in idle]
+        _idle_connections.clear()
+    for conn in connections:
+        try:
+            conn.close()
+        except OSError:
+            pass
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
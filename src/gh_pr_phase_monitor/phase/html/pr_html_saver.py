@@ -5,8 +5,9 @@ PRのHTMLを取得してlogs/pr/ディレクトリに保存するユーティリ
 import json
 import re
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from .pr_html_analyzer import analyze_pr_html, save_analysis_json
 from .pr_html_fetcher import _fetch_pr_html
@@ -30,6 +31,10 @@ def _write_if_changed(path: Path, content: str) -> bool:
 
 DEFAULT_OUTPUT_DIR = Path("logs/pr")
 
+# 保存したHTMLファイル -> 保存時の timeline_digest()（同じなら読み比べずに書き込みを省略する）
+_saved_digests: Dict[Path, str] = {}
+_saved_digests_lock = threading.Lock()
+
 
 def parse_pr_url(url: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
     """GitHub PR URLからowner、リポジトリ名、PR番号を抽出する。
@@ -49,7 +54,7 @@ def parse_pr_url(url: str) -> tuple[Optional[str], Optional[str], Optional[str]]
 def fetch_pr_html(pr_url: str) -> Optional[str]:
     """PR HTMLページをcurlで取得する（認証なし）。
 
-    実際の取得処理は pr_html_fetcher._fetch_pr_html() に委譲する。
+    実際の取得処理は pr_html_fetcher._fetch_pr_html() に委譲する（条件付きGETは使わず常に本文を取得する）。
 
     Args:
         pr_url: 取得対象のPR URL
@@ -57,7 +62,7 @@ def fetch_pr_html(pr_url: str) -> Optional[str]:
     Returns:
         HTML文字列。取得失敗時はNone
     """
-    return _fetch_pr_html(pr_url)
+    return _fetch_pr_html(pr_url, conditional=False)
 
 
 def save_html_to_logs(
@@ -65,6 +70,7 @@ def save_html_to_logs(
     pr_url: str,
     analysis: Optional[dict] = None,
     output_dir: Path = DEFAULT_OUTPUT_DIR,
+    digest: Optional[str] = None,
 ) -> Optional[Path]:
     """取得済みHTMLをlogs/pr/{repo_name}_{pr_number}.htmlに保存する（検証用）。
 
@@ -72,11 +78,15 @@ def save_html_to_logs(
     内容が変わっていない場合は書き込みをスキップする。
     保存と同時に {repo_name}_{pr_number}.json も出力する。
 
+    digest（pr_html_analysis_cache.timeline_digest()）を渡すと、前回このファイルに保存したときと
+    同じ場合は既存ファイルを読み比べずに HTML・JSON とも書き込みを省略する。
+
     Args:
         html: 保存するHTML文字列
         pr_url: PR URL（ファイル名生成・JSON解析に使用）
         analysis: 事前計算済みの解析結果。省略時は analyze_pr_html() で算出する。
         output_dir: 保存先ディレクトリ（デフォルト: logs/pr）
+        digest: 解析に使う部分のハッシュ（省略時は既存ファイルとの比較のみ）
 
     Returns:
         保存したファイルのPath。失敗時はNone
@@ -89,6 +99,14 @@ def save_html_to_logs(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / f"{repo_name}_{pr_number}.html"
+    json_file = output_file.with_suffix(".json")
+
+    if digest is not None:
+        with _saved_digests_lock:
+            unchanged = _saved_digests.get(output_file) == digest
+        if unchanged and output_file.exists() and json_file.exists():
+            print(f"スキップ（変更なし）: {output_file}")
+            return output_file
 
     if _write_if_changed(output_file, html):
         print(f"保存: {output_file}")
@@ -98,12 +116,14 @@ def save_html_to_logs(
     # HTML解析してstatusを算出するための元データJSONを生成・保存
     if analysis is None:
         analysis = analyze_pr_html(html, pr_url)
-    json_file = output_file.with_suffix(".json")
     if _write_if_changed(json_file, json.dumps(analysis, ensure_ascii=False, indent=2)):
         print(f"保存: {json_file}")
     else:
         print(f"スキップ（変更なし）: {json_file}")
 
+    if digest is not None:
+        with _saved_digests_lock:
+            _saved_digests[output_file] = digest
     return output_file
 
 
@@ -0,0 +1,133 @@
+"""
+PR HTMLを1回の走査で解析するスキャナ。
+
+数MBのPRページから、タイトル・draftマーカー・TimelineItem-body（タイムライン項目）・
+Copilotレビューの要約（"generated no comments"）を取り出す。ページを小文字化したコピーを
+1つだけ作り、タイムライン項目の開始タグを先頭から1回たどってページを区間に分ける。
+各区間の目印は区間の範囲に限定した検索（コピーなし）で調べる。
+
+CPython の re は先頭がリテラルのパターンでしか高速な読み飛ばしができないため、
+目印をすべて1つの正規表現の選択（|）にまとめると1文字ずつの照合になり、かえって遅くなる。
+ここでは各パターンを小文字化したコピーに対する大文字小文字を区別するリテラル先頭の検索にして、
+C実装の高速な読み飛ばしを使う。
+
+抽出結果は従来の個別の正規表現（pr_html_analyzer / llm_status_extractor）と同じになるよう、
+各目印の判定条件をそのまま用いている。
+"""
+
+import html as html_lib
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_REVIEWER_MARKER = "copilot-pull-request-reviewer"
+
+# draft状態を示す目印（小文字化したページに対して照合する）
+_DRAFT_PATTERN_SOURCES = (
+    r"<span[^>]*>\s*draft\s*</span>",
+    r'aria-label="[^"]*draft[^"]*"',
+    r'class="[^"]*state--draft[^"]*"',
+    r'data-state="draft"',
+    r'data-status="draft"',
+    r"octicon-git-pull-request-draft",
+)
+# 埋め込みJSONの "state":"DRAFT" だけは大文字小文字を区別して元のページに照合する
+_STATE_JSON_DRAFT_PATTERN = re.compile(r'"state"\s*:\s*"DRAFT"')
+
+_ITEM_START_SOURCE = r"<div[^>]*timelineitem-body[^>]*>"
+# LLMステータス抽出の対象となるのは class 属性に TimelineItem-body を含む div のみ
+_BODY_START_SOURCE = r'<div[^>]*class="[^"]*timelineitem-body[^"]*"[^>]*>'
+_NO_INLINE_COMMENTS_SOURCE = r"generated\s+(?:no|0)\s+comments?"
+
+
+def _compile_pair(source: str, flags: int = 0) -> Tuple["re.Pattern[str]", "re.Pattern[str]"]:
+    """(小文字化したページ用, 元のページ用 IGNORECASE) のパターン組を返す。"""
+    return re.compile(source, flags), re.compile(source, flags | re.IGNORECASE)
+
+
+_DRAFT_PATTERNS = [_compile_pair(source) for source in _DRAFT_PATTERN_SOURCES]
+_ITEM_START_PATTERNS = _compile_pair(_ITEM_START_SOURCE)
+_BODY_START_PATTERNS = _compile_pair(_BODY_START_SOURCE)
+_NO_INLINE_COMMENTS_PATTERNS = _compile_pair(_NO_INLINE_COMMENTS_SOURCE)
+_TITLE_PATTERNS = _compile_pair(r"<title>(.*?)</title>", re.DOTALL)
+_DIV_END_PATTERNS = _compile_pair(r"</div>")
+
+# GitHub PR HTMLの<title>: "PR Title · Pull Request #N · owner/repo · GitHub"
+_PR_TITLE_SEPARATOR = " · Pull Request "
+
+
+def _title_from_tag_text(title_text: str) -> Optional[str]:
+    """<title>タグの中身からPRタイトルを取り出す（PRページの形式でなければ None）。"""
+    if _PR_TITLE_SEPARATOR not in title_text:
+        return None
+    title = html_lib.unescape(title_text.split(_PR_TITLE_SEPARATOR)[0].strip())
+    return title if title else None
+
+
+def scan_pr_html(html: str) -> Dict[str, Any]:
+    """PR HTMLを走査して、解析に必要な目印を抽出する。
+
+    Args:
+        html: PRページのHTML
+
+    Returns:
+        {
+            "title": str | None,         # <title>から抽出したPRタイトル
+            "is_draft": bool,            # draftマーカーの有無
+            "timeline_bodies": list[str],  # TimelineItem-body divの中身（最初の</div>まで、文書順）
+            "copilot_review_without_inline_comments": bool,
+                # Copilotレビュアーの目印と "generated no/0 comments" が同じタイムライン区間にある
+            "mentions_llm": bool,        # "llm"（大文字小文字を問わない）を含むか。
+                # False なら "LLM status" ラベルや data-llm-status 属性は存在しない
+        }
+    """
+    html = html or ""
+    lowered = html.lower()
+    # 小文字化で長さが変わる文字（例: "İ"）を含むと位置が対応しないため、元のページを IGNORECASE で調べる
+    aligned = len(lowered) == len(html)
+    text = lowered if aligned else html
+    index = 0 if aligned else 1
+
+    title_match = _TITLE_PATTERNS[index].search(text)
+    title = _title_from_tag_text(html[title_match.start(1) : title_match.end(1)]) if title_match else None
+
+    mentions_llm = "llm" in lowered
+
+    is_draft = _STATE_JSON_DRAFT_PATTERN.search(html) is not None or any(
+        patterns[index].search(text) for patterns in _DRAFT_PATTERNS
+    )
+
+    # タイムライン項目の開始タグでページを区間に分け、各区間を範囲指定の検索で調べる
+    timeline_bodies: List[str] = []
+    review_without_inline_comments = False
+    # 本文を取り出した項目の</div>までに始まる項目は本文として扱わない（従来の re.findall と同じ非重複の扱い）
+    body_resume = 0
+    section_start = 0
+    for item in _ITEM_START_PATTERNS[index].finditer(text):
+        if not review_without_inline_comments:
+            review_without_inline_comments = _section_has_no_comment_review(
+                html, text, index, section_start, item.start()
+            )
+        section_start = item.start()
+        if item.start() >= body_resume and _BODY_START_PATTERNS[index].fullmatch(text, item.start(), item.end()):
+            body_end = _DIV_END_PATTERNS[index].search(text, item.end())
+            if body_end:
+                timeline_bodies.append(html[item.end() : body_end.start()])
+                body_resume = body_end.end()
+    if not review_without_inline_comments:
+        review_without_inline_comments = _section_has_no_comment_review(html, text, index, section_start, len(html))
+
+    return {
+        "title": title,
+        "is_draft": is_draft,
+        "timeline_bodies": timeline_bodies,
+        "copilot_review_without_inline_comments": review_without_inline_comments,
+        "mentions_llm": mentions_llm,
+    }
+
+
+def _section_has_no_comment_review(html: str, text: str, index: int, start: int, end: int) -> bool:
+    """区間 [start, end) にCopilotレビュアーの目印と "generated no/0 comments" の両方があるか。"""
+    # レビュアーの目印は大文字小文字を区別するので元のページで探す
+    if html.find(_REVIEWER_MARKER, start, end) == -1:
+        return False
+    return _NO_INLINE_COMMENTS_PATTERNS[index].search(text, start, end) is not None
@@ -0,0 +1,119 @@
+"""
+PR HTMLの条件付きGET用バリデータストア。
+
+PR URLごとに直近のレスポンスの ETag / Last-Modified と、そのHTMLの analyze_pr_html() 結果を保持する。
+解析結果が揃っているPRには If-None-Match / If-Modified-Since を送り、304 Not Modified なら
+HTMLのダウンロードも解析も行わずに前回の解析結果を再利用する。
+
+ストアは export / import で永続化でき（monitor.baseline_store、api_baseline_file）、
+再起動後も最初のイテレーションから304を利用できる。
+"""
+
+import copy
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# PR URL -> {"etag": str | None, "last_modified": str | None, "analysis": dict | None}
+_entries: Dict[str, Dict[str, Any]] = {}
+# 条件付きGETの累計: "conditional"=バリデータ付きで送ったリクエスト数, "not_modified"=そのうち304の数
+_stats: Dict[str, int] = {"conditional": 0, "not_modified": 0}
+_state_lock = threading.Lock()
+
+
+def get_request_validators(pr_url: str) -> Tuple[Optional[str], Optional[str]]:
+    """条件付きGETに使う (etag, last_modified) を返す。
+
+    前回の解析結果が無いPRは304を受けても再利用できないため、(None, None) を返す。
+    """
+    with _state_lock:
+        entry = _entries.get(pr_url)
+        if not entry or entry.get("analysis") is None:
+            return None, None
+        return entry.get("etag"), entry.get("last_modified")
+
+
+def remember_response_validators(pr_url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+    """200レスポンスのバリデータを記録する（新しいHTMLなので前回の解析結果は破棄する）。"""
+    with _state_lock:
+        if not etag and not last_modified:
+            _entries.pop(pr_url, None)
+            return
+        _entries[pr_url] = {"etag": etag, "last_modified": last_modified, "analysis": None}
+
+
+def store_analysis(pr_url: str, analysis: Dict[str, Any]) -> None:
+    """直近に取得したHTMLの解析結果を、そのHTMLのバリデータに紐づけて保存する。"""
+    with _state_lock:
+        entry = _entries.get(pr_url)
+        if entry is not None:
+            entry["analysis"] = copy.deepcopy(analysis)
+
+
+def get_stored_analysis(pr_url: str) -> Optional[Dict[str, Any]]:
+    """保存済みの解析結果のコピーを返す（無ければ None）。"""
+    with _state_lock:
+        analysis = (_entries.get(pr_url) or {}).get("analysis")
+        return copy.deepcopy(analysis) if analysis is not None else None
+
+
+def record_conditional_result(not_modified: bool) -> None:
+    """バリデータ付きリクエストの結果をヒット率の統計に加える。"""
+    with _state_lock:
+        _stats["conditional"] += 1
+        if not_modified:
+            _stats["not_modified"] += 1
+
+
+def get_pr_html_validator_stats() -> Dict[str, int]:
+    """条件付きGETの累計（conditional / not_modified）を返す。"""
+    with _state_lock:
+        return dict(_stats)
+
+
+def export_pr_html_validators() -> Dict[str, Dict[str, Any]]:
+    """解析結果付きのエントリをJSONに変換可能な形で返す（import_pr_html_validators 参照）。"""
+    with _state_lock:
+        return {url: copy.deepcopy(entry) for url, entry in _entries.items() if entry.get("analysis") is not None}
+
+
+def import_pr_html_validators(entries: Dict[str, Dict[str, Any]]) -> None:
+    """export_pr_html_validators() の結果を復元する（再起動後など）。
+
+    Raises:
+        ValueError: 形式が不正な場合（その場合は何も復元しない）
+    """
+    if not isinstance(entries, dict):
+        raise ValueError("invalid PR HTML validators")
+    restored: Dict[str, Dict[str, Any]] = {}
+    for url, entry in entries.items():
+        if (
+            not isinstance(url, str)
+            or not isinstance(entry, dict)
+            or not isinstance(entry.get("analysis"), dict)
+            or not all(isinstance(entry.get(key), (str, type(None))) for key in ("etag", "last_modified"))
+        ):
+            raise ValueError("invalid PR HTML validators")
+        restored[url] = {
+            "etag": entry.get("etag"),
+            "last_modified": entry.get("last_modified"),
+            "analysis": entry["analysis"],
+        }
+    with _state_lock:
+        _entries.clear()
+        _entries.update(restored)
+
+
+def retain_pr_html_validators(open_urls: Iterable[str]) -> None:
+    """openでなくなったPR（クローズ・マージ済み）のエントリを破棄する。"""
+    keep = set(open_urls)
+    with _state_lock:
+        for url in [url for url in _entries if url not in keep]:
+            del _entries[url]
+
+
+def reset_pr_html_validators() -> None:
+    """ストアと統計をリセットする（テスト用）。"""
+    with _state_lock:
+        _entries.clear()
+        _stats["conditional"] = 0
+        _stats["not_modified"] = 0
@@ -0,0 +1,125 @@
+"""
+LLM statuses from the REST issue timeline of a PR (llm_status_source = "timeline").
+
+Maps Copilot-related timeline events onto the same status strings that the HTML scraper
+extracts, so phase_detector and the 1A~3A classification work unchanged:
+
+- copilot_work_started                  -> "Copilot started work on behalf of {actor} {date}"
+- copilot_work_finished(_failure)       -> "Copilot finished work on behalf of {actor} {date}"
+- review_requested (reviewer: Copilot)  -> "Copilot started reviewing on behalf of {actor} {date}"
+- reviewed (reviewer: Copilot)          -> "Copilot reviewed {date}"
+- ready_for_review                      -> "{actor} marked this pull request as ready for review {date}"
+
+Dates use the "March 7, 2026 10:01" (UTC) form that get_latest_activity_timestamp() parses.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from ..github.timeline_fetcher import fetch_pr_timeline
+from .html.pr_html_analyzer import NO_INLINE_COMMENTS_PATTERN, determine_html_status
+from .phase_detector import PHASE2A_REVIEW_COMPLETED, PHASE3A_LLM_FEEDBACK_FINISHED_WORK
+
+_PR_URL_PATTERN = re.compile(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
+# Logins of Copilot's accounts (the coding agent and the PR reviewer bot), lower-cased
+COPILOT_LOGINS = frozenset(
+    {
+        "copilot",
+        "copilot-swe-agent",
+        "copilot-swe-agent[bot]",
+        "copilot-pull-request-reviewer",
+        "copilot-pull-request-reviewer[bot]",
+    }
+)
+
+
+def _is_copilot(login: str) -> bool:
+    """Return True for Copilot's accounts (see COPILOT_LOGINS)."""
+    return (login or "").lower() in COPILOT_LOGINS
+
+
+def _format_event_time(timestamp: str) -> str:
+    """Convert an ISO 8601 timestamp into the "March 7, 2026 10:01" form used by the HTML page."""
+    try:
+        moment = datetime.strptime(timestamp or "", "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return ""
+    return f"{moment:%B} {moment.day}, {moment.year} {moment:%H:%M}"
+
+
+def _login(user: Any) -> str:
+    return (user or {}).get("login", "") if isinstance(user, dict) else ""
+
+
+def llm_statuses_from_timeline(events: List[Dict[str, Any]]) -> List[str]:
+    """Return the LLM statuses described by timeline events, oldest first."""
+    statuses: List[str] = []
+    for event in events:
+        kind = event.get("event", "")
+        actor = _login(event.get("actor"))
+        when = _format_event_time(event.get("created_at", ""))
+        if kind == "copilot_work_started":
+            text = f"Copilot started work on behalf of {actor} {when}"
+        elif kind in ("copilot_work_finished", "copilot_work_finished_failure"):
+            text = f"Copilot finished work on behalf of {actor} {when}"
+        elif kind == "review_requested" and _is_copilot(_login(event.get("requested_reviewer"))):
+            text = f"Copilot started reviewing on behalf of {actor} {when}"
+        elif kind == "reviewed" and _is_copilot(_login(event.get("user"))):
+            text = f"Copilot reviewed {_format_event_time(event.get('submitted_at', ''))}"
+        elif kind == "ready_for_review":
+            text = f"{actor} marked this pull request as ready for review {when}"
+        else:
+            continue
+        statuses.append(re.sub(r"\s+", " ", text).strip())
+    return statuses
+
+
+def _is_draft_from_timeline(events: List[Dict[str, Any]], default: bool) -> bool:
+    """Return the draft state after the last ready_for_review / convert_to_draft event."""
+    for event in reversed(events):
+        if event.get("event") == "ready_for_review":
+            return False
+        if event.get("event") == "convert_to_draft":
+            return True
+    return default
+
+
+def analyze_pr_timeline(events: List[Dict[str, Any]], is_draft: bool, pr_url: str = "") -> Dict[str, Any]:
+    """Analyze timeline events into the same structure as analyze_pr_html() (without title)."""
+    llm_statuses = llm_statuses_from_timeline(events)
+    is_draft = _is_draft_from_timeline(events, is_draft)
+    status = determine_html_status(llm_statuses, is_draft)
+
+    # Same upgrade as the HTML analysis: a Copilot review without inline comments leaves
+    # nothing to address
+    if status == PHASE2A_REVIEW_COMPLETED:
+        copilot_reviews = [e for e in events if e.get("event") == "reviewed" and _is_copilot(_login(e.get("user")))]
+        if copilot_reviews and NO_INLINE_COMMENTS_PATTERN.search(copilot_reviews[-1].get("body") or ""):
+            status = PHASE3A_LLM_FEEDBACK_FINISHED_WORK
+
+    return {"pr_url": pr_url, "is_draft": is_draft, "llm_statuses": llm_statuses, "status": status}
+
+
+def fetch_and_analyze_pr_timeline(pr: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Fetch a PR's timeline (conditional GET) and update its llm_statuses / html_status.
+
+    Returns:
+        The analysis, or None when the timeline could not be fetched (the caller falls back
+        to scraping the PR page)
+    """
+    match = _PR_URL_PATTERN.search(pr.get("url", ""))
+    if not match:
+        return None
+    owner, repo, number = match.group(1), match.group(2), int(match.group(3))
+    try:
+        events = fetch_pr_timeline(owner, repo, number)
+    except (ValueError, OSError) as timeline_error:
+        print(f"    タイムライン取得に失敗しました（HTML解析にフォールバック）: {timeline_error}")
+        return None
+
+    analysis = analyze_pr_timeline(events, bool(pr.get("isDraft", False)), pr.get("url", ""))
+    pr["llm_statuses"] = analysis["llm_statuses"]
+    pr["html_status"] = analysis["status"]
+    return analysis
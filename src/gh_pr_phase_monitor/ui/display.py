@@ -17,6 +17,8 @@ from ..core.time_utils import format_elapsed_time
 from ..github import github_client
 from ..github.github_client import assign_issue_to_copilot, get_issues_from_repositories
 from ..github.issue_etag_checker import check_issues_etag_changed
+from ..github.query_budget_planner import QueryBudgetExceededError
+from ..github.resilience import CircuitOpenError
 from ..monitor.state_tracker import cleanup_old_pr_states, get_pr_state_time, set_pr_state_time
 from ..phase.html.llm_status_extractor import get_latest_activity_timestamp
 from ..phase.phase_detector import PHASE_LLM_WORKING, get_llm_working_progress_label, is_llm_working
@@ -31,6 +33,17 @@ _cached_top_issues: List[Dict[str, Any]] = []
 _issue_cache_state: Dict[str, bool] = {"needs_refresh": False}
 
 
+def get_cached_top_issues() -> List[Dict[str, Any]]:
+    """Return a copy of the cached top issues (used to persist them across restarts)."""
+    return list(_cached_top_issues)
+
+
+def restore_cached_top_issues(issues: List[Dict[str, Any]]) -> None:
+    """Replace the cached top issues (e.g. with the list persisted before a restart)."""
+    _cached_top_issues.clear()
+    _cached_top_issues.extend(issues)
+
+
 def display_cached_top_issues(repos_with_prs: Optional[List[Dict[str, Any]]] = None) -> None:
     """Display top issues from the in-memory cache without making any API calls.
 
@@ -264,14 +277,31 @@ def display_issues_from_repos_without_prs(config: Optional[Dict[str, Any]] = Non
                 display_cached_top_issues()
                 return
 
-            top_issues = get_issues_from_repositories(repos_with_issues, limit=issue_limit)
+            fetch_status: Dict[str, Any] = {}
+            try:
+                top_issues = get_issues_from_repositories(
+                    repos_with_issues, limit=issue_limit, fetch_status=fetch_status
+                )
+            except (QueryBudgetExceededError, CircuitOpenError) as budget_error:
+                # Low-priority listing deferred to a later iteration; keep showing the last known issues
+                print(f"  issue一覧の取得を延期しました: {budget_error}")
+                display_cached_top_issues()
+                return
 
-            # Full fetch succeeded: reset the refresh flag (may have been set by cache invalidation)
-            _issue_cache_state["needs_refresh"] = False
+            dropped_repos = fetch_status.get("dropped_repositories") or []
+            if dropped_repos:
+                # Partial fetch: the ETags of the dropped repositories were already advanced, so
+                # the next iteration must bypass the ETag skip and re-fetch instead of trusting a
+                # cache built from this partial list
+                print(f"  issue一覧は一部のみ取得（予算により{len(dropped_repos)}リポジトリを次回に延期）")
+                _issue_cache_state["needs_refresh"] = True
+            else:
+                # Full fetch succeeded: reset the refresh flag (may have been set by cache invalidation)
+                _issue_cache_state["needs_refresh"] = False
 
-            # Cache the fetched issues so they can be displayed without re-fetching on no-change iterations
-            _cached_top_issues.clear()
-            _cached_top_issues.extend(top_issues)
+                # Cache the fetched issues so they can be displayed without re-fetching on no-change iterations
+                _cached_top_issues.clear()
+                _cached_top_issues.extend(top_issues)
 
             assigned_issue_count = sum(1 for issue in top_issues if issue.get("assignees"))
             effective_llm_working_count = llm_working_count + assigned_issue_count
@@ -368,7 +398,11 @@ def display_issues_from_repos_without_prs(config: Optional[Dict[str, Any]] = Non
                     if label_filter:
                         query_kwargs["labels"] = label_filter
 
-                    candidate_issues = get_issues_from_repositories(repos_list, **query_kwargs)
+                    try:
+                        candidate_issues = get_issues_from_repositories(repos_list, **query_kwargs)
+                    except (QueryBudgetExceededError, CircuitOpenError) as budget_error:
+                        print(f"  Auto-assign候補の取得を延期しました: {budget_error}")
+                        break
 
                     if candidate_issues:
                         issue = candidate_issues[0]
@@ -2,6 +2,7 @@
 Wait and countdown handling with hot reload support
 """
 
+import threading
 import time
 from typing import Any, Callable, Dict, Tuple
 
@@ -44,6 +45,7 @@ def wait_with_countdown(
     self_update_interval_seconds: int = 60,
     status_display_callback: Callable[[], None] | None = None,
     status_display_interval_seconds: int = 60,
+    wake_event: threading.Event | None = None,
 ) -> Tuple[Dict[str, Any], int, str, float]:
     """Wait for the specified interval with a live countdown display and hot reload support
 
@@ -63,6 +65,7 @@ def wait_with_countdown(
         status_display_callback: Optional callback invoked periodically during wait to
             re-display cached status without making API calls
         status_display_interval_seconds: Minimum seconds between status re-display callbacks
+        wake_event: Optional event that ends the wait early when set (e.g. a webhook delivery)
 
     Returns:
         Tuple of (config, interval_seconds, interval_str, new_config_mtime)
@@ -97,7 +100,14 @@ def wait_with_countdown(
         # Print countdown on same line using carriage return
         print(f"\rWaiting {remaining_str}     ", end="", flush=True)
         sleep_duration = min(1, remaining)
-        time.sleep(sleep_duration)
+        if wake_event is not None:
+            if wake_event.wait(sleep_duration):
+                print(f"\n{'=' * 50}")
+                print("Webhookを受信しました。待機を終了して更新します...")
+                print(f"{'=' * 50}")
+                return current_config, current_interval_seconds, current_interval_str, current_mtime
+        else:
+            time.sleep(sleep_duration)
 
         if self_update_callback and time.time() - last_update_check >= self_update_interval_seconds:
             try:
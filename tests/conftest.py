@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import json
+import subprocess
+
+import pytest
+
+
+@pytest.fixture
+def gh_api_response():
+    """Return a builder of fake ``gh api --include`` results.
+
+    build(status, body=None, headers=None) returns a CompletedProcess whose stdout holds the
+    status line, the given headers (None values are left out) and the body (JSON-encoded
+    unless it is already a string).
+    """
+
+    def build(status=200, body=None, headers=None):
+        lines = [f"HTTP/2.0 {status}"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items() if value is not None]
+        if body is None:
+            body = ""
+        elif not isinstance(body, str):
+            body = json.dumps(body)
+        return subprocess.CompletedProcess(
+            args=["gh", "api", "--include"], returncode=0, stdout="\r\n".join(lines) + "\r\n\r\n" + body
+        )
+
+    return build
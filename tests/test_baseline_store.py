@@ -0,0 +1,133 @@
+"""
+Tests for persisting change-detection baselines across restarts.
+
+Verifies that:
+- ETags, the updatedAt baseline, the PR snapshot and cached top issues round-trip through the file
+- a file written for another user or schema version is ignored
+- a malformed file restores nothing
+- restored page ETags make the next check a free 304 fast path
+"""
+
+import json
+
+import pytest
+
+import src.gh_pr_phase_monitor.github.etag_checker as ec
+import src.gh_pr_phase_monitor.github.issue_etag_checker as iec
+import src.gh_pr_phase_monitor.github.repository_fetcher as rf
+import src.gh_pr_phase_monitor.monitor.state_tracker as st
+import src.gh_pr_phase_monitor.ui.display as display
+from src.gh_pr_phase_monitor.monitor.baseline_store import BASELINE_SCHEMA_VERSION, load_baselines, save_baselines
+
+PR = {"url": "https://github.com/testuser/repo1/pull/1", "title": "PR", "phase": "phase1"}
+REPO = {"name": "repo1", "owner": "testuser", "openPRCount": 1}
+ISSUE = {"title": "Issue", "url": "https://github.com/testuser/repo2/issues/3", "number": 3}
+
+
+def _reset_all():
+    ec.reset_etag_state()
+    iec.reset_issue_etag_state()
+    rf.reset_repos_updated_at_baseline()
+    st._last_pr_snapshot = None
+    display.restore_cached_top_issues([])
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    _reset_all()
+    yield
+    _reset_all()
+
+
+def _populate():
+    ec._page_etags.update({1: 'W/"p1"', 2: 'W/"p2"'})
+    ec._last_page_count = 2
+    ec._initialized = True
+    iec._repo_issue_etags["testuser/repo2"] = 'W/"i2"'
+    rf._last_repo_updated_at["repo1"] = "2024-01-01T00:00:00Z"
+    st.set_last_pr_snapshot([PR], [REPO])
+    display.restore_cached_top_issues([ISSUE])
+
+
+def test_round_trip_restores_every_baseline(tmp_path):
+    path = tmp_path / "baselines.json"
+    _populate()
+
+    assert save_baselines(path, "testuser") is True
+    _reset_all()
+    assert load_baselines(path, "testuser") is True
+
+    assert ec._page_etags == {1: 'W/"p1"', 2: 'W/"p2"'}
+    assert ec._last_page_count == 2
+    assert iec._repo_issue_etags == {"testuser/repo2": 'W/"i2"'}
+    assert rf._last_repo_updated_at == {"repo1": "2024-01-01T00:00:00Z"}
+    assert st.get_last_pr_snapshot() == ([PR], [REPO])
+    assert display.get_cached_top_issues() == [ISSUE]
+
+
+def test_restored_page_etags_give_free_304_fast_path(tmp_path, mocker):
+    path = tmp_path / "baselines.json"
+    _populate()
+    save_baselines(path, "testuser")
+    _reset_all()
+    load_baselines(path, "testuser")
+
+    mock_run = mocker.patch.object(ec, "_run_repos_api", return_value=mocker.MagicMock(stdout="HTTP/2 304 \n\n"))
+
+    assert ec.check_repos_etag_changed() is False
+    assert sorted(call.args for call in mock_run.call_args_list) == [(1, 'W/"p1"'), (2, 'W/"p2"')]
+
+
+def test_other_user_is_ignored(tmp_path):
+    path = tmp_path / "baselines.json"
+    _populate()
+    save_baselines(path, "testuser")
+    _reset_all()
+
+    assert load_baselines(path, "someone-else") is False
+    assert ec._page_etags == {}
+    assert st.get_last_pr_snapshot() is None
+
+
+def test_other_schema_version_is_ignored(tmp_path):
+    path = tmp_path / "baselines.json"
+    _populate()
+    save_baselines(path, "testuser")
+    document = json.loads(path.read_text(encoding="utf-8"))
+    document["schema_version"] = BASELINE_SCHEMA_VERSION + 1
+    path.write_text(json.dumps(document), encoding="utf-8")
+    _reset_all()
+
+    assert load_baselines(path, "testuser") is False
+    assert rf._last_repo_updated_at == {}
+
+
+def test_malformed_section_restores_nothing(tmp_path):
+    path = tmp_path / "baselines.json"
+    _populate()
+    save_baselines(path, "testuser")
+    document = json.loads(path.read_text(encoding="utf-8"))
+    document["repo_updated_at"] = ["not", "a", "mapping"]
+    path.write_text(json.dumps(document), encoding="utf-8")
+    _reset_all()
+
+    assert load_baselines(path, "testuser") is False
+    assert ec._page_etags == {}
+    assert iec._repo_issue_etags == {}
+    assert display.get_cached_top_issues() == []
+
+
+def test_missing_or_corrupt_file_is_ignored(tmp_path):
+    assert load_baselines(tmp_path / "missing.json", "testuser") is False
+
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json", encoding="utf-8")
+    assert load_baselines(corrupt, "testuser") is False
+
+
+def test_unserializable_state_is_not_written(tmp_path):
+    path = tmp_path / "baselines.json"
+    st.set_last_pr_snapshot([{"url": "x", "phase": object()}], [REPO])
+
+    assert save_baselines(path, "testuser") is False
+    assert not path.exists()
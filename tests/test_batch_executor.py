@@ -0,0 +1,155 @@
+"""
+Tests for concurrent execution of aliased GraphQL batches.
+
+Verifies that:
+- run_batches() returns results in batch order even when batches finish out of order
+- the number of batches in flight never exceeds the concurrency limit
+- the first GitHubRateLimitError cancels batches that have not started yet, including queued ones
+- get_pr_details_batch / get_issues_from_repositories merge concurrent batches deterministically
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.gh_pr_phase_monitor.github.batch_executor import (
+    get_graphql_max_concurrency,
+    run_batches,
+    set_graphql_max_concurrency,
+)
+from src.gh_pr_phase_monitor.github.graphql_client import GitHubRateLimitError
+
+
+def test_results_are_returned_in_batch_order():
+    def worker(idx, batch):
+        # Later batches finish first
+        time.sleep(0.02 * (5 - idx))
+        return batch * 10
+
+    assert run_batches([1, 2, 3, 4, 5], worker, max_concurrency=5) == [10, 20, 30, 40, 50]
+
+
+def test_concurrency_is_bounded():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def worker(idx, batch):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return idx
+
+    assert run_batches(list(range(8)), worker, max_concurrency=3) == list(range(8))
+    assert 1 < state["peak"] <= 3
+
+
+def test_sequential_when_concurrency_is_one():
+    order = []
+
+    def worker(idx, batch):
+        order.append(threading.current_thread().name)
+        return idx
+
+    run_batches([0, 1, 2], worker, max_concurrency=1)
+    assert all(name == threading.current_thread().name for name in order)
+
+
+def test_rate_limit_error_cancels_remaining_batches():
+    started = []
+    lock = threading.Lock()
+
+    def worker(idx, batch):
+        with lock:
+            started.append(idx)
+        if idx == 0:
+            raise GitHubRateLimitError("rate limit exceeded")
+        time.sleep(0.05)
+        return idx
+
+    with pytest.raises(GitHubRateLimitError):
+        run_batches(list(range(20)), worker, max_concurrency=2)
+
+    # Only the batches already in flight when the error surfaced were started
+    assert len(started) < 20
+
+
+def test_queued_batches_do_not_run_after_rate_limit_error():
+    started = []
+    lock = threading.Lock()
+    in_flight = threading.Event()
+
+    def worker(idx, batch):
+        with lock:
+            started.append(idx)
+        if idx == 0:
+            in_flight.wait(1)
+            raise GitHubRateLimitError("rate limit exceeded")
+        in_flight.set()
+        time.sleep(0.1)
+        return idx
+
+    with pytest.raises(GitHubRateLimitError):
+        run_batches(list(range(10)), worker, max_concurrency=2)
+    time.sleep(0.1)
+
+    # Batch 1 was in flight when batch 0 failed; batches 2..9 were still queued
+    assert sorted(started) == [0, 1]
+
+
+def test_set_graphql_max_concurrency_clamps_to_one():
+    original = get_graphql_max_concurrency()
+    try:
+        set_graphql_max_concurrency(0)
+        assert get_graphql_max_concurrency() == 1
+    finally:
+        set_graphql_max_concurrency(original)
+
+
+def _repos(count):
+    return [{"name": f"repo{i:02d}", "owner": "testuser"} for i in range(count)]
+
+
+def _alias_response(variables, field, make_nodes):
+    """Build a response for an aliased query by echoing the repository names it asked for."""
+    data = {}
+    for key, name in variables.items():
+        if key.startswith("name"):
+            alias = f"repo{key[len('name') :]}"
+            data[alias] = {"name": name, "owner": {"login": "testuser"}, field: {"nodes": make_nodes(name)}}
+    return {"data": data}
+
+
+def test_get_pr_details_batch_merges_concurrent_batches_in_order(mocker):
+    from src.gh_pr_phase_monitor.github.pr_fetcher import get_pr_details_batch
+
+    def fake_execute(query, variables=None, intent=None, **kwargs):
+        # Make the first batch the slowest so completion order differs from batch order
+        if variables.get("name0") == "repo00":
+            time.sleep(0.05)
+        return _alias_response(variables, "pullRequests", lambda name: [{"title": f"PR in {name}", "url": name}])
+
+    mocker.patch("src.gh_pr_phase_monitor.github.pr_fetcher.execute_graphql_query", side_effect=fake_execute)
+    mocker.patch("src.gh_pr_phase_monitor.github.batch_executor._graphql_max_concurrency", 3)
+
+    prs = get_pr_details_batch(_repos(25))
+
+    assert [pr["repository"]["name"] for pr in prs] == [f"repo{i:02d}" for i in range(25)]
+
+
+def test_get_issues_from_repositories_propagates_rate_limit_error(mocker):
+    from src.gh_pr_phase_monitor.github.issue_fetcher import get_issues_from_repositories
+
+    def fake_execute(query, variables=None, intent=None, **kwargs):
+        if "repo10" in variables.values():
+            raise GitHubRateLimitError("rate limit exceeded")
+        return _alias_response(variables, "issues", lambda name: [])
+
+    mocker.patch("src.gh_pr_phase_monitor.github.issue_fetcher.execute_graphql_query", side_effect=fake_execute)
+    mocker.patch("src.gh_pr_phase_monitor.github.batch_executor._graphql_max_concurrency", 2)
+
+    with pytest.raises(GitHubRateLimitError):
+        get_issues_from_repositories(_repos(30))
@@ -0,0 +1,134 @@
+"""
+Tests for adaptive alias batch sizing.
+
+Verifies that:
+- batch sizes grow after cheap, fast, full batches and are capped at the per-kind maximum
+- slow responses shrink the size
+- timeout / node-limit errors halve the size and the failed batch is retried in halves
+- rate-limit and unrelated errors are re-raised without splitting
+- learned state is kept separately per query kind
+"""
+
+import pytest
+
+from src.gh_pr_phase_monitor.github import batch_size_controller as bsc
+from src.gh_pr_phase_monitor.github.graphql_client import GitHubRateLimitError
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    bsc.reset_batch_size_state()
+    yield
+    bsc.reset_batch_size_state()
+
+
+def _response(cost):
+    return {"data": {"rateLimit": {"cost": cost, "remaining": 4000}}}
+
+
+def test_initial_size_is_clamped_to_max():
+    assert bsc.get_batch_size("pr_details", 10, 5) == 5
+
+
+def test_cheap_fast_full_batch_grows_size():
+    bsc.get_batch_size("pr_details", 10, 30)
+    bsc.record_batch_success("pr_details", 10, cost=3, elapsed_seconds=0.5)
+    assert bsc.get_batch_size("pr_details", 10, 30) == 10 + bsc.BATCH_SIZE_GROWTH_STEP
+
+
+def test_partial_batch_does_not_grow_size():
+    bsc.get_batch_size("pr_details", 10, 30)
+    bsc.record_batch_success("pr_details", 4, cost=1, elapsed_seconds=0.1)
+    assert bsc.get_batch_size("pr_details", 10, 30) == 10
+
+
+def test_expensive_batch_does_not_grow_size():
+    bsc.get_batch_size("pr_details", 10, 30)
+    bsc.record_batch_success("pr_details", 10, cost=bsc.CHEAP_BATCH_COST_POINTS + 1, elapsed_seconds=0.5)
+    assert bsc.get_batch_size("pr_details", 10, 30) == 10
+
+
+def test_growth_is_capped_at_max():
+    bsc.get_batch_size("issues", 10, 11)
+    bsc.record_batch_success("issues", 10, cost=1, elapsed_seconds=0.1)
+    assert bsc.get_batch_size("issues", 10, 11) == 11
+
+
+def test_slow_response_shrinks_size():
+    bsc.get_batch_size("pr_details", 12, 30)
+    bsc.record_batch_success("pr_details", 12, cost=1, elapsed_seconds=bsc.SLOW_RESPONSE_SECONDS + 1)
+    assert bsc.get_batch_size("pr_details", 12, 30) == 9
+
+
+def test_state_is_kept_per_kind():
+    bsc.get_batch_size("pr_details", 10, 30)
+    bsc.get_batch_size("issues", 10, 50)
+    bsc.record_batch_success("issues", 10, cost=1, elapsed_seconds=0.1)
+    assert bsc.get_batch_size("pr_details", 10, 30) == 10
+    assert bsc.get_batch_size("issues", 10, 50) == 12
+
+
+def test_timeout_error_halves_size_and_splits_batch():
+    bsc.get_batch_size("pr_details", 8, 30)
+    calls = []
+
+    def fetch(batch):
+        calls.append(list(batch))
+        if len(batch) > 4:
+            raise RuntimeError("Error executing GraphQL query\ngh: Something went wrong while executing your query")
+        # Expensive halves so the halved size is not immediately grown back
+        return [item * 10 for item in batch], _response(bsc.CHEAP_BATCH_COST_POINTS + 1)
+
+    results = bsc.fetch_batch_adaptively("pr_details", list(range(8)), fetch)
+
+    assert results == [i * 10 for i in range(8)]
+    assert calls == [list(range(8)), [0, 1, 2, 3], [4, 5, 6, 7]]
+    assert bsc.get_batch_size("pr_details", 8, 30) == 4
+
+
+def test_node_limit_error_is_treated_as_too_large():
+    assert bsc.is_batch_too_large_error(RuntimeError("MAX_NODE_LIMIT_EXCEEDED: query exceeds the maximum"))
+
+
+def test_rate_limit_error_is_not_split():
+    bsc.get_batch_size("issues", 10, 50)
+
+    def fetch(batch):
+        raise GitHubRateLimitError("GitHub API rate limit exceeded. timeout")
+
+    with pytest.raises(GitHubRateLimitError):
+        bsc.fetch_batch_adaptively("issues", list(range(10)), fetch)
+    assert bsc.get_batch_size("issues", 10, 50) == 10
+
+
+def test_unrelated_error_is_reraised():
+    bsc.get_batch_size("issues", 10, 50)
+
+    def fetch(batch):
+        raise RuntimeError("authentication required")
+
+    with pytest.raises(RuntimeError, match="authentication required"):
+        bsc.fetch_batch_adaptively("issues", list(range(10)), fetch)
+
+
+def test_single_item_batch_reraises_timeout():
+    bsc.get_batch_size("pr_details", 1, 30)
+
+    def fetch(batch):
+        raise RuntimeError("timeout")
+
+    with pytest.raises(RuntimeError, match="timeout"):
+        bsc.fetch_batch_adaptively("pr_details", [1], fetch)
+
+
+def test_get_pr_details_batch_uses_learned_size(mocker):
+    from src.gh_pr_phase_monitor.github.pr_fetcher import PR_DETAILS_QUERY_KIND, get_pr_details_batch
+
+    bsc.get_batch_size(PR_DETAILS_QUERY_KIND, 3, 30)
+    mock_execute = mocker.patch(
+        "src.gh_pr_phase_monitor.github.pr_fetcher.execute_graphql_query", return_value={"data": {}}
+    )
+
+    get_pr_details_batch([{"name": f"repo{i}", "owner": "testuser"} for i in range(7)])
+
+    assert mock_execute.call_count == 3
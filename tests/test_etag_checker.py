@@ -7,6 +7,7 @@ Verifies that:
 - Returns True when any page returns 200 (something changed)
 - ETags are stored and sent as If-None-Match on subsequent calls
 - Pagination is handled correctly (_last_page_count tracks multi-page accounts)
+- Known pages are probed concurrently; new pages are discovered sequentially
 - Errors / empty output are treated as "changed" (safe fallback)
 - reset_etag_state() resets all module-level state
 """
@@ -398,6 +399,100 @@ class TestPagination:
         assert 1 in ec._page_etags
         assert 2 not in ec._page_etags  # stale entry purged
 
+    def test_known_pages_are_probed_concurrently(self, mocker):
+        """All known pages are requested at once; a barrier would time out if they ran one by one."""
+        import threading
+
+        import src.gh_pr_phase_monitor.github.etag_checker as ec
+        from src.gh_pr_phase_monitor.github.etag_checker import check_repos_etag_changed
+
+        for page in (1, 2, 3):
+            ec._page_etags[page] = f'W/"p{page}"'
+        ec._last_page_count = 3
+        ec._initialized = True
+        barrier = threading.Barrier(3, timeout=5)
+        requested = []
+
+        def fake_run(page, etag=None):
+            requested.append((page, etag))
+            barrier.wait()
+            m = mocker.MagicMock()
+            m.stdout = "HTTP/2 304 \n\n"
+            return m
+
+        mocker.patch(
+            "src.gh_pr_phase_monitor.github.etag_checker._run_repos_api",
+            side_effect=fake_run,
+        )
+
+        result = check_repos_etag_changed()
+
+        assert result is False
+        assert sorted(requested) == [(1, 'W/"p1"'), (2, 'W/"p2"'), (3, 'W/"p3"')]
+
+    def test_new_pages_are_discovered_when_last_page_links_next(self, mocker):
+        """When the last known page gains a Link: next, the new pages are walked sequentially."""
+        import src.gh_pr_phase_monitor.github.etag_checker as ec
+        from src.gh_pr_phase_monitor.github.etag_checker import check_repos_etag_changed
+
+        ec._page_etags[1] = 'W/"p1"'
+        ec._page_etags[2] = 'W/"p2"'
+        ec._last_page_count = 2
+        ec._initialized = True
+        requested = []
+
+        def fake_run(page, etag=None):
+            requested.append(page)
+            m = mocker.MagicMock()
+            if page == 1:
+                m.stdout = "HTTP/2 304 \n\n"
+            elif page == 2:
+                m.stdout = 'HTTP/2 200 \netag: W/"p2-new"\nlink: <https://x?page=3>; rel="next"\n\n[]\n'
+            else:
+                m.stdout = 'HTTP/2 200 \netag: W/"p3"\n\n[]\n'
+            return m
+
+        mocker.patch(
+            "src.gh_pr_phase_monitor.github.etag_checker._run_repos_api",
+            side_effect=fake_run,
+        )
+
+        result = check_repos_etag_changed()
+
+        assert result is True
+        assert sorted(requested) == [1, 2, 3]
+        assert ec._page_etags == {1: 'W/"p1"', 2: 'W/"p2-new"', 3: 'W/"p3"'}
+        assert ec._last_page_count == 3
+
+    def test_shrink_ignores_responses_beyond_new_last_page(self, mocker):
+        """Responses for pages after a page without Link: next must not store ETags."""
+        import src.gh_pr_phase_monitor.github.etag_checker as ec
+        from src.gh_pr_phase_monitor.github.etag_checker import check_repos_etag_changed
+
+        for page in (1, 2, 3):
+            ec._page_etags[page] = f'W/"p{page}"'
+        ec._last_page_count = 3
+        ec._initialized = True
+
+        def fake_run(page, etag=None):
+            m = mocker.MagicMock()
+            if page == 1:
+                m.stdout = "HTTP/2 304 \n\n"
+            else:
+                m.stdout = f'HTTP/2 200 \netag: W/"p{page}-new"\n\n[]\n'
+            return m
+
+        mocker.patch(
+            "src.gh_pr_phase_monitor.github.etag_checker._run_repos_api",
+            side_effect=fake_run,
+        )
+
+        result = check_repos_etag_changed()
+
+        assert result is True
+        assert ec._last_page_count == 2
+        assert ec._page_etags == {1: 'W/"p1"', 2: 'W/"p2-new"'}
+
 
 # ---------------------------------------------------------------------------
 # reset_etag_state
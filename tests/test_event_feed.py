@@ -0,0 +1,219 @@
+"""
+Tests for the event-feed-driven repository change detection in event_feed.
+
+Verifies that:
+- the first poll establishes a baseline (None) and later polls send If-None-Match
+- a 304 means no change; new relevant events on user-owned repositories are reported
+- X-Poll-Interval is respected (no request before it elapsed; reported as no change)
+- more new events than the feed retains fall back to the updatedAt check
+- get_repos_changed_since_last_check() uses the feed only when enabled and answerable
+"""
+
+import pytest
+
+import src.gh_pr_phase_monitor.github.event_feed as ef
+import src.gh_pr_phase_monitor.github.repository_fetcher as rf
+
+
+def _response(gh_api_response, status=200, events=None, etag='W/"feed"', poll_interval=60):
+    return gh_api_response(status, events if status == 200 else None, {"X-Poll-Interval": poll_interval, "Etag": etag})
+
+
+def _event(event_id, repo="testuser/repo1", event_type="PushEvent"):
+    return {"id": str(event_id), "type": event_type, "repo": {"name": repo}}
+
+
+@pytest.fixture(autouse=True)
+def _clean_state(monkeypatch):
+    ef.reset_event_feed_state()
+    ef.set_event_feed_enabled(False)
+    rf.reset_repos_updated_at_baseline()
+    now = {"value": 1000.0}
+    monkeypatch.setattr(ef, "_clock", lambda: now["value"])
+    yield now
+    ef.reset_event_feed_state()
+    ef.set_event_feed_enabled(False)
+    rf.reset_repos_updated_at_baseline()
+
+
+def _mock_feeds(mocker, responses_by_feed):
+    """Patch _run_events_api to answer from per-feed lists of responses (in call order)."""
+    queues = {feed: list(responses) for feed, responses in responses_by_feed.items()}
+
+    def fake_run(user, feed, page, etag=None):
+        return queues[feed].pop(0)
+
+    return mocker.patch.object(ef, "_run_events_api", side_effect=fake_run)
+
+
+def test_first_poll_is_baseline_then_304_means_no_change(mocker, _clean_state, gh_api_response):
+    mock_run = _mock_feeds(
+        mocker,
+        {
+            "events": [_response(gh_api_response, events=[_event(10)]), _response(gh_api_response, status=304)],
+            "received_events": [
+                _response(gh_api_response, events=[], etag='W/"rcv"'),
+                _response(gh_api_response, status=304),
+            ],
+        },
+    )
+
+    assert ef.check_repos_changed_via_events("testuser") is None
+    _clean_state["value"] += 61
+    assert ef.check_repos_changed_via_events("testuser") == set()
+
+    second_round = mock_run.call_args_list[2:]
+    assert [(c.args[1], c.args[3]) for c in second_round] == [("events", 'W/"feed"'), ("received_events", 'W/"rcv"')]
+
+
+def test_reports_relevant_events_on_owned_repositories(mocker, _clean_state, gh_api_response):
+    new_events = [
+        _event(15, "testuser/repo3", "IssuesEvent"),
+        _event(14, "otheruser/repo9", "PushEvent"),
+        _event(13, "testuser/repo4", "WatchEvent"),
+        _event(12, "TestUser/repo2", "PullRequestEvent"),
+        _event(10, "testuser/repo1", "PushEvent"),
+    ]
+    _mock_feeds(
+        mocker,
+        {
+            "events": [_response(gh_api_response, events=[_event(10)]), _response(gh_api_response, events=new_events)],
+            "received_events": [
+                _response(gh_api_response, events=[]),
+                _response(gh_api_response, events=[_event(20, "testuser/repo5")]),
+            ],
+        },
+    )
+
+    ef.check_repos_changed_via_events("testuser")
+    _clean_state["value"] += 61
+
+    # repo1's event (id 10) was already seen; repo4's WatchEvent and otheruser's repo are ignored
+    assert ef.check_repos_changed_via_events("testuser") == {"repo3", "repo2", "repo5"}
+
+
+def test_poll_interval_not_elapsed_reports_no_change_without_request(mocker, _clean_state, gh_api_response):
+    mock_run = _mock_feeds(
+        mocker,
+        {
+            "events": [_response(gh_api_response, events=[_event(10)], poll_interval=120)],
+            "received_events": [_response(gh_api_response, events=[], poll_interval=120)],
+        },
+    )
+
+    ef.check_repos_changed_via_events("testuser")
+    _clean_state["value"] += 61
+
+    assert ef.check_repos_changed_via_events("testuser") == set()
+    assert mock_run.call_count == 2
+
+
+def test_window_exceeded_falls_back(mocker, _clean_state, gh_api_response):
+    def full_page(start):
+        return [_event(start - i) for i in range(ef.EVENT_FEED_PAGE_SIZE)]
+
+    _mock_feeds(
+        mocker,
+        {
+            "events": [
+                _response(gh_api_response, events=[_event(10)]),
+                _response(gh_api_response, events=full_page(5000)),
+                _response(gh_api_response, events=full_page(4000)),
+                _response(gh_api_response, events=full_page(3000)),
+            ],
+            "received_events": [_response(gh_api_response, events=[]), _response(gh_api_response, status=304)],
+        },
+    )
+
+    ef.check_repos_changed_via_events("testuser")
+    _clean_state["value"] += 61
+
+    assert ef.check_repos_changed_via_events("testuser") is None
+    # The baseline still advances to the newest event so the next poll is incremental again
+    assert ef._feed_state["events"]["last_event_id"] == 5000
+
+
+def test_error_response_falls_back(mocker, _clean_state, gh_api_response):
+    _mock_feeds(
+        mocker,
+        {
+            "events": [
+                _response(gh_api_response, events=[_event(10)]),
+                _response(gh_api_response, status=502, etag=None),
+            ],
+            "received_events": [_response(gh_api_response, events=[]), _response(gh_api_response, status=304)],
+        },
+    )
+
+    ef.check_repos_changed_via_events("testuser")
+    _clean_state["value"] += 61
+
+    assert ef.check_repos_changed_via_events("testuser") is None
+
+
+class TestRepositoryFetcherIntegration:
+    def test_feed_answer_skips_etag_and_advances_updated_at_baseline(self, mocker):
+        ef.set_event_feed_enabled(True)
+        rf._last_repo_updated_at["repo1"] = "2024-01-01T00:00:00Z"
+        mocker.patch.object(rf, "get_current_user", return_value="testuser")
+        mocker.patch.object(rf, "check_repos_changed_via_events", return_value={"repo1"})
+        mock_etag = mocker.patch.object(rf, "check_repos_etag_changed")
+        mocker.patch.object(rf, "get_all_repos_updated_at", return_value={"repo1": "2024-01-02T00:00:00Z"})
+
+        assert rf.get_repos_changed_since_last_check() == {"repo1"}
+        mock_etag.assert_not_called()
+        assert rf._last_repo_updated_at == {"repo1": "2024-01-02T00:00:00Z"}
+
+    def test_fallback_after_feed_answer_reports_only_new_changes(self, mocker):
+        ef.set_event_feed_enabled(True)
+        rf._last_repo_updated_at.update({"repo1": "t0", "repo2": "t0"})
+        mocker.patch.object(rf, "get_current_user", return_value="testuser")
+        mocker.patch.object(rf, "check_repos_changed_via_events", side_effect=[{"repo1"}, None])
+        mocker.patch.object(rf, "check_repos_etag_changed", return_value=True)
+        mocker.patch.object(
+            rf,
+            "get_all_repos_updated_at",
+            side_effect=[{"repo1": "t1", "repo2": "t0"}, {"repo1": "t1", "repo2": "t2"}],
+        )
+
+        rf.get_repos_changed_since_last_check()
+
+        # repo1's change was already reported by the feed
+        assert rf.get_repos_changed_since_last_check() == {"repo2"}
+
+    def test_empty_feed_answer_does_not_scan(self, mocker):
+        ef.set_event_feed_enabled(True)
+        rf._last_repo_updated_at["repo1"] = "2024-01-01T00:00:00Z"
+        mocker.patch.object(rf, "get_current_user", return_value="testuser")
+        mocker.patch.object(rf, "check_repos_changed_via_events", return_value=set())
+        mock_scan = mocker.patch.object(rf, "get_all_repos_updated_at")
+
+        assert rf.get_repos_changed_since_last_check() == set()
+        mock_scan.assert_not_called()
+
+    def test_unanswerable_feed_falls_back(self, mocker):
+        ef.set_event_feed_enabled(True)
+        rf._last_repo_updated_at["repo1"] = "2024-01-01T00:00:00Z"
+        mocker.patch.object(rf, "get_current_user", return_value="testuser")
+        mocker.patch.object(rf, "check_repos_changed_via_events", return_value=None)
+        mocker.patch.object(rf, "check_repos_etag_changed", return_value=False)
+
+        assert rf.get_repos_changed_since_last_check() == set()
+
+    def test_disabled_feed_is_not_polled(self, mocker):
+        mock_feed = mocker.patch.object(rf, "check_repos_changed_via_events")
+        mocker.patch.object(rf, "check_repos_etag_changed", return_value=False)
+
+        rf.get_repos_changed_since_last_check()
+        mock_feed.assert_not_called()
+
+
+def test_invalid_change_detection_source_uses_default(tmp_path):
+    from src.gh_pr_phase_monitor.core.config import DEFAULT_CHANGE_DETECTION_SOURCE, load_config
+
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('change_detection_source = "webhooks"\n', encoding="utf-8")
+    assert load_config(str(config_path))["change_detection_source"] == DEFAULT_CHANGE_DETECTION_SOURCE
+
+    config_path.write_text('change_detection_source = "Events"\n', encoding="utf-8")
+    assert load_config(str(config_path))["change_detection_source"] == "events"
@@ -0,0 +1,54 @@
+"""
+Tests for the shared gh api --include output parser (gh_api_response).
+
+Verifies that:
+- the status line, lower-cased headers and body are split at the first blank line
+- an unreadable status line yields None
+- x-ratelimit-* headers update the rate-limit tracker, including on 304 responses
+- X-Poll-Interval falls back to the default when missing or malformed
+"""
+
+import pytest
+
+from src.gh_pr_phase_monitor.github import rate_limit_tracker as tracker
+from src.gh_pr_phase_monitor.github.gh_api_response import (
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    parse_gh_api_response,
+    poll_interval_seconds,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracker():
+    tracker.reset_rate_limit_tracker()
+    yield
+    tracker.reset_rate_limit_tracker()
+
+
+def test_splits_status_headers_and_body():
+    output = 'HTTP/2.0 200 OK\r\nETag: W/"a"\r\nLink: <x?page=2>; rel="next"\r\n\r\n[1,\n2]'
+
+    status_code, headers, body = parse_gh_api_response(output)
+
+    assert status_code == 200
+    assert headers == {"etag": 'W/"a"', "link": '<x?page=2>; rel="next"'}
+    assert body == "[1,\n2]"
+
+
+def test_unreadable_status_line_is_none():
+    assert parse_gh_api_response("")[0] is None
+    assert parse_gh_api_response("gh: Not Found\n")[0] is None
+
+
+def test_not_modified_records_rate_limit_headers():
+    output = "HTTP/2 304\nx-ratelimit-limit: 5000\nx-ratelimit-remaining: 4800\nx-ratelimit-resource: core\n\n"
+
+    assert parse_gh_api_response(output)[0] == 304
+    assert tracker.get_rate_limit_snapshot(tracker.CORE_BUCKET)["remaining"] == 4800
+
+
+@pytest.mark.parametrize(("value", "expected"), [("120", 120.0), ("", DEFAULT_POLL_INTERVAL_SECONDS), ("1.5", 60)])
+def test_poll_interval_seconds(value, expected):
+    headers = {"x-poll-interval": value} if value else {}
+
+    assert poll_interval_seconds(headers) == expected
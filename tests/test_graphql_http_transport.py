@@ -0,0 +1,220 @@
+"""
+Tests for the in-process HTTPS GraphQL transport.
+
+Runs execute_graphql_query against a local stub HTTP server and verifies that:
+- queries and variables are POSTed as JSON with the bearer token
+- the token is read once and keep-alive connections are reused across queries
+- rate-limit exhaustion still raises GitHubRateLimitError (from headers, no extra call)
+- GraphQL errors and non-2xx responses raise RuntimeError; transient 5xx responses are retried
+- the gh CLI is used as a fallback when the HTTP transport is unavailable
+"""
+
+import json
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import src.gh_pr_phase_monitor.github.graphql_client as gc
+import src.gh_pr_phase_monitor.github.http_transport as ht
+from src.gh_pr_phase_monitor.github import resilience
+from src.gh_pr_phase_monitor.github.graphql_client import GitHubRateLimitError, execute_graphql_query
+
+
+class _StubGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connection_count += 1
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.requests.append({"path": self.path, "headers": dict(self.headers), "payload": payload})
+        status, headers, body = self.server.responses.pop(0) if self.server.responses else (200, {}, {"data": {}})
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGitHubHandler)
+    server.requests = []
+    server.responses = []
+    server.connection_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv("GH_TOKEN", "test-token")
+    ht.reset_transport()
+    ht.set_api_base_url(f"http://127.0.0.1:{server.server_address[1]}")
+    gc.set_graphql_transport("http")
+    try:
+        yield server
+    finally:
+        gc.set_graphql_transport("gh")
+        ht.reset_transport()
+        ht.set_api_base_url(ht.DEFAULT_API_BASE_URL)
+        server.shutdown()
+        server.server_close()
+
+
+def test_query_is_posted_with_token_and_variables(stub_server):
+    stub_server.responses.append((200, {}, {"data": {"viewer": {"login": "testuser"}}}))
+
+    result = execute_graphql_query("query($login: String!) { user(login: $login) { login } }", {"login": "testuser"})
+
+    assert result == {"data": {"viewer": {"login": "testuser"}}}
+    request = stub_server.requests[0]
+    assert request["path"] == "/graphql"
+    assert request["headers"]["Authorization"] == "bearer test-token"
+    assert request["payload"]["variables"] == {"login": "testuser"}
+    assert "user(login: $login)" in request["payload"]["query"]
+
+
+def test_keep_alive_connection_is_reused(stub_server, mocker):
+    mock_run = mocker.patch("subprocess.run")
+    stub_server.responses.extend([(200, {}, {"data": {"n": i}}) for i in range(3)])
+
+    for _ in range(3):
+        execute_graphql_query("query { viewer { login } }")
+
+    assert len(stub_server.requests) == 3
+    assert stub_server.connection_count == 1
+    # Token came from GH_TOKEN and no gh subprocess was spawned
+    mock_run.assert_not_called()
+
+
+def test_cost_is_displayed(stub_server, capsys):
+    stub_server.responses.append((200, {}, {"data": {"rateLimit": {"cost": 4, "remaining": 4990}}}))
+
+    execute_graphql_query("query { rateLimit { cost remaining } }", intent="テスト")
+
+    out = capsys.readouterr().out
+    assert "クエリ意図: テスト" in out
+    assert "消費コスト: 4点, 残=4990" in out
+
+
+def test_rate_limit_response_raises_rate_limit_error_from_headers(stub_server, mocker):
+    mock_run = mocker.patch("subprocess.run")
+    stub_server.responses.append(
+        (
+            403,
+            {
+                "x-ratelimit-limit": "5000",
+                "x-ratelimit-used": "5000",
+                "x-ratelimit-remaining": "0",
+                "x-ratelimit-reset": "1777777777",
+            },
+            {"message": "API rate limit exceeded for user ID 1."},
+        )
+    )
+
+    with pytest.raises(GitHubRateLimitError, match="used=5000, remaining=0, limit=5000") as exc_info:
+        execute_graphql_query("query { viewer { login } }")
+
+    assert exc_info.value.rate_limit_info == {"limit": 5000, "used": 5000, "remaining": 0, "reset": 1777777777}
+    mock_run.assert_not_called()
+
+
+def test_rate_limited_graphql_error_raises_rate_limit_error(stub_server):
+    stub_server.responses.append(
+        (
+            200,
+            {"x-ratelimit-remaining": "0", "x-ratelimit-limit": "5000"},
+            {"errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded for user ID 1."}]},
+        )
+    )
+
+    with pytest.raises(GitHubRateLimitError):
+        execute_graphql_query("query { viewer { login } }")
+
+
+def test_graphql_errors_raise_runtime_error(stub_server):
+    stub_server.responses.append(
+        (200, {}, {"data": {"repo0": None}, "errors": [{"message": "Could not resolve to a Repository"}]})
+    )
+
+    with pytest.raises(RuntimeError, match="Could not resolve") as exc_info:
+        execute_graphql_query("query { viewer { login } }")
+
+    assert not isinstance(exc_info.value, GitHubRateLimitError)
+
+
+def test_server_error_raises_runtime_error(stub_server):
+    stub_server.responses.append((404, {}, {"message": "Not Found"}))
+
+    with pytest.raises(RuntimeError, match="HTTP 404"):
+        execute_graphql_query("query { viewer { login } }")
+
+
+def test_transient_server_error_is_retried_after_retry_after(stub_server, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(resilience, "_sleep", sleeps.append)
+    stub_server.responses.append((503, {"Retry-After": "2"}, {"message": "Service Unavailable"}))
+    stub_server.responses.append((200, {}, {"data": {"viewer": {"login": "testuser"}}}))
+
+    result = execute_graphql_query("query { viewer { login } }")
+
+    assert result == {"data": {"viewer": {"login": "testuser"}}}
+    assert sleeps == [2.0]
+    assert len(stub_server.requests) == 2
+
+
+def test_falls_back_to_gh_when_server_unreachable(stub_server, mocker):
+    ht.set_api_base_url("http://127.0.0.1:1")
+    mock_run = mocker.patch(
+        "subprocess.run",
+        return_value=subprocess.CompletedProcess(
+            args=["gh"], returncode=0, stdout=json.dumps({"data": {"viewer": {"login": "gh-user"}}}), stderr=""
+        ),
+    )
+
+    result = execute_graphql_query("query { viewer { login } }")
+
+    assert result["data"]["viewer"]["login"] == "gh-user"
+    assert mock_run.call_args[0][0][:3] == ["gh", "api", "graphql"]
+
+
+def test_falls_back_to_gh_on_unauthorized(stub_server, mocker):
+    stub_server.responses.append((401, {}, {"message": "Bad credentials"}))
+    mock_run = mocker.patch(
+        "subprocess.run",
+        return_value=subprocess.CompletedProcess(args=["gh"], returncode=0, stdout='{"data": {}}', stderr=""),
+    )
+
+    assert execute_graphql_query("query { viewer { login } }") == {"data": {}}
+    mock_run.assert_called_once()
+
+
+def test_token_is_read_from_gh_auth_token_once(monkeypatch, mocker):
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    ht.reset_transport()
+    mock_run = mocker.patch(
+        "subprocess.run",
+        return_value=subprocess.CompletedProcess(args=["gh"], returncode=0, stdout="gho_abc\n", stderr=""),
+    )
+    try:
+        assert ht.get_auth_token() == "gho_abc"
+        assert ht.get_auth_token() == "gho_abc"
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["gh", "auth", "token"]
+    finally:
+        ht.reset_transport()
+
+
+def test_invalid_transport_value_falls_back_to_default():
+    gc.set_graphql_transport("carrier-pigeon")
+    assert gc.get_graphql_transport() == "gh"
@@ -0,0 +1,135 @@
+"""
+Tests for the GraphQL TTL response cache.
+
+Verifies that:
+- caching is disabled unless a TTL is configured for the query kind
+- identical queries (modulo whitespace) with the same variables hit the cache
+- entries expire after the TTL and are invalidated for changed repositories
+- get_repos_changed_since_last_check drops entries of changed repositories
+- hit/miss counters are exposed per kind
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.gh_pr_phase_monitor.github import graphql_response_cache as cache
+from src.gh_pr_phase_monitor.github.graphql_client import execute_graphql_query
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    cache.set_graphql_cache_ttls({})
+    cache.clear_graphql_response_cache()
+    yield
+    cache.set_graphql_cache_ttls({})
+    cache.clear_graphql_response_cache()
+
+
+@pytest.fixture
+def mock_gh(mocker):
+    mock_result = MagicMock()
+    mock_result.stdout = json.dumps({"data": {"repository": {"name": "repo1"}}})
+    return mocker.patch("subprocess.run", return_value=mock_result)
+
+
+QUERY = 'query { repository(owner: "o", name: "repo1") { name } }'
+
+
+def test_disabled_by_default(mock_gh):
+    execute_graphql_query(QUERY, cache_kind="issues")
+    execute_graphql_query(QUERY, cache_kind="issues")
+    assert mock_gh.call_count == 2
+    assert cache.get_cache_stats() == {}
+
+
+def test_identical_query_hits_cache(mock_gh):
+    cache.set_graphql_cache_ttls({"issues": 60})
+
+    first = execute_graphql_query(QUERY, cache_kind="issues", cache_repositories=["repo1"])
+    # Different whitespace, same normalized text
+    second = execute_graphql_query(QUERY.replace(" { ", "\n  {\n    "), cache_kind="issues")
+
+    assert mock_gh.call_count == 1
+    assert second == first
+    assert cache.get_cache_stats() == {"issues": {"hits": 1, "misses": 1}}
+
+
+def test_variables_are_part_of_the_key(mock_gh):
+    cache.set_graphql_cache_ttls({"issues": 60})
+    execute_graphql_query(QUERY, {"login": "a"}, cache_kind="issues")
+    execute_graphql_query(QUERY, {"login": "b"}, cache_kind="issues")
+    assert mock_gh.call_count == 2
+
+
+def test_cached_response_is_not_shared_with_callers(mock_gh):
+    cache.set_graphql_cache_ttls({"issues": 60})
+    first = execute_graphql_query(QUERY, cache_kind="issues")
+    first["data"]["repository"]["name"] = "mutated"
+    assert execute_graphql_query(QUERY, cache_kind="issues")["data"]["repository"]["name"] == "repo1"
+
+
+def test_entries_expire(mock_gh, mocker):
+    cache.set_graphql_cache_ttls({"issues": 60})
+    now = [1000.0]
+    mocker.patch("src.gh_pr_phase_monitor.github.graphql_response_cache.time.monotonic", side_effect=lambda: now[0])
+
+    execute_graphql_query(QUERY, cache_kind="issues")
+    now[0] += 61
+    execute_graphql_query(QUERY, cache_kind="issues")
+
+    assert mock_gh.call_count == 2
+
+
+def test_invalidate_changed_repositories_only():
+    cache.set_graphql_cache_ttls({"issues": 60, "all_repos": 60})
+    cache.store_response("issues", "k1", {"data": 1}, ["repo1"])
+    cache.store_response("issues", "k2", {"data": 2}, ["repo2"])
+    cache.store_response("all_repos", "k3", {"data": 3}, None)
+
+    assert cache.invalidate_repositories(set()) == 0
+    assert cache.invalidate_repositories({"repo1"}) == 2
+
+    assert cache.get_cached_response("issues", "k1") is None
+    assert cache.get_cached_response("issues", "k2") == {"data": 2}
+    assert cache.get_cached_response("all_repos", "k3") is None
+
+
+def test_repos_changed_since_last_check_invalidates(mocker):
+    from src.gh_pr_phase_monitor.github import repository_fetcher
+
+    cache.set_graphql_cache_ttls({"issues": 60})
+    cache.store_response("issues", "k1", {"data": 1}, ["repo1"])
+    cache.store_response("issues", "k2", {"data": 2}, ["repo2"])
+
+    mocker.patch.object(repository_fetcher, "check_repos_etag_changed", return_value=True)
+    mocker.patch.object(
+        repository_fetcher,
+        "get_all_repos_updated_at",
+        return_value={"repo1": "2024-01-02T00:00:00Z", "repo2": "2024-01-01T00:00:00Z"},
+    )
+    mocker.patch.dict(
+        repository_fetcher._last_repo_updated_at,
+        {"repo1": "2024-01-01T00:00:00Z", "repo2": "2024-01-01T00:00:00Z"},
+        clear=True,
+    )
+
+    assert repository_fetcher.get_repos_changed_since_last_check() == {"repo1"}
+    assert cache.get_cached_response("issues", "k1") is None
+    assert cache.get_cached_response("issues", "k2") == {"data": 2}
+
+
+def test_issue_fetcher_reuses_cached_batches(mocker):
+    from src.gh_pr_phase_monitor.github.issue_fetcher import get_issues_from_repositories
+
+    cache.set_graphql_cache_ttls({"issues": 60})
+    mock_execute_gh = mocker.patch(
+        "src.gh_pr_phase_monitor.github.graphql_client._execute_graphql_via_gh", return_value={"data": {}}
+    )
+    repos = [{"name": "repo1", "owner": "o"}]
+
+    get_issues_from_repositories(repos)
+    get_issues_from_repositories(repos)
+
+    assert mock_execute_gh.call_count == 1
@@ -8,15 +8,21 @@ HTMLを取得し、1A～3Aのstatusに分類して保存することを確認す
 import pytest
 
 from src.gh_pr_phase_monitor.phase.html.html_status_processor import fetch_and_analyze_pr_html
+from src.gh_pr_phase_monitor.phase.html.pr_html_analysis_cache import reset_analysis_cache, timeline_digest
 from src.gh_pr_phase_monitor.phase.html.pr_html_analyzer import (
-    PHASE1A_DRAFT_LLM_WORKING,
-    PHASE1B_DRAFT_LLM_FINISHED_WORK,
     PHASE1C_REVIEW_IN_PROGRESS,
     PHASE2A_REVIEW_COMPLETED,
     PHASE3A_LLM_FEEDBACK_FINISHED_WORK,
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_analysis_cache():
+    reset_analysis_cache()
+    yield
+    reset_analysis_cache()
+
+
 def _make_pr(url="https://github.com/owner/repo/pull/1"):
     return {"url": url, "title": "Test PR"}
 
@@ -56,7 +62,7 @@ def test_fetch_and_analyze_pr_html_saves_html_and_updates_pr(mocker):
     result = fetch_and_analyze_pr_html(pr)
 
     # HTML+JSON保存が呼ばれること
-    mock_save.assert_called_once_with(mock_html, pr["url"], analysis=mock_analysis)
+    mock_save.assert_called_once_with(mock_html, pr["url"], analysis=mock_analysis, digest=timeline_digest(mock_html))
 
     # pr辞書が更新されること
     assert pr["llm_statuses"] == ["Copilot started reviewing"]
@@ -9,8 +9,12 @@ Verifies that:
 - Errors / empty output are treated as "changed" (safe fallback)
 - reset_issue_etag_state() resets all module-level state
 - Empty repos list returns False immediately (nothing to check)
+- Repos are probed concurrently; the check returns at the first change unless a
+  baseline is missing or early_exit=False
 """
 
+import threading
+
 
 def _reset():
     """Reset module-level state in issue_etag_checker between tests."""
@@ -379,6 +383,80 @@ class TestCheckIssuesEtagMixed:
         assert iec._repo_issue_etags["user/repo2"] == 'W/"e2-new"'
 
 
+# ---------------------------------------------------------------------------
+# Concurrency and early exit
+# ---------------------------------------------------------------------------
+
+
+class TestCheckIssuesEtagConcurrency:
+    def setup_method(self):
+        _reset()
+
+    def test_probes_run_concurrently(self, mocker):
+        """All probes are in flight at the same time (bounded by the pool size)."""
+        import src.gh_pr_phase_monitor.github.issue_etag_checker as iec
+        from src.gh_pr_phase_monitor.github.issue_etag_checker import check_issues_etag_changed
+
+        repos = [{"owner": "user", "name": f"repo{i}"} for i in range(4)]
+        for repo in repos:
+            _populate_etag_cache(repo=repo["name"])
+        barrier = threading.Barrier(len(repos), timeout=5)
+
+        def fake_run(owner, repo, etag=None):
+            barrier.wait()  # would time out if the probes ran serially
+            return mocker.MagicMock(stdout="HTTP/2 304 \n\n")
+
+        mocker.patch.object(iec, "_run_issues_api", side_effect=fake_run)
+
+        assert check_issues_etag_changed(repos) is False
+
+    def test_early_exit_skips_remaining_probes(self, mocker):
+        """The first 200 ends the check; probes not yet started are cancelled."""
+        import src.gh_pr_phase_monitor.github.issue_etag_checker as iec
+        from src.gh_pr_phase_monitor.github.issue_etag_checker import check_issues_etag_changed
+
+        mocker.patch.object(iec, "ISSUE_ETAG_PROBE_MAX_CONCURRENCY", 1)
+        repos = [{"owner": "user", "name": f"repo{i}"} for i in range(20)]
+        for repo in repos:
+            _populate_etag_cache(repo=repo["name"])
+        mock_run = mocker.patch.object(
+            iec, "_run_issues_api", return_value=mocker.MagicMock(stdout='HTTP/2 200 \netag: W/"new"\n\n[]\n')
+        )
+
+        assert check_issues_etag_changed(repos) is True
+        assert iec._repo_issue_etags["user/repo0"] == 'W/"new"'
+        assert mock_run.call_count < len(repos)
+
+    def test_early_exit_disabled_probes_every_repo(self, mocker):
+        """With early_exit=False every repo is probed and every new ETag is recorded."""
+        import src.gh_pr_phase_monitor.github.issue_etag_checker as iec
+        from src.gh_pr_phase_monitor.github.issue_etag_checker import check_issues_etag_changed
+
+        repos = [{"owner": "user", "name": f"repo{i}"} for i in range(10)]
+        for repo in repos:
+            _populate_etag_cache(repo=repo["name"])
+        mocker.patch.object(
+            iec, "_run_issues_api", return_value=mocker.MagicMock(stdout='HTTP/2 200 \netag: W/"new"\n\n[]\n')
+        )
+
+        assert check_issues_etag_changed(repos, early_exit=False) is True
+        assert set(iec._repo_issue_etags.values()) == {'W/"new"'}
+
+    def test_missing_baseline_disables_early_exit(self, mocker):
+        """While any repo lacks an ETag, every repo is probed to establish the baseline."""
+        import src.gh_pr_phase_monitor.github.issue_etag_checker as iec
+        from src.gh_pr_phase_monitor.github.issue_etag_checker import check_issues_etag_changed
+
+        mocker.patch.object(iec, "ISSUE_ETAG_PROBE_MAX_CONCURRENCY", 1)
+        repos = [{"owner": "user", "name": f"repo{i}"} for i in range(5)]
+        mocker.patch.object(
+            iec, "_run_issues_api", return_value=mocker.MagicMock(stdout='HTTP/2 200 \netag: W/"new"\n\n[]\n')
+        )
+
+        assert check_issues_etag_changed(repos) is None
+        assert len(iec._repo_issue_etags) == len(repos)
+
+
 # ---------------------------------------------------------------------------
 # reset_issue_etag_state
 # ---------------------------------------------------------------------------
@@ -10,7 +10,7 @@ def _setup_common_main_mocks(monkeypatch, wait_kwargs):
     monkeypatch.setattr(main_module.signal, "signal", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(main_module, "set_auto_update_debug_log_enabled", lambda _enabled: None)
     monkeypatch.setattr(main_module, "run_startup_self_update_foreground", lambda *, apply_update=True: None)
-    monkeypatch.setattr(main_module, "get_rate_limit_info", lambda: None)
+    monkeypatch.setattr(main_module, "get_rate_limit_snapshot", lambda *_args: None)
     monkeypatch.setattr(main_module, "_display_rate_limit_usage", lambda *_args, **_kwargs: None)
     monkeypatch.setattr(main_module, "_check_rate_limit_throttle", lambda *_args, **_kwargs: (False, 60))
     monkeypatch.setattr(main_module, "check_no_state_change_timeout", lambda *_args, **_kwargs: False)
@@ -0,0 +1,142 @@
+"""
+Tests for the notification-driven PR HTML refetch selection in notification_poller.
+
+Verifies that:
+- when disabled, or when the notifications cannot answer, every PR is re-fetched (None)
+- PRs with new notification activity are selected; others wait for the safety interval
+- polls send If-Modified-Since and the since cursor taken from the server's Date header
+- X-Poll-Interval is respected (no request before it elapsed)
+- _process_open_prs re-fetches only the selected PRs but still processes every PR
+"""
+
+import pytest
+
+import src.gh_pr_phase_monitor.github.notification_poller as npoll
+
+PR1 = {"url": "https://github.com/testuser/repo1/pull/1"}
+PR2 = {"url": "https://github.com/testuser/repo2/pull/7"}
+LAST_MODIFIED = "Thu, 01 Jan 2026 00:00:00 GMT"
+
+
+def _response(gh_api_response, status=200, threads=None, date="Thu, 01 Jan 2026 00:01:00 GMT", poll_interval=60):
+    headers = {"Date": date, "Last-Modified": LAST_MODIFIED, "X-Poll-Interval": poll_interval}
+    return gh_api_response(status, (threads or []) if status == 200 else None, headers)
+
+
+def _thread(api_url, subject_type="PullRequest"):
+    return {"subject": {"type": subject_type, "url": api_url}}
+
+
+@pytest.fixture(autouse=True)
+def _clean_state(monkeypatch):
+    npoll.reset_notification_poller_state()
+    npoll.set_pr_html_refetch_settings("notifications", 600)
+    now = {"value": 1000.0}
+    monkeypatch.setattr(npoll, "_clock", lambda: now["value"])
+    yield now
+    npoll.reset_notification_poller_state()
+    npoll.set_pr_html_refetch_settings("all")
+
+
+def _fetch_all():
+    npoll.record_pr_html_fetched(PR1["url"])
+    npoll.record_pr_html_fetched(PR2["url"])
+
+
+def test_disabled_refetches_everything(mocker):
+    npoll.set_pr_html_refetch_settings("all")
+    mock_run = mocker.patch.object(npoll, "_run_notifications_api")
+
+    assert npoll.select_prs_for_html_refetch([PR1, PR2]) is None
+    mock_run.assert_not_called()
+
+
+def test_first_poll_refetches_everything(mocker, gh_api_response):
+    mocker.patch.object(npoll, "_run_notifications_api", return_value=_response(gh_api_response))
+    _fetch_all()
+
+    assert npoll.select_prs_for_html_refetch([PR1, PR2]) is None
+
+
+def test_selects_prs_with_new_activity(mocker, _clean_state, gh_api_response):
+    mock_run = mocker.patch.object(
+        npoll,
+        "_run_notifications_api",
+        side_effect=[
+            _response(gh_api_response),
+            _response(
+                gh_api_response,
+                threads=[
+                    _thread("https://api.github.com/repos/TestUser/repo2/pulls/7"),
+                    _thread("https://api.github.com/repos/testuser/repo1/issues/1", "Issue"),
+                ],
+            ),
+        ],
+    )
+    npoll.select_prs_for_html_refetch([PR1, PR2])
+    _fetch_all()
+    _clean_state["value"] += 61
+
+    assert npoll.select_prs_for_html_refetch([PR1, PR2]) == ({PR2["url"]}, set())
+    assert mock_run.call_args_list[1].args == ("2026-01-01T00:01:00Z", LAST_MODIFIED)
+
+
+def test_not_modified_selects_only_overdue_prs(mocker, _clean_state, gh_api_response):
+    mocker.patch.object(
+        npoll,
+        "_run_notifications_api",
+        side_effect=[_response(gh_api_response), _response(gh_api_response, status=304)],
+    )
+    npoll.select_prs_for_html_refetch([PR1, PR2])
+    npoll.record_pr_html_fetched(PR1["url"])
+    _clean_state["value"] += 300
+    npoll.record_pr_html_fetched(PR2["url"])
+    _clean_state["value"] += 301
+
+    # PR1 was fetched 601 seconds ago (safety interval elapsed), PR2 only 301 seconds ago
+    assert npoll.select_prs_for_html_refetch([PR1, PR2]) == (set(), {PR1["url"]})
+
+
+def test_poll_interval_is_respected(mocker, _clean_state, gh_api_response):
+    mock_run = mocker.patch.object(
+        npoll, "_run_notifications_api", return_value=_response(gh_api_response, poll_interval=120)
+    )
+    npoll.select_prs_for_html_refetch([PR1, PR2])
+    _fetch_all()
+    _clean_state["value"] += 61
+
+    assert npoll.select_prs_for_html_refetch([PR1, PR2]) == (set(), set())
+    assert mock_run.call_count == 1
+
+
+def test_error_or_full_page_refetches_everything(mocker, _clean_state, gh_api_response):
+    full_page = [_thread(f"https://api.github.com/repos/testuser/repo1/pulls/{n}") for n in range(50)]
+    mocker.patch.object(
+        npoll,
+        "_run_notifications_api",
+        side_effect=[
+            _response(gh_api_response),
+            _response(gh_api_response, status=502),
+            _response(gh_api_response, threads=full_page),
+        ],
+    )
+    npoll.select_prs_for_html_refetch([PR1, PR2])
+    _fetch_all()
+    _clean_state["value"] += 61
+    assert npoll.select_prs_for_html_refetch([PR1, PR2]) is None
+    assert npoll.select_prs_for_html_refetch([PR1, PR2]) is None
+
+
+def test_process_open_prs_refetches_only_selected(mocker):
+    from src.gh_pr_phase_monitor.monitor import pr_processor
+
+    mock_fetch = mocker.patch.object(pr_processor, "fetch_and_analyze_pr_html", return_value={"status": "1A"})
+    mocker.patch.object(pr_processor, "determine_phase", return_value="phase1")
+    mock_process = mocker.patch.object(pr_processor, "process_pr")
+
+    pr_processor._process_open_prs([dict(PR1), dict(PR2)], [], {}, refetch_urls={PR2["url"]})
+
+    assert [c.args[0]["url"] for c in mock_fetch.call_args_list] == [PR2["url"]]
+    assert mock_process.call_count == 2
+    assert npoll._pr_key_from_html_url(PR2["url"]) in npoll._last_html_fetch
+    assert npoll._pr_key_from_html_url(PR1["url"]) not in npoll._last_html_fetch
@@ -0,0 +1,107 @@
+"""
+Tests for the concurrent fetch-and-analyze stage of _process_open_prs.
+
+Verifies that:
+- PR pages are fetched concurrently, bounded by pr_fetch_max_concurrency
+- requests in flight to one host never exceed pr_fetch_max_per_host
+- phase detection and process_pr still run serially in the original PR order
+- a failed fetch is reported for its PR without stopping the others
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.gh_pr_phase_monitor.monitor import pr_processor
+
+
+def _pr(number):
+    return {"url": f"https://github.com/testuser/repo1/pull/{number}", "repository": {"name": "repo1"}}
+
+
+@pytest.fixture(autouse=True)
+def _settings(mocker):
+    mocker.patch.object(pr_processor, "select_prs_needing_analysis", return_value=None)
+    mocker.patch.object(pr_processor, "determine_phase", return_value="phase1")
+    yield
+    pr_processor.set_pr_fetch_concurrency(4, 3)
+
+
+def _tracking_fetch(mocker, delay=0.05, fail_url=None):
+    """Patch the fetch with a slow fake that records the peak number of concurrent calls."""
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fetch(pr):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        if pr["url"] == fail_url:
+            raise RuntimeError("curl failed")
+        pr["llm_statuses"] = [pr["url"]]
+        return {"status": "ok"}
+
+    mocker.patch.object(pr_processor, "fetch_and_analyze_pr_html", side_effect=fetch)
+    return state
+
+
+def test_fetches_run_concurrently_and_actions_keep_order(mocker):
+    pr_processor.set_pr_fetch_concurrency(8, 8)
+    state = _tracking_fetch(mocker)
+    processed = []
+    mocker.patch.object(pr_processor, "process_pr", side_effect=lambda pr, config, phase: processed.append(pr["url"]))
+    prs = [_pr(n) for n in range(1, 9)]
+
+    pr_processor._process_open_prs(prs, [], {})
+
+    assert state["peak"] > 1
+    assert processed == [pr["url"] for pr in prs]
+    assert all(pr["llm_statuses"] == [pr["url"]] for pr in prs)
+
+
+def test_per_host_limit_caps_requests_in_flight(mocker):
+    pr_processor.set_pr_fetch_concurrency(8, 2)
+    state = _tracking_fetch(mocker)
+    mocker.patch.object(pr_processor, "process_pr")
+
+    pr_processor._process_open_prs([_pr(n) for n in range(1, 9)], [], {})
+
+    assert state["peak"] == 2
+
+
+def test_concurrency_of_one_is_sequential(mocker):
+    pr_processor.set_pr_fetch_concurrency(1, 3)
+    state = _tracking_fetch(mocker, delay=0)
+    mocker.patch.object(pr_processor, "process_pr")
+
+    pr_processor._process_open_prs([_pr(1), _pr(2), _pr(3)], [], {})
+
+    assert state["peak"] == 1
+
+
+def test_failed_fetch_is_logged_and_others_are_processed(mocker):
+    pr_processor.set_pr_fetch_concurrency(4, 4)
+    failing = _pr(2)
+    _tracking_fetch(mocker, delay=0, fail_url=failing["url"])
+    mock_log = mocker.patch.object(pr_processor, "log_error_to_file")
+    mock_process = mocker.patch.object(pr_processor, "process_pr")
+
+    pr_processor._process_open_prs([_pr(1), failing, _pr(3)], [], {})
+
+    assert mock_process.call_count == 3
+    assert mock_log.call_args.args[0] == f"Failed to fetch/analyze HTML for {failing['url']}"
+    assert "llm_statuses" not in failing
+
+
+def test_only_refetch_targets_are_fetched(mocker):
+    _tracking_fetch(mocker, delay=0)
+    mocker.patch.object(pr_processor, "process_pr")
+    prs = [_pr(1), _pr(2)]
+
+    pr_processor._process_open_prs(prs, [], {}, refetch_urls={prs[1]["url"]})
+
+    pr_processor.fetch_and_analyze_pr_html.assert_called_once_with(prs[1])
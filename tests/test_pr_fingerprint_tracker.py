@@ -0,0 +1,160 @@
+"""
+Tests for the per-PR change fingerprints in pr_fingerprint_tracker and pr_fetcher.
+
+Verifies that:
+- fingerprints combine updatedAt, head SHA, review count and the last timeline item id
+- when disabled, or when the fingerprint query fails, every PR is fetched (None)
+- unchanged PRs reuse their stored analysis; changed, new and stale PRs are selected
+- _process_open_prs fetches HTML only for the selected PRs and stores fresh analyses
+- explicitly signalled PRs (notifications, webhooks) are fetched even with an unchanged fingerprint
+"""
+
+import pytest
+
+import src.gh_pr_phase_monitor.monitor.pr_fingerprint_tracker as fpt
+from src.gh_pr_phase_monitor.github.pr_fetcher import _parse_pr_fingerprint_response
+
+URL1 = "https://github.com/testuser/repo1/pull/1"
+URL2 = "https://github.com/testuser/repo1/pull/2"
+
+
+def _pr(url):
+    return {"url": url, "title": "PR", "repository": {"name": "repo1", "owner": "testuser"}}
+
+
+@pytest.fixture(autouse=True)
+def _clean_state(monkeypatch):
+    fpt.reset_pr_fingerprint_state()
+    fpt.set_pr_fingerprint_settings(True, 600)
+    now = {"value": 1000.0}
+    monkeypatch.setattr(fpt, "_clock", lambda: now["value"])
+    yield now
+    fpt.reset_pr_fingerprint_state()
+    fpt.set_pr_fingerprint_settings(False)
+
+
+def _analyze(pr, status):
+    pr["llm_statuses"] = [status]
+    pr["html_status"] = status
+    fpt.record_pr_analysis(pr)
+
+
+def test_parse_fingerprint_response():
+    data = {
+        "data": {
+            "repo0": {
+                "pullRequests": {
+                    "nodes": [
+                        {
+                            "url": URL1,
+                            "updatedAt": "2026-01-01T00:00:00Z",
+                            "headRefOid": "abc123",
+                            "reviews": {"totalCount": 2},
+                            "timelineItems": {"nodes": [{"id": "IT_1"}]},
+                        },
+                        {"url": URL2, "updatedAt": "2026-01-02T00:00:00Z", "timelineItems": {"nodes": []}},
+                    ]
+                }
+            }
+        }
+    }
+
+    fingerprints = _parse_pr_fingerprint_response(data, [{"owner": "testuser", "name": "repo1"}])
+
+    assert fingerprints == [(URL1, "2026-01-01T00:00:00Z|abc123|2|IT_1"), (URL2, "2026-01-02T00:00:00Z||0|")]
+
+
+def test_disabled_fetches_everything(mocker):
+    fpt.set_pr_fingerprint_settings(False)
+    mock_query = mocker.patch.object(fpt, "get_pr_fingerprints")
+
+    assert fpt.select_prs_needing_analysis([_pr(URL1)]) is None
+    mock_query.assert_not_called()
+
+
+def test_query_failure_fetches_everything(mocker):
+    mocker.patch.object(fpt, "get_pr_fingerprints", side_effect=RuntimeError("boom"))
+    mocker.patch.object(fpt, "log_error_to_file")
+
+    assert fpt.select_prs_needing_analysis([_pr(URL1)]) is None
+
+
+def test_unchanged_pr_reuses_stored_analysis(mocker):
+    mock_query = mocker.patch.object(fpt, "get_pr_fingerprints", return_value={URL1: "a", URL2: "b"})
+    first = [_pr(URL1), _pr(URL2)]
+    assert fpt.select_prs_needing_analysis(first) == {URL1, URL2}
+    _analyze(first[0], "1A")
+    _analyze(first[1], "2A")
+
+    mock_query.return_value = {URL1: "a", URL2: "b-changed"}
+    fresh = [_pr(URL1), _pr(URL2)]
+
+    assert fpt.select_prs_needing_analysis(fresh) == {URL2}
+    assert fresh[0]["llm_statuses"] == ["1A"]
+    assert fresh[0]["html_status"] == "1A"
+    assert "llm_statuses" not in fresh[1]
+    mock_query.assert_called_with([{"owner": "testuser", "name": "repo1"}])
+
+
+def test_stale_analysis_is_refetched(mocker, _clean_state):
+    mocker.patch.object(fpt, "get_pr_fingerprints", return_value={URL1: "a"})
+    pr = _pr(URL1)
+    fpt.select_prs_needing_analysis([pr])
+    _analyze(pr, "1A")
+
+    _clean_state["value"] += 599
+    assert fpt.select_prs_needing_analysis([_pr(URL1)]) == set()
+    _clean_state["value"] += 1
+    assert fpt.select_prs_needing_analysis([_pr(URL1)]) == {URL1}
+
+
+def test_closed_prs_are_forgotten(mocker):
+    mocker.patch.object(fpt, "get_pr_fingerprints", return_value={URL1: "a", URL2: "b"})
+    prs = [_pr(URL1), _pr(URL2)]
+    fpt.select_prs_needing_analysis(prs)
+    _analyze(prs[0], "1A")
+    _analyze(prs[1], "2A")
+
+    fpt.select_prs_needing_analysis([_pr(URL1)])
+
+    assert set(fpt._analyses) == {URL1}
+
+
+def test_process_open_prs_fetches_only_changed_prs(mocker):
+    from src.gh_pr_phase_monitor.monitor import pr_processor
+
+    def fake_fetch(pr):
+        pr["llm_statuses"] = ["fresh"]
+        return {"status": "fresh"}
+
+    mocker.patch.object(fpt, "get_pr_fingerprints", return_value={URL1: "a", URL2: "b"})
+    mock_fetch = mocker.patch.object(pr_processor, "fetch_and_analyze_pr_html", side_effect=fake_fetch)
+    mocker.patch.object(pr_processor, "determine_phase", return_value="phase1")
+    mocker.patch.object(pr_processor, "process_pr")
+
+    pr_processor._process_open_prs([_pr(URL1), _pr(URL2)], [], {})
+    assert mock_fetch.call_count == 2
+
+    mock_fetch.reset_mock()
+    fpt.get_pr_fingerprints.return_value = {URL1: "a", URL2: "b2"}
+    prs = [_pr(URL1), _pr(URL2)]
+    pr_processor._process_open_prs(prs, [], {})
+
+    assert [c.args[0]["url"] for c in mock_fetch.call_args_list] == [URL2]
+    assert prs[0]["llm_statuses"] == ["fresh"]
+
+
+def test_signalled_prs_are_fetched_despite_unchanged_fingerprint(mocker):
+    from src.gh_pr_phase_monitor.monitor import pr_processor
+
+    mocker.patch.object(fpt, "get_pr_fingerprints", return_value={URL1: "a", URL2: "b"})
+    mock_fetch = mocker.patch.object(pr_processor, "fetch_and_analyze_pr_html", return_value={"status": "fresh"})
+    mocker.patch.object(pr_processor, "determine_phase", return_value="phase1")
+    mocker.patch.object(pr_processor, "process_pr")
+    pr_processor._process_open_prs([_pr(URL1), _pr(URL2)], [], {})
+    mock_fetch.reset_mock()
+
+    # URL1 is due on the safety cadence but unchanged; URL2 was named by a notification or webhook
+    pr_processor._process_open_prs([_pr(URL1), _pr(URL2)], [], {}, refetch_urls={URL1}, signalled_urls={URL2})
+
+    assert [c.args[0]["url"] for c in mock_fetch.call_args_list] == [URL2]
@@ -0,0 +1,90 @@
+"""
+Tests for the content-hash memoization of PR page analyses (pr_html_analysis_cache).
+
+Verifies that:
+- the digest covers the title and timeline region but not per-request head/footer content
+- pages with a known digest reuse the analysis (pr_url replaced) without running analyze_pr_html
+- the LRU keeps at most pr_analysis_cache_size entries and 0 disables it
+- per-iteration hit/miss counts reset when taken
+- save_html_to_logs skips both writes when the digest matches the last save
+"""
+
+import pytest
+
+from src.gh_pr_phase_monitor.phase.html import html_status_processor
+from src.gh_pr_phase_monitor.phase.html import pr_html_analysis_cache as cache
+from src.gh_pr_phase_monitor.phase.html.pr_html_saver import save_html_to_logs
+
+
+def _page(csrf="token-1", timeline="Copilot started work", title="Fix parser"):
+    return (
+        f'<html><head><title>{title} · Pull Request #1 · owner/repo · GitHub</title><meta name="csrf" content="{csrf}">'
+        f'</head><body><div class="prc-PageLayout-Content"><div class="TimelineItem-body">{timeline}</div></div>'
+        f'<footer data-request-id="{csrf}"></footer></body></html>'
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    cache.reset_analysis_cache()
+    cache.set_analysis_cache_size(256)
+    yield
+    cache.reset_analysis_cache()
+    cache.set_analysis_cache_size(256)
+
+
+def test_digest_ignores_head_and_footer_but_not_timeline_or_title():
+    digest = cache.timeline_digest(_page())
+
+    assert cache.timeline_digest(_page(csrf="token-2")) == digest
+    assert cache.timeline_digest(_page(timeline="Copilot finished work")) != digest
+    assert cache.timeline_digest(_page(title="Fix lexer")) != digest
+
+
+def test_unchanged_timeline_skips_analysis(mocker):
+    pages = iter([_page(), _page(csrf="token-2")])
+    mocker.patch.object(html_status_processor, "_fetch_pr_html", side_effect=lambda url: next(pages))
+    analyze = mocker.patch.object(
+        html_status_processor, "analyze_pr_html", side_effect=lambda html, url: {"pr_url": url, "status": "ok"}
+    )
+    mocker.patch.object(html_status_processor, "save_html_to_logs")
+
+    html_status_processor.fetch_and_analyze_pr_html({"url": "https://github.com/owner/repo/pull/1"})
+    result = html_status_processor.fetch_and_analyze_pr_html({"url": "https://github.com/owner/repo/pull/2"})
+
+    analyze.assert_called_once()
+    assert result == {"pr_url": "https://github.com/owner/repo/pull/2", "status": "ok"}
+    assert cache.take_analysis_cache_stats() == {"hits": 1, "misses": 1}
+    assert cache.take_analysis_cache_stats() == {"hits": 0, "misses": 0}
+
+
+def test_lru_evicts_least_recently_used():
+    cache.set_analysis_cache_size(2)
+    cache.cache_analysis("a", {"status": "A"})
+    cache.cache_analysis("b", {"status": "B"})
+    assert cache.get_cached_analysis("a", "url") is not None
+    cache.cache_analysis("c", {"status": "C"})
+
+    assert cache.get_cached_analysis("b", "url") is None
+    assert cache.get_cached_analysis("a", "url")["status"] == "A"
+    assert cache.get_cached_analysis("c", "url")["status"] == "C"
+
+
+def test_size_zero_disables_cache():
+    cache.set_analysis_cache_size(0)
+    cache.cache_analysis("a", {"status": "A"})
+
+    assert cache.get_cached_analysis("a", "url") is None
+    assert cache.take_analysis_cache_stats() == {"hits": 0, "misses": 0}
+
+
+def test_save_skips_writes_when_digest_matches_last_save(tmp_path):
+    url = "https://github.com/owner/repo/pull/7"
+    saved = save_html_to_logs(_page(), url, analysis={"status": "A"}, output_dir=tmp_path, digest="d1")
+
+    save_html_to_logs(_page(csrf="token-2"), url, analysis={"status": "A"}, output_dir=tmp_path, digest="d1")
+    assert saved.read_text(encoding="utf-8") == _page()
+
+    save_html_to_logs(_page(csrf="token-3"), url, analysis={"status": "B"}, output_dir=tmp_path, digest="d2")
+    assert saved.read_text(encoding="utf-8") == _page(csrf="token-3")
+    assert '"B"' in saved.with_suffix(".json").read_text(encoding="utf-8")
@@ -15,11 +15,11 @@ from src.gh_pr_phase_monitor.phase.html.pr_html_analyzer import (
     PHASE2A_REVIEW_COMPLETED,
     PHASE2B_LLM_ADDRESSING_FEEDBACK,
     PHASE3A_LLM_FEEDBACK_FINISHED_WORK,
-    _determine_html_status,
     _extract_title_from_html,
     _is_draft_from_html,
     _is_review_still_in_progress,
     analyze_pr_html,
+    determine_html_status,
     save_analysis_json,
 )
 
@@ -87,24 +87,24 @@ class TestIsDraftFromHtml:
 class TestDetermineHtmlStatus:
     def test_phase1a_draft_no_statuses(self):
         """Draft PR with no LLM statuses → PHASE1A"""
-        assert _determine_html_status([], is_draft=True) == PHASE1A_DRAFT_LLM_WORKING
+        assert determine_html_status([], is_draft=True) == PHASE1A_DRAFT_LLM_WORKING
 
     def test_phase1a_draft_started_only(self):
         """Draft PR with started-work only → PHASE1A"""
-        assert _determine_html_status(["started work on something"], is_draft=True) == PHASE1A_DRAFT_LLM_WORKING
+        assert determine_html_status(["started work on something"], is_draft=True) == PHASE1A_DRAFT_LLM_WORKING
 
     def test_phase1b_draft_finished(self):
         """Draft PR with started then finished → PHASE1B"""
         statuses = ["started work on something", "finished work on something"]
-        assert _determine_html_status(statuses, is_draft=True) == PHASE1B_DRAFT_LLM_FINISHED_WORK
+        assert determine_html_status(statuses, is_draft=True) == PHASE1B_DRAFT_LLM_FINISHED_WORK
 
     def test_phase1c_not_draft_no_reviewing(self):
         """Non-draft PR with no reviewing event → PHASE1C"""
-        assert _determine_html_status([], is_draft=False) == PHASE1C_REVIEW_IN_PROGRESS
+        assert determine_html_status([], is_draft=False) == PHASE1C_REVIEW_IN_PROGRESS
 
     def test_phase1c_not_draft_with_started_only(self):
         """Non-draft PR with started but no reviewing → PHASE1C"""
-        assert _determine_html_status(["started work"], is_draft=False) == PHASE1C_REVIEW_IN_PROGRESS
+        assert determine_html_status(["started work"], is_draft=False) == PHASE1C_REVIEW_IN_PROGRESS
 
     def test_phase1b_not_draft_finished_no_reviewing(self):
         """Non-draft PR with started→finished work but no reviewing event → PHASE1B_LLM_FINISHED_WORK (not PHASE1C).
@@ -116,22 +116,22 @@ class TestDetermineHtmlStatus:
         to avoid triggering 'gh pr ready' on a PR that is already not draft.
         """
         statuses = ["Copilot started work on behalf of cat2151", "Copilot finished work on behalf of cat2151"]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE1B_LLM_FINISHED_WORK
+        assert determine_html_status(statuses, is_draft=False) == PHASE1B_LLM_FINISHED_WORK
 
     def test_phase2a_reviewing_only(self):
         """reviewing event but no started after → PHASE2A"""
         statuses = ["started work", "finished work", "reviewing something"]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE2A_REVIEW_COMPLETED
+        assert determine_html_status(statuses, is_draft=False) == PHASE2A_REVIEW_COMPLETED
 
     def test_phase2b_reviewing_then_started(self):
         """reviewing then started (no finished after) → PHASE2B"""
         statuses = ["reviewing something", "started work on feedback"]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE2B_LLM_ADDRESSING_FEEDBACK
+        assert determine_html_status(statuses, is_draft=False) == PHASE2B_LLM_ADDRESSING_FEEDBACK
 
     def test_phase3a_reviewing_started_finished(self):
         """reviewing → started → finished → PHASE3A"""
         statuses = ["reviewing something", "started work on feedback", "finished work on feedback"]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE3A_LLM_FEEDBACK_FINISHED_WORK
+        assert determine_html_status(statuses, is_draft=False) == PHASE3A_LLM_FEEDBACK_FINISHED_WORK
 
     def test_phase3a_multiple_review_cycles(self):
         """Multiple review cycles, last cycle finished → PHASE3A"""
@@ -142,7 +142,7 @@ class TestDetermineHtmlStatus:
             "started work on first feedback",
             "finished work on first feedback",
         ]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE3A_LLM_FEEDBACK_FINISHED_WORK
+        assert determine_html_status(statuses, is_draft=False) == PHASE3A_LLM_FEEDBACK_FINISHED_WORK
 
     def test_phase2b_second_review_started_not_finished(self):
         """Second review cycle started but not finished → PHASE2B"""
@@ -153,7 +153,7 @@ class TestDetermineHtmlStatus:
             "reviewing second",
             "started work on second feedback",
         ]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE2B_LLM_ADDRESSING_FEEDBACK
+        assert determine_html_status(statuses, is_draft=False) == PHASE2B_LLM_ADDRESSING_FEEDBACK
 
     def test_phase2b_new_started_after_finished_within_same_cycle(self):
         """reviewing → started → finished → started (no finished) → PHASE2B, not PHASE3A.
@@ -168,7 +168,7 @@ class TestDetermineHtmlStatus:
             "finished work on feedback",
             "started work again",  # new cycle started, no matching finished
         ]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE2B_LLM_ADDRESSING_FEEDBACK
+        assert determine_html_status(statuses, is_draft=False) == PHASE2B_LLM_ADDRESSING_FEEDBACK
 
     def test_returns_dict_with_required_keys(self):
         html = "<html><body>Some PR content</body></html>"
@@ -260,7 +260,7 @@ class TestPhase1cReviewInProgress:
     def test_started_reviewing_only_returns_phase1c(self):
         """Bug fix: 'started reviewing' without 'finished reviewing' → PHASE1C, not PHASE2A."""
         statuses = ["Copilot started reviewing on behalf of cat2151 March 5, 2026 23:29"]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE1C_REVIEW_IN_PROGRESS
+        assert determine_html_status(statuses, is_draft=False) == PHASE1C_REVIEW_IN_PROGRESS
 
     def test_issue_example_returns_phase1c(self):
         """Exact scenario from the bug report: started work, finished work, then started reviewing."""
@@ -269,7 +269,7 @@ class TestPhase1cReviewInProgress:
             "Copilot finished work on behalf of cat2151 March 5, 2026 23:24",
             "Copilot started reviewing on behalf of cat2151 March 5, 2026 23:29",
         ]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE1C_REVIEW_IN_PROGRESS
+        assert determine_html_status(statuses, is_draft=False) == PHASE1C_REVIEW_IN_PROGRESS
 
     def test_started_and_finished_reviewing_returns_phase2a(self):
         """Once 'finished reviewing' is present, it should be PHASE2A (review done, no work yet)."""
@@ -277,7 +277,7 @@ class TestPhase1cReviewInProgress:
             "Copilot started reviewing on behalf of cat2151",
             "Copilot finished reviewing on behalf of cat2151",
         ]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE2A_REVIEW_COMPLETED
+        assert determine_html_status(statuses, is_draft=False) == PHASE2A_REVIEW_COMPLETED
 
     def test_started_reviewing_then_started_work_returns_phase2b(self):
         """started reviewing → finished reviewing → started work → PHASE2B."""
@@ -286,7 +286,7 @@ class TestPhase1cReviewInProgress:
             "Copilot finished reviewing",
             "Copilot started work on feedback",
         ]
-        assert _determine_html_status(statuses, is_draft=False) == PHASE2B_LLM_ADDRESSING_FEEDBACK
+        assert determine_html_status(statuses, is_draft=False) == PHASE2B_LLM_ADDRESSING_FEEDBACK
 
 
 class TestSaveAnalysisJson:
@@ -0,0 +1,156 @@
+"""
+Tests for the in-process PR page client (pr_html_fetch_backend = "http").
+
+Verifies against a local HTTP/1.1 server that:
+- gzip-compressed pages are requested, decompressed and decoded
+- consecutive fetches reuse one keep-alive connection
+- redirects are followed and validators of 2xx responses are remembered
+- 304 raises PrHtmlNotModified and non-2xx responses return None
+- connection failures fall back to curl
+- pr_html_stop_at_footer stops reading at <footer> (also across chunk boundaries) and closes the connection
+- pr_html_max_bytes aborts larger pages without falling back to curl
+"""
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import src.gh_pr_phase_monitor.phase.html.pr_html_fetcher as fetcher
+import src.gh_pr_phase_monitor.phase.html.pr_html_http_client as client
+from src.gh_pr_phase_monitor.phase.html.pr_html_validators import reset_pr_html_validators, store_analysis
+
+PAGE = "<html><body>Copilot reviewed ✓</body></html>" * 50
+# <footer> が受信の1断片目と2断片目の境目をまたぐページ
+LONG_PAGE_CONTENT = "<html><body>" + "x" * (client.STREAM_CHUNK_SIZE - len("<html><body>") - 3)
+LONG_PAGE = LONG_PAGE_CONTENT + '<FOOTER class="footer">' + "y" * 1_000_000 + "</footer></body></html>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    requests = []
+
+    def do_GET(self):  # noqa: N802
+        _Handler.connections.add(self.client_address)
+        _Handler.requests.append(dict(self.headers))
+        if self.path == "/old":
+            self._send(301, b"", {"Location": "/pull/1"})
+        elif self.path == "/long":
+            self._send(200, LONG_PAGE.encode("utf-8"), {"Content-Type": "text/html; charset=utf-8"})
+        elif self.path == "/missing":
+            self._send(404, b"not found")
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self._send(304, b"")
+        else:
+            body = PAGE.encode("utf-8")
+            headers = {"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"}
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                headers["Content-Encoding"] = "gzip"
+            self._send(200, body, headers)
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # クライアントが <footer> で受信をやめて接続を閉じた
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    _Handler.connections.clear()
+    _Handler.requests.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client.reset_page_client()
+    reset_pr_html_validators()
+    fetcher.set_pr_html_fetch_backend("http")
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    fetcher.set_pr_html_fetch_backend("curl")
+    fetcher.set_pr_html_fetch_limits(False, 0)
+    client.reset_page_client()
+    reset_pr_html_validators()
+    server.shutdown()
+    server.server_close()
+
+
+def test_gzip_page_is_decoded_and_connection_reused(base_url):
+    assert fetcher._fetch_pr_html(f"{base_url}/pull/1", conditional=False) == PAGE
+    assert fetcher._fetch_pr_html(f"{base_url}/pull/1", conditional=False) == PAGE
+
+    assert len(_Handler.connections) == 1
+    stats = client.get_page_fetch_stats()
+    assert stats["requests"] == 2
+    assert stats["wire_bytes"] < stats["decoded_bytes"]
+
+
+def test_redirect_is_followed_and_304_reuses_analysis(base_url):
+    url = f"{base_url}/old"
+    assert fetcher._fetch_pr_html(url) == PAGE
+    store_analysis(url, {"status": "PHASE2A_REVIEW_COMPLETED"})
+
+    with pytest.raises(fetcher.PrHtmlNotModified):
+        fetcher._fetch_pr_html(url)
+    assert _Handler.requests[-1]["If-None-Match"] == '"v1"'
+
+
+def test_non_2xx_returns_none(base_url):
+    assert fetcher._fetch_pr_html(f"{base_url}/missing") is None
+
+
+def test_connection_failure_falls_back_to_curl(base_url, mocker):
+    mocker.patch.object(fetcher, "fetch_page", side_effect=client.PageFetchError("refused"))
+    curl = mocker.patch.object(
+        fetcher.subprocess, "run", return_value=mocker.MagicMock(returncode=0, stdout="<html/>\n200")
+    )
+
+    assert fetcher._fetch_pr_html("https://github.com/testuser/repo1/pull/1") == "<html/>"
+    assert curl.call_args.args[0][0] == "curl"
+
+
+def test_stop_at_footer_truncates_and_closes_connection(base_url):
+    fetcher.set_pr_html_fetch_limits(True, 0)
+
+    assert fetcher._fetch_pr_html(f"{base_url}/long", conditional=False) == LONG_PAGE_CONTENT
+    assert fetcher._fetch_pr_html(f"{base_url}/pull/1", conditional=False) == PAGE
+
+    # 読み残した接続はプールに戻さないため、2件目は新しい接続になる
+    assert len(_Handler.connections) == 2
+    stats = client.get_page_fetch_stats()
+    assert stats["stopped_at_footer"] == 1
+    assert stats["wire_bytes"] < len(LONG_PAGE) // 2
+
+
+def test_max_bytes_aborts_without_curl_fallback(base_url, mocker):
+    fetcher.set_pr_html_fetch_limits(False, 200_000)
+    curl = mocker.patch.object(fetcher.subprocess, "run")
+
+    assert fetcher._fetch_pr_html(f"{base_url}/long", conditional=False) is None
+    assert fetcher._fetch_pr_html(f"{base_url}/pull/1", conditional=False) == PAGE
+
+    curl.assert_not_called()
+    assert client.get_page_fetch_stats()["over_budget"] == 1
+
+
+def test_max_bytes_is_passed_to_curl(mocker):
+    fetcher.set_pr_html_fetch_limits(False, 5_000_000)
+    curl = mocker.patch.object(fetcher.subprocess, "run", return_value=mocker.MagicMock(returncode=63, stdout=""))
+    try:
+        assert fetcher._fetch_pr_html("https://github.com/testuser/repo1/pull/1", conditional=False) is None
+    finally:
+        fetcher.set_pr_html_fetch_limits(False, 0)
+
+    args = curl.call_args.args[0]
+    assert args[args.index("--max-filesize") + 1] == "5000000"
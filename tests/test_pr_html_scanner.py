@@ -0,0 +1,96 @@
+"""
+Tests for the single-pass PR HTML scanner (scan_pr_html).
+
+Verifies that:
+- title, draft markers, timeline bodies and the Copilot review summary are extracted in one pass
+- results match the previous per-marker regexes, including case-sensitive "state":"DRAFT"
+- pages whose length changes when lower-cased fall back to case-insensitive matching
+- analyze_pr_html skips the full-page markdown conversion when no "LLM status" label can exist
+"""
+
+import re
+
+from src.gh_pr_phase_monitor.phase.html import pr_html_analyzer
+from src.gh_pr_phase_monitor.phase.html.pr_html_scanner import scan_pr_html
+
+_REVIEW_ITEM = (
+    '<div class="TimelineItem-body"><strong><a data-hovercard-type="copilot" '
+    'data-hovercard-url="/copilot/hovercard?bot=copilot-pull-request-reviewer">Copilot</a></strong>'
+    "reviewed<p>Copilot reviewed 3 out of 3 changed files and Generated NO comments.</p></div>"
+)
+_WORK_ITEM = (
+    '<div class="TimelineItem-body"><a href="/tasks?session_id=1">'
+    "Copilot started work on behalf of owner March 7, 2026 10:01</a></div>"
+)
+
+
+def _page(body, title="Fix &amp; parser · Pull Request #42 · owner/repo · GitHub"):
+    return f"<html><head><title>{title}</title></head><body>{body}</body></html>"
+
+
+def test_extracts_all_markers():
+    scan = scan_pr_html(_page(_WORK_ITEM + _REVIEW_ITEM + '<span class="State">Draft</span>'))
+
+    assert scan["title"] == "Fix & parser"
+    assert scan["is_draft"] is True
+    assert scan["copilot_review_without_inline_comments"] is True
+    assert scan["mentions_llm"] is False
+    assert len(scan["timeline_bodies"]) == 2
+    assert scan["timeline_bodies"][0].startswith('<a href="/tasks?session_id=1">')
+
+
+def test_timeline_bodies_match_findall_without_overlap():
+    html = _page(
+        '<DIV class="x TimelineItem-Body">outer<div class="TimelineItem-body">nested</div>tail</div>'
+        '<div data-x="TimelineItem-body">no class</div>'
+        '<div class="TimelineItem-body">last</div>'
+    )
+    legacy = re.findall(
+        r'<div[^>]*class="[^"]*TimelineItem-body[^"]*"[^>]*>(.*?)</div>', html, re.DOTALL | re.IGNORECASE
+    )
+
+    assert scan_pr_html(html)["timeline_bodies"] == legacy == ['outer<div class="TimelineItem-body">nested', "last"]
+
+
+def test_json_state_draft_is_case_sensitive():
+    assert scan_pr_html('{"state": "DRAFT"}')["is_draft"] is True
+    assert scan_pr_html('{"state":"draft"}')["is_draft"] is False
+    assert scan_pr_html('<div data-state="Draft"></div>')["is_draft"] is True
+
+
+def test_no_comments_phrase_outside_reviewer_section_is_ignored():
+    html = _page(
+        '<div class="TimelineItem-body">copilot-pull-request-reviewer reviewed</div>'
+        '<div class="TimelineItem-body">I quote: generated no comments</div>'
+    )
+
+    assert scan_pr_html(html)["copilot_review_without_inline_comments"] is False
+
+
+def test_length_changing_lowercase_falls_back_to_ignorecase():
+    # "İ".lower() は2文字になるため、小文字化したコピーと元のページの位置が対応しない
+    html = _page("İ" * 3 + _REVIEW_ITEM + '<DIV CLASS="TimelineItem-body">çå</div>', title="İ · Pull Request #1 · o/r")
+
+    scan = scan_pr_html(html)
+
+    assert scan["title"] == "İ"
+    assert scan["copilot_review_without_inline_comments"] is True
+    assert scan["timeline_bodies"][1] == "çå"
+
+
+def test_analyze_skips_markdown_without_llm_status_label(mocker):
+    convert = mocker.patch.object(pr_html_analyzer, "_html_to_simple_markdown", return_value="")
+
+    result = pr_html_analyzer.analyze_pr_html(_page(_REVIEW_ITEM))
+
+    convert.assert_not_called()
+    assert result["status"] == pr_html_analyzer.PHASE3A_LLM_FEEDBACK_FINISHED_WORK
+
+
+def test_analyze_converts_markdown_when_label_present(mocker):
+    convert = mocker.spy(pr_html_analyzer, "_html_to_simple_markdown")
+
+    result = pr_html_analyzer.analyze_pr_html("<p>LLM&nbsp;status: Copilot finished work on behalf of owner</p>")
+
+    convert.assert_called_once()
+    assert result["llm_statuses"] == ["Copilot finished work on behalf of owner"]
@@ -0,0 +1,151 @@
+"""
+Tests for conditional GETs of PR HTML pages (pr_html_validators / pr_html_fetcher).
+
+Verifies that:
+- validators of a 200 response are sent only once an analysis of that page is stored
+- a 304 reuses the stored analysis without analyzing or saving the page again
+- header blocks of redirects are skipped when parsing curl -D - output
+- the conditional-request hit rate is counted
+- the store round-trips through export/import and the baseline file
+- entries of PRs that are no longer open are dropped
+"""
+
+import pytest
+
+import src.gh_pr_phase_monitor.phase.html.html_status_processor as hsp
+import src.gh_pr_phase_monitor.phase.html.pr_html_fetcher as fetcher
+import src.gh_pr_phase_monitor.phase.html.pr_html_validators as validators
+from src.gh_pr_phase_monitor.monitor.baseline_store import load_baselines, save_baselines
+
+PR_URL = "https://github.com/testuser/repo1/pull/1"
+ETAG = 'W/"abc"'
+LAST_MODIFIED = "Thu, 01 Jan 2026 00:00:00 GMT"
+
+
+def _curl_output(status, body="", etag=ETAG):
+    headers = f"HTTP/2 {status}\r\netag: {etag}\r\nlast-modified: {LAST_MODIFIED}\r\n\r\n"
+    return f"{headers}{body}\n{status}"
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    validators.reset_pr_html_validators()
+    yield
+    validators.reset_pr_html_validators()
+
+
+def test_split_response_headers_uses_last_block_after_redirect():
+    output = 'HTTP/1.1 301 Moved\r\nLocation: /x\r\n\r\nHTTP/2 200\r\nETag: "v2"\r\n\r\n<html>body</html>'
+
+    headers, body = fetcher._split_response_headers(output)
+
+    assert headers == {"etag": '"v2"'}
+    assert body == "<html>body</html>"
+
+
+def test_validators_sent_only_after_analysis_is_stored(mocker):
+    mock_run = mocker.patch.object(
+        fetcher.subprocess, "run", return_value=mocker.MagicMock(returncode=0, stdout=_curl_output(200, "<html/>"))
+    )
+
+    assert fetcher._fetch_pr_html(PR_URL) == "<html/>"
+    assert fetcher._fetch_pr_html(PR_URL) == "<html/>"
+    assert not any("If-None-Match" in arg for arg in mock_run.call_args.args[0])
+
+    validators.store_analysis(PR_URL, {"llm_statuses": ["1A"]})
+    fetcher._fetch_pr_html(PR_URL)
+
+    args = mock_run.call_args.args[0]
+    assert f"If-None-Match: {ETAG}" in args
+    assert f"If-Modified-Since: {LAST_MODIFIED}" in args
+    assert args[-1] == PR_URL
+
+
+def test_not_modified_reuses_stored_analysis(mocker):
+    analysis = {"llm_statuses": ["1A"], "status": "1A", "title": "PR title"}
+    mocker.patch.object(
+        fetcher.subprocess,
+        "run",
+        side_effect=[
+            mocker.MagicMock(returncode=0, stdout=_curl_output(200, "<html/>")),
+            mocker.MagicMock(returncode=0, stdout=_curl_output(304)),
+        ],
+    )
+    mock_analyze = mocker.patch.object(hsp, "analyze_pr_html", return_value=analysis)
+    mock_save = mocker.patch.object(hsp, "save_html_to_logs")
+
+    assert hsp.fetch_and_analyze_pr_html({"url": PR_URL}) == analysis
+    pr = {"url": PR_URL}
+    assert hsp.fetch_and_analyze_pr_html(pr) == analysis
+
+    assert mock_analyze.call_count == 1
+    assert mock_save.call_count == 1
+    assert pr["llm_statuses"] == ["1A"]
+    assert validators.get_pr_html_validator_stats() == {"conditional": 1, "not_modified": 1}
+
+
+def test_changed_page_is_analyzed_again(mocker):
+    mocker.patch.object(
+        fetcher.subprocess,
+        "run",
+        side_effect=[
+            mocker.MagicMock(returncode=0, stdout=_curl_output(200, "<html>v1</html>")),
+            mocker.MagicMock(returncode=0, stdout=_curl_output(200, "<html>v2</html>", etag='W/"def"')),
+        ],
+    )
+    mock_analyze = mocker.patch.object(hsp, "analyze_pr_html", side_effect=[{"status": "v1"}, {"status": "v2"}])
+    mocker.patch.object(hsp, "save_html_to_logs")
+
+    hsp.fetch_and_analyze_pr_html({"url": PR_URL})
+    hsp.fetch_and_analyze_pr_html({"url": PR_URL})
+
+    assert mock_analyze.call_count == 2
+    assert validators.get_request_validators(PR_URL) == ('W/"def"', LAST_MODIFIED)
+    assert validators.get_stored_analysis(PR_URL) == {"status": "v2"}
+    assert validators.get_pr_html_validator_stats() == {"conditional": 1, "not_modified": 0}
+
+
+def test_export_import_round_trip():
+    validators.remember_response_validators(PR_URL, ETAG, LAST_MODIFIED)
+    validators.store_analysis(PR_URL, {"status": "1A"})
+    validators.remember_response_validators("https://github.com/testuser/repo1/pull/2", ETAG, None)
+    exported = validators.export_pr_html_validators()
+
+    validators.reset_pr_html_validators()
+    validators.import_pr_html_validators(exported)
+
+    # Entries without an analysis cannot serve a 304 and are not persisted
+    assert list(exported) == [PR_URL]
+    assert validators.get_request_validators(PR_URL) == (ETAG, LAST_MODIFIED)
+    assert validators.get_stored_analysis(PR_URL) == {"status": "1A"}
+
+
+def test_retain_drops_entries_of_closed_prs():
+    closed_url = "https://github.com/testuser/repo1/pull/2"
+    for url in (PR_URL, closed_url):
+        validators.remember_response_validators(url, ETAG, LAST_MODIFIED)
+        validators.store_analysis(url, {"status": "1A"})
+
+    validators.retain_pr_html_validators([PR_URL])
+
+    assert list(validators.export_pr_html_validators()) == [PR_URL]
+    assert validators.get_stored_analysis(closed_url) is None
+
+
+@pytest.mark.parametrize("entries", [[], {PR_URL: {"etag": 1, "analysis": {}}}, {PR_URL: {"etag": ETAG}}])
+def test_import_rejects_malformed_entries(entries):
+    with pytest.raises(ValueError):
+        validators.import_pr_html_validators(entries)
+
+
+def test_baseline_file_persists_validators(tmp_path):
+    path = tmp_path / "baselines.json"
+    validators.remember_response_validators(PR_URL, ETAG, LAST_MODIFIED)
+    validators.store_analysis(PR_URL, {"status": "1A"})
+
+    assert save_baselines(path, "testuser") is True
+    validators.reset_pr_html_validators()
+    assert load_baselines(path, "testuser") is True
+
+    assert validators.get_request_validators(PR_URL) == (ETAG, LAST_MODIFIED)
+    assert validators.get_stored_analysis(PR_URL) == {"status": "1A"}
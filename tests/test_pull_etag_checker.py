@@ -0,0 +1,119 @@
+"""
+Tests for the REST pulls-list ETag probes used by the skip path (pull_etag_checker).
+
+Verifies that:
+- the first probe of a repository establishes its baseline (None: caller recounts via GraphQL)
+- 304 responses report no change; 200 responses report the repository and store the new ETag
+- error responses drop the stored ETag
+- with skip_path_open_pr_check = "rest_etag" the skip path spends no GraphQL inventory scan
+  and re-fetches PR details only for the repositories that returned 200
+"""
+
+import pytest
+
+import src.gh_pr_phase_monitor.github.pull_etag_checker as pec
+from src.gh_pr_phase_monitor.monitor import iteration_runner
+
+REPO1 = {"name": "repo1", "owner": "testuser", "openPRCount": 1}
+REPO2 = {"name": "repo2", "owner": "testuser", "openPRCount": 1}
+PR1 = {"url": "https://github.com/testuser/repo1/pull/1", "repository": {"name": "repo1", "owner": "testuser"}}
+PR2 = {"url": "https://github.com/testuser/repo2/pull/2", "repository": {"name": "repo2", "owner": "testuser"}}
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    pec.reset_pull_etag_state()
+    pec.set_skip_path_open_pr_check("rest_etag")
+    yield
+    pec.reset_pull_etag_state()
+    pec.set_skip_path_open_pr_check("graphql")
+
+
+def _fake_api(mocker, gh_api_response, responses):
+    """Answer each repository with the given (status, etag) and record the sent ETags."""
+    sent = {}
+
+    def run(owner, repo, etag=None):
+        sent[repo] = etag
+        status, etag = responses[repo]
+        return gh_api_response(status, [], {"Etag": etag})
+
+    mocker.patch.object(pec, "_run_pulls_api", side_effect=run)
+    return sent
+
+
+def test_first_probe_establishes_baseline(mocker, gh_api_response):
+    _fake_api(mocker, gh_api_response, {"repo1": (200, 'W/"a1"'), "repo2": (200, 'W/"b1"')})
+
+    assert pec.check_open_pulls_changed([REPO1, REPO2]) is None
+    assert pec.export_pull_etag_state() == {"testuser/repo1": 'W/"a1"', "testuser/repo2": 'W/"b1"'}
+
+
+def test_only_repos_returning_200_are_reported(mocker, gh_api_response):
+    pec.import_pull_etag_state({"testuser/repo1": 'W/"a1"', "testuser/repo2": 'W/"b1"'})
+    sent = _fake_api(mocker, gh_api_response, {"repo1": (304, None), "repo2": (200, 'W/"b2"')})
+
+    assert pec.check_open_pulls_changed([REPO1, REPO2]) == {"testuser/repo2"}
+    assert sent == {"repo1": 'W/"a1"', "repo2": 'W/"b1"'}
+    assert pec.export_pull_etag_state()["testuser/repo2"] == 'W/"b2"'
+
+
+def test_error_response_drops_etag(mocker, gh_api_response):
+    pec.import_pull_etag_state({"testuser/repo1": 'W/"a1"'})
+    _fake_api(mocker, gh_api_response, {"repo1": (502, None)})
+
+    assert pec.check_open_pulls_changed([REPO1]) == {"testuser/repo1"}
+    assert pec.export_pull_etag_state() == {}
+
+
+def _setup_skip_path(mocker):
+    mocks = {
+        "recount": mocker.patch.object(iteration_runner, "get_repositories_with_open_prs"),
+        "details": mocker.patch.object(iteration_runner, "get_pr_details_batch"),
+        "process": mocker.patch.object(iteration_runner, "_process_open_prs"),
+        "snapshot": mocker.patch.object(iteration_runner, "set_last_pr_snapshot"),
+    }
+    mocker.patch.object(iteration_runner, "validate_phase3_merge_config_required")
+    mocker.patch.object(iteration_runner, "select_prs_for_html_refetch", return_value=None)
+    return mocks
+
+
+def test_skip_path_unchanged_spends_no_graphql(mocker, gh_api_response):
+    pec.import_pull_etag_state({"testuser/repo1": 'W/"a1"', "testuser/repo2": 'W/"b1"'})
+    _fake_api(mocker, gh_api_response, {"repo1": (304, None), "repo2": (304, None)})
+    mocks = _setup_skip_path(mocker)
+
+    all_prs, repos, _ = iteration_runner._run_skip_check_path([PR1, PR2], [REPO1, REPO2], [], {})
+
+    mocks["recount"].assert_not_called()
+    mocks["details"].assert_not_called()
+    assert (all_prs, repos) == ([PR1, PR2], [REPO1, REPO2])
+
+
+def test_skip_path_refreshes_only_changed_repo(mocker, gh_api_response):
+    pec.import_pull_etag_state({"testuser/repo1": 'W/"a1"', "testuser/repo2": 'W/"b1"'})
+    _fake_api(mocker, gh_api_response, {"repo1": (304, None), "repo2": (200, 'W/"b2"')})
+    mocks = _setup_skip_path(mocker)
+    new_pr = {"url": "https://github.com/testuser/repo2/pull/3", "repository": {"name": "repo2", "owner": "testuser"}}
+    mocks["details"].return_value = [PR2, new_pr]
+    mocker.patch.object(iteration_runner, "select_prs_for_html_refetch", return_value=(set(), set()))
+
+    all_prs, repos, _ = iteration_runner._run_skip_check_path([PR1, PR2], [REPO1, REPO2], [], {})
+
+    mocks["recount"].assert_not_called()
+    mocks["details"].assert_called_once_with([REPO2])
+    assert all_prs == [PR1, PR2, new_pr]
+    assert repos == [REPO1, dict(REPO2, openPRCount=2)]
+    # PRs whose details were re-fetched always get their HTML fetched too
+    assert mocks["process"].call_args.args[3:] == (set(), {PR2["url"], new_pr["url"]})
+
+
+def test_skip_path_without_baseline_recounts_via_graphql(mocker, gh_api_response):
+    _fake_api(mocker, gh_api_response, {"repo1": (200, 'W/"a1"')})
+    mocks = _setup_skip_path(mocker)
+    mocks["recount"].return_value = [REPO1]
+
+    iteration_runner._run_skip_check_path([PR1], [REPO1], [], {})
+
+    mocks["recount"].assert_called_once()
+    mocks["details"].assert_not_called()
@@ -0,0 +1,145 @@
+"""
+Tests for the per-iteration GraphQL point budget planner.
+
+Verifies that:
+- budgeting is disabled by default and every batch is planned
+- low-priority batches are trimmed to what fits the remaining points
+- nothing fitting raises QueryBudgetExceededError, high priority is never trimmed
+- execute_graphql_query charges the reported cost, or the estimate when none is reported
+- the issue display falls back to cached issues when the listing is deferred
+- a partially planned issue listing reports the dropped repositories and is not cached as complete
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.gh_pr_phase_monitor.github import query_budget_planner as planner
+
+
+@pytest.fixture(autouse=True)
+def _reset_budget():
+    original = planner.get_iteration_point_budget()
+    planner.begin_iteration()
+    yield
+    planner.set_iteration_point_budget(original)
+    planner.begin_iteration()
+
+
+def test_budget_disabled_plans_everything():
+    planner.set_iteration_point_budget(0)
+    planner.record_query_cost(1000)
+    assert planner.get_remaining_points() is None
+    assert planner.plan_batches("issues", [1, 2, 3], lambda b: 100) == [1, 2, 3]
+
+
+def test_low_priority_batches_are_trimmed():
+    planner.set_iteration_point_budget(50)
+    planner.record_query_cost(20)
+    assert planner.plan_batches("issues", ["a", "b", "c", "d"], lambda b: 10) == ["a", "b", "c"]
+
+
+def test_nothing_fits_raises():
+    planner.set_iteration_point_budget(50)
+    planner.record_query_cost(45)
+    with pytest.raises(planner.QueryBudgetExceededError):
+        planner.plan_batches("issues", ["a"], lambda b: 10)
+
+
+def test_high_priority_is_never_trimmed():
+    planner.set_iteration_point_budget(10)
+    planner.record_query_cost(10)
+    assert planner.plan_batches("pr_details", ["a", "b"], lambda b: 30, planner.PRIORITY_HIGH) == ["a", "b"]
+
+
+def test_begin_iteration_resets_spent_points():
+    planner.set_iteration_point_budget(10)
+    planner.record_query_cost(10)
+    planner.begin_iteration()
+    assert planner.get_remaining_points() == 10
+
+
+def test_execute_graphql_query_charges_reported_cost(mocker):
+    from src.gh_pr_phase_monitor.github.graphql_client import execute_graphql_query
+
+    mock_result = MagicMock()
+    mock_result.stdout = json.dumps({"data": {"rateLimit": {"cost": 7, "remaining": 4900}}})
+    mocker.patch("subprocess.run", return_value=mock_result)
+
+    execute_graphql_query("query { rateLimit { cost remaining } }")
+
+    assert planner.get_spent_points() == 7
+
+
+def test_execute_graphql_query_charges_estimate_without_rate_limit(mocker):
+    from src.gh_pr_phase_monitor.github.graphql_client import execute_graphql_query
+
+    mock_result = MagicMock()
+    mock_result.stdout = json.dumps({"data": {"viewer": {"login": "testuser"}}})
+    mocker.patch("subprocess.run", return_value=mock_result)
+
+    execute_graphql_query("query { viewer { login } }")
+
+    assert planner.get_spent_points() == 1
+
+
+def test_issue_listing_is_deferred_to_cache(mocker, capsys):
+    from src.gh_pr_phase_monitor.ui import display
+
+    cached = [{"number": 1, "title": "cached issue", "url": "https://github.com/o/r/issues/1"}]
+    mocker.patch.object(display, "_cached_top_issues", list(cached))
+    mocker.patch(
+        "src.gh_pr_phase_monitor.github.github_client.get_repositories_with_no_prs_and_open_issues",
+        return_value=[{"name": "r", "owner": "o", "openIssueCount": 1}],
+    )
+    mocker.patch("src.gh_pr_phase_monitor.ui.display.check_issues_etag_changed", return_value=True)
+    mock_execute = mocker.patch("src.gh_pr_phase_monitor.github.issue_fetcher.execute_graphql_query")
+
+    planner.set_iteration_point_budget(5)
+    planner.record_query_cost(5)
+    display.display_issues_from_repos_without_prs({})
+
+    out = capsys.readouterr().out
+    mock_execute.assert_not_called()
+    assert "延期" in out
+    assert "cached issue" in out
+
+
+def test_issue_listing_reports_dropped_repositories(mocker):
+    from src.gh_pr_phase_monitor.github import issue_fetcher
+
+    mocker.patch.object(issue_fetcher, "get_batch_size", return_value=2)
+    mocker.patch.object(issue_fetcher, "estimate_query_cost", return_value={"points": 1})
+    mocker.patch.object(issue_fetcher, "fetch_batch_adaptively", return_value=[])
+    repos = [{"name": f"r{index}", "owner": "o"} for index in range(5)]
+
+    planner.set_iteration_point_budget(1)
+    fetch_status = {}
+    issue_fetcher.get_issues_from_repositories(repos, fetch_status=fetch_status)
+
+    assert fetch_status["dropped_repositories"] == repos[2:]
+
+
+def test_partial_issue_listing_keeps_cache_and_refresh_flag(mocker):
+    from src.gh_pr_phase_monitor.ui import display
+
+    cached = [{"number": 1, "title": "cached issue", "url": "https://github.com/o/r/issues/1"}]
+    mocker.patch.object(display, "_cached_top_issues", list(cached))
+    mocker.patch.object(display, "_issue_cache_state", {"needs_refresh": False})
+    mocker.patch(
+        "src.gh_pr_phase_monitor.github.github_client.get_repositories_with_no_prs_and_open_issues",
+        return_value=[{"name": "r", "owner": "o", "openIssueCount": 1}, {"name": "s", "owner": "o", "openIssueCount": 1}],
+    )
+    mocker.patch("src.gh_pr_phase_monitor.ui.display.check_issues_etag_changed", return_value=True)
+
+    def partial_listing(repos, limit, fetch_status):
+        fetch_status["dropped_repositories"] = repos[1:]
+        return [{"number": 2, "title": "partial issue", "url": "https://github.com/o/r/issues/2"}]
+
+    mocker.patch("src.gh_pr_phase_monitor.ui.display.get_issues_from_repositories", side_effect=partial_listing)
+
+    display.display_issues_from_repos_without_prs({})
+
+    assert display._cached_top_issues == cached
+    assert display._issue_cache_state["needs_refresh"] is True
@@ -0,0 +1,78 @@
+"""
+Tests for the local GraphQL cost estimator.
+
+Verifies that:
+- connection request counts multiply through nested first/last arguments
+- first: $variable arguments are resolved from the variables dict
+- fields without first/last do not count as connections
+- the point cost follows GitHub's requests / 100 rule with a minimum of 1
+- the queries built by issue_fetcher / pr_fetcher are estimated as expected
+"""
+
+from src.gh_pr_phase_monitor.github.query_cost_estimator import estimate_query_cost
+
+
+def test_single_connection_costs_one_point():
+    cost = estimate_query_cost("query { viewer { repositories(first: 100) { nodes { name } } } }")
+    assert cost == {"requests": 1, "nodes": 100, "points": 1}
+
+
+def test_nested_connections_multiply():
+    query = """
+    query {
+      viewer {
+        repositories(first: 50) {
+          nodes {
+            issues(first: 10) {
+              nodes {
+                labels(first: 5) { nodes { name } }
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+    cost = estimate_query_cost(query)
+    # 1 + 50 + 50*10 requests; 50 + 500 + 2500 nodes
+    assert cost == {"requests": 551, "nodes": 3050, "points": 6}
+
+
+def test_variables_are_resolved():
+    query = (
+        "query($n: Int!) { viewer { repositories(first: $n, orderBy: {field: NAME, direction: ASC}) { totalCount } } }"
+    )
+    assert estimate_query_cost(query, {"n": 30})["nodes"] == 30
+
+
+def test_fields_without_page_size_are_not_connections():
+    query = 'query { repository(owner: "o", name: "r") { pullRequests(states: OPEN) { totalCount } } }'
+    assert estimate_query_cost(query) == {"requests": 0, "nodes": 0, "points": 1}
+
+
+def test_aliases_and_sibling_connections_are_summed():
+    query = """
+    query {
+      repo0: repository(owner: "o", name: "a") { issues(first: 50) { nodes { title } } }
+      repo1: repository(owner: "o", name: "b") { issues(first: 50) { nodes { title } } }
+      rateLimit { cost remaining }
+    }
+    """
+    assert estimate_query_cost(query) == {"requests": 2, "nodes": 100, "points": 1}
+
+
+def test_string_arguments_do_not_confuse_the_parser():
+    query = 'query { repository(owner: "first", name: "{ last: 100 }") { issues(last: 20) { totalCount } } }'
+    assert estimate_query_cost(query)["nodes"] == 20
+
+
+def test_issue_listing_query_estimate():
+    from src.gh_pr_phase_monitor.github.issue_fetcher import _build_issues_query
+    from src.gh_pr_phase_monitor.github.query_templates import ISSUES_PER_REPO
+
+    repos = [{"name": f"repo{i}", "owner": "testuser"} for i in range(10)]
+    cost = estimate_query_cost(_build_issues_query(repos, None, False))
+
+    # Per repository: issues + labels and assignees for each issue
+    assert cost["requests"] == 10 * (1 + 2 * ISSUES_PER_REPO)
+    assert cost["points"] == 10
@@ -0,0 +1,96 @@
+"""
+Tests for prebuilt GraphQL query templates.
+
+Verifies that:
+- repository scans send the same query text for every page and pass the cursor as $after
+- aliased batch queries are built once per batch size and take $ownerN/$nameN variables
+- repository names are never spliced into the query text
+- the gh CLI path passes string variables raw (-f) and omits null variables
+"""
+
+import json
+from unittest.mock import MagicMock
+
+from src.gh_pr_phase_monitor.github import query_templates
+from src.gh_pr_phase_monitor.github.graphql_client import execute_graphql_query
+
+
+def test_repository_scan_pages_reuse_query_text(mocker):
+    from src.gh_pr_phase_monitor.github import repository_fetcher
+
+    pages = [
+        {
+            "data": {
+                "user": {
+                    "repositories": {
+                        "nodes": [{"name": "repo1", "updatedAt": "2024-01-01T00:00:00Z"}],
+                        "pageInfo": {"hasNextPage": True, "endCursor": "CURSOR1"},
+                    }
+                }
+            }
+        },
+        {
+            "data": {
+                "user": {
+                    "repositories": {
+                        "nodes": [{"name": "repo2", "updatedAt": "2024-01-02T00:00:00Z"}],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                }
+            }
+        },
+    ]
+    mocker.patch.object(repository_fetcher, "get_current_user", return_value="testuser")
+    mock_execute = mocker.patch.object(repository_fetcher, "execute_graphql_query", side_effect=pages)
+
+    result = repository_fetcher.get_all_repos_updated_at()
+
+    assert result == {"repo1": "2024-01-01T00:00:00Z", "repo2": "2024-01-02T00:00:00Z"}
+    first_call, second_call = mock_execute.call_args_list
+    assert first_call.args[0] is second_call.args[0] is query_templates.REPOSITORY_INVENTORY_QUERY
+    assert first_call.args[1] == {"login": "testuser", "after": None}
+    assert second_call.args[1] == {"login": "testuser", "after": "CURSOR1"}
+
+
+def test_aliased_query_is_built_once_per_batch_size():
+    first = query_templates.aliased_repository_query(query_templates.PR_DETAILS_SELECTION, 3)
+    second = query_templates.aliased_repository_query(query_templates.PR_DETAILS_SELECTION, 3)
+    assert first is second
+    assert "$owner2: String!, $name2: String!" in first
+    assert "repo2: repository(owner: $owner2, name: $name2)" in first
+    assert "repo3:" not in first
+
+
+def test_aliased_variables_carry_repository_names():
+    batch = [{"name": 'we"ird', "owner": "alice"}, {"name": "repo", "owner": "bob"}]
+    assert query_templates.aliased_repository_variables(batch) == {
+        "owner0": "alice",
+        "name0": 'we"ird',
+        "owner1": "bob",
+        "name1": "repo",
+    }
+
+
+def test_pr_details_query_contains_no_repository_names(mocker):
+    from src.gh_pr_phase_monitor.github import pr_fetcher
+
+    mock_execute = mocker.patch.object(pr_fetcher, "execute_graphql_query", return_value={"data": {}})
+    pr_fetcher.get_pr_details_batch([{"name": "secret-repo", "owner": "alice"}])
+
+    query, variables = mock_execute.call_args.args[:2]
+    assert "secret-repo" not in query
+    assert variables == {"owner0": "alice", "name0": "secret-repo"}
+
+
+def test_gh_path_passes_strings_raw_and_omits_null(mocker):
+    mock_result = MagicMock()
+    mock_result.stdout = json.dumps({"data": {}})
+    mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+    execute_graphql_query(
+        "query($login: String!, $after: String) { viewer { login } }", {"login": "123", "after": None}
+    )
+
+    cmd = mock_run.call_args.args[0]
+    assert cmd[-2:] == ["-f", "login=123"]
+    assert not any(arg.startswith("after=") for arg in cmd)
@@ -0,0 +1,127 @@
+"""
+Tests for rate-limit telemetry derived from API responses.
+
+Verifies that:
+- GraphQL rateLimit fields update the graphql bucket (resetAt converted to epoch seconds)
+- x-ratelimit-* headers update the bucket named by x-ratelimit-resource
+- raw header lines are read only up to the blank line separating headers from the body
+- ETag probes and execute_graphql_query keep the tracker current without extra API calls
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.gh_pr_phase_monitor.github import rate_limit_tracker as tracker
+from src.gh_pr_phase_monitor.github.etag_checker import _parse_response
+from src.gh_pr_phase_monitor.github.graphql_client import execute_graphql_query
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracker():
+    tracker.reset_rate_limit_tracker()
+    yield
+    tracker.reset_rate_limit_tracker()
+
+
+def test_snapshot_is_none_before_any_observation():
+    assert tracker.get_rate_limit_snapshot() is None
+    assert tracker.get_all_rate_limit_snapshots() == {}
+
+
+def test_graphql_rate_limit_field_updates_graphql_bucket():
+    tracker.record_graphql_rate_limit(
+        {
+            "data": {
+                "rateLimit": {
+                    "cost": 1,
+                    "limit": 5000,
+                    "remaining": 4990,
+                    "used": 10,
+                    "resetAt": "2024-01-01T01:00:00Z",
+                }
+            }
+        }
+    )
+
+    expected_reset = int(datetime(2024, 1, 1, 1, 0, tzinfo=timezone.utc).timestamp())
+    assert tracker.get_rate_limit_snapshot(tracker.GRAPHQL_BUCKET) == {
+        "limit": 5000,
+        "remaining": 4990,
+        "used": 10,
+        "reset": expected_reset,
+    }
+
+
+def test_graphql_rate_limit_without_used_derives_it():
+    tracker.record_graphql_rate_limit({"data": {"rateLimit": {"limit": 5000, "remaining": 4000}}})
+
+    assert tracker.get_rate_limit_snapshot()["used"] == 1000
+
+
+def test_graphql_response_without_rate_limit_is_ignored():
+    tracker.record_graphql_rate_limit({"data": {"viewer": {"login": "u"}}})
+    tracker.record_graphql_rate_limit(None)
+
+    assert tracker.get_rate_limit_snapshot() is None
+
+
+def test_headers_update_bucket_named_by_resource():
+    tracker.record_rate_limit_headers(
+        {
+            "X-RateLimit-Limit": "30",
+            "X-RateLimit-Remaining": "29",
+            "X-RateLimit-Used": "1",
+            "X-RateLimit-Reset": "1700000000",
+            "X-RateLimit-Resource": "search",
+        }
+    )
+    tracker.record_rate_limit_headers({"x-ratelimit-remaining": "4999", "x-ratelimit-limit": "5000"})
+
+    snapshots = tracker.get_all_rate_limit_snapshots()
+    assert snapshots["search"] == {"limit": 30, "remaining": 29, "used": 1, "reset": 1700000000}
+    assert snapshots["core"] == {"limit": 5000, "remaining": 4999, "used": 1}
+
+
+def test_headers_without_remaining_are_ignored():
+    tracker.record_rate_limit_headers({"Content-Type": "application/json"})
+
+    assert tracker.get_all_rate_limit_snapshots() == {}
+
+
+def test_header_lines_stop_at_body():
+    tracker.record_rate_limit_header_lines(
+        [
+            "x-ratelimit-limit: 5000",
+            "x-ratelimit-remaining: 4321",
+            "",
+            "x-ratelimit-remaining: 1",
+        ]
+    )
+
+    assert tracker.get_rate_limit_snapshot(tracker.CORE_BUCKET)["remaining"] == 4321
+
+
+def test_etag_probe_feeds_tracker_even_on_304():
+    output = "HTTP/2 304\nx-ratelimit-limit: 5000\nx-ratelimit-remaining: 4800\nx-ratelimit-resource: core\n\n"
+
+    is_304, _etag, _has_next = _parse_response(output)
+
+    assert is_304 is True
+    assert tracker.get_rate_limit_snapshot(tracker.CORE_BUCKET)["remaining"] == 4800
+
+
+def test_execute_graphql_query_records_rate_limit(mocker):
+    mock_result = MagicMock()
+    mock_result.stdout = json.dumps(
+        {"data": {"viewer": {"login": "u"}, "rateLimit": {"cost": 1, "limit": 5000, "remaining": 4321, "used": 679}}}
+    )
+    mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+    execute_graphql_query("query { viewer { login } rateLimit { cost limit remaining used resetAt } }")
+
+    # Only the query itself was sent; no separate `gh api rate_limit` call
+    assert mock_run.call_count == 1
+    assert tracker.get_rate_limit_snapshot()["remaining"] == 4321
@@ -0,0 +1,81 @@
+"""
+Tests for the shared repository inventory.
+
+Verifies that:
+- inside repository_inventory_scope() the updatedAt check, Phase 1 and the issue listing
+  share a single paginated scan
+- outside a scope every call fetches a fresh inventory
+- the inventory is dropped when the scope ends
+"""
+
+import pytest
+
+from src.gh_pr_phase_monitor.github import repository_fetcher
+
+
+def _inventory_page():
+    return {
+        "data": {
+            "user": {
+                "repositories": {
+                    "nodes": [
+                        {
+                            "name": "with-prs",
+                            "owner": {"login": "testuser"},
+                            "updatedAt": "2024-01-01T00:00:00Z",
+                            "pullRequests": {"totalCount": 2},
+                            "issues": {"totalCount": 1},
+                        },
+                        {
+                            "name": "issues-only",
+                            "owner": {"login": "testuser"},
+                            "updatedAt": "2024-01-02T00:00:00Z",
+                            "pullRequests": {"totalCount": 0},
+                            "issues": {"totalCount": 3},
+                        },
+                    ],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def mock_execute(mocker):
+    mocker.patch.object(repository_fetcher, "get_current_user", return_value="testuser")
+    return mocker.patch.object(
+        repository_fetcher, "execute_graphql_query", side_effect=lambda *args, **kwargs: _inventory_page()
+    )
+
+
+def test_consumers_share_one_scan_within_scope(mock_execute):
+    with repository_fetcher.repository_inventory_scope():
+        updated_at = repository_fetcher.get_all_repos_updated_at()
+        with_prs = repository_fetcher.get_repositories_with_open_prs()
+        issues_only = repository_fetcher.get_repositories_with_no_prs_and_open_issues()
+
+    assert mock_execute.call_count == 1
+    assert updated_at == {"with-prs": "2024-01-01T00:00:00Z", "issues-only": "2024-01-02T00:00:00Z"}
+    assert with_prs == [{"name": "with-prs", "owner": "testuser", "openPRCount": 2}]
+    assert issues_only == [{"name": "issues-only", "owner": "testuser", "openPRCount": 0, "openIssueCount": 3}]
+
+
+def test_each_call_fetches_outside_scope(mock_execute):
+    repository_fetcher.get_all_repos_updated_at()
+    repository_fetcher.get_repositories_with_open_prs()
+    assert mock_execute.call_count == 2
+
+
+def test_inventory_is_dropped_after_scope(mock_execute):
+    with repository_fetcher.repository_inventory_scope():
+        repository_fetcher.get_repository_inventory()
+    with repository_fetcher.repository_inventory_scope():
+        repository_fetcher.get_repository_inventory()
+    assert mock_execute.call_count == 2
+
+
+def test_callers_cannot_mutate_shared_inventory(mock_execute):
+    with repository_fetcher.repository_inventory_scope():
+        repository_fetcher.get_repository_inventory()[0]["openPRCount"] = 99
+        assert repository_fetcher.get_repository_inventory()[0]["openPRCount"] == 2
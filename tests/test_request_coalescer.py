@@ -0,0 +1,114 @@
+"""
+Tests for singleflight request coalescing.
+
+Verifies that:
+- concurrent callers of the same key share one in-flight call (also outside a scope)
+- inside request_coalescing_scope() later callers reuse a successful result
+- failures are not memoized
+- get_current_user and is_process_running are coalesced
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.gh_pr_phase_monitor.core import request_coalescer
+from src.gh_pr_phase_monitor.core.process_utils import is_process_running
+from src.gh_pr_phase_monitor.core.request_coalescer import coalesce, get_coalescing_stats, request_coalescing_scope
+from src.gh_pr_phase_monitor.github import github_auth
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    request_coalescer.reset_coalescing_stats()
+    yield
+    request_coalescer.reset_coalescing_stats()
+
+
+def test_concurrent_callers_share_one_call():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(coalesce("key", fetch)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(coalesce("key", fetch))) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    # Give the followers time to join the in-flight call before it completes
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == ["value"] * 4
+    assert get_coalescing_stats() == {"calls": 1, "shared": 3}
+
+
+def test_results_are_reused_only_inside_scope():
+    fetch = MagicMock(return_value=42)
+
+    with request_coalescing_scope():
+        assert coalesce("answer", fetch) == 42
+        assert coalesce("answer", fetch) == 42
+    assert fetch.call_count == 1
+
+    # Scope ended: the next read is fresh, and without a scope nothing is memoized
+    coalesce("answer", fetch)
+    coalesce("answer", fetch)
+    assert fetch.call_count == 3
+
+
+def test_failures_are_not_memoized():
+    fetch = MagicMock(side_effect=[RuntimeError("boom"), "ok"])
+
+    with request_coalescing_scope():
+        with pytest.raises(RuntimeError, match="boom"):
+            coalesce("flaky", fetch)
+        assert coalesce("flaky", fetch) == "ok"
+
+    assert fetch.call_count == 2
+
+
+def test_is_process_running_is_looked_up_once_per_scope(mocker):
+    mock_run = mocker.patch("subprocess.run", return_value=MagicMock(returncode=0, stdout="123\n"))
+
+    with request_coalescing_scope():
+        assert is_process_running("cat-window-watcher") is True
+        assert is_process_running("cat-window-watcher") is True
+        is_process_running("other-process")
+
+    assert mock_run.call_count == 2
+
+
+def test_get_current_user_concurrent_first_calls_share_one_lookup(mocker, monkeypatch):
+    monkeypatch.setattr(github_auth, "_current_user_cache", None)
+    release = threading.Event()
+
+    def slow_run(*args, **kwargs):
+        release.wait(5)
+        return MagicMock(stdout="testuser\n")
+
+    mock_run = mocker.patch("subprocess.run", side_effect=slow_run)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(github_auth.get_current_user())) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["testuser"] * 3
+    assert mock_run.call_count == 1
@@ -0,0 +1,200 @@
+"""
+Tests for the retry / backoff / circuit breaker layer.
+
+Verifies that:
+- transient failures are retried with backoff (or Retry-After) and non-transient ones are not
+- secondary rate limits are retried instead of being reported as primary rate-limit exhaustion
+- mutations are never replayed
+- the circuit breaker opens after repeated failures, skips calls, and closes after a successful trial
+- retry counts and breaker states are observable
+"""
+
+import json
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.gh_pr_phase_monitor.github import resilience
+from src.gh_pr_phase_monitor.github.graphql_client import GitHubRateLimitError, execute_graphql_query
+from src.gh_pr_phase_monitor.github.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_OPEN,
+    CircuitOpenError,
+    TransientGitHubError,
+    call_with_resilience,
+    get_resilience_stats,
+    parse_retry_after,
+)
+from src.gh_pr_phase_monitor.monitor.pages_watcher import get_pages_url
+
+
+@pytest.fixture(autouse=True)
+def _reset_resilience(monkeypatch):
+    resilience.reset_resilience_state()
+    resilience.set_resilience_settings()
+    sleeps = []
+    monkeypatch.setattr(resilience, "_sleep", sleeps.append)
+    yield sleeps
+    resilience.reset_resilience_state()
+    resilience.set_resilience_settings()
+
+
+def _flaky(failures, result="ok", retry_after=None):
+    calls = {"count": 0}
+
+    def operation():
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            raise TransientGitHubError("HTTP 502: Bad Gateway", retry_after=retry_after)
+        return result
+
+    return operation, calls
+
+
+def test_transient_failure_is_retried_with_backoff(_reset_resilience):
+    operation, calls = _flaky(2)
+
+    assert call_with_resilience("graphql", operation, use_circuit_breaker=False) == "ok"
+
+    assert calls["count"] == 3
+    assert len(_reset_resilience) == 2
+    # Full jitter: each wait is within the exponential cap for its retry
+    assert 0 <= _reset_resilience[0] <= 1.0
+    assert 0 <= _reset_resilience[1] <= 2.0
+    assert get_resilience_stats()["graphql"]["retries"] == 2
+
+
+def test_retry_after_is_honoured(_reset_resilience):
+    operation, _calls = _flaky(1, retry_after=7)
+
+    call_with_resilience("graphql", operation)
+
+    assert _reset_resilience == [7]
+
+
+def test_retries_stop_after_max_attempts():
+    resilience.set_resilience_settings(max_attempts=2)
+    operation, calls = _flaky(5)
+
+    with pytest.raises(TransientGitHubError):
+        call_with_resilience("graphql", operation, use_circuit_breaker=False)
+
+    assert calls["count"] == 2
+    assert get_resilience_stats()["graphql"]["failures"] == 1
+
+
+def test_non_idempotent_calls_are_not_retried():
+    operation, calls = _flaky(1)
+
+    with pytest.raises(TransientGitHubError):
+        call_with_resilience("graphql", operation, idempotent=False)
+
+    assert calls["count"] == 1
+
+
+def test_non_transient_errors_propagate_without_retry():
+    calls = {"count": 0}
+
+    def operation():
+        calls["count"] += 1
+        raise RuntimeError("Not Found")
+
+    with pytest.raises(RuntimeError, match="Not Found"):
+        call_with_resilience("pages", operation)
+
+    assert calls["count"] == 1
+    assert get_resilience_stats()["pages"]["state"] == CIRCUIT_CLOSED
+
+
+def test_circuit_opens_after_threshold_and_skips_calls(monkeypatch):
+    resilience.set_resilience_settings(max_attempts=1, failure_threshold=2, cooldown_seconds=60)
+    now = {"value": 1000.0}
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now["value"])
+    operation, calls = _flaky(10)
+
+    for _ in range(2):
+        with pytest.raises(TransientGitHubError):
+            call_with_resilience("pages", operation)
+
+    with pytest.raises(CircuitOpenError):
+        call_with_resilience("pages", operation)
+    assert calls["count"] == 2
+    assert get_resilience_stats()["pages"] == {"state": CIRCUIT_OPEN, "retries": 0, "failures": 2, "skipped": 1}
+
+    # After the cooldown a successful trial call closes the breaker
+    now["value"] += 61
+    assert call_with_resilience("pages", lambda: "ok") == "ok"
+    assert get_resilience_stats()["pages"]["state"] == CIRCUIT_CLOSED
+
+
+def test_failed_trial_call_reopens_circuit(monkeypatch):
+    resilience.set_resilience_settings(max_attempts=1, failure_threshold=1, cooldown_seconds=60)
+    now = {"value": 1000.0}
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now["value"])
+    operation, calls = _flaky(10)
+
+    with pytest.raises(TransientGitHubError):
+        call_with_resilience("issues", operation)
+    now["value"] += 61
+    with pytest.raises(TransientGitHubError):
+        call_with_resilience("issues", operation)
+    with pytest.raises(CircuitOpenError):
+        call_with_resilience("issues", operation)
+
+    assert calls["count"] == 2
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_execute_graphql_query_retries_gh_502(mocker, _reset_resilience):
+    ok = MagicMock()
+    ok.stdout = json.dumps({"data": {"viewer": {"login": "u"}}})
+    mock_run = mocker.patch(
+        "subprocess.run",
+        side_effect=[
+            subprocess.CalledProcessError(
+                1, ["gh"], stderr="gh: HTTP 502: Bad Gateway (https://api.github.com/graphql)"
+            ),
+            ok,
+        ],
+    )
+
+    result = execute_graphql_query("query { viewer { login } }")
+
+    assert result == {"data": {"viewer": {"login": "u"}}}
+    assert mock_run.call_count == 2
+
+
+def test_secondary_rate_limit_is_retried_not_reported_as_exhaustion(mocker, _reset_resilience):
+    resilience.set_resilience_settings(max_attempts=1)
+    mocker.patch(
+        "subprocess.run",
+        side_effect=subprocess.CalledProcessError(
+            1, ["gh"], stderr="gh: You have exceeded a secondary rate limit. Please wait a few minutes."
+        ),
+    )
+
+    with pytest.raises(TransientGitHubError) as exc_info:
+        execute_graphql_query("query { viewer { login } }")
+
+    assert not isinstance(exc_info.value, GitHubRateLimitError)
+
+
+def test_pages_call_returns_none_while_circuit_is_open(mocker):
+    resilience.set_resilience_settings(max_attempts=1, failure_threshold=1, cooldown_seconds=300)
+    mock_run = mocker.patch(
+        "subprocess.run",
+        side_effect=subprocess.CalledProcessError(1, ["gh"], stderr="gh: HTTP 503: Service Unavailable"),
+    )
+
+    assert get_pages_url("owner", "repo") is None
+    assert get_pages_url("owner", "repo") is None
+
+    assert mock_run.call_count == 1
+    assert get_resilience_stats()["pages"]["skipped"] == 1
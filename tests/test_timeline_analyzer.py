@@ -0,0 +1,181 @@
+"""
+Tests for the REST timeline as an LLM status source (llm_status_source = "timeline").
+
+Verifies that:
+- Copilot timeline events map onto the same llm_statuses / phases as the HTML scraper
+- only Copilot's own accounts (exact logins) count as Copilot reviewers
+- an unchanged timeline costs one conditional request (304) and reuses the stored pages
+- pages announced by the Link header are followed, and the page after a full last page is probed
+- rulesets select the source per repository and failures fall back to the HTML scraper
+"""
+
+import pytest
+
+import src.gh_pr_phase_monitor.github.timeline_fetcher as tf
+from src.gh_pr_phase_monitor.monitor import pr_processor
+from src.gh_pr_phase_monitor.phase import timeline_analyzer
+from src.gh_pr_phase_monitor.phase.phase_detector import (
+    PHASE1B_DRAFT_LLM_FINISHED_WORK,
+    PHASE2A_REVIEW_COMPLETED,
+    PHASE3A_LLM_FEEDBACK_FINISHED_WORK,
+)
+
+PR_URL = "https://github.com/testuser/repo1/pull/7"
+STARTED = {"event": "copilot_work_started", "actor": {"login": "Copilot"}, "created_at": "2026-03-07T10:01:00Z"}
+FINISHED = {"event": "copilot_work_finished", "actor": {"login": "Copilot"}, "created_at": "2026-03-07T10:30:00Z"}
+READY = {"event": "ready_for_review", "actor": {"login": "testuser"}, "created_at": "2026-03-07T10:31:00Z"}
+REVIEWED = {
+    "event": "reviewed",
+    "user": {"login": "copilot-pull-request-reviewer[bot]"},
+    "submitted_at": "2026-03-07T10:40:00Z",
+    "body": "Copilot reviewed 3 out of 3 changed files in this pull request and generated 2 comments.",
+}
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    tf.reset_timeline_state()
+    yield
+    tf.reset_timeline_state()
+
+
+def _response(gh_api_response, status, events=None, etag=None, link=None):
+    return gh_api_response(status, events, {"Etag": etag, "Link": link})
+
+
+def test_events_map_to_html_style_statuses():
+    statuses = timeline_analyzer.llm_statuses_from_timeline([STARTED, {"event": "labeled"}, FINISHED])
+
+    assert statuses == [
+        "Copilot started work on behalf of Copilot March 7, 2026 10:01",
+        "Copilot finished work on behalf of Copilot March 7, 2026 10:30",
+    ]
+
+
+def test_only_copilot_accounts_count_as_copilot():
+    human_review = dict(REVIEWED, user={"login": "copilotfan"})
+    human_request = {"event": "review_requested", "requested_reviewer": {"login": "my-copilot-helper"}}
+
+    assert timeline_analyzer.llm_statuses_from_timeline([human_review, human_request]) == []
+    assert timeline_analyzer.llm_statuses_from_timeline([REVIEWED]) == ["Copilot reviewed March 7, 2026 10:40"]
+
+
+def test_analysis_follows_draft_and_review_state():
+    assert timeline_analyzer.analyze_pr_timeline([STARTED, FINISHED], True)["status"] == PHASE1B_DRAFT_LLM_FINISHED_WORK
+
+    analysis = timeline_analyzer.analyze_pr_timeline([STARTED, FINISHED, READY, REVIEWED], True)
+    assert analysis["is_draft"] is False
+    assert analysis["status"] == PHASE2A_REVIEW_COMPLETED
+
+    no_comments = dict(REVIEWED, body="Copilot reviewed 1 out of 1 changed files and generated no comments.")
+    assert timeline_analyzer.analyze_pr_timeline([READY, no_comments], False)["status"] == (
+        PHASE3A_LLM_FEEDBACK_FINISHED_WORK
+    )
+
+
+def test_unchanged_timeline_is_a_single_304(mocker, gh_api_response):
+    mock_api = mocker.patch.object(
+        tf,
+        "_run_timeline_api",
+        side_effect=[_response(gh_api_response, 200, [STARTED], 'W/"t1"'), _response(gh_api_response, 304)],
+    )
+
+    assert tf.fetch_pr_timeline("testuser", "repo1", 7) == [STARTED]
+    assert tf.fetch_pr_timeline("testuser", "repo1", 7) == [STARTED]
+
+    assert mock_api.call_args_list[1].args == ("testuser", "repo1", 7, 1, 'W/"t1"')
+    assert tf.get_timeline_stats() == {"conditional": 1, "not_modified": 1}
+
+
+def test_next_pages_are_followed_and_last_page_is_revalidated(mocker, gh_api_response):
+    link = '<https://api.github.com/repositories/1/issues/7/timeline?per_page=100&page=2>; rel="next"'
+    mock_api = mocker.patch.object(
+        tf,
+        "_run_timeline_api",
+        side_effect=[
+            _response(gh_api_response, 200, [STARTED], 'W/"p1"', link),
+            _response(gh_api_response, 200, [FINISHED], 'W/"p2"'),
+            _response(gh_api_response, 200, [FINISHED, READY], 'W/"p2b"'),
+        ],
+    )
+
+    assert tf.fetch_pr_timeline("testuser", "repo1", 7) == [STARTED, FINISHED]
+    # Only the last page is requested again; page 1 is kept
+    assert tf.fetch_pr_timeline("testuser", "repo1", 7) == [STARTED, FINISHED, READY]
+    assert mock_api.call_args_list[2].args == ("testuser", "repo1", 7, 2, 'W/"p2"')
+
+
+def test_events_after_a_full_last_page_are_found(mocker, gh_api_response):
+    full_page = [{"event": "labeled"}] * tf.TIMELINE_PAGE_SIZE
+    mock_api = mocker.patch.object(
+        tf,
+        "_run_timeline_api",
+        side_effect=[
+            _response(gh_api_response, 200, full_page, 'W/"p1"'),
+            _response(gh_api_response, 304),
+            _response(gh_api_response, 200, [], 'W/"empty"'),
+            _response(gh_api_response, 304),
+            _response(gh_api_response, 304),
+            _response(gh_api_response, 304),
+            _response(gh_api_response, 200, [FINISHED], 'W/"p2"'),
+        ],
+    )
+
+    assert tf.fetch_pr_timeline("testuser", "repo1", 7) == full_page
+    assert tf.fetch_pr_timeline("testuser", "repo1", 7) == full_page
+    assert tf.fetch_pr_timeline("testuser", "repo1", 7) == full_page
+    # The new event starts page 2 while page 1 still answers 304
+    assert tf.fetch_pr_timeline("testuser", "repo1", 7) == full_page + [FINISHED]
+
+    probes = [c.args for c in mock_api.call_args_list[1:]]
+    assert probes[:2] == [("testuser", "repo1", 7, 1, 'W/"p1"'), ("testuser", "repo1", 7, 2, None)]
+    assert probes[3] == ("testuser", "repo1", 7, 2, 'W/"empty"')
+    assert probes[5] == ("testuser", "repo1", 7, 2, 'W/"empty"')
+    assert tf._timelines["testuser/repo1#7"]["etag"] == 'W/"p2"'
+
+
+def test_closed_prs_are_forgotten(mocker, gh_api_response):
+    mocker.patch.object(tf, "_run_timeline_api", return_value=_response(gh_api_response, 200, [STARTED], 'W/"t1"'))
+    tf.fetch_pr_timeline("testuser", "repo1", 7)
+
+    tf.retain_pr_timelines(["https://github.com/testuser/repo1/pull/8"])
+
+    assert tf._timelines == {}
+
+
+def _setup_dispatch(mocker, source):
+    config = {"rulesets": [{"repositories": ["repo1"], "llm_status_source": source}]}
+    pr = {"url": PR_URL, "isDraft": False, "repository": {"name": "repo1", "owner": "testuser"}}
+    mock_html = mocker.patch.object(pr_processor, "fetch_and_analyze_pr_html", return_value={"status": "html"})
+    return config, pr, mock_html
+
+
+def test_ruleset_selects_timeline(mocker, gh_api_response):
+    config, pr, mock_html = _setup_dispatch(mocker, "timeline")
+    mocker.patch.object(
+        tf, "_run_timeline_api", return_value=_response(gh_api_response, 200, [READY, REVIEWED], 'W/"t1"')
+    )
+
+    analysis = pr_processor._fetch_and_analyze_pr(pr, config)
+
+    mock_html.assert_not_called()
+    assert analysis["status"] == PHASE2A_REVIEW_COMPLETED
+    assert pr["html_status"] == PHASE2A_REVIEW_COMPLETED
+
+
+def test_timeline_failure_falls_back_to_html(mocker, gh_api_response):
+    config, pr, mock_html = _setup_dispatch(mocker, "timeline")
+    mocker.patch.object(tf, "_run_timeline_api", return_value=_response(gh_api_response, 502))
+
+    assert pr_processor._fetch_and_analyze_pr(pr, config) == {"status": "html"}
+    mock_html.assert_called_once_with(pr)
+
+
+def test_default_source_is_html(mocker):
+    config, pr, mock_html = _setup_dispatch(mocker, "html")
+    mock_api = mocker.patch.object(tf, "_run_timeline_api")
+
+    pr_processor._fetch_and_analyze_pr(pr, config)
+
+    mock_api.assert_not_called()
+    mock_html.assert_called_once_with(pr)
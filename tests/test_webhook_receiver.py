@@ -0,0 +1,172 @@
+"""
+Tests for the embedded webhook receiver (push-based refresh).
+
+Verifies that:
+- recorded deliveries POSTed to localhost with a valid X-Hub-Signature-256 queue the
+  affected PR (reviews, PR comments) or repository (push, issues, PRs opened/closed) by
+  owner/name, so same-named repositories of different owners do not refresh each other
+- deliveries with a missing or wrong signature are rejected and queue nothing
+- a queued delivery wakes wait_with_countdown() early
+- the listener only starts with a port and a secret
+- the skip path re-fetches the PRs named by webhook deliveries on top of the regular selection,
+  and PRs not fetched for webhook_fallback_interval when there is no selection
+"""
+
+import hashlib
+import hmac
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+import src.gh_pr_phase_monitor.github.webhook_receiver as wr
+from src.gh_pr_phase_monitor.ui.wait_handler import wait_with_countdown
+
+SECRET = "s3cret"
+PR_URL = "https://github.com/testuser/repo1/pull/1"
+REVIEW_PAYLOAD = {
+    "action": "submitted",
+    "pull_request": {"html_url": PR_URL, "number": 1},
+    "repository": {"name": "repo1", "full_name": "testuser/repo1"},
+}
+PUSH_PAYLOAD = {"ref": "refs/heads/main", "repository": {"name": "repo2", "full_name": "testuser/repo2"}}
+
+
+@pytest.fixture
+def port():
+    wr.reset_webhook_receiver_state()
+    yield wr.start_webhook_receiver("127.0.0.1", 0, SECRET)
+    wr.reset_webhook_receiver_state()
+
+
+def _post(port, event, payload, secret=SECRET):
+    body = json.dumps(payload).encode("utf-8")
+    headers = {"X-GitHub-Event": event, "Content-Type": "application/json"}
+    if secret is not None:
+        digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        headers["X-Hub-Signature-256"] = f"sha256={digest}"
+    request = urllib.request.Request(f"http://127.0.0.1:{port}/", data=body, headers=headers, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_pr_level_delivery_queues_pr_and_wakes(port):
+    assert _post(port, "pull_request_review", REVIEW_PAYLOAD) == 202
+
+    assert wr.get_webhook_wake_event().is_set()
+    assert wr.take_webhook_refreshes() == (set(), {PR_URL})
+    assert not wr.get_webhook_wake_event().is_set()
+
+
+def test_repository_level_deliveries_queue_repo(port):
+    opened = dict(REVIEW_PAYLOAD, action="opened")
+    comment_on_issue = {
+        "issue": {"html_url": "https://github.com/testuser/repo3/issues/4"},
+        "repository": {"name": "repo3", "full_name": "testuser/repo3"},
+    }
+
+    assert _post(port, "push", PUSH_PAYLOAD) == 202
+    assert _post(port, "pull_request", opened) == 202
+    assert _post(port, "issue_comment", comment_on_issue) == 202
+
+    assert wr.take_webhook_refreshes() == ({"testuser/repo1", "testuser/repo2", "testuser/repo3"}, set())
+
+
+def test_same_named_repositories_of_other_owners_stay_apart(port, mocker):
+    from src.gh_pr_phase_monitor.monitor import iteration_runner
+
+    other_owner = {"ref": "refs/heads/main", "repository": {"name": "repo2", "full_name": "someorg/repo2"}}
+    assert _post(port, "push", other_owner) == 202
+
+    repos, _ = wr.take_webhook_refreshes()
+    mocker.patch.object(iteration_runner, "get_current_user", return_value="TestUser")
+
+    assert repos == {"someorg/repo2"}
+    assert iteration_runner._owned_repo_names(repos | {"testuser/repo1"}) == {"repo1"}
+
+
+def test_comment_on_pr_queues_pr(port):
+    payload = {"issue": {"html_url": PR_URL, "pull_request": {"html_url": PR_URL}}, "repository": {"name": "repo1"}}
+
+    assert _post(port, "issue_comment", payload) == 202
+    assert wr.take_webhook_refreshes() == (set(), {PR_URL})
+
+
+@pytest.mark.parametrize("secret", [None, "wrong"])
+def test_invalid_signature_is_rejected(port, secret):
+    assert _post(port, "push", PUSH_PAYLOAD, secret=secret) == 401
+
+    assert not wr.get_webhook_wake_event().is_set()
+    assert wr.take_webhook_refreshes() == (set(), set())
+
+
+def test_unrelated_events_are_acknowledged_and_ignored(port):
+    assert _post(port, "ping", {"zen": "Keep it simple."}) == 200
+    assert _post(port, "star", PUSH_PAYLOAD) == 200
+
+    assert wr.take_webhook_refreshes() == (set(), set())
+
+
+def test_delivery_ends_wait_early(port):
+    _post(port, "push", PUSH_PAYLOAD)
+
+    _config, seconds, interval_str, _mtime = wait_with_countdown(600, "10m", wake_event=wr.get_webhook_wake_event())
+
+    assert (seconds, interval_str) == (600, "10m")
+
+
+def test_listener_requires_port_and_secret(mocker):
+    mock_start = mocker.patch.object(wr, "start_webhook_receiver", return_value=8765)
+
+    wr.apply_webhook_receiver_settings("127.0.0.1", 0, SECRET)
+    wr.apply_webhook_receiver_settings("127.0.0.1", 8765, "")
+    mock_start.assert_not_called()
+
+    wr.apply_webhook_receiver_settings("127.0.0.1", 8765, SECRET)
+    mock_start.assert_called_once_with("127.0.0.1", 8765, SECRET)
+    wr._listen_address = None
+
+
+def _run_skip_path(mocker, prs, selection):
+    from src.gh_pr_phase_monitor.monitor import iteration_runner
+
+    cached_repos = [{"name": "repo1", "owner": "testuser", "openPRCount": len(prs)}]
+    mocker.patch.object(iteration_runner, "get_repositories_with_open_prs", return_value=cached_repos)
+    mocker.patch.object(iteration_runner, "select_prs_for_html_refetch", return_value=selection)
+    mock_process = mocker.patch.object(iteration_runner, "_process_open_prs")
+    mocker.patch.object(iteration_runner, "set_last_pr_snapshot")
+
+    iteration_runner._run_skip_check_path(prs, cached_repos, [], {}, webhook_pr_urls={PR_URL})
+    refetch_urls, signalled_urls = mock_process.call_args.args[3:]
+    return refetch_urls | signalled_urls
+
+
+def test_skip_path_adds_webhook_prs_to_notification_selection(mocker):
+    other_url = "https://github.com/testuser/repo1/pull/2"
+
+    selection = (set(), {other_url})
+
+    assert _run_skip_path(mocker, [{"url": PR_URL}, {"url": other_url}], selection) == {PR_URL, other_url}
+
+
+def test_skip_path_without_selection_still_refetches_stale_prs(mocker, monkeypatch):
+    import src.gh_pr_phase_monitor.github.notification_poller as npoll
+
+    fresh_url = "https://github.com/testuser/repo1/pull/2"
+    stale_url = "https://github.com/testuser/repo1/pull/3"
+    now = {"value": 1000.0}
+    monkeypatch.setattr(npoll, "_clock", lambda: now["value"])
+    npoll.reset_notification_poller_state()
+    npoll.record_pr_html_fetched(stale_url)
+    now["value"] += 600
+    npoll.record_pr_html_fetched(fresh_url)
+    npoll.record_pr_html_fetched(PR_URL)
+
+    # webhook_fallback_interval defaults to 10m: only the PR fetched 600 seconds ago is due
+    prs = [{"url": PR_URL}, {"url": fresh_url}, {"url": stale_url}]
+    assert _run_skip_path(mocker, prs, None) == {PR_URL, stale_url}
+    npoll.reset_notification_poller_state()